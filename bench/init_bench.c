@@ -0,0 +1,114 @@
+/*
+ * DynaCL: loader initialization benchmark
+ *
+ * usage
+ *    init_bench library [iterations]
+ *
+ * Times iterations of dynacl_init()/dynacl_shutdown() cycles on the library,
+ * then prints a JSON object for dynacl_init() and one for dynacl_shutdown(),
+ * each holding the minimum, median and mean time of a call, in nanoseconds.
+ */
+#if !defined(_WIN32) && !defined(_POSIX_C_SOURCE)
+  /* clock_gettime() is POSIX, hidden by the strict ISO C modes (-std=c99, -std=c11) */
+  #define _POSIX_C_SOURCE 199309L
+#endif /* !_WIN32 && !_POSIX_C_SOURCE */
+
+#include <CL/dynacl.h>
+#include <stdio.h>
+#include <stdlib.h>
+
+#ifdef _WIN32
+#include <windows.h>
+#else
+#include <time.h>
+#endif /* _WIN32 */
+
+#define DEFAULT_ITERATIONS 1000
+
+/*!
+ * \return A monotonic time, in nanoseconds
+ */
+static double now_ns() {
+#ifdef _WIN32
+  LARGE_INTEGER counter, frequency;
+
+  QueryPerformanceCounter(&counter);
+  QueryPerformanceFrequency(&frequency);
+
+  return (double)counter.QuadPart * 1e9 / (double)frequency.QuadPart;
+#else
+  struct timespec t;
+
+  clock_gettime(CLOCK_MONOTONIC, &t);
+
+  return (double)t.tv_sec * 1e9 + (double)t.tv_nsec;
+#endif /* _WIN32 */
+}
+
+static int compare_doubles(const void *a, const void *b) {
+  double x = *(const double *)a, y = *(const double *)b;
+
+  return (x > y) - (x < y);
+}
+
+/*!
+ * Prints the statistics of a set of timings.
+ *
+ * \p name The benchmark name
+ * \p times The timings, sorted in place
+ * \p count The number of timings
+ */
+static void print_stats(const char *name, double *times, unsigned int count) {
+  double sum = 0;
+  unsigned int i;
+
+  qsort(times, count, sizeof(double), compare_doubles);
+
+  for(i = 0; i < count; i++)
+    sum += times[i];
+
+  printf("{\"name\": \"%s\", \"iterations\": %u, \"min_ns\": %.0f, \"median_ns\": %.0f, \"mean_ns\": %.0f}\n",
+    name, count, times[0], times[count / 2], sum / count);
+}
+
+int main(int argc, char** argv) {
+  unsigned int iterations = argc > 2 ? (unsigned int)atoi(argv[2]) : DEFAULT_ITERATIONS;
+  double *init_times, *shutdown_times, start;
+  unsigned int i, err;
+
+  if(argc < 2 || iterations == 0) {
+    fprintf(stderr, "usage: %s library [iterations]\n", argv[0]);
+    return 2;
+  }
+
+  init_times = malloc(iterations * sizeof(double));
+  shutdown_times = malloc(iterations * sizeof(double));
+
+  if(init_times == NULL || shutdown_times == NULL) {
+    fputs("Out of memory\n", stderr);
+    return 1;
+  }
+
+  for(i = 0; i < iterations; i++) {
+    start = now_ns();
+    err = dynacl_init(argv[1]);
+    init_times[i] = now_ns() - start;
+
+    if(err != DYNACL_SUCCESS) {
+      fprintf(stderr, "dynacl_init() returned error %u.\n", err);
+      return 1;
+    }
+
+    start = now_ns();
+    dynacl_shutdown();
+    shutdown_times[i] = now_ns() - start;
+  }
+
+  print_stats("init", init_times, iterations);
+  print_stats("shutdown", shutdown_times, iterations);
+
+  free(init_times);
+  free(shutdown_times);
+
+  return 0;
+}
@@ -1,5 +1,9 @@
+import os
+import sys
 from foundry import *
 from foundry.naming import *
+from foundry import bench
+import codegen
 
 PROJECT_NAME = 'DynaCL'
 LIB_NAME = name_library_static(PROJECT_NAME.lower())
@@ -7,53 +11,165 @@ LIB_NAME = name_library_static(PROJECT_NAME.lower())
 srcdir = 'src/'
 includedir = 'include/'
 testdir = 'test/'
+icddir = testdir + 'icd/'
 
-@Target('compile')
+STUB_SOURCE = icddir + 'opencl_stub.c'
+STUB_NAME = icddir + name_library_dynamic('OpenCL')
+
+benchdir = 'bench/'
+
+BENCH_SOURCE = benchdir + 'init_bench.c'
+BENCH_NAME = benchdir + name_executable('init_bench')
+BENCH_RESULTS = benchdir + 'results.json'
+BENCH_BASELINE = benchdir + 'baseline.json'
+
+def bench_symbols():
+  """ Returns the symbol counts of the benchmark stubs, set with -D:DYNACL_BENCH_SYMBOLS=N,N... """
+  return [int(n) for n in os.environ.get('DYNACL_BENCH_SYMBOLS', '100,1000,10000').split(',')]
+
+def bench_stubs():
+  """ Returns a dictionary mapping the benchmark stub sources to their libraries """
+  return {benchdir + 'stub_{}.c'.format(n): benchdir + name_library_dynamic('OpenCL_{}'.format(n)) for n in bench_symbols()}
+
+# The tests link the loader backend's libraries
+LIBS = '' if sys.platform == 'win32' else '-ldl -pthread'
+
+# Loader variants, selected with -D:NAME=1
+VARIANTS = ('DYNACL_LAZY', 'DYNACL_INSTRUMENT')
+
+def cflags():
+  """ Returns the compiler flags of the selected loader variants """
+  return ' '.join('-D' + v for v in VARIANTS if os.environ.get(v, '0') not in ('', '0'))
+
+def objects_out():
+  return source_object_assoc(dir_filter_ext(srcdir, 'c', cached=True), 'c', 'o').values()
+
+def tests_assoc():
+  return {src: name_executable(src[:-2]) for src in dir_filter_ext(testdir, 'c', subdirs=False, cached=True)}
+
+def tests_out():
+  return tests_assoc().values()
+
+@Target('generate', inputs=('codegen.py',) + codegen.HEADERS + tuple(codegen.TEMPLATES), outputs=tuple(codegen.TEMPLATES.values()))
+def target_generate():
+  """ Generates the entry point tables from the OpenCL headers """
+  if not dry_run():
+    codegen.generate()
+
+@Target('compile', deps=('generate',), inputs=('build.py', srcdir + '**/*.c', srcdir + '**/*.h', includedir + '**/*.h'), outputs=objects_out, options=cflags)
 def target_compile():
   """ Compiles the sources """
-  sources = dir_filter_ext(srcdir, 'c')
+  sources = dir_filter_ext(srcdir, 'c', cached=True)
   objects = source_object_assoc(sources, 'c', 'o')
 
-  for src, obj in objects.items():
-    if needs_compile(src, obj):
-      check_call('gcc -c -o {obj} -I{includedir} {src}'.format(obj=obj, src=src, includedir=includedir))
+  parallel_compile(objects, 'gcc -c -MMD -MF {dep} -o {obj} -I{includedir} {cflags} {src}', includedir=includedir, cflags=cflags())
 
 @Target('build', deps=('compile',), default=True)
 def target_build():
   pass
 
-@Target('clean', deps=('clean-tests',))
+@Target('clean', deps=('clean-tests', 'clean-bench'))
 def target_clean():
-  objects = dir_filter_ext(srcdir, 'o')
+  objects = dir_filter_ext(srcdir, ('o', 'd'), cached=True)
 
   for obj in objects:
     remove(obj)
 
-@Target('build-tests', deps=('build',))
+@Target('build-stub', deps=('generate',), inputs=('build.py', STUB_SOURCE, includedir + '**/*.h'), outputs=(STUB_NAME,))
+def target_stub_build():
+  """ Builds the stub OpenCL library loaded by the tests """
+  parallel_compile({STUB_SOURCE: STUB_NAME}, 'gcc -shared -fPIC -MMD -MF {dep} -o {obj} -I{includedir} {src}', includedir=includedir)
+
+@Target('build-tests', deps=('build', 'build-stub'), inputs=('build.py', testdir + '*.c', includedir + '**/*.h', 'src/dynacl.o'), outputs=tests_out)
 def target_tests_build():
   """ Builds the tests """
-  sources = dir_filter_ext(testdir, 'c')
-  objects = source_object_assoc(sources, 'c', 'exe')
+  objects = tests_assoc()
 
-  for src, exe in objects.items():
-    if needs_compile(src, exe):
-      check_call('gcc -o {exe} -I{includedir} src/dynacl.o {src}'.format(exe=exe, src=src, includedir=includedir))
+  parallel_compile(objects, 'gcc -MMD -MF {dep} -o {obj} -I{includedir} {src} src/dynacl.o {libs}', inputs=('src/dynacl.o',), includedir=includedir, libs=LIBS)
 
 @Target('test', deps=('build-tests',))
 def target_tests_run():
   """ Runs the tests """
-  tests = dir_filter_ext(testdir, ('exe',))
-
-  for test in tests:
+  for test in tests_out():
     print('Running test "{0}"...'.format(test))
-    call(test)
+
+    if call('{} {}'.format(test, STUB_NAME)) != 0:
+      fatal('Test "{}" failed'.format(test))
+
+@Target('test-foundry')
+def target_foundry_tests_run():
+  """ Runs the foundry unit tests """
+  if call('{} -m unittest discover -s {}'.format(sys.executable, testdir + 'python')) != 0:
+    fatal('Foundry tests failed')
 
 @Target('clean-tests')
 def target_tests_clean():
   """ Cleans the tests """
-  tests = dir_filter_ext(testdir, ('exe',))
+  tests = list(tests_out()) + list(dir_filter_ext(testdir, 'd', cached=True)) + [STUB_NAME]
 
   for test in tests:
-    remove(test)
+    if os.path.isfile(test):
+      remove(test)
+
+@Target('build-bench', deps=('build',), inputs=('build.py', 'codegen.py', codegen.STUB_TEMPLATE, BENCH_SOURCE, includedir + '**/*.h', 'src/dynacl.o'), outputs=lambda: [BENCH_NAME] + list(bench_stubs().values()), options=lambda: ','.join(map(str, bench_symbols())))
+def target_bench_build():
+  """ Builds the loader benchmark and its stub OpenCL libraries """
+  stubs = bench_stubs()
+
+  for src, n in zip(stubs, bench_symbols()):
+    if not dry_run():
+      codegen.generate_stub(src, n)
+
+  parallel_compile(stubs, 'gcc -shared -fPIC -MMD -MF {dep} -o {obj} -I{includedir} {src}', includedir=includedir)
+  parallel_compile({BENCH_SOURCE: BENCH_NAME}, 'gcc -O2 -MMD -MF {dep} -o {obj} -I{includedir} {src} src/dynacl.o {libs}', inputs=('src/dynacl.o',), includedir=includedir, libs=LIBS)
+
+def run_bench():
+  """ Runs the loader benchmark on each stub, set the iterations with -D:DYNACL_BENCH_ITERATIONS=N """
+  iterations = int(os.environ.get('DYNACL_BENCH_ITERATIONS', '1000'))
+  results = {}
+
+  for n, stub in zip(bench_symbols(), bench_stubs().values()):
+    results.update(bench.run_benchmark('{} {} {}'.format(BENCH_NAME, stub, iterations), prefix='{} symbols'.format(n)))
+
+  return results
+
+@Target('bench', deps=('build-bench',))
+def target_bench():
+  """ Benchmarks the loader, failing if it is slower than the baseline (-D:DYNACL_BENCH_THRESHOLD=fraction) """
+  results = run_bench()
+  baseline = bench.load_results(BENCH_BASELINE)
+
+  bench.save_results(BENCH_RESULTS, results)
+  bench.report(results, baseline)
+
+  if baseline is None:
+    warn('No benchmark baseline: run the bench-baseline target to record one')
+    return
+
+  regressions = bench.compare(results, baseline, threshold=float(os.environ.get('DYNACL_BENCH_THRESHOLD', bench.default_threshold)))
+
+  for name, metric, base, value in regressions:
+    err('{} {}: {:.0f} over the baseline {:.0f}'.format(name, metric, value, base))
+
+  if regressions:
+    fatal('The loader benchmark regressed')
+
+@Target('bench-baseline', deps=('build-bench',))
+def target_bench_baseline():
+  """ Records the loader benchmark baseline """
+  results = run_bench()
+
+  bench.save_results(BENCH_BASELINE, results)
+  bench.report(results)
+
+@Target('clean-bench')
+def target_bench_clean():
+  """ Cleans the benchmark """
+  stubs = bench_stubs()
+  files = [BENCH_NAME, BENCH_RESULTS] + list(stubs) + list(stubs.values()) + list(dir_filter_ext(benchdir, 'd', cached=True))
+
+  for f in files:
+    if os.path.isfile(f):
+      remove(f)
 
 run_foundry()
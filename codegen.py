@@ -0,0 +1,501 @@
+"""
+DynaCL entry point generator
+
+Parses the OpenCL entry points declared by the OpenCL headers and expands the
+loader templates with them:
+
+  * the function pointer types and variables exported by CL/dynacl.h;
+  * the table of entry points loaded by dynacl_init();
+  * the trampolines of the lazy loader, which resolve each entry point on its
+    first call;
+  * the wrappers of the instrumented loader, which count the calls to each
+    entry point and their time;
+  * the stub OpenCL library the tests load.
+"""
+
+import re
+import os.path
+from foundry import msg, fatal, mkdir
+from foundry.expansion import expand_file
+
+## Headers scanned for entry points, in table order
+HEADERS = ('include/CL/cl.h', 'include/CL/cl_gl.h', 'include/CL/cl_ext.h')
+
+## Header which declares the core entry points, as function pointer types only
+CORE_HEADER = 'include/CL/cl.h'
+
+## Templates and the files they are expanded to
+TEMPLATES = {
+  'templates/dynacl_entries.h.in': 'include/CL/dynacl_entries.h',
+  'templates/dynacl_table.h.in': 'src/dynacl_table.h',
+  'templates/dynacl_lazy.h.in': 'src/dynacl_lazy.h',
+  'templates/dynacl_instrument.h.in': 'src/dynacl_instrument.h',
+  'templates/opencl_stub.c.in': 'test/icd/opencl_stub.c'
+}
+
+## Entry point name suffixes of the extensions, which are looked up through clGetExtensionFunctionAddress() too
+EXTENSION_SUFFIXES = ('KHR', 'EXT', 'APPLE', 'QCOM', 'AMD', 'NV', 'INTEL', 'ARM')
+
+## Words the core entry point names are made of. CL/cl.h only names the
+## function pointer types (e.g. CLGETPLATFORMIDS_PTR), so the entry point
+## names are rebuilt from these words.
+WORDS = (
+  'Address', 'Arg', 'Barrier', 'Binary', 'Buffer', 'Build', 'Callback',
+  'Command', 'Compiler', 'Context', 'Copy', 'Create', 'Destructor', 'Device',
+  'Enqueue', 'Event', 'Events', 'Extension', 'Finish', 'Flush', 'For',
+  'Formats', 'From', 'Function', 'Get', 'Group', 'IDs', 'Image', 'Image2D',
+  'Image3D', 'In', 'Info', 'Kernel', 'Kernels', 'Map', 'Marker', 'Mem',
+  'NDRange', 'Native', 'Object', 'Platform', 'Profiling', 'Program',
+  'Property', 'Queue', 'Read', 'Rect', 'Release', 'Retain', 'Sampler', 'Set',
+  'Source', 'Status', 'Sub', 'Supported', 'Task', 'To', 'Type', 'Unload',
+  'Unmap', 'User', 'Wait', 'With', 'Work', 'Write'
+)
+
+## Entry point kinds, as named in the generated table
+REQUIRED = 'DYNACL_ENTRY_REQUIRED'
+OPTIONAL = 'DYNACL_ENTRY_OPTIONAL'
+EXTENSION = 'DYNACL_ENTRY_EXTENSION'
+
+## Stub OpenCL library template
+STUB_TEMPLATE = 'templates/opencl_stub.c.in'
+
+## Type qualifiers, which never name a parameter
+QUALIFIERS = ('const', 'volatile', 'signed', 'unsigned', 'struct', 'enum')
+
+## Value returned by the trampolines of the cl_int entry points which cannot be resolved
+UNRESOLVED_ERROR = 'CL_INVALID_OPERATION'
+
+## Marks the C++ only blocks of a header, which are skipped
+_CPLUSPLUS = object()
+
+_comment_re = re.compile(r'/\*.*?\*/|//[^\n]*', re.S)
+_typedef_re = re.compile(r'typedef\s+CL_API_ENTRY\s+(?P<ret>[^(]+?)\s*\(\s*CL_API_CALL\s*\*\s*(?P<type>CL\w+_PTR)\s*\)\s*\((?P<params>.*)\)\s*\w*$', re.S)
+_fnptr_re = re.compile(r'\(\s*((?:CL_CALLBACK\s*)?\*)\s*\w*\s*\)')
+_proto_re = re.compile(r'^(?:extern\s+)?(?P<ret>.*?CL_API_ENTRY.*?)\s*\b(?P<name>cl\w+)\s*\((?P<params>.*)\)\s*\w*$', re.S)
+
+class Entry:
+  """!
+    An OpenCL entry point.
+  """
+  def __init__(self, name, ret, params, ptr_type, typedef, condition, kind):
+    """!
+      \param name The entry point name
+      \param ret The return type
+      \param params A list of the parameter declarations, without names
+      \param ptr_type The function pointer type name
+      \param typedef True if the function pointer type must be generated
+      \param condition A list of the preprocessor conditions the entry point is declared under
+      \param kind The entry point kind: REQUIRED, OPTIONAL or EXTENSION
+    """
+
+    ## Entry point name
+    self.name = name
+
+    ## Return type
+    self.ret = ret
+
+    ## Parameter declarations
+    self.params = params
+
+    ## Function pointer type name
+    self.ptr_type = ptr_type
+
+    ## True if the function pointer type is not declared by the OpenCL headers
+    self.typedef = typedef
+
+    ## Preprocessor conditions
+    self.condition = tuple(condition)
+
+    ## Entry point kind
+    self.kind = kind
+
+  def variable(self):
+    """!
+      \return The name of the function pointer variable. Entry points declared
+        as functions by the OpenCL headers use a prefixed variable, mapped to
+        the entry point name by a macro
+    """
+    return self.name if not self.typedef else 'dynacl_' + self.name
+
+  def trampoline(self):
+    """!
+      \return The definition of the lazy loader trampoline of the entry point
+    """
+    args = self.args()
+    call = '(({})dynacl_load_acquire(&DYNACL_TARGET({})))({})'.format(self.ptr_type, self.name, ', '.join(args))
+
+    if self.ret == 'void':
+      unresolved, resolved = 'return;', call + ';'
+    elif self.ret == 'cl_int':
+      unresolved, resolved = 'return {};'.format(UNRESOLVED_ERROR), 'return {};'.format(call)
+    else:
+      unresolved, resolved = 'return ({})0;'.format(self.ret), 'return {};'.format(call)
+
+      # Objects are created with an error code pointer last
+      if self.params and self.params[-1] in ('cl_int *', 'int *'):
+        unresolved = 'if({0}) *{0} = {1};\n    {2}'.format(args[-1], UNRESOLVED_ERROR, unresolved)
+
+    return '\n'.join((
+      'static {} CL_API_CALL dynacl_lazy_{}({}) {{'.format(self.ret, self.name, self.named_params()),
+      '  if(!dynacl_resolve("{0}", (dynacl_function *)&DYNACL_TARGET({0}), {1})) {{'.format(self.name, self.kind),
+      '    ' + unresolved,
+      '  }',
+      '',
+      '  ' + resolved,
+      '}'
+    ))
+
+  def wrapper(self):
+    """!
+      \return The declarations of the function pointer called by the
+        instrumented loader wrapper of the entry point, of its call counter
+        and the definition of the wrapper
+    """
+    call = '(({})dynacl_load_acquire(&dynacl_real_{}))({})'.format(self.ptr_type, self.name, ', '.join(self.args()))
+    lines = [
+      'static {} dynacl_real_{} = NULL;'.format(self.ptr_type, self.name),
+      'static dynacl_counter dynacl_counter_{};'.format(self.name),
+      '',
+      'static {} CL_API_CALL dynacl_instrument_{}({}) {{'.format(self.ret, self.name, self.named_params())
+    ]
+
+    if self.ret == 'void':
+      lines += [
+        '  unsigned long long start = dynacl_now();',
+        '',
+        '  {};'.format(call),
+        '  dynacl_count(&dynacl_counter_{}, start);'.format(self.name)
+      ]
+    else:
+      lines += [
+        '  unsigned long long start = dynacl_now();',
+        '  {} result = {};'.format(self.ret, call),
+        '',
+        '  dynacl_count(&dynacl_counter_{}, start);'.format(self.name),
+        '',
+        '  return result;'
+      ]
+
+    return '\n'.join(lines + ['}'])
+
+  def stub(self):
+    """!
+      \return The definition of the entry point in the stub OpenCL library:
+        it does nothing and succeeds, except for the object constructors,
+        which fail
+    """
+    args = self.args()
+    body = ['  (void){};'.format(a) for a in args]
+
+    if self.ret == 'cl_int':
+      body.append('  return CL_SUCCESS;')
+    elif self.ret != 'void':
+      if self.params and self.params[-1] in ('cl_int *', 'int *'):
+        body.append('  if({0}) *{0} = CL_OUT_OF_RESOURCES;'.format(args[-1]))
+
+      body.append('  return ({})0;'.format(self.ret))
+
+    return '\n'.join(['CL_API_ENTRY {} CL_API_CALL {}({}) {{'.format(self.ret, self.name, self.named_params())] + body + ['}'])
+
+  def args(self):
+    """!
+      \return A list of the parameter names used by the generated definitions
+    """
+    return ['a{}'.format(i) for i in range(len(self.params))]
+
+  def named_params(self):
+    """!
+      \return The parameter list of the generated definitions
+    """
+    return ', '.join(name_param(p, a) for p, a in zip(self.params, self.args())) or 'void'
+
+def entry_name(ptr_type):
+  """!
+    Rebuilds an entry point name from its function pointer type name.
+
+    \param ptr_type The function pointer type name, e.g. CLGETPLATFORMIDS_PTR
+
+    \return The entry point name, e.g. clGetPlatformIDs
+  """
+  upper = ptr_type[2:-4]
+  words = {w.upper(): w for w in WORDS}
+
+  # best[i] holds the shortest split of upper[:i]
+  best = [[]] + [None] * len(upper)
+
+  for end in range(1, len(upper) + 1):
+    for start in range(end):
+      word = words.get(upper[start:end])
+
+      if word is not None and best[start] is not None:
+        split = best[start] + [word]
+
+        if best[end] is None or len(split) < len(best[end]):
+          best[end] = split
+
+  if best[-1] is None:
+    fatal('Cannot name the entry point of {}: add its words to codegen.WORDS'.format(ptr_type))
+
+  return 'cl' + ''.join(best[-1])
+
+def split_params(params):
+  """!
+    Splits a parameter list on its top level commas.
+
+    \param params The parameter list, without the enclosing parentheses
+
+    \return A list of parameter declarations, empty for \p void
+  """
+  result = []
+  depth = 0
+  word = ''
+
+  for c in params:
+    if c == ',' and depth == 0:
+      result.append(word.strip())
+      word = ''
+      continue
+
+    depth += (c == '(') - (c == ')')
+    word += c
+
+  if word.strip() and word.strip() != 'void':
+    result.append(word.strip())
+
+  return result
+
+def name_param(param, name):
+  """!
+    Names a parameter declaration, replacing its name if it has one.
+
+    \param param The parameter declaration, e.g. \p const char ** or \p void (CL_CALLBACK *pfn_notify)(void *)
+    \param name The parameter name
+
+    \return The named parameter declaration
+  """
+  if '(' in param: # Function pointer
+    return _fnptr_re.sub(lambda m: '({} {})'.format(m.group(1), name), param, count = 1)
+
+  tokens = re.findall(r'\w+|\*', param)
+  types = [t for t in tokens if t not in QUALIFIERS]
+
+  if len(types) > 1 and types[-1] != '*':
+    param = param[:param.rindex(types[-1])].rstrip()
+
+  return '{} {}'.format(param, name)
+
+def _normalize(text):
+  """! Collapses the whitespace of a declaration """
+  return re.sub(r'\s+', ' ', text).replace('( ', '(').replace(' )', ')').strip()
+
+def parse_header(path):
+  """!
+    Parses the entry points declared by an OpenCL header.
+
+    Entry points are declared either as function pointer types
+    (\p typedef CL_API_ENTRY ret (CL_API_CALL *NAME_PTR)(...)) or as functions
+    (\p extern CL_API_ENTRY ret CL_API_CALL name(...)). The preprocessor
+    conditions they are declared under are kept, except for include guards
+    and C++ guards.
+
+    \param path The header path
+
+    \return A list of Entry objects
+  """
+  with open(path, 'r', encoding = 'utf_8') as header:
+    text = _comment_re.sub(' ', header.read())
+
+  entries = []
+  conditions = []
+  statement = ''
+  lines = text.split('\n')
+
+  for i, line in enumerate(lines):
+    stripped = line.strip()
+
+    if stripped.startswith('#'):
+      directive = stripped[1:].split(None, 1) + ['']
+      keyword, arg = directive[0], directive[1].strip()
+      next_line = lines[i + 1].strip() if i + 1 < len(lines) else ''
+
+      if keyword == 'ifndef' and next_line.replace(' ', '') == '#define' + arg:
+        conditions.append(None) # Include guard
+      elif keyword == 'ifdef' and arg == '__cplusplus':
+        conditions.append(_CPLUSPLUS)
+      elif keyword == 'ifdef':
+        conditions.append('defined(' + arg + ')')
+      elif keyword == 'ifndef':
+        conditions.append('!defined(' + arg + ')')
+      elif keyword == 'if':
+        conditions.append('(' + arg + ')')
+      elif keyword == 'else' and conditions and conditions[-1] not in (None, _CPLUSPLUS):
+        conditions[-1] = '!' + conditions[-1]
+      elif keyword == 'endif' and conditions:
+        conditions.pop()
+
+      continue
+
+    if _CPLUSPLUS in conditions:
+      continue
+
+    statement += line + '\n'
+
+    if ';' not in line:
+      continue
+
+    for decl in statement.split(';')[:-1]:
+      entry = _parse_declaration(path, _normalize(decl), [c for c in conditions if c not in (None, _CPLUSPLUS)])
+
+      if entry is not None:
+        entries.append(entry)
+
+    statement = statement.split(';')[-1]
+
+  msg('Found {} entry points in "{}"'.format(len(entries), path), v = 5)
+  return entries
+
+def _parse_declaration(path, decl, condition):
+  """!
+    Parses a declaration.
+
+    \return An Entry object, or \p None if \p decl does not declare an entry point
+  """
+  if 'CL_API_ENTRY' not in decl:
+    return None
+
+  m = _typedef_re.match(decl)
+
+  if m is not None:
+    if path != CORE_HEADER:
+      return None # Extension function pointer types duplicate their prototypes
+
+    return Entry(entry_name(m.group('type')), m.group('ret'), split_params(m.group('params')), m.group('type'), False, condition, REQUIRED)
+
+  if decl.startswith('typedef'):
+    return None
+
+  m = _proto_re.match(decl)
+
+  if m is None:
+    return None
+
+  name = m.group('name')
+  ret = _normalize(re.sub(r'\b(CL_API_ENTRY|CL_API_CALL|extern)\b', ' ', m.group('ret')))
+  kind = EXTENSION if name.endswith(EXTENSION_SUFFIXES) else OPTIONAL
+
+  return Entry(name, ret, split_params(m.group('params')), 'CL' + name[2:].upper() + '_PTR', True, condition, kind)
+
+def parse_headers(headers = HEADERS):
+  """!
+    Parses the entry points declared by a set of OpenCL headers.
+
+    \param headers An iterable object containing the header paths
+
+    \return A list of Entry objects, without duplicates
+  """
+  entries = []
+  names = set()
+
+  for path in headers:
+    for entry in parse_header(path):
+      if entry.name not in names:
+        names.add(entry.name)
+        entries.append(entry)
+
+  return entries
+
+def _guarded(entries, line_f):
+  """!
+    Formats a line for each entry, wrapping the lines in the preprocessor
+    conditions of their entries.
+  """
+  lines = []
+  current = ()
+
+  for entry in entries:
+    if entry.condition != current:
+      if current:
+        lines.append('#endif')
+      if entry.condition:
+        lines.append('#if ' + ' && '.join(entry.condition))
+      current = entry.condition
+
+    lines.append(line_f(entry))
+
+  if current:
+    lines.append('#endif')
+
+  return '\n'.join(lines)
+
+def template_vars(entries):
+  """!
+    Computes the template variables.
+
+    \param entries A list of Entry objects
+
+    \return A dictionary of variables/values
+  """
+  generated = [e for e in entries if e.typedef]
+
+  return {
+    'SOURCES': ', '.join(os.path.basename(h) for h in HEADERS),
+    'COUNT': str(len(entries)),
+    'TYPEDEFS': _guarded(generated, lambda e: 'typedef CL_API_ENTRY {} (CL_API_CALL *{})({});'.format(e.ret, e.ptr_type, ', '.join(e.params) or 'void')),
+    'POINTERS': _guarded(entries, lambda e: 'DYNACL_EXTERN {} {} DYNACL_NULLPTR;'.format(e.ptr_type, e.variable())),
+    'MACROS': _guarded(generated, lambda e: '#define {} {}'.format(e.name, e.variable())),
+    'TABLE': _guarded(entries, lambda e: 'DYNACL_ENTRY({}, {})'.format(e.name, e.kind)),
+    'TRAMPOLINES': _guarded(entries, lambda e: e.trampoline() + '\n'),
+    'WRAPPERS': _guarded(entries, lambda e: e.wrapper() + '\n'),
+    'STUBS': _guarded(entries, lambda e: e.stub() + '\n')
+  }
+
+def generate(templates = TEMPLATES, headers = HEADERS):
+  """!
+    Expands the loader templates from the OpenCL headers. Files whose content
+    does not change are not written.
+
+    \param templates A dictionary mapping the templates to their output files
+    \param headers An iterable object containing the header paths
+
+    \return A list of the files which have been written
+  """
+  vars = template_vars(parse_headers(headers))
+  written = []
+
+  for src, dest in templates.items():
+    mkdir(os.path.dirname(dest))
+
+    if expand_file(src, dest, vars, overwrite = True, changed_only = True):
+      msg('Generated "{}"'.format(dest))
+      written.append(dest)
+
+  return written
+
+def generate_stub(dest, symbols = None, template = STUB_TEMPLATE, headers = HEADERS):
+  """!
+    Expands a stub OpenCL library exporting a given number of symbols: the
+    entry points, followed by as many filler functions as needed. The
+    fillers make the symbol table as large as the one of a real OpenCL
+    library, for benchmarking.
+
+    \param dest The output file path
+    \param symbols The number of exported symbols, which cannot be less than the number of entry points. \p None to export the entry points only
+    \param template The stub template path
+    \param headers An iterable object containing the header paths
+
+    \return True if the file has been written
+  """
+  entries = parse_headers(headers)
+
+  if symbols is None:
+    symbols = len(entries)
+  elif symbols < len(entries):
+    fatal('Cannot generate a stub exporting {} symbols: the headers declare {} entry points'.format(symbols, len(entries)))
+
+  vars = template_vars(entries)
+  fillers = ['int dynacl_filler_{0}(void) {{ return {0}; }}'.format(i) for i in range(symbols - len(entries))]
+
+  vars['STUBS'] += '\n' + '\n'.join(fillers)
+  mkdir(os.path.dirname(dest))
+
+  return expand_file(template, dest, vars, overwrite = True, changed_only = True)
@@ -19,45 +19,176 @@ Babilonia project: Utility library and framework for C11/Python3
 import sys
 import os
 import os.path
-import concurrent.futures
-import subprocess
+import threading
+import time
+import functools
+
+from .log import fatal, err, msg, warn, set_verbosity, get_verbosity
 
 ## Module version
 __version__ = '0.0.11'
 
-## Verbosity level
-_verbosity = 4
+## Objects of the submodules re-exported by this module, imported on first use: name -> submodule
+_lazy_exports = {
+  'BuildDatabase': 'database',
+  'IncludeGraph': 'depends',
+  'parse_deps': 'depends',
+  'ObjectCache': 'cache',
+  'Profiler': 'profiling',
+  'AtomicWriter': 'atomic',
+  'write_if_changed': 'atomic',
+  'FileIndex': 'fileindex',
+  'JobServer': 'jobs',
+  'JobResult': 'jobs',
+  'run_job': 'jobs'
+}
 
 ## Number of threads for parallel-enabled operations
 _parallel_queues = 1
 
+## Polling interval of the watch mode, in seconds. None if the watch mode is disabled
+_watch_interval = None
+
+## Default polling interval of the watch mode, in seconds
+_watch_default_interval = 0.5
+
 if __name__ == '__main__':
   print('This module cannot be run on its own', file=sys.stderr)
   os.abort()
 
-# Ensure the CWD is always the script's directory
-os.chdir(os.path.dirname(os.path.abspath(sys.argv[0])))
-  
+## Build database file path, relative to the script's directory
+_database_path = '.foundry.db'
+
+## Build database, loaded on first use
+_database = None
+
+_database_lock = threading.Lock()
+
+## Dependencies read from the dependency files, loaded on first use
+_include_graph = None
+
+_include_graph_lock = threading.Lock()
+
+## Environment variable holding the object cache directory. The object cache is disabled if it is not set
+_cache_dir_var = 'FOUNDRY_CACHE_DIR'
+
+## Environment variable holding the object cache maximum size, in MiB
+_cache_size_var = 'FOUNDRY_CACHE_SIZE'
+
+## Default object cache maximum size, in MiB
+_cache_default_size = 1024
+
+## Object cache, loaded on first use. False if disabled
+_object_cache = None
+
+_object_cache_lock = threading.Lock()
+
+## Extensions of the source files handed to the compiler
+_cache_source_ext = ('.c', '.cc', '.cpp', '.cxx', '.m', '.S')
+
+## Compiler options which are dropped, along with their value, when preprocessing
+_cache_output_opts = ('-o', '-MF', '-MT', '-MQ')
+
+## Compiler options whose value is a separate argument
+_cache_value_opts = ('-I', '-D', '-U', '-L', '-l', '-x', '-include', '-imacros', '-isystem', '-iquote', '-idirafter')
+
+## Environment variable listing the remote workers
+_remote_var = 'FOUNDRY_REMOTE'
+
+## Remote worker pool, created on first use. False if disabled
+_remote_pool = None
+
+_remote_pool_lock = threading.Lock()
+
+## File indexes built during this run: (path, subdirs) -> FileIndex
+_file_indexes = {}
+
+_file_indexes_lock = threading.Lock()
+
+## Build profiler, None unless profiling has been enabled (see --profile and --trace:)
+_profiler = None
+
+## Trace event output file path, None if not requested
+_trace_path = None
+
+## JSON build report output file path, None if not requested
+_report_path = None
+
+## Job slots shared by the external programs, created on first use
+_job_server = None
+
+_job_server_lock = threading.Lock()
+
+## JobResult objects of the external programs run so far
+_job_history = []
+
+## Serializes the output of the external programs
+_output_lock = threading.Lock()
+
+## True if the commands are only printed, see dry_run()
+_dry_run = False
+
+## Commands a dry run would run: (target name, command line) tuples
+_planned_commands = []
+
+## Files a dry run would write
+_planned_outputs = set()
+
+## Per-thread state: the target being run and its buffered output
+_tracking = threading.local()
+
 ## Registered targets
 _targets = {}
 
 ## Default target
 _default_target = None
 
-def Target(name, deps = [], repeatable = False, default = False, private = False):
+def __getattr__(name):
+  """!
+    Imports the submodule objects this module re-exports on first use, so
+    that importing foundry only loads what the build script needs.
+
+    \param name The attribute name
+
+    \throws AttributeError If \p name is not re-exported from a submodule
+  """
+  if name not in _lazy_exports:
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+  import importlib
+
+  value = getattr(importlib.import_module('.' + _lazy_exports[name], __name__), name)
+  globals()[name] = value
+
+  return value
+
+def Target(name, deps = [], repeatable = False, default = False, private = False, inputs = None, outputs = None, options = None):
   """!
     Target decorator
+
+    A target declaring its outputs is skipped when they are up to date with
+    its inputs: the outputs must all exist and the inputs must either match
+    the hashes recorded the last time the target ran or, if there is no such
+    record, be older than the outputs.
+
+    Inputs and outputs are given as a glob pattern (\p ** matches any number
+    of subdirectories), a callable object returning an iterable object of
+    file paths, or a list of those. The outputs are also out of date when the
+    options, e.g. the compiler flags, differ from the last run.
     
     \param name The target name
     \param deps A list of dependencies
     \param repeatable True if the target should be called more than once
     \param default True if this target should be the default target
     \param private True if the target should not appear in the target list
+    \param inputs The files the target reads
+    \param outputs The files the target writes
+    \param options A string, or a callable object returning one, holding the settings the outputs depend on besides the inputs
   """
   def wrap(func):
     global _targets, _default_target
     
-    _targets[name] = _Target(name, func, deps, repeatable, default, private)
+    _targets[name] = _Target(name, func, deps, repeatable, default, private, inputs, outputs, options)
     
     if default:
       _default_target = _targets[name]
@@ -73,7 +204,7 @@ class _Target:
   """!
     This private class represents a target inside the module.
   """
-  def __init__(self, name, func, deps = [], repeatable = False, default = False, private = False):
+  def __init__(self, name, func, deps = [], repeatable = False, default = False, private = False, inputs = None, outputs = None, options = None):
     """!
       \param name The target name
       \param func The target function
@@ -81,6 +212,9 @@ class _Target:
       \param repeatable True if the target can be called multiple times
       \param default True if the target is the default target
       \param private True if the target should not appear in the target list
+      \param inputs The declared input files, see Target()
+      \param outputs The declared output files, see Target()
+      \param options The declared options, see Target()
     """
     
     ## Target name
@@ -103,343 +237,1539 @@ class _Target:
     
     ## Target has already been called
     self.called = False
-    
-    ## Target is currently being called
-    self.calling = False # True if the target is currently being called
+
+    ## Declared inputs, None if not declared
+    self.inputs = _file_spec(inputs)
+
+    ## Declared outputs, None if not declared
+    self.outputs = _file_spec(outputs)
+
+    ## Declared options, None if not declared
+    self.options = options
+
+    ## Why the target has been skipped in its last call, None if it has been run
+    self.skip_reason = None
+
+    ## Outcome of the last call: 'run', 'skipped' or 'failed', None if not called yet
+    self.status = None
+
+    ## Wall time of the last call, in seconds
+    self.duration = None
+
+    ## Files and directories read by the target during its last run
+    self.tracked_inputs = set()
     
   def call(self):
     """!
-      Calls the target function, if it should be called.
+      Calls the target function, if it should be called, along with its
+      dependencies.
+
+      \see _run_targets()
     """
-    self.calling = True
-    
-    if not self.called or self.repeatable:
-      for dep in self.dependencies:
-        try:
-          if not _targets[dep].calling:
-            _targets[dep].call()
-          else:
-            warn('Cyclic dependencies detected [' + self.name + ', ' + _targets[dep].name + ']')
-        except KeyError:
-          err('Unknown target \'' + dep + '\' dependency of \'' + self.name + '\'')
-          sys.exit(1)
-          
+    _run_targets((self,))
+
+  def _run(self):
+    """!
+      Runs the target function, without checking its dependencies.
+    """
+    self.tracked_inputs = set()
+    self.skip_reason = None
+    begin = time.perf_counter()
+    # The directories scanned for the declared files are inputs too, so that new files are noticed
+    _tracking.target = self
+
+    try:
+      if self.outputs is not None:
+        inputs = _expand_file_spec(self.inputs)
+        outputs = _expand_file_spec(self.outputs)
+        _track_inputs(inputs)
+        self.skip_reason = self._up_to_date(inputs, outputs)
+
+        if self.skip_reason is not None:
+          msg('Skipping target: {} ({})'.format(self.name, self.skip_reason))
+          self.status = 'skipped'
+          self.called = True
+          return
+
       msg('Current target: ' + self.name)
-      self.target()
-      self.called = True
-    
-    self.calling = False
-    print()
+      self.status = 'failed'
 
-@Target('targets', default=True, private=True)
-def target_targets():
-  """! Prints this message. """
-  for tgt in _targets:
-    if _targets[tgt].private is False:
-      print(tgt + (' (DEFAULT)' if _targets[tgt].default else ''), end='')
-      
-      if _targets[tgt].target.__doc__ != None:
-        print(' - ' + _targets[tgt].target.__doc__.strip())
+      with _measure('target ' + self.name, 'target'):
+        self.target()
+    finally:
+      _tracking.target = None
+      self.duration = time.perf_counter() - begin
+
+    if self.outputs is not None:
+      if _dry_run:
+        _plan_outputs(outputs)
       else:
-        print()
-      
-def call_target(tgt):
-  """!
-    Calls a target function.
-    
-    \param tgt The target function
-  """
-  if tgt in _targets:
-    _targets[tgt].call()
-  else: target_targets()
-  
-def fatal(s):
-  """!
-    Prints an error message and exits.
-  
-    \param s The error message to log
-  """
-  err(s)
-  sys.exit(1)
-  
-def err(s, fatal = False):
-  """!
-    Prints an error message.
-    
-    \param s The error message to log
-    \param fatal True if this is a fatal error
-  """
-  if (_verbosity > 0 and fatal) or (_verbosity > 1):
-    print(('ERROR: ' if not fatal else 'FATAL: ') + s, file=sys.stderr)
-  
-def msg(s, v = 4):
-  """!
-    Logs a message.
-  
-    \param s The message to log
-    \param v The verbosity of the message
+        build_database().record(self._record_key(), self._record_command(inputs), inputs)
 
-    \see set_verbosity()
-  """
-  if _verbosity >= v:
-    print(s if v < 5 else 'DEBUG: ' + s)
-  
-def warn(s):
-  """!
-    Warning message logging.
-  
-    \param s The warning message to log
-  """
-  if _verbosity >= 3:
-    print('Warning: ' + s, file=sys.stderr)
+    self.status = 'run'
+    self.called = True
+    print()
 
-def _handle_switch(sw):
-  """!
-    Handles switches in command line.
-    
-    \param sw The switch to handle
-  """
-  try:
-    if sw.startswith('-v:'):
-      set_verbosity(int(sw[3:]))
-    elif sw == '-h' or sw == '--help':
-      _help()
-      sys.exit(0)
-    elif sw.startswith('-D:'):
-      _export_switch_variable(sw[3:])
-    elif sw.startswith('-n:'):
-      global _parallel_queues
-      _parallel_queues = int(sw[3:])
-      msg('Set {} parallel queues.'.format(_parallel_queues), v = 5)
-    else:
-      err('Unknown switch value "{}"'.format(sw))
-      _help()
-      sys.exit(1)
-  except ValueError:
-    err('Error in command line arguments')
-    _help()
-    sys.exit(1)
+  def _record_key(self):
+    """! Returns the key of the target record in the build database """
+    return '@' + self.name
 
-def _export_switch_variable(svar):
-  """! Exports a command line variable
-    Exports a command line variable as an environment variable.
+  def _record_command(self, inputs):
+    """! Returns the command of the target record in the build database: its inputs and options """
+    options = self.options() if callable(self.options) else self.options
+    command = '\n'.join(inputs)
 
-    \param svar The variable in the form 'name=value'
-  """
-  var = svar.split('=', 1)
+    return command if options is None else command + '\n@' + options
 
-  os.environ[var[0]] = var[1]
+  def _up_to_date(self, inputs, outputs):
+    """!
+      Checks whether the declared outputs are up to date.
 
-def _help():
-  """! Shows the foundry help message """
-  print('Babilonia\'s Foundry command line switches:')
-  print()
+      \param inputs A list of the declared input files
+      \param outputs A list of the declared output files
 
-  print('\t-v:N\t\tSets the verbosity of the build script (1 to 5)')
-  print('\t-h\n\t--help\t\tShows this message')
-  print('\t-D:name=value\tManually define an environment variable')
+      \return A string telling why the outputs are up to date, or \p None if they are not
+    """
+    if not outputs or not all(os.path.isfile(f) for f in outputs) or _planned(inputs):
+      return None
 
-def _handle_switches():
-  """! Checks the command line switches
+    unchanged = build_database().is_unchanged(self._record_key(), self._record_command(inputs))
+
+    if unchanged is not None:
+      return 'inputs unchanged' if unchanged else None
+
+    try:
+      oldest = min(os.path.getmtime(f) for f in outputs)
+
+      if all(os.path.getmtime(f) <= oldest for f in inputs):
+        return 'outputs newer than inputs'
+    except OSError:
+      pass
+
+    return None
+
+def _file_spec(spec):
+  """!
+    Normalizes a file specification given to Target().
+
+    \return A tuple of glob patterns and callable objects, or \p None
   """
-  for arg in sys.argv[1:]:
-    if arg.startswith('-'):
-      _handle_switch(arg)
+  if spec is None:
+    return None
 
-def run_foundry():
+  if isinstance(spec, str) or callable(spec):
+    return (spec,)
+
+  return tuple(spec)
+
+def _expand_file_spec(spec):
   """!
-    Runs the foundry standard behavior.
+    Expands a file specification normalized by _file_spec(). The
+    directories the glob patterns are matched in are recorded as inputs of
+    the target being run, see _track_inputs().
+
+    \return A sorted list of file paths, without duplicates
   """
-  called_target = False
-  
-  for arg in sys.argv[1:]:
-    if not arg.startswith('-'):
-      call_target(arg)
-      called_target = True
-      
-  if not called_target:
-    if _default_target is not None:
-      _default_target.call()
+  import glob
+
+  files = set()
+
+  for item in spec or ():
+    if callable(item):
+      files.update(os.path.normpath(f) for f in item())
     else:
-      warn('Default target not set')
-      print()
-      target_targets()
+      files.update(os.path.normpath(f) for f in glob.glob(item, recursive = True))
 
-def dir_filter(src, filter, subdirs = True):
+      if glob.has_magic(item):
+        _track_inputs(_glob_dirs(item))
+
+  return sorted(files)
+
+def _glob_dirs(pattern):
   """!
-    Filters the files contained in \p src (or in its full tree) according to
-    a filter function.
-    
-    The filter function must accept a file path as its argument and return
-    True if the file should be added to the output, False if not.
-    
-    \param src The toplevel directory path
-    \param filter A callable object which accepts a file path relative to \p src and returns a boolean value
-    \param subdirs True if the output should also contain files in subdirectories
-    
-    \return An iterable object containing the filtered files of \p src
+    Returns the directories a glob pattern is matched in: the ones whose
+    contents its last component is matched against.
+
+    \param pattern A glob pattern, see Target()
+
+    \return A list of directory paths
   """
-  files = []
-  
-  for f in os.listdir(src):
-    fpath = os.path.join(src, f)
-    if os.path.isdir(fpath):
-        if subdirs: files += dir_filter(fpath, filter, subdirs)
-    elif filter(fpath):
-      fpath = os.path.normpath(fpath)
-      files.append(fpath)
-      msg('Filter accepted file ' + fpath, v = 5)
-  
-  return files
-  
-def dir_filter_all(src, subdirs = True):
+  import glob
+
+  base = os.path.dirname(pattern)
+
+  if not glob.has_magic(base):
+    return [base or os.curdir]
+
+  return [d for d in glob.glob(base, recursive = True) if os.path.isdir(d)]
+
+def _target_graph(roots):
   """!
-    Returns all files contained in a directory (tree).
+    Builds the dependency graph of a set of targets.
 
-    \param src The toplevel directory path
-    \param subdirs True if the output should also contain files in subdirectories
+    Targets which have already been called and are not repeatable are left
+    out of the graph, as are the edges leading to them. Cyclic dependencies
+    are reported and the offending edge is ignored.
 
-    \return An iterable object containing the files of \p src
-  """
-  return dir_filter(src, lambda x: True, subdirs)
+    The roots are run in the order given: the targets a root brings into
+    the graph, besides the ones an earlier root needs, also depend on the
+    previous root.
 
-def dir_filter_ext(src, ext, subdirs = True):
-  """! Filters files by extension
-    Filters the files contained in \p src (or in its full tree) according to
-    the supplied extensions.
+    \param roots An iterable object containing the targets to resolve
 
-    \param src The toplevel directory path
-    \param ext An iterable object containing the file extensions to filter (without dot)
-    \param subdirs True if the output should also contain files in subdirectories
-    
-    \return An iterable object containing the filtered files of \p src
-    
-    \sa dir_filter()
+    \return A tuple made of the list of targets in topological order and of a
+      dictionary mapping each target to the set of targets it depends on
   """
-  return dir_filter(src, lambda f: f.endswith(tuple(set(['.' + x for x in ext]))), subdirs)
-  
-def dir_filter_filename(src, fnames, remove_ext = False, subdirs = True):
-  """! Filters files by name
-    Filters the files contained in \p src (or in its full tree) according to
-    the supplied filename.
+  order = []
+  deps = {}
+  visiting = set()
 
-    \param src The toplevel directory path
-    \param fnames An iterable object containing the file names to filter
-    \param remove_ext True to remove the extension before checking the filename, False to check the file along with its extension
-    \param subdirs True if the output should also contain files in subdirectories
-    
-    \return An iterable object containing the filtered files of \p src
-    
-    \sa dir_filter()
-  """
-  def filter_f(f):
-    f = os.path.basename(f) if not remove_ext else os.path.splitext(os.path.basename(f))[0]
-    return f in fnames
-  return dir_filter(src, filter_f, subdirs)
+  def visit(tgt):
+    visiting.add(tgt)
+    deps[tgt] = set()
 
-def source_object_assoc(sources, sext, oext):
-  """! Associates sources with default objects
-    Creates a dictionary object of which the keys are the provided source files
-    and the values are their object file names. The default object file names
-    are the source file names without their extension to which is appended the
-    object file extension provided.
-    
-    \param sources An iterable object containing the source files
-    \param sext The source file extension (without dot)
-    \param oext The object file extension (without dot)
-  """
-  se_len = len(sext)
-  srcs = tuple(sources)
+    for dep in tgt.dependencies:
+      try:
+        dep_tgt = _targets[dep]
+      except KeyError:
+        err('Unknown target \'' + dep + '\' dependency of \'' + tgt.name + '\'')
+        sys.exit(1)
 
-  return dict(zip(srcs, [f[:-se_len] + oext for f in srcs]))
+      if dep_tgt in visiting:
+        warn('Cyclic dependencies detected [' + tgt.name + ', ' + dep_tgt.name + ']')
+      elif dep_tgt.called and not dep_tgt.repeatable:
+        pass
+      else:
+        if dep_tgt not in deps:
+          visit(dep_tgt)
+        deps[tgt].add(dep_tgt)
 
-def set_verbosity(v):
-  """! Sets the verbosity level
-    Sets the verbosity level to \p v. \p v must be an integer number from 0 to
-    5.
+    visiting.discard(tgt)
+    order.append(tgt)
 
-    The foundry uses verbosity this way:
-    \li 0 - Silent running, no message is shown
-    \li 1 - Silent running, only fatal errors are reported
-    \li 2 - Silent running, every error is reported
-    \li 3 - Normal running, warning messages are reported
-    \li 4 - Normal running, warning messages and information messages are reported
-    \li 5 - Verbose running, warning, information, and debug messages are reported
+  previous = None
 
-    Target change messages are shown with verbosity level greater than 1.
-    
-    \note
-      Verbosity level is automatically set form command line. This method is
-      used to allow overriding the default behavior.
-  """
-  global _verbosity
+  for tgt in roots:
+    if tgt not in deps and (not tgt.called or tgt.repeatable):
+      first = len(order)
+      visit(tgt)
 
-  if v >= 0 and v <= 5:
-    _verbosity = v
-    msg('Verbosity set to %d' % v, v = 5)
-  else:
-    warn('Verbosity level out of range. Setting default value of 4...')
-    _verbosity = 4
+      if previous is not None:
+        for added in order[first:]:
+          deps[added].add(previous)
 
-def get_parallel_queues():
-  """! Returns the number of parallel queues.
-    Returns the number of parallel queues that will be used in parallel-enabled
-    operations when no override is present.
-  """
-  return _parallel_queues
+      previous = tgt
 
-def get_verbosity():
-  """! Returns the verbosity state
-    \returns The current verbosity state
-  """
-  return verbosity
+  return order, deps
 
-def parallel_call(func, args, threads = get_parallel_queues()):
-  """! Parallel function call
-    Enables a function to be executed in parallel.
+def _run_targets(roots):
+  """!
+    Runs a set of targets along with their dependencies.
 
-    \param func The function to be executed
-    \param args An iterable object of tuples, each one containing the arguments to be given to each function call
-    \param threads The maximum number of function calls to be executed simultaniously
+    The whole dependency graph is resolved before running any target, then
+    each target is run as soon as all of its dependencies are done. Up to
+    get_parallel_queues() independent targets are run at the same time,
+    while the roots are run one after another (see _target_graph()).
+
+    \param roots An iterable object containing the targets to run
   """
-  with concurrent.futures.ThreadPoolExecutor(threads) as xtor:
-    res = xtor.map(func, *zip(*args))
-    try:
-      for r in res: pass
-    except:
-      xtor.shutdown()
-      raise
+  order, deps = _target_graph(roots)
+  queues = get_parallel_queues()
 
-def needs_compile(src, obj):
-  """!
-    Checks if a source file should be recompiled.
-    
+  if queues <= 1 or len(order) <= 1:
+    for tgt in order:
+      tgt._run()
+    return
+
+  import concurrent.futures
+
+  # Position in the topological order, used to prioritize ready targets
+  rank = {tgt: i for i, tgt in enumerate(order)}
+  waiting = {tgt: set(tgt_deps) for tgt, tgt_deps in deps.items()}
+  dependents = {tgt: [] for tgt in order}
+
+  for tgt, tgt_deps in deps.items():
+    for dep in tgt_deps:
+      dependents[dep].append(tgt)
+
+  ready = [tgt for tgt in order if not waiting[tgt]]
+  running = {}
+  error = None
+  # Each target's output is printed as a whole when it is done, rather than interleaved
+  streams = sys.stdout, sys.stderr
+  sys.stdout, sys.stderr = _TargetOutput(sys.stdout), _TargetOutput(sys.stderr)
+
+  try:
+    with concurrent.futures.ThreadPoolExecutor(queues) as xtor:
+      while ready or running:
+        while ready and error is None and len(running) < queues:
+          tgt = ready.pop(0)
+          running[xtor.submit(_run_buffered, tgt)] = tgt
+
+        if not running:
+          break
+
+        done, _ = concurrent.futures.wait(running, return_when = concurrent.futures.FIRST_COMPLETED)
+
+        for fut in done:
+          tgt = running.pop(fut)
+
+          if fut.exception() is not None:
+            if error is None:
+              error = fut.exception()
+            continue
+
+          for dependent in dependents[tgt]:
+            waiting[dependent].discard(tgt)
+
+            if not waiting[dependent]:
+              ready.append(dependent)
+
+        ready.sort(key = rank.get)
+  finally:
+    sys.stdout, sys.stderr = streams
+
+  if error is not None:
+    raise error
+
+def _run_buffered(tgt):
+  """!
+    Runs a target, holding back what it prints until it is done.
+
+    \param tgt The target to run
+  """
+  _tracking.output = []
+
+  try:
+    tgt._run()
+  finally:
+    output, _tracking.output = _tracking.output, None
+
+    with _output_lock:
+      for stream, text in output:
+        stream.write(text)
+        stream.flush()
+
+class _TargetOutput:
+  """!
+    Standard stream wrapper which buffers the text written while running a
+    target in parallel with others (see _run_buffered()).
+  """
+
+  def __init__(self, stream):
+    """!
+      \param stream The wrapped stream
+    """
+    self._stream = stream
+
+  def write(self, text):
+    """!
+      Writes some text to the stream, or to the current target's buffer.
+
+      \param text The text to write
+      \return The length of \p text
+    """
+    output = getattr(_tracking, 'output', None)
+
+    if output is None:
+      return self._stream.write(text)
+
+    output.append((self._stream, text))
+    return len(text)
+
+  def flush(self):
+    if getattr(_tracking, 'output', None) is None:
+      self._stream.flush()
+
+  def __getattr__(self, name):
+    return getattr(self._stream, name)
+
+def _track_inputs(paths):
+  """!
+    Records a set of files or directories as inputs of the target being run
+    by the current thread, if any.
+
+    \param paths An iterable object containing file or directory paths
+  """
+  tgt = getattr(_tracking, 'target', None)
+
+  if tgt is not None:
+    tgt.tracked_inputs.update(os.path.normpath(p) for p in paths)
+
+def _tracked(func):
+  """!
+    Wraps a function so that the inputs it reads are recorded for the target
+    being run by the current thread, even if the function is run by a
+    different thread.
+
+    \param func The function to wrap
+
+    \return The wrapped function
+  """
+  tgt = getattr(_tracking, 'target', None)
+  output = getattr(_tracking, 'output', None)
+
+  def wrap_f(*args, **kwargs):
+    _tracking.target = tgt
+    _tracking.output = output
+
+    try:
+      return func(*args, **kwargs)
+    finally:
+      _tracking.target = None
+      _tracking.output = None
+
+  return wrap_f
+
+def _enable_profiler(tracing = False):
+  """!
+    Enables the build profiler, creating it if needed.
+
+    \param tracing True to also collect trace events
+  """
+  from .profiling import Profiler
+
+  global _profiler
+
+  if _profiler is None:
+    _profiler = Profiler()
+
+  _profiler.enable(tracing)
+
+class _Unmeasured:
+  """! Context manager standing for a profiler measure while profiling is disabled """
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *exc):
+    return False
+
+def _measure(name, category = 'foundry', args = None):
+  """!
+    Returns a context manager measuring the time spent in its block if
+    profiling is enabled, see Profiler.measure().
+  """
+  if _profiler is None:
+    return _Unmeasured()
+
+  return _profiler.measure(name, category, args)
+
+def _profiled(name, category = 'foundry'):
+  """!
+    Function decorator measuring each call of the decorated function if
+    profiling is enabled, see Profiler.profiled().
+  """
+  def wrap(func):
+    @functools.wraps(func)
+    def wrap_f(*args, **kwargs):
+      with _measure(name, category):
+        return func(*args, **kwargs)
+
+    return wrap_f
+
+  return wrap
+
+def _profiled_generator(name, category = 'foundry'):
+  """!
+    Generator function decorator measuring the time spent producing the
+    items of each generator if profiling is enabled, see
+    Profiler.profiled_generator().
+  """
+  def wrap(func):
+    @functools.wraps(func)
+    def wrap_f(*args, **kwargs):
+      if _profiler is None:
+        return func(*args, **kwargs)
+
+      return _profiler.profiled_generator(name, category)(func)(*args, **kwargs)
+
+    return wrap_f
+
+  return wrap
+
+def _dependents(targets):
+  """!
+    Returns the registered targets which depend, directly or not, on a set of
+    targets.
+
+    \param targets An iterable object containing targets
+
+    \return A set containing \p targets and their dependents
+  """
+  result = set(targets)
+  found = True
+
+  while found:
+    found = False
+
+    for tgt in _targets.values():
+      if tgt not in result and any(dep in _targets and _targets[dep] in result for dep in tgt.dependencies):
+        result.add(tgt)
+        found = True
+
+  return result
+
+def _stat_inputs(paths):
+  """!
+    Takes a snapshot of the state of a set of files or directories.
+
+    \param paths An iterable object containing file or directory paths
+
+    \return A dictionary mapping each path to its (mtime, size) pair, or to \p None if it does not exist
+  """
+  snapshot = {}
+
+  for path in paths:
+    try:
+      st = os.stat(path)
+      snapshot[path] = (st.st_mtime_ns, st.st_size)
+    except OSError:
+      snapshot[path] = None
+
+  return snapshot
+
+def _watch(roots, interval):
+  """!
+    Runs the watch mode: runs the targets, then polls the inputs read by the
+    targets in their last run and runs again the targets whose inputs
+    changed, along with the targets depending on them. A failed run is
+    reported and the inputs are still polled. Runs until interrupted.
+
+    \param roots A list of the targets requested on the command line
+    \param interval The polling interval, in seconds
+  """
+  def snapshot():
+    return _stat_inputs(set().union(*(tgt.tracked_inputs for tgt in _targets.values())))
+
+  _run_watched(roots)
+  msg('Watching for changes, press Ctrl-C to stop...')
+  state = snapshot()
+
+  try:
+    while True:
+      time.sleep(interval)
+      current = _stat_inputs(state)
+      changed = {p for p in state if current[p] != state[p]}
+
+      if not changed:
+        continue
+
+      for path in sorted(changed):
+        msg('Changed: ' + path, v = 5)
+
+      invalidate_file_index()
+      affected = _dependents(tgt for tgt in _targets.values() if tgt.tracked_inputs & changed)
+
+      for tgt in affected:
+        tgt.called = False
+
+      _run_watched(roots)
+
+      if _database is not None:
+        _database.save()
+
+      state = snapshot()
+  except KeyboardInterrupt:
+    print()
+
+def _run_watched(roots):
+  """!
+    Runs a set of targets for the watch mode, reporting a build failure
+    instead of raising it.
+
+    \param roots An iterable object containing the targets to run
+
+    \return True if the targets have succeeded
+  """
+  import subprocess
+
+  try:
+    _run_targets(roots)
+    return True
+  except (BuildError, subprocess.CalledProcessError) as e:
+    err(str(e))
+  except SystemExit as e:
+    # Raised by fatal(), which has already reported the error
+    msg('Build stopped (exit status {})'.format(e.code))
+
+  return False
+
+@Target('targets', default=True, private=True)
+def target_targets():
+  """! Prints this message. """
+  for tgt in _targets:
+    if _targets[tgt].private is False:
+      print(tgt + (' (DEFAULT)' if _targets[tgt].default else ''), end='')
+      
+      if _targets[tgt].target.__doc__ != None:
+        print(' - ' + _targets[tgt].target.__doc__.strip())
+      else:
+        print()
+      
+def call_target(tgt):
+  """!
+    Calls a target function.
+    
+    \param tgt The target function
+  """
+  if tgt in _targets:
+    _run_targets((_targets[tgt],))
+  else: target_targets()
+  
+def _handle_switch(sw):
+  """!
+    Handles switches in command line.
+    
+    \param sw The switch to handle
+  """
+  try:
+    if sw.startswith('-v:'):
+      set_verbosity(int(sw[3:]))
+    elif sw == '-h' or sw == '--help':
+      _help()
+      sys.exit(0)
+    elif sw.startswith('-D:'):
+      _export_switch_variable(sw[3:])
+    elif sw == '--watch':
+      global _watch_interval
+      _watch_interval = _watch_default_interval
+    elif sw.startswith('--watch:'):
+      _watch_interval = float(sw[8:])
+    elif sw == '--profile':
+      _enable_profiler()
+    elif sw.startswith('--trace:'):
+      global _trace_path
+      _trace_path = sw[8:]
+      _enable_profiler(tracing = True)
+    elif sw == '--dry-run':
+      global _dry_run
+      _dry_run = True
+    elif sw.startswith('--report:'):
+      global _report_path
+      _report_path = sw[9:]
+    elif sw.startswith('-n:'):
+      global _parallel_queues
+      _parallel_queues = int(sw[3:])
+      msg('Set {} parallel queues.'.format(_parallel_queues), v = 5)
+    else:
+      err('Unknown switch value "{}"'.format(sw))
+      _help()
+      sys.exit(1)
+  except ValueError:
+    err('Error in command line arguments')
+    _help()
+    sys.exit(1)
+
+def _export_switch_variable(svar):
+  """! Exports a command line variable
+    Exports a command line variable as an environment variable.
+
+    \param svar The variable in the form 'name=value'
+  """
+  var = svar.split('=', 1)
+
+  os.environ[var[0]] = var[1]
+
+def _help():
+  """! Shows the foundry help message """
+  print('Babilonia\'s Foundry command line switches:')
+  print()
+
+  print('\t-v:N\t\tSets the verbosity of the build script (1 to 5) once run_foundry() is called')
+  print('\t-h\n\t--help\t\tShows this message')
+  print('\t-D:name=value\tManually define an environment variable')
+  print('\t-n:N\t\tRuns up to N independent jobs at the same time')
+  print('\t--profile\tPrints a timing report at the end of the run')
+  print('\t--trace:file\tWrites a Chrome trace event file at the end of the run')
+  print('\t--report:file\tWrites a JSON build report at the end of the run')
+  print('\t--dry-run\tPrints the commands the targets would run without running them,\n\t\t\tand estimates the critical path from the timings of the last run')
+  print('\t--watch[:S]\tKeeps running the targets again as their inputs change, polling every S seconds')
+
+def _handle_switches():
+  """! Checks the command line switches
+  """
+  for arg in sys.argv[1:]:
+    if arg.startswith('-'):
+      _handle_switch(arg)
+
+def run_foundry():
+  """!
+    Runs the foundry standard behavior: handles the command line switches,
+    then runs the targets given on the command line.
+
+    The switches only take effect from this call on: the messages printed
+    while the build script is being imported use the default verbosity,
+    unless the script calls set_verbosity() itself.
+  """
+  # Ensure the CWD is always the script's directory
+  os.chdir(os.path.dirname(os.path.abspath(sys.argv[0])))
+  _handle_switches()
+
+  roots = [arg for arg in sys.argv[1:] if not arg.startswith('-')]
+  start = time.time()
+  begin = time.perf_counter()
+  failed = True
+
+  try:
+    if any(arg not in _targets for arg in roots):
+      target_targets()
+
+    # The targets given are run together, so that a dependency they share is run only once
+    targets = [_targets[arg] for arg in roots if arg in _targets]
+
+    if not roots:
+      if _default_target is not None:
+        targets = [_default_target]
+      else:
+        warn('Default target not set')
+        print()
+        target_targets()
+
+    if _watch_interval is None:
+      _run_targets(targets)
+    else:
+      if not targets and _default_target is not None:
+        targets = [_default_target]
+
+      _watch(targets, _watch_interval)
+
+    failed = False
+  finally:
+    duration = time.perf_counter() - begin
+
+    if _database is not None and not _dry_run:
+      _record_timings()
+      _database.save()
+
+    if _object_cache:
+      msg('Object cache: {} hit(s), {} miss(es)'.format(_object_cache.hits, _object_cache.misses), v = 5)
+
+    for line in _plan() if _dry_run else _summary(failed, duration):
+      msg(line)
+
+    if _profiler is not None:
+      for line in _profiler.report():
+        msg(line)
+
+    if _trace_path is not None:
+      _profiler.write_trace(_trace_path)
+      msg('Trace written to "{}"'.format(_trace_path))
+
+    if _report_path is not None and not _dry_run:
+      _write_report(_report_path, failed, start, duration)
+      msg('Report written to "{}"'.format(_report_path))
+
+def _called_targets():
+  """! Returns the targets called during this run, in declaration order """
+  return [tgt for tgt in _targets.values() if tgt.status is not None]
+
+def _target_commands():
+  """! Returns a dictionary mapping the target names to the number of commands they have run """
+  counts = {}
+
+  for result in job_history():
+    counts[result.target] = counts.get(result.target, 0) + 1
+
+  return counts
+
+def _summary(failed, duration):
+  """!
+    Formats the build summary: the outcome of each public target called
+    during this run, and the overall figures.
+
+    \param failed True if the run has failed
+    \param duration The run wall time, in seconds
+
+    \return A list of text lines, empty if no public target has been called
+  """
+  targets = [tgt for tgt in _called_targets() if not tgt.private]
+
+  if not targets:
+    return []
+
+  commands = _target_commands()
+  lines = []
+
+  for tgt in targets:
+    if tgt.status == 'skipped':
+      lines.append('  {:<24} skipped ({})'.format(tgt.name, tgt.skip_reason))
+    else:
+      lines.append('  {:<24} {:<8} {:>8.3f}s, {} command(s)'.format(tgt.name, tgt.status, tgt.duration, commands.get(tgt.name, 0)))
+
+  counts = [sum(tgt.status == s for tgt in targets) for s in ('run', 'skipped', 'failed')]
+  lines.insert(0, 'Build {} in {:.3f}s: {} target(s) run, {} skipped, {} failed, {} command(s)'.format('failed' if failed else 'succeeded', duration, *counts, len(job_history())))
+
+  return lines
+
+def _record_timings():
+  """!
+    Records the durations of the commands run, and the time each target has
+    spent out of them, for the estimates of the next dry runs.
+  """
+  intervals = {}
+
+  for result in job_history():
+    intervals.setdefault(result.target, []).append((result.start, result.start + result.duration))
+
+    if result.returncode == 0:
+      _database.record_timing(_command_line(result.args), result.duration)
+
+  for tgt in _called_targets():
+    if tgt.status == 'run':
+      covered = 0.0
+      end = None
+
+      # Length of the union of the command intervals
+      for begin, finish in sorted(intervals.get(tgt.name, ())):
+        if end is None or begin > end:
+          covered += finish - begin
+          end = finish
+        elif finish > end:
+          covered += finish - end
+          end = finish
+
+      _database.record_timing(tgt._record_key(), max(tgt.duration - covered, 0.0))
+
+def _plan():
+  """!
+    Formats the plan of a dry run: the targets which would run and the ones
+    which are up to date, along with an estimate of the critical path.
+
+    Each target which would run is estimated from the time it spent out of
+    its commands in the last run, plus the durations its planned commands
+    took in the last run, assuming up to get_parallel_queues() of them run at
+    the same time. The critical path is the longest chain of dependent
+    targets.
+
+    \return A list of text lines
+  """
+  db = build_database()
+  queues = max(get_parallel_queues(), 1)
+  targets = _called_targets()
+  commands = {}
+  unknown = 0
+
+  for name, command in _planned_commands:
+    commands.setdefault(name, []).append(command)
+
+  estimates = {}
+
+  for tgt in targets:
+    if tgt.status == 'skipped':
+      estimates[tgt] = 0.0
+      continue
+
+    own = db.timing(tgt._record_key())
+    times = [db.timing(command) for command in commands.get(tgt.name, ())]
+    known = [t for t in times if t is not None]
+    unknown += (own is None) + len(times) - len(known)
+    estimates[tgt] = (own or 0.0) + max(max(known, default = 0.0), sum(known) / queues)
+
+  # Longest chain of dependencies ending with each target
+  chains = {}
+
+  def chain(tgt):
+    if tgt not in chains:
+      deps = [chain(_targets[dep]) for dep in tgt.dependencies if _targets[dep] in estimates]
+      longest = max(deps, key = lambda c: c[0], default = (0.0, []))
+      chains[tgt] = (longest[0] + estimates[tgt], longest[1] + [tgt.name])
+
+    return chains[tgt]
+
+  critical = max((chain(tgt) for tgt in targets), key = lambda c: c[0], default = (0.0, []))
+  total = sum(estimates.values())
+  run = [tgt for tgt in targets if tgt.status != 'skipped']
+  lines = ['Dry run: {} target(s) would run, {} up to date, {} command(s) planned'.format(len(run), len(targets) - len(run), len(_planned_commands))]
+
+  for tgt in targets:
+    if tgt.private:
+      continue
+    elif tgt.status == 'skipped':
+      lines.append('  {:<24} up to date ({})'.format(tgt.name, tgt.skip_reason))
+    else:
+      lines.append('  {:<24} would run ~{:.3f}s, {} command(s)'.format(tgt.name, estimates[tgt], len(commands.get(tgt.name, ()))))
+
+  lines.append('Estimated critical path: {:.3f}s ({})'.format(critical[0], ' -> '.join(critical[1])))
+  lines.append('Estimated total work: {:.3f}s, at least {:.3f}s with -n:{}'.format(total, max(critical[0], total / queues), queues))
+
+  if unknown:
+    lines.append('No timing recorded for {} planned step(s): the estimates only cover the ones run before'.format(unknown))
+
+  return lines
+
+def _write_report(path, failed, start, duration):
+  """!
+    Writes the build report of this run as a JSON object holding the
+    outcome of the run, the status of each target called, the commands run
+    with their timings and the object cache hit/miss counts.
+
+    \param path The output file path
+    \param failed True if the run has failed
+    \param start The time the run has started at, as returned by \p time.time()
+    \param duration The run wall time, in seconds
+  """
+  import json
+
+  commands = _target_commands()
+  report = {
+    'format': 1,
+    'status': 'failed' if failed else 'succeeded',
+    'start': start,
+    'duration': duration,
+    'targets': [{
+      'name': tgt.name,
+      'status': tgt.status,
+      'reason': tgt.skip_reason,
+      'duration': tgt.duration,
+      'commands': commands.get(tgt.name, 0)
+    } for tgt in _called_targets()],
+    'commands': [{
+      'command': _command_line(result.args),
+      'target': result.target,
+      'status': result.returncode,
+      'start': result.start,
+      'duration': result.duration
+    } for result in job_history()],
+    'cache': {
+      'enabled': bool(_object_cache),
+      'hits': _object_cache.hits if _object_cache else 0,
+      'misses': _object_cache.misses if _object_cache else 0
+    }
+  }
+
+  with open(path, 'w', encoding = 'utf_8') as report_file:
+    json.dump(report, report_file, indent = 2)
+
+@_profiled_generator('dir_filter')
+def dir_filter(src, filter, subdirs = True):
+  """!
+    Filters the files contained in \p src (or in its full tree) according to
+    a filter function.
+    
+    The filter function must accept a file path as its argument and return
+    True if the file should be added to the output, False if not.
+    
+    \param src The toplevel directory path
+    \param filter A callable object which accepts a file path relative to \p src and returns a boolean value
+    \param subdirs True if the output should also contain files in subdirectories
+    
+    \return A generator of the filtered files of \p src
+  """
+  from .fileindex import scan_dir
+
+  dirs = []
+
+  for fpath in scan_dir(src, subdirs, dirs):
+    if filter(fpath):
+      fpath = os.path.normpath(fpath)
+      msg('Filter accepted file ' + fpath, v = 5)
+      yield fpath
+
+  _track_inputs(dirs)
+  
+def dir_filter_all(src, subdirs = True, cached = False):
+  """!
+    Returns all files contained in a directory (tree).
+
+    \param src The toplevel directory path
+    \param subdirs True if the output should also contain files in subdirectories
+    \param cached True to query the file index of \p src instead of scanning it
+
+    \return An iterable object containing the files of \p src
+
+    \see file_index()
+  """
+  if cached:
+    return file_index(src, subdirs).all()
+
+  return dir_filter(src, lambda x: True, subdirs)
+
+def dir_filter_ext(src, ext, subdirs = True, cached = False):
+  """! Filters files by extension
+    Filters the files contained in \p src (or in its full tree) according to
+    the supplied extensions.
+
+    \param src The toplevel directory path
+    \param ext A file extension or an iterable object containing the file extensions to filter (without dot). Multi-part extensions such as \p tar.gz are allowed
+    \param subdirs True if the output should also contain files in subdirectories
+    \param cached True to query the file index of \p src instead of scanning it
+    
+    \return An iterable object containing the filtered files of \p src
+    
+    \sa dir_filter(), dir_partition_ext(), file_index()
+  """
+  from .fileindex import ext_matcher
+
+  if cached:
+    return file_index(src, subdirs).ext(ext)
+
+  match = ext_matcher(ext)
+  return dir_filter(src, lambda f: match(f) is not None, subdirs)
+
+def dir_partition_ext(src, ext, subdirs = True, cached = False):
+  """! Partitions files by extension
+    Partitions the files contained in \p src (or in its full tree) according
+    to the supplied extensions, walking the tree once.
+
+    \param src The toplevel directory path
+    \param ext A file extension or an iterable object containing the file extensions (without dot)
+    \param subdirs True if the output should also contain files in subdirectories
+    \param cached True to query the file index of \p src instead of scanning it
+
+    \return A dictionary mapping each extension to the list of files which end with it. When more than one extension matches a file (e.g. \p gz and \p tar.gz), the longest one wins
+
+    \sa dir_filter_ext(), file_index()
+  """
+  from .fileindex import scan_dir, ext_matcher, normalize_ext
+
+  if cached:
+    return file_index(src, subdirs).partition_ext(ext)
+
+  match = ext_matcher(ext)
+  buckets = {e: [] for e in normalize_ext(ext)}
+  dirs = []
+
+  for fpath in scan_dir(src, subdirs, dirs):
+    e = match(fpath)
+
+    if e is not None:
+      fpath = os.path.normpath(fpath)
+      msg('Filter accepted file ' + fpath, v = 5)
+      buckets[e].append(fpath)
+
+  _track_inputs(dirs)
+
+  return buckets
+  
+def dir_filter_filename(src, fnames, remove_ext = False, subdirs = True, cached = False):
+  """! Filters files by name
+    Filters the files contained in \p src (or in its full tree) according to
+    the supplied filename.
+
+    \param src The toplevel directory path
+    \param fnames An iterable object containing the file names to filter
+    \param remove_ext True to remove the extension before checking the filename, False to check the file along with its extension
+    \param subdirs True if the output should also contain files in subdirectories
+    \param cached True to query the file index of \p src instead of scanning it
+    
+    \return An iterable object containing the filtered files of \p src
+    
+    \sa dir_filter(), file_index()
+  """
+  if cached:
+    return file_index(src, subdirs).name(fnames, remove_ext)
+
+  def filter_f(f):
+    f = os.path.basename(f) if not remove_ext else os.path.splitext(os.path.basename(f))[0]
+    return f in fnames
+  return dir_filter(src, filter_f, subdirs)
+
+def file_index(src, subdirs = True):
+  """! Returns the file index of a directory
+    Returns the index of the files contained in \p src (or in its full tree),
+    scanning the directory the first time it is requested during a run.
+
+    The files created by record_build() and removed by remove() are added to
+    or removed from every index they belong to. Indexes must be invalidated
+    by invalidate_file_index() when files are created or removed by other
+    means.
+
+    \param src The toplevel directory path
+    \param subdirs True if the index should also contain files in subdirectories
+
+    \return A FileIndex object
+  """
+  from .fileindex import FileIndex
+
+  key = (os.path.normpath(src), subdirs)
+
+  with _file_indexes_lock:
+    index = _file_indexes.get(key)
+
+  if index is None:
+    msg('Indexing directory "{}"'.format(src), v = 5)
+
+    with _measure('file_index', args = {'path': src}):
+      index = FileIndex(src, subdirs)
+
+    with _file_indexes_lock:
+      index = _file_indexes.setdefault(key, index)
+
+  _track_inputs(index.dirs)
+
+  return index
+
+def invalidate_file_index(src = None):
+  """! Invalidates file indexes
+    Drops the file index of a directory, or every file index, so that it
+    is scanned again the next time it is requested.
+
+    \param src The toplevel directory path, \p None to drop every index
+  """
+  with _file_indexes_lock:
+    if src is None:
+      _file_indexes.clear()
+    else:
+      src = os.path.normpath(src)
+
+      for key in [k for k in _file_indexes if k[0] == src]:
+        del _file_indexes[key]
+
+def _update_file_indexes(path, present):
+  """!
+    Adds a file to or removes a file from the indexes it belongs to.
+
+    \param path The file path
+    \param present True if the file has been created, False if it has been removed
+  """
+  with _file_indexes_lock:
+    indexes = [i for i in _file_indexes.values() if i.covers(path)]
+
+  for index in indexes:
+    if present:
+      index.add(path)
+    else:
+      index.discard(path)
+
+def source_object_assoc(sources, sext, oext):
+  """! Associates sources with default objects
+    Creates a dictionary object of which the keys are the provided source files
+    and the values are their object file names. The default object file names
+    are the source file names without their extension to which is appended the
+    object file extension provided.
+    
+    \param sources An iterable object containing the source files
+    \param sext The source file extension (without dot)
+    \param oext The object file extension (without dot)
+  """
+  se_len = len(sext)
+  srcs = tuple(sources)
+
+  return dict(zip(srcs, [f[:-se_len] + oext for f in srcs]))
+
+def get_parallel_queues():
+  """! Returns the number of parallel queues.
+    Returns the number of parallel queues that will be used in parallel-enabled
+    operations when no override is present.
+  """
+  return _parallel_queues
+
+def dry_run():
+  """! Tells whether this is a dry run
+    In a dry run, set by the \p --dry-run switch, the targets are called but
+    the commands run through call(), check_call(), cached_check_call(),
+    remote_check_call() and parallel_compile() are only printed, and the
+    files they would write are deemed changed by needs_compile(),
+    needs_link() and the declared target outputs. Targets doing other work
+    by themselves should skip it in a dry run.
+
+    \return True if this is a dry run
+  """
+  return _dry_run
+
+class CallResults(list):
+  """!
+    The results of parallel_call(), in the order of the calls.
+  """
+  def __init__(self, results, durations):
+    """!
+      \param results A list of the call results
+      \param durations A list of the call durations
+    """
+    super().__init__(results)
+
+    ## Wall time of each call, in seconds, in the order of the calls
+    self.durations = durations
+
+def _timed_call(func, args):
+  """!
+    Calls a function, measuring it. It is a module function so that process
+    pools can run it.
+
+    \return A (result, start, wall time, CPU time) tuple
+  """
+  start = time.perf_counter()
+  cpu = time.thread_time()
+  result = func(*args)
+
+  return result, start, time.perf_counter() - start, time.thread_time() - cpu
+
+def parallel_call(func, args, threads = None, executor = 'thread', fail_fast = True):
+  """! Parallel function call
+    Enables a function to be executed in parallel.
+
+    The calls are run by one of these executors:
+    \li \p 'thread' - a thread pool, for calls waiting on I/O or external programs
+    \li \p 'process' - a process pool, for CPU bound Python calls, which a
+      thread pool would serialize. \p func and its arguments must be picklable
+    \li \p 'asyncio' - an event loop, for coroutine functions such as the ones
+      driving subprocesses through \p asyncio. Other functions are run in
+      worker threads
+    \li a \p concurrent.futures.Executor object, which is not shut down
+
+    The time of each call is added to the profiler (see \p --profile).
+
+    \param func The function to be executed
+    \param args An iterable object of tuples, each one containing the arguments to be given to each function call
+    \param threads The maximum number of function calls to be executed simultaniously, \p None to use get_parallel_queues()
+    \param executor The executor running the calls
+    \param fail_fast True to cancel the pending calls as soon as one of them raises, False to let them all run
+
+    \return A CallResults list of the call results, in the order of \p args
+
+    \throw Exception The exception raised by the first failed call, in the order of \p args
+  """
+  if threads is None:
+    threads = get_parallel_queues()
+
+  args = [tuple(a) for a in args]
+  name = getattr(func, '__name__', 'call')
+
+  if not args:
+    return CallResults([], [])
+
+  if executor == 'asyncio':
+    import asyncio
+
+    outcomes = asyncio.run(_async_calls(func, args, threads, fail_fast))
+  else:
+    outcomes = _executor_calls(func, args, threads, executor, fail_fast)
+
+  for i, (result, start, wall, cpu) in enumerate(outcomes):
+    msg('Call {} of {} took {:.3f}s'.format(i + 1, name, wall), v = 5)
+
+    if _profiler is not None:
+      _profiler.add('task ' + name, start, wall, cpu, 'task')
+
+  return CallResults([o[0] for o in outcomes], [o[2] for o in outcomes])
+
+def _executor_calls(func, args, threads, executor, fail_fast):
+  """!
+    Runs the calls of parallel_call() in a \p concurrent.futures executor.
+
+    \return A list of (result, start, wall time, CPU time) tuples
+  """
+  import concurrent.futures
+
+  owned = not isinstance(executor, concurrent.futures.Executor)
+
+  if executor == 'thread':
+    executor = concurrent.futures.ThreadPoolExecutor(threads)
+  elif executor == 'process':
+    executor = concurrent.futures.ProcessPoolExecutor(threads)
+  elif owned:
+    raise ValueError('Unknown executor "{}"'.format(executor))
+
+  # Worker processes do not report the files they read
+  call = func if isinstance(executor, concurrent.futures.ProcessPoolExecutor) else _tracked(func)
+  futures = [executor.submit(_timed_call, call, a) for a in args]
+
+  try:
+    concurrent.futures.wait(futures, return_when = concurrent.futures.FIRST_EXCEPTION if fail_fast else concurrent.futures.ALL_COMPLETED)
+
+    for future in futures:
+      if future.done() and not future.cancelled() and future.exception() is not None:
+        raise future.exception()
+
+    return [future.result() for future in futures]
+  finally:
+    for future in futures:
+      future.cancel()
+
+    if owned:
+      executor.shutdown(wait = True, cancel_futures = True)
+
+async def _async_calls(func, args, limit, fail_fast):
+  """!
+    Runs the calls of parallel_call() in the current event loop, up to
+    \p limit at the same time.
+
+    \return A list of (result, start, wall time, CPU time) tuples
+  """
+  import asyncio
+
+  semaphore = asyncio.Semaphore(limit)
+  coroutine = asyncio.iscoroutinefunction(func)
+  call = func if coroutine else _tracked(func)
+
+  async def run(a):
+    async with semaphore:
+      if not coroutine:
+        return await asyncio.to_thread(_timed_call, call, a)
+
+      start = time.perf_counter()
+      cpu = time.thread_time()
+      result = await call(*a)
+
+      # The CPU time includes the other coroutines run meanwhile
+      return result, start, time.perf_counter() - start, time.thread_time() - cpu
+
+  tasks = [asyncio.ensure_future(run(a)) for a in args]
+
+  try:
+    await asyncio.wait(tasks, return_when = asyncio.FIRST_EXCEPTION if fail_fast else asyncio.ALL_COMPLETED)
+
+    for task in tasks:
+      if task.done() and not task.cancelled() and task.exception() is not None:
+        raise task.exception()
+
+    return [task.result() for task in tasks]
+  finally:
+    for task in tasks:
+      task.cancel()
+
+    await asyncio.gather(*tasks, return_exceptions = True)
+
+class BuildError(Exception):
+  """!
+    Raised when one or more build commands fail.
+  """
+  def __init__(self, failures):
+    """!
+      \param failures A list of \p subprocess.CalledProcessError objects, one for each failed command
+    """
+    super().__init__('{} command(s) failed'.format(len(failures)))
+
+    ## Failed commands
+    self.failures = failures
+
+def parallel_compile(objects, command, needs = None, threads = None, inputs = (), **kwargs):
+  """! Compiles a set of sources in parallel
+    Checks each source/object pair and runs \p command for every pair which
+    is out of date. Up to \p threads pairs are checked and compiled at the
+    same time.
+
+    Every command is run even if some of them fail: failures are reported as
+    they happen and a BuildError is raised once all of the commands are done.
+
+    Each successful build is recorded in the build database along with the
+    header dependencies found in its dependency file, if the command writes
+    one to \p {dep}.
+
+    \param objects A dictionary mapping source files to their object files, as returned by source_object_assoc()
+    \param command The command template. \p {src}, \p {obj} and \p {dep} are replaced with the source, object and dependency file paths
+    \param needs A callable object accepting a source and an object file path and returning True if the object should be rebuilt, \p None to use needs_compile()
+    \param threads The maximum number of pairs to be processed simultaniously, \p None to use get_parallel_queues(), or the number of remote worker slots if greater
+    \param inputs An iterable object containing additional input files shared by every pair
+    \param kwargs Additional values to substitute in \p command
+
+    \return A list containing the rebuilt object files
+
+    \throws BuildError If one or more commands fail
+  """
+  import concurrent.futures
+  import subprocess
+
+  if threads is None:
+    threads = get_parallel_queues()
+
+    # Keep every remote slot busy
+    if remote_pool() is not None:
+      threads = max(threads, remote_pool().slots())
+
+  inputs = tuple(inputs)
+
+  def compile_f(src, obj):
+    dep = depfile_name(obj)
+    cmd = command.format(src = src, obj = obj, dep = dep, **kwargs)
+
+    if needs(src, obj) if needs is not None else needs_compile(src, obj, cmd, inputs):
+      cached_check_call(cmd, (obj, dep))
+
+      if not _dry_run:
+        record_build(obj, cmd, (src,) + inputs, dep)
+
+      return True
+
+    return False
+
+  rebuilt = []
+  failures = []
+
+  with concurrent.futures.ThreadPoolExecutor(max(threads, 1)) as xtor:
+    compile_f = _tracked(compile_f)
+    futures = {xtor.submit(compile_f, src, obj): obj for src, obj in objects.items()}
+
+    for fut in concurrent.futures.as_completed(futures):
+      try:
+        if fut.result():
+          rebuilt.append(futures[fut])
+      except subprocess.CalledProcessError as e:
+        err('Command "{}" returned {}'.format(e.cmd, e.returncode))
+        failures.append(e)
+
+  if failures:
+    raise BuildError(failures)
+
+  return rebuilt
+
+def build_database():
+  """! Returns the build database
+    Returns the build database of the project, loading it on first use.
+
+    \return A BuildDatabase object
+  """
+  from .database import BuildDatabase
+
+  global _database
+
+  with _database_lock:
+    if _database is None:
+      _database = BuildDatabase(_database_path)
+      msg('Loaded build database "{}"'.format(_database_path), v = 5)
+
+  return _database
+
+def _includes():
+  """!
+    Returns the graph of the dependencies read from the dependency files,
+    creating it on first use.
+
+    \return An IncludeGraph object
+  """
+  from .depends import IncludeGraph
+
+  global _include_graph
+
+  with _include_graph_lock:
+    if _include_graph is None:
+      _include_graph = IncludeGraph()
+
+  return _include_graph
+
+def depfile_name(output):
+  """! Names the dependency file of an output
+
+    \param output The output file path
+
+    \return The dependency file path, which is \p output with its extension replaced by \p .d
+  """
+  return os.path.splitext(output)[0] + '.d'
+
+def _plan_outputs(paths):
+  """! Records the files a dry run would write """
+  with _output_lock:
+    _planned_outputs.update(os.path.normpath(p) for p in paths)
+
+def _planned(paths):
+  """! Tells whether a dry run would write any of the given files """
+  if not _dry_run:
+    return False
+
+  with _output_lock:
+    return any(os.path.normpath(p) in _planned_outputs for p in paths)
+
+def _planned_inputs(output, inputs):
+  """! Tells whether a dry run would write any of the inputs of an output, including its recorded ones """
+  if not _dry_run:
+    return False
+
+  inputs = list(inputs) + build_database().inputs(output)
+
+  if _includes().load(depfile_name(output)):
+    inputs += _includes().prerequisites(output)
+
+  return _planned(inputs)
+
+def record_build(output, command, inputs, depfile = None):
+  """! Records a successful build
+    Records \p output in the build database, so that needs_compile() and
+    needs_link() can tell whether it is up to date.
+
+    \param output The output file path
+    \param command The command line \p output has been built with
+    \param inputs An iterable object containing the input file paths
+    \param depfile A dependency file listing further inputs, such as the ones written by gcc's \p -MMD switch
+  """
+  inputs = list(inputs)
+
+  if depfile is not None and _includes().load(depfile):
+    for dep in sorted(_includes().prerequisites(output)):
+      if dep not in inputs:
+        inputs.append(dep)
+
+  build_database().record(output, command, inputs)
+  _track_inputs(inputs)
+  _update_file_indexes(output, True)
+
+  if depfile is not None and os.path.isfile(depfile):
+    _update_file_indexes(depfile, True)
+
+@_profiled('needs_compile')
+def needs_compile(src, obj, command = None, inputs = ()):
+  """!
+    Checks if a source file should be recompiled.
+
+    When \p command is given and the build database holds a record of \p obj,
+    the decision is taken by comparing the recorded command line and input
+    hashes (including the header dependencies) with the current ones.
+    Otherwise the modification times of \p src and \p obj are compared,
+    along with the ones of the headers \p src includes, directly or not,
+    according to the dependency file of \p obj.
+    
     \param src The source file path to check for compile
     \param obj The object file path the source needs to be compiled to
+    \param command The command line which would compile \p src
+    \param inputs An iterable object containing additional input files, only used when there is no record of \p obj
     
     \return True if the source file should be recompiled, false if not
     
     \throws FileNotFoundError If the source file does not exist
   """
+  _track_inputs((src,) + tuple(inputs))
+
+  if _planned_inputs(obj, (src,) + tuple(inputs)):
+    return True
+
+  if command is not None:
+    up_to_date = build_database().is_up_to_date(obj, command)
+
+    if up_to_date is not None:
+      _track_inputs(build_database().inputs(obj))
+      return not up_to_date
+
   if os.path.isfile(obj):
-    src_date = os.path.getmtime(src)
     obj_date = os.path.getmtime(obj)
-        
-    return (src_date - obj_date) > 0
+
+    for f in (src,) + tuple(inputs):
+      if os.path.getmtime(f) > obj_date:
+        return True
+
+    if _includes().load(depfile_name(obj)):
+      _track_inputs(_includes().prerequisites(obj))
+      return _includes().newer_than(obj, obj_date)
+
+    return False
   else:
     return True
 
-def needs_link(obj, exe):
+@_profiled('needs_link')
+def needs_link(obj, exe, command = None):
   """!
     Checks if an object file should be relinked.
+
+    \see needs_compile()
     
     \param obj The object file path to check for linkage
     \param exe The executable path to check for linkage
+    \param command The command line which would link \p exe
     
     \return True if the object file should be relinked, false if not
     
     \throws FileNotFoundError If the object file does not exist
   """
+  _track_inputs((obj,))
+
+  if _planned_inputs(exe, (obj,)):
+    return True
+
+  if command is not None:
+    up_to_date = build_database().is_up_to_date(exe, command)
+
+    if up_to_date is not None:
+      _track_inputs(build_database().inputs(exe))
+      return not up_to_date
+
   if os.path.isfile(exe):
     exe_date = os.path.getmtime(exe)
     obj_date = os.path.getmtime(obj)
@@ -448,23 +1778,374 @@ def needs_link(obj, exe):
   else:
     return True
 
+def job_server():
+  """! Returns the job server
+    Returns the job slots shared by the external programs, creating them on
+    first use: the slots of the GNU make jobserver inherited through
+    \p MAKEFLAGS, if any, otherwise get_parallel_queues() local slots.
+
+    \return A JobServer object
+  """
+  from .jobs import JobServer
+
+  global _job_server
+
+  with _job_server_lock:
+    if _job_server is None:
+      _job_server = JobServer(get_parallel_queues())
+
+      if _job_server.fds is not None:
+        msg('Using the GNU make jobserver', v = 5)
+
+  return _job_server
+
+def job_history():
+  """! Returns the external programs run so far
+    \return A list of JobResult objects, in the order the programs ended
+  """
+  with _output_lock:
+    return _job_history[:]
+
+def _command_line(args):
+  """! Formats a command line string or argument list """
+  import shlex
+
+  return args if isinstance(args, str) else ' '.join(shlex.quote(str(a)) for a in args)
+
+def _run_job(name, args, stdin, stdout, stderr, remote = None, echo = True):
+  """!
+    Runs an external program through the job server, then prints the
+    command line along with its captured output at once, so that the
+    output of parallel programs does not interleave.
+
+    \param remote A (RemotePool, inputs, outputs) tuple to run the program on a remote worker, \p None to run it locally
+    \param echo False to leave the captured standard output to the caller instead of printing it
+
+    \return A JobResult object
+  """
+  from .jobs import JobResult, run_job
+
+  tgt = getattr(_tracking, 'target', None)
+
+  if _dry_run:
+    with _output_lock:
+      _planned_commands.append((tgt.name if tgt is not None else None, _command_line(args)))
+      msg(_command_line(args))
+
+    return JobResult(args, 0, None, None, time.time(), 0.0)
+
+  trace_args = {'command': _command_line(args)}
+
+  with _measure(name, 'command', trace_args) as measure:
+    if remote is None:
+      result = run_job(args, job_server(), stdin, stdout, stderr)
+    else:
+      result = remote[0].run(args, remote[1], remote[2])
+
+    measure.child_cpu = result.cpu or 0.0
+
+  trace_args['status'] = result.returncode
+  result.target = tgt.name if tgt is not None else None
+
+  with _output_lock:
+    _job_history.append(result)
+    msg(_command_line(args))
+
+    for data, stream in ((result.stdout if echo else None, sys.stdout), (result.stderr, sys.stderr)):
+      if data:
+        stream.write(data.decode(errors = 'replace'))
+        stream.flush()
+
+  return result
+
 def call(args, stdin = None, stdout = None, stderr = None):
   """! Calls an external program
+    Runs an external program once a job slot is free (see job_server()).
+    Argument lists, and command lines which do not use shell features, are
+    run without a shell. The outputs which are not redirected are captured
+    and printed when the program ends.
 
-    \see subprocess.call()
+    \param args A command line string or an argument list
+    \param stdin The standard input, see \p subprocess.run()
+    \param stdout The standard output, see \p subprocess.run()
+    \param stderr The standard error, see \p subprocess.run()
+
+    \return The program exit status
   """
-  msg(args)
-  return subprocess.call(args, stdin = stdin, stdout = stdout, stderr = stderr, shell = True)
+  return _run_job('call', args, stdin, stdout, stderr).returncode
 
 def check_call(args, stdin = None, stdout = None, stderr = None):
   """! Calls an external program
-    Calls an external program and throws \p subprocess.CalledProcessError if
-    return value is not 0.
+    Calls an external program like call() and throws
+    \p subprocess.CalledProcessError if return value is not 0.
+
+    \return 0
+  """
+  import subprocess
+
+  result = _run_job('check_call', args, stdin, stdout, stderr)
+
+  if result.returncode != 0:
+    raise subprocess.CalledProcessError(result.returncode, args, result.stdout, result.stderr)
+
+  return 0
+
+def check_output(args, stdin = None, stderr = None):
+  """! Calls an external program and returns its output
+    Calls an external program like check_call(), returning its standard
+    output instead of printing it.
+
+    \return The standard output of the program as a string, empty in a dry run
+  """
+  import subprocess
+
+  result = _run_job('check_output', args, stdin, None, stderr, echo = False)
+
+  if result.returncode != 0:
+    raise subprocess.CalledProcessError(result.returncode, args, result.stdout, result.stderr)
+
+  return (result.stdout or b'').decode(errors = 'replace')
+
+def object_cache():
+  """! Returns the object cache
+    Returns the object cache, loading it on first use. The object cache is
+    enabled by setting the \p FOUNDRY_CACHE_DIR environment variable (e.g.
+    with \p -D:FOUNDRY_CACHE_DIR=path) to the cache directory. Its maximum
+    size in MiB is read from \p FOUNDRY_CACHE_SIZE.
+
+    \return An ObjectCache object, or \p None if the object cache is disabled
+  """
+  from .cache import ObjectCache
+
+  global _object_cache
+
+  with _object_cache_lock:
+    if _object_cache is None:
+      path = os.environ.get(_cache_dir_var)
+
+      if path:
+        try:
+          size = int(os.environ.get(_cache_size_var, _cache_default_size))
+        except ValueError:
+          warn('Invalid object cache size "{}"'.format(os.environ[_cache_size_var]))
+          size = _cache_default_size
+
+        _object_cache = ObjectCache(os.path.expanduser(path), size << 20)
+        msg('Using object cache "{}"'.format(path), v = 5)
+      else:
+        _object_cache = False
+
+  return _object_cache or None
+
+def cached_check_call(args, outputs):
+  """! Calls a compiler, through the object cache
+    Restores the outputs of a compiler command from the object cache when
+    possible, otherwise runs the command by remote_check_call() and stores
+    its outputs in the cache.
+
+    Entries are keyed on the command line, the preprocessed sources, the
+    contents of the other input files (e.g. objects to link) and the compiler
+    executable. If the sources cannot be preprocessed, the cache is bypassed.
+
+    \param args The compiler command line
+    \param outputs A list of the output file paths written by the command, the main one first
+
+    \return The command return code
+
+    \throws subprocess.CalledProcessError If the command return code is not 0
+  """
+  if _dry_run:
+    _plan_outputs(outputs)
+    return check_call(args)
 
-    \see subprocess.check_call()
+  cache = object_cache()
+  key = _cache_key(args) if cache is not None else None
+
+  if key is not None and cache.restore(key, outputs):
+    msg('Restored "{}" from the object cache'.format(outputs[0]))
+    return 0
+
+  ret = remote_check_call(args, outputs)
+
+  if key is not None:
+    cache.store(key, outputs)
+
+  return ret
+
+def _cache_key(args):
+  """!
+    Computes the object cache key of a compiler command line.
+
+    \return The key, or \p None if the command cannot be cached
+  """
+  import subprocess
+  import shlex
+  import shutil
+  from .cache import ObjectCache
+
+  argv = shlex.split(args)
+  parts = [args]
+  compiler = shutil.which(argv[0]) if argv else None
+  split = _compiler_argv(argv)
+
+  if compiler is None or split is None:
+    return None
+
+  st = os.stat(compiler)
+  parts.append('{}:{}:{}'.format(compiler, st.st_size, st.st_mtime_ns))
+  pp_argv, files = split
+
+  for path in files:
+    with open(path, 'rb') as f:
+      parts.append(f.read())
+
+  pp = subprocess.run(pp_argv + ['-E'], stdout = subprocess.PIPE, stderr = subprocess.DEVNULL)
+
+  if pp.returncode != 0:
+    return None
+
+  parts.append(pp.stdout)
+
+  return ObjectCache.key(*parts)
+
+def _compiler_argv(argv):
+  """!
+    Splits a compiler argument list into the arguments which preprocess its
+    sources and the other input files it names (e.g. objects to link).
+
+    \return A (preprocessor argument list, input file list) tuple, or \p None if an argument is not understood
+  """
+  pp_argv = argv[:1]
+  files = []
+
+  i = 1
+  while i < len(argv):
+    a = argv[i]
+
+    if a in _cache_output_opts:
+      i += 1
+    elif a in _cache_value_opts:
+      pp_argv += argv[i:i + 2]
+      i += 1
+    elif a in ('-c', '-MD', '-MMD', '-MP'):
+      pass
+    elif a.startswith('-') or a.endswith(_cache_source_ext):
+      pp_argv.append(a)
+    elif os.path.isfile(a):
+      files.append(a)
+    else:
+      return None
+
+    i += 1
+
+  return pp_argv, files
+
+def remote_pool():
+  """! Returns the remote worker pool
+    Returns the pool of the workers running the compiler commands, creating
+    it on first use. Remote execution is enabled by setting the
+    \p FOUNDRY_REMOTE environment variable (e.g. with
+    \p -D:FOUNDRY_REMOTE=host:port,host:port) to the addresses of workers
+    started by \p python -m foundry.remote worker.
+
+    \return A RemotePool object, or \p None if remote execution is disabled
+  """
+  global _remote_pool
+
+  with _remote_pool_lock:
+    if _remote_pool is None:
+      hosts = os.environ.get(_remote_var)
+
+      if hosts:
+        from .remote import RemotePool, parse_hosts
+
+        try:
+          _remote_pool = RemotePool(parse_hosts(hosts))
+          msg('Using remote workers "{}"'.format(hosts), v = 5)
+        except ValueError:
+          warn('Invalid remote worker list "{}"'.format(hosts))
+          _remote_pool = False
+      else:
+        _remote_pool = False
+
+  return _remote_pool or None
+
+def remote_check_call(args, outputs, inputs = ()):
+  """! Calls a compiler on a remote worker
+    Sends a compiler command to a worker of remote_pool() along with its
+    input files, then writes back its outputs. The inputs are the files
+    named by the command line and the headers its sources include, as found
+    by the preprocessor, besides \p inputs; files given by absolute paths,
+    such as the system headers, are expected to be found on the worker.
+
+    The command is run locally by check_call() if remote execution is
+    disabled, no worker is available, or its inputs cannot be found or lie
+    outside of the current directory.
+
+    \param args The compiler command line, using paths relative to the current directory
+    \param outputs A list of the output file paths written by the command
+    \param inputs An iterable object containing additional input files
+
+    \return 0
+
+    \throws subprocess.CalledProcessError If the command return code is not 0
+  """
+  import subprocess
+  from .remote import RemoteError
+
+  pool = remote_pool() if not _dry_run else None
+  files = _command_inputs(args) if pool is not None and pool.slots() > 0 else None
+
+  if files is None:
+    return check_call(args)
+
+  files = sorted(set(files).union(os.path.normpath(f) for f in inputs))
+
+  try:
+    result = _run_job('remote_check_call', args, None, None, None, (pool, files, outputs))
+  except RemoteError as e:
+    warn('Running "{}" locally: {}'.format(_command_line(args), e))
+    return check_call(args)
+
+  if result.returncode != 0:
+    raise subprocess.CalledProcessError(result.returncode, args, result.stdout, result.stderr)
+
+  return 0
+
+def _command_inputs(args):
+  """!
+    Finds the input files of a compiler command line: the files it names and
+    the headers its sources include. Files given by absolute paths are left
+    out.
+
+    \return A list of file paths, or \p None if the inputs cannot be found or lie outside of the current directory
   """
-  msg(args)
-  return subprocess.check_call(args, stdin = stdin, stdout = stdout, stderr = stderr, shell = True)
+  import subprocess
+  import shlex
+  from .depends import parse_deps
+
+  split = _compiler_argv(shlex.split(args) if isinstance(args, str) else [str(a) for a in args])
+
+  if split is None:
+    return None
+
+  pp_argv, files = split
+
+  if any(a.endswith(_cache_source_ext) for a in pp_argv[1:]):
+    pp = subprocess.run(pp_argv + ['-MM'], stdout = subprocess.PIPE, stderr = subprocess.DEVNULL, universal_newlines = True)
+
+    if pp.returncode != 0:
+      return None
+
+    for prereqs in parse_deps(pp.stdout).values():
+      files += prereqs
+
+  files = [os.path.normpath(f) for f in files if not os.path.isabs(f)]
+
+  if any(f.split(os.sep)[0] == '..' for f in files):
+    return None
+
+  return files
 
 def remove(f):
   """! Removes a file
@@ -475,7 +2156,10 @@ def remove(f):
   """
   if os.path.isfile(f):
     msg('Removing file \'{}\'...'.format(f))
-    os.remove(f)
+
+    if not _dry_run:
+      os.remove(f)
+      _update_file_indexes(f, False)
 
 def mkdir(path, mode = 0o777, dir_fd = None):
   """! Creates a directory
@@ -483,11 +2167,13 @@ def mkdir(path, mode = 0o777, dir_fd = None):
 
     \see os.mkdir()
   """
+  if _dry_run:
+    if not os.path.isdir(path):
+      msg('Created directory \'%s\'' % path)
+    return
+
   try:
-    os.mkdir(path, mode, dir_fd)
+    os.mkdir(path, mode, dir_fd = dir_fd)
     msg('Created directory \'%s\'' % path)
   except OSError:
     pass
-
-# Check the command line switches
-_handle_switches()
@@ -0,0 +1,145 @@
+"""
+Babilonia project: Utility library and framework for C11/Python3
+    Copyright (C) 2014  Alfredo Mungo
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import os
+import os.path
+import hashlib
+import tempfile
+
+class AtomicWriter:
+  """!
+    Context manager writing a file atomically, only if its content changes.
+
+    The content is written to a temporary file in the destination directory.
+    When the block ends, the temporary file is compared with the destination
+    file (sizes first, then content hashes) and renamed over it only if they
+    differ, so that an unchanged file keeps its modification time and the
+    files depending on it are not rebuilt. If the block raises, the
+    destination file is left untouched.
+
+    \code{.py}
+    with AtomicWriter('out.h', 'w') as f:
+      f.write(text)
+    \endcode
+  """
+  def __init__(self, dest, mode = 'w', overwrite = True, **kwargs):
+    """!
+      \param dest The destination file path
+      \param mode The file mode, either \p 'w' or \p 'wb'
+      \param overwrite False to raise FileExistsError if the destination file exists and would change
+      \param kwargs Additional arguments to pass to \p open(), such as \p encoding or \p newline
+    """
+
+    ## Destination file path
+    self.dest = dest
+
+    ## True if the destination file has been written. Set when the block ends
+    self.changed = None
+
+    self._mode = mode
+    self._overwrite = overwrite
+    self._kwargs = kwargs
+
+  def __enter__(self):
+    fd, self._tmp = tempfile.mkstemp(prefix = '.' + os.path.basename(self.dest) + '.', dir = os.path.dirname(self.dest) or os.curdir)
+    self._file = os.fdopen(fd, self._mode, **self._kwargs)
+    return self._file
+
+  def __exit__(self, exc_type, exc, tb):
+    self._file.close()
+
+    try:
+      if exc_type is not None:
+        return False
+
+      self.changed = not _same_content(self._tmp, self.dest)
+
+      if self.changed:
+        if not self._overwrite and os.path.exists(self.dest):
+          raise FileExistsError(self.dest)
+
+        # mkstemp() creates private files: a replaced file keeps its mode, a new one gets the mode open() would give it
+        try:
+          os.chmod(self._tmp, os.stat(self.dest).st_mode & 0o7777)
+        except FileNotFoundError:
+          os.chmod(self._tmp, 0o666 & ~_umask())
+
+        os.replace(self._tmp, self.dest)
+    finally:
+      if os.path.exists(self._tmp):
+        os.remove(self._tmp)
+
+    return False
+
+def write_if_changed(dest, data, **kwargs):
+  """! Writes a file if its content changes
+    Atomically replaces the content of a file, leaving the file untouched if
+    the content is the same.
+
+    \param dest The destination file path
+    \param data The file content, either a string or a bytes object
+    \param kwargs Additional arguments to pass to \p open(), for strings
+
+    \return True if the file has been written, False if it was up to date
+
+    \see AtomicWriter
+  """
+  writer = AtomicWriter(dest, 'wb' if isinstance(data, bytes) else 'w', **kwargs)
+
+  with writer as f:
+    f.write(data)
+
+  return writer.changed
+
+def _umask():
+  """! Returns the file mode creation mask of the process """
+  # Read without changing it where possible, as other threads may be creating files
+  try:
+    with open('/proc/self/status', 'r') as status:
+      for line in status:
+        if line.startswith('Umask:'):
+          return int(line.split()[1], 8)
+  except (OSError, ValueError):
+    pass
+
+  mask = os.umask(0o022)
+  os.umask(mask)
+  return mask
+
+def _same_content(a, b):
+  """! Checks whether two files have the same size and content hash """
+  try:
+    if os.path.getsize(a) != os.path.getsize(b):
+      return False
+  except OSError:
+    return False
+
+  return _hash_file(a) == _hash_file(b)
+
+def _hash_file(path):
+  """! Returns the hash of a file content """
+  digest = hashlib.blake2b()
+
+  with open(path, 'rb') as f:
+    for block in iter(lambda: f.read(1 << 16), b''):
+      digest.update(block)
+
+  return digest.digest()
+
+if __name__ == '__main__':
+  print('This module cannot be run on its own')
@@ -0,0 +1,154 @@
+"""
+Babilonia project: Utility library and framework for C11/Python3
+    Copyright (C) 2014  Alfredo Mungo
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import json
+from .log import msg, warn
+from .atomic import write_if_changed
+
+## Benchmark result file format version
+_format = 1
+
+## Default metrics compared with the baseline
+default_metrics = ('median_ns',)
+
+## Default slowdown allowed over the baseline, as a fraction of the baseline value
+default_threshold = 0.25
+
+def run_benchmark(command, prefix = None):
+  """!
+    Runs a benchmark program and collects its results.
+
+    The program prints a JSON object on a line of its own for each benchmark,
+    holding the benchmark name (the \p name key) and its metrics; any other
+    output line is ignored.
+
+    \param command The command line of the program, run like check_output()
+    \param prefix A string prepended to the benchmark names, followed by a slash
+
+    \return A dictionary mapping the benchmark names to dictionaries of metrics/values, empty in a dry run
+
+    \throw subprocess.CalledProcessError if the program fails
+  """
+  from . import check_output
+
+  # Empty in a dry run, where the command is only printed and planned
+  output = check_output(command)
+  results = {}
+
+  for line in output.splitlines():
+    line = line.strip()
+
+    if not line.startswith('{'):
+      continue
+
+    record = json.loads(line)
+    name = record.pop('name')
+    results[name if prefix is None else prefix + '/' + name] = record
+
+  return results
+
+def load_results(path):
+  """!
+    Loads benchmark results, e.g. a baseline.
+
+    \param path The result file path
+
+    \return A dictionary of benchmark names/metrics, or \p None if the file does not exist
+  """
+  try:
+    with open(path, 'r', encoding = 'utf_8') as f:
+      data = json.load(f)
+  except FileNotFoundError:
+    return None
+
+  if data.get('format') != _format:
+    warn('Ignoring benchmark results "{}": unknown format'.format(path))
+    return None
+
+  return data['results']
+
+def save_results(path, results):
+  """!
+    Saves benchmark results.
+
+    \param path The result file path
+    \param results A dictionary of benchmark names/metrics
+  """
+  from . import dry_run
+
+  if not dry_run():
+    write_if_changed(path, json.dumps({'format': _format, 'results': results}, indent = 2, sort_keys = True) + '\n')
+
+  msg('Saved benchmark results to "{}"'.format(path))
+
+def compare(results, baseline, metrics = default_metrics, threshold = default_threshold):
+  """!
+    Compares benchmark results with a baseline. Benchmarks missing from
+    either side are not compared.
+
+    \param results A dictionary of benchmark names/metrics
+    \param baseline A dictionary of benchmark names/metrics
+    \param metrics An iterable object containing the metrics to compare, lower values being better
+    \param threshold The slowdown allowed over the baseline, as a fraction of the baseline value, or a dictionary mapping the benchmark names to their thresholds (the \p None key holding the default one)
+
+    \return A list of (name, metric, baseline value, value) tuples, one for each regression
+  """
+  regressions = []
+
+  for name in sorted(results):
+    if name not in baseline:
+      continue
+
+    limit = threshold.get(name, threshold.get(None, default_threshold)) if isinstance(threshold, dict) else threshold
+
+    for metric in metrics:
+      value = results[name].get(metric)
+      base = baseline[name].get(metric)
+
+      if value is not None and base is not None and value > base * (1 + limit):
+        regressions.append((name, metric, base, value))
+
+  return regressions
+
+def report(results, baseline = None, metrics = default_metrics):
+  """!
+    Prints benchmark results, along with their change over a baseline.
+
+    \param results A dictionary of benchmark names/metrics
+    \param baseline A dictionary of benchmark names/metrics, or \p None
+    \param metrics An iterable object containing the metrics to print
+  """
+  print('{:<32} {:<12} {:>14} {:>14} {:>9}'.format('Benchmark', 'Metric', 'Value', 'Baseline', 'Change'))
+
+  for name in sorted(results):
+    for metric in metrics:
+      value = results[name].get(metric)
+
+      if value is None:
+        continue
+
+      base = (baseline or {}).get(name, {}).get(metric)
+
+      if base:
+        print('{:<32} {:<12} {:>14.0f} {:>14.0f} {:>+8.1f}%'.format(name, metric, value, base, (value - base) * 100 / base))
+      else:
+        print('{:<32} {:<12} {:>14.0f} {:>14} {:>9}'.format(name, metric, value, '-', '-'))
+
+  print()
+
+if __name__ == '__main__':
+  print('This module cannot be run on its own')
@@ -0,0 +1,180 @@
+"""
+Babilonia project: Utility library and framework for C11/Python3
+    Copyright (C) 2014  Alfredo Mungo
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import os
+import os.path
+import shutil
+import hashlib
+import threading
+import tempfile
+
+class ObjectCache:
+  """!
+    Local cache of compiled outputs.
+
+    Each cache entry is a directory named after the entry key, holding one
+    file per output. Entries are evicted in least recently used order when
+    the cache grows beyond its maximum size: the modification time of an
+    entry directory is updated each time the entry is used.
+  """
+  def __init__(self, path, max_size):
+    """!
+      \param path The cache directory path. It is created if it does not exist
+      \param max_size The maximum cache size, in bytes
+    """
+
+    ## Cache directory path
+    self.path = path
+
+    ## Maximum cache size, in bytes
+    self.max_size = max_size
+
+    ## Number of outputs restored from the cache
+    self.hits = 0
+
+    ## Number of outputs not found in the cache
+    self.misses = 0
+
+    ## Total size of the cache, computed on first store
+    self._size = None
+
+    self._lock = threading.Lock()
+
+    os.makedirs(path, exist_ok = True)
+
+  @staticmethod
+  def key(*parts):
+    """!
+      Computes an entry key.
+
+      \param parts The byte strings (or strings) the entry depends on
+
+      \return The hexadecimal entry key
+    """
+    digest = hashlib.blake2b(digest_size = 20)
+
+    for part in parts:
+      if isinstance(part, str):
+        part = part.encode('utf_8')
+
+      digest.update(len(part).to_bytes(8, 'little'))
+      digest.update(part)
+
+    return digest.hexdigest()
+
+  def _entry(self, key):
+    return os.path.join(self.path, key[:2], key[2:])
+
+  def restore(self, key, outputs):
+    """!
+      Restores the outputs stored in an entry.
+
+      \param key The entry key
+      \param outputs A list of output file paths, in the same order they were stored
+
+      \return True on a cache hit, False on a cache miss
+    """
+    entry = self._entry(key)
+
+    try:
+      os.utime(entry)
+      names = set(os.listdir(entry))
+    except OSError:
+      names = ()
+
+    if '0' not in names:
+      with self._lock:
+        self.misses += 1
+      return False
+
+    for i, out in enumerate(outputs):
+      if str(i) in names:
+        shutil.copy(os.path.join(entry, str(i)), out)
+
+    with self._lock:
+      self.hits += 1
+
+    return True
+
+  def store(self, key, outputs):
+    """!
+      Stores a set of outputs in a new entry. Outputs which do not exist are
+      left out, except for the first one which must exist.
+
+      \param key The entry key
+      \param outputs A list of output file paths
+    """
+    entry = self._entry(key)
+    os.makedirs(os.path.dirname(entry), exist_ok = True)
+    tmp = tempfile.mkdtemp(dir = os.path.dirname(entry))
+    size = 0
+
+    for i, out in enumerate(outputs):
+      if os.path.isfile(out):
+        shutil.copy(out, os.path.join(tmp, str(i)))
+        size += os.path.getsize(out)
+
+    try:
+      os.rename(tmp, entry)
+    except OSError: # Stored meanwhile by someone else
+      shutil.rmtree(tmp, ignore_errors = True)
+      return
+
+    with self._lock:
+      if self._size is None:
+        self._size = self._total_size()
+      else:
+        self._size += size
+
+      if self._size > self.max_size:
+        self._evict()
+
+  def _total_size(self):
+    """! Returns the size of every entry in the cache """
+    size = 0
+
+    for entry in self._entries():
+      size += _dir_size(entry.path)
+
+    return size
+
+  def _entries(self):
+    """! Yields the entry directories of the cache """
+    for bucket in os.scandir(self.path):
+      if bucket.is_dir():
+        for entry in os.scandir(bucket.path):
+          if entry.is_dir() and not entry.name.startswith('tmp'):
+            yield entry
+
+  def _evict(self):
+    """! Removes the least recently used entries until the cache fits its maximum size """
+    entries = sorted(self._entries(), key = lambda e: e.stat().st_mtime)
+
+    for entry in entries:
+      if self._size <= self.max_size:
+        break
+
+      self._size -= _dir_size(entry.path)
+      shutil.rmtree(entry.path, ignore_errors = True)
+
+def _dir_size(path):
+  """! Returns the size of the files contained in a directory """
+  return sum(f.stat().st_size for f in os.scandir(path) if f.is_file())
+
+if __name__ == '__main__':
+  print('This module cannot be run on its own')
@@ -0,0 +1,227 @@
+"""
+Babilonia project: Utility library and framework for C11/Python3
+    Copyright (C) 2014  Alfredo Mungo
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import os
+import os.path
+import json
+import hashlib
+import threading
+
+## Database format version
+_FORMAT = 1
+
+class BuildDatabase:
+  """!
+    Persistent record of the build outputs.
+
+    For each output the database stores the exact command line it was built
+    with and a content hash of each of its inputs. File hashes are cached
+    along with the file size and modification time, so they are only
+    recomputed when one of them changes.
+  """
+  def __init__(self, path):
+    """!
+      \param path The database file path. The file is read if it exists
+    """
+
+    ## Database file path
+    self.path = path
+
+    ## Known files: path -> [size, mtime_ns, hash]
+    self._files = {}
+
+    ## Recorded outputs: path -> {'command': command, 'inputs': {path: hash}}
+    self._outputs = {}
+
+    ## Durations recorded by the last run: key -> seconds
+    self._timings = {}
+
+    ## True if the database has unsaved changes
+    self._dirty = False
+
+    self._lock = threading.RLock()
+    self.load()
+
+  def load(self):
+    """!
+      Loads the database file. A missing or unreadable file yields an empty
+      database.
+    """
+    try:
+      with open(self.path, 'r', encoding = 'utf_8') as db_file:
+        data = json.load(db_file)
+    except (OSError, ValueError):
+      data = {}
+
+    with self._lock:
+      if data.get('format') == _FORMAT:
+        self._files = data.get('files', {})
+        self._outputs = data.get('outputs', {})
+        self._timings = data.get('timings', {})
+      else:
+        self._files = {}
+        self._outputs = {}
+        self._timings = {}
+
+      self._dirty = False
+
+  def save(self):
+    """!
+      Writes the database file, if it has been changed since it was loaded.
+    """
+    with self._lock:
+      if not self._dirty:
+        return
+
+      tmp = self.path + '.tmp'
+
+      with open(tmp, 'w', encoding = 'utf_8') as db_file:
+        json.dump({'format': _FORMAT, 'files': self._files, 'outputs': self._outputs, 'timings': self._timings}, db_file, separators = (',', ':'))
+
+      os.replace(tmp, self.path)
+      self._dirty = False
+
+  def hash_file(self, path):
+    """!
+      Returns the content hash of a file.
+
+      \param path The file path
+
+      \return The hexadecimal hash of the file, or \p None if the file does not exist
+    """
+    path = os.path.normpath(path)
+
+    try:
+      st = os.stat(path)
+    except OSError:
+      return None
+
+    with self._lock:
+      entry = self._files.get(path)
+
+      if entry is not None and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+        return entry[2]
+
+    digest = hashlib.blake2b(digest_size = 20)
+
+    with open(path, 'rb') as f:
+      for block in iter(lambda: f.read(1 << 16), b''):
+        digest.update(block)
+
+    with self._lock:
+      self._files[path] = [st.st_size, st.st_mtime_ns, digest.hexdigest()]
+      self._dirty = True
+
+    return digest.hexdigest()
+
+  def is_up_to_date(self, output, command):
+    """!
+      Checks an output against its record.
+
+      \param output The output file path
+      \param command The command line which would build \p output
+
+      \return \p None if there is no record of \p output, True if \p output exists and has been built with \p command from inputs which have not changed since, False otherwise
+    """
+    unchanged = self.is_unchanged(output, command)
+
+    if unchanged and not os.path.isfile(output):
+      return False
+
+    return unchanged
+
+  def is_unchanged(self, key, command):
+    """!
+      Checks a record against the current state of its inputs, without
+      checking whether the recorded output exists.
+
+      \param key The output file path, or any other key the record has been stored with
+      \param command The command line which would build the output
+
+      \return \p None if there is no such record, True if the record has been made with \p command from inputs which have not changed since, False otherwise
+    """
+    with self._lock:
+      record = self._outputs.get(os.path.normpath(key))
+
+    if record is None:
+      return None
+
+    if record['command'] != command:
+      return False
+
+    for path, digest in record['inputs'].items():
+      if self.hash_file(path) != digest:
+        return False
+
+    return True
+
+  def inputs(self, output):
+    """!
+      Returns the inputs recorded for an output.
+
+      \param output The output file path
+
+      \return A list of input file paths, empty if there is no record of \p output
+    """
+    with self._lock:
+      record = self._outputs.get(os.path.normpath(output))
+
+    return list(record['inputs']) if record is not None else []
+
+  def record(self, output, command, inputs):
+    """!
+      Records an output as built.
+
+      \param output The output file path, or any other key identifying the record
+      \param command The command line \p output has been built with
+      \param inputs An iterable object containing the input file paths
+    """
+    hashes = {}
+
+    for path in inputs:
+      path = os.path.normpath(path)
+      hashes[path] = self.hash_file(path)
+
+    with self._lock:
+      self._outputs[os.path.normpath(output)] = {'command': command, 'inputs': hashes}
+      self._dirty = True
+
+  def timing(self, key):
+    """!
+      Returns a recorded duration.
+
+      \param key The key the duration has been recorded with, such as a command line
+
+      \return The duration in seconds, or \p None if there is no such record
+    """
+    with self._lock:
+      return self._timings.get(key)
+
+  def record_timing(self, key, seconds):
+    """!
+      Records the duration of a command or of any other step of the build.
+
+      \param key The key identifying the step, such as its command line
+      \param seconds The duration, in seconds
+    """
+    with self._lock:
+      self._timings[key] = seconds
+      self._dirty = True
+
+if __name__ == '__main__':
+  print('This module cannot be run on its own')
@@ -0,0 +1,189 @@
+"""
+Babilonia project: Utility library and framework for C11/Python3
+    Copyright (C) 2014  Alfredo Mungo
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import os
+import os.path
+import threading
+
+def parse_depfile(path):
+  """! Parses a make-style dependency file
+    Parses a dependency file such as the ones generated by gcc's \p -MD and
+    \p -MMD switches.
+
+    \param path The path to the dependency file
+
+    \return A dictionary mapping each target found in the file to the list of its prerequisites
+
+    \throws FileNotFoundError If the dependency file does not exist
+  """
+  with open(path, 'r', encoding = 'utf_8') as dep_file:
+    return parse_deps(dep_file.read())
+
+def parse_deps(text):
+  """! Parses make-style dependency rules
+    Parses dependency rules such as the ones printed by gcc's \p -M and \p -MM
+    switches.
+
+    \param text The dependency rules
+
+    \return A dictionary mapping each target found in \p text to the list of its prerequisites
+  """
+  text = text.replace('\\\r\n', ' ').replace('\\\n', ' ')
+
+  rules = {}
+
+  for line in text.splitlines():
+    words = _split_words(line)
+
+    colon = next((i for i, w in enumerate(words) if w.endswith(':')), None)
+
+    if colon is None:
+      continue
+
+    targets = words[:colon + 1]
+    prereqs = [os.path.normpath(w) for w in words[len(targets):]]
+
+    for tgt in targets:
+      tgt = os.path.normpath(tgt.rstrip(':'))
+
+      if tgt:
+        rules.setdefault(tgt, []).extend(prereqs)
+
+  return rules
+
+class IncludeGraph:
+  """!
+    In-memory graph of the dependencies read from dependency files.
+
+    Each dependency file is parsed once and parsed again only when it
+    changes, so the graph can be queried for every object of a build at the
+    cost of a stat call per dependency file.
+  """
+  def __init__(self):
+    ## Direct prerequisites: path -> set of paths
+    self._edges = {}
+
+    ## Loaded dependency files: path -> (mtime_ns, targets)
+    self._depfiles = {}
+
+    self._lock = threading.Lock()
+
+  def load(self, depfile):
+    """!
+      Adds the rules of a dependency file to the graph, replacing the ones
+      it contributed before.
+
+      \param depfile The dependency file path
+
+      \return True if the dependency file exists, False otherwise
+    """
+    try:
+      mtime = os.stat(depfile).st_mtime_ns
+    except OSError:
+      return False
+
+    with self._lock:
+      loaded = self._depfiles.get(depfile)
+
+      if loaded is not None and loaded[0] == mtime:
+        return True
+
+    rules = parse_depfile(depfile)
+
+    with self._lock:
+      if loaded is not None:
+        for tgt in loaded[1]:
+          self._edges.pop(tgt, None)
+
+      for tgt, prereqs in rules.items():
+        self._edges.setdefault(tgt, set()).update(prereqs)
+
+      self._depfiles[depfile] = (mtime, tuple(rules))
+
+    return True
+
+  def prerequisites(self, path):
+    """!
+      Returns the transitive prerequisites of a file.
+
+      \param path The file path
+
+      \return A set containing every file \p path depends on, directly or not
+    """
+    seen = set()
+    stack = [os.path.normpath(path)]
+
+    with self._lock:
+      while stack:
+        for dep in self._edges.get(stack.pop(), ()):
+          if dep not in seen:
+            seen.add(dep)
+            stack.append(dep)
+
+    return seen
+
+  def newer_than(self, path, mtime):
+    """!
+      Checks whether any transitive prerequisite of a file is newer than a
+      given time.
+
+      \param path The file path
+      \param mtime The reference modification time, in seconds
+
+      \return True if a prerequisite is newer than \p mtime or is missing, False otherwise
+    """
+    for dep in self.prerequisites(path):
+      try:
+        if os.path.getmtime(dep) > mtime:
+          return True
+      except OSError:
+        return True
+
+    return False
+
+def _split_words(line):
+  """! Splits a dependency file line into words, honoring escaped spaces """
+  words = []
+  word = ''
+  i = 0
+
+  while i < len(line):
+    c = line[i]
+
+    if c == '\\' and i + 1 < len(line) and line[i + 1] in ' #':
+      word += line[i + 1]
+      i += 1
+    elif c == '$' and line[i + 1:i + 2] == '$':
+      word += '$'
+      i += 1
+    elif c.isspace():
+      if word:
+        words.append(word)
+      word = ''
+    else:
+      word += c
+
+    i += 1
+
+  if word:
+    words.append(word)
+
+  return words
+
+if __name__ == '__main__':
+  print('This module cannot be run on its own')
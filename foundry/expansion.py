@@ -21,26 +21,69 @@ Babilonia project: Utility library and framework for C11/Python3
   The expansion module can also be called as a standalone executable by running
   
   python -m bbl.expansion [options] -o:out_file in_file
+  python -m bbl.expansion [options] -m:manifest
+  python -m bbl.expansion [options] -d:template_dir [-p:pattern] [-o:out_dir]
   
   
   When running as an executable, you can provide the following options:
   
     * -f to overwrite existing files
     * -D:name=value to define a substitution variable
-    * -o:out to define the output file
+    * -o:out to define the output file (or directory, in directory mode)
+    * -m:manifest to expand every file listed in a JSON manifest
+    * -d:dir to expand every template file in a directory tree
+    * -p:pattern to select the template files in directory mode (*.in)
+    * -n:N to expand up to N files at the same time
   
   
   If no input and/or output file is provided, an exception is thrown.
+
+  A manifest is a JSON object such as:
+
+    {
+      "vars": {"NAME": "value"},
+      "files": [
+        {"template": "a.h.in", "output": "a.h", "vars": {"OTHER": "value"}}
+      ]
+    }
+
+  where the top level "vars" are shared by every file and paths are relative
+  to the manifest directory. In directory mode, each output is named after
+  its template without its last extension.
+
+  In manifest and directory modes, outputs whose content would not change
+  are not written.
 """
 
 import sys
+import io
+import os
 import os.path
-from . import err, fatal, msg
+import re
+import json
+import glob
+import threading
+from .log import err, fatal, msg, warn
+from .atomic import AtomicWriter
 
 ## Module version
-__version__ = '0.0.2'
+__version__ = '0.0.3'
+
+## Template variable pattern: @@[+-]VARNAME@@
+_var_re = re.compile(r'@@([+-]?)([^@\s]+)@@')
+
+## Compiled templates: path -> (mtime_ns, size, parts)
+_templates = {}
+
+_templates_lock = threading.Lock()
 
-def expand_file(src, dest, vars, overwrite = False, newline = '\n'):
+## Size of the chunks yielded by expand_iter(), in characters
+_chunk_size = 1 << 16
+
+## Buffer size of the destination files opened by expand_file(), in bytes
+_buffer_size = 1 << 20
+
+def expand_file(src, dest, vars, overwrite = False, newline = '\n', changed_only = False):
   """! Expands a template file.
     Transforms a template file to a destination file, expanding its
     @@-variables.
@@ -58,59 +101,284 @@ def expand_file(src, dest, vars, overwrite = False, newline = '\n'):
       @@+AUTHOR@@ => "JOHN DOE"
       @@-AUTHOR@@ => "john doe"
     \endcode
+
+    The template is expanded in a single pass, so values containing @@ are
+    not expanded again. Variables missing from \p vars are left as they are
+    and reported as a warning.
     
     \param src The path to the template file
-    \param dest The path to the destination file. \p None to return the expanded file as a string
+    \param dest The path to the destination file, or a writable file-like object. \p None to return the expanded file as a string
     \param vars A dictionary of variables/values to expand in the template file
     \param overwrite True if an existing destination file should be overwritten
-    \param newline The newline character to use when transforming files
+    \param newline The newline character to use when transforming files. Ignored if \p dest is a file-like object
+    \param changed_only True to write the destination file atomically and only if its content changes, so that its modification time is kept otherwise
     
-    \returns Nothing unless \p dest is set to \p {None}. In that case returns the expanded file as a string
+    \returns Nothing unless \p dest is set to \p {None}. In that case returns the expanded file as a string. If \p changed_only is True, returns whether the destination file has been written
 
     \throws FileExistsError if the destination file exists and \p overwrite is False
+
+    \see expand_iter()
   """
-  with open(src, 'r', encoding = 'utf_8') as input_file:
-    if dest is not None:
-      if os.path.exists(dest) and not overwrite:
-        err('expansion.expand_file(): The destination file "{}" exists.'.format(dest))
-        raise FileExistsError
+  if dest is None: # Return expanded file as string
+    msg('Expanding file "{}" to string...'.format(src), v = 5)
+    return ''.join(expand_iter(src, vars))
 
-      with open(dest, 'wt', newline = newline) as output_file:
-        msg('Expanding file "{}" to file "{}"...'.format(src, dest), v = 5)
-  
-        for line in input_file:
-          print(_expand_line(line, vars), end='', file=output_file)
-    else: # Return expanded file as string
-      msg('Expanding file "{}" to string...'.format(src), v = 5)
-      lines = ''
+  if hasattr(dest, 'write'):
+    msg('Expanding file "{}" to stream...'.format(src), v = 5)
+    expand_to(src, dest, vars)
+    return
+
+  if os.path.exists(dest) and not overwrite:
+    err('expansion.expand_file(): The destination file "{}" exists.'.format(dest))
+    raise FileExistsError
+
+  if changed_only:
+    writer = AtomicWriter(dest, 'w', encoding = 'utf_8', newline = newline, buffering = _buffer_size)
+
+    with writer as output_file:
+      msg('Expanding file "{}" to file "{}"...'.format(src, dest), v = 5)
+      expand_to(src, output_file, vars)
+
+    return writer.changed
+
+  with open(dest, 'wt', encoding = 'utf_8', newline = newline, buffering = _buffer_size) as output_file:
+    msg('Expanding file "{}" to file "{}"...'.format(src, dest), v = 5)
+    expand_to(src, output_file, vars)
 
-      for line in input_file:
-        lines += _expand_line(line, vars)
+def expand_iter(src, vars):
+  """! Expands a template file lazily.
+    Yields the expansion of a template file in chunks, without building the
+    whole expanded text in memory.
 
-      return lines
+    \param src The path to the template file
+    \param vars A dictionary of variables/values to expand in the template file
 
-def _expand_line(line, vars):
-  """! Expands a line.
-    Expands a line by expanding @@[+-]VARNAME@@ to its value in \p vars.
+    \returns A generator of strings
 
     \see expand_file()
   """
-  for var in vars:
-    line = line.replace('@@' + var + '@@', vars[var]) \
-    .replace('@@+' + var + '@@', vars[var].upper()) \
-    .replace('@@-' + var + '@@', vars[var].lower())
+  return _render(_load_template(src), vars, src)
+
+def expand_to(src, out, vars):
+  """! Expands a template file to a stream.
+    Writes the expansion of a template file to a file-like object, chunk by
+    chunk.
+
+    \param src The path to the template file
+    \param out A writable file-like object. Binary streams (such as a pipe to a process stdin) receive UTF-8 text
+    \param vars A dictionary of variables/values to expand in the template file
+
+    \see expand_iter()
+  """
+  binary = isinstance(out, (io.RawIOBase, io.BufferedIOBase)) or 'b' in getattr(out, 'mode', '')
+
+  for chunk in expand_iter(src, vars):
+    out.write(chunk.encode('utf_8') if binary else chunk)
+
+def compile_template(text):
+  """! Compiles a template.
+    Splits a template into its literal text and its variables, so that it
+    can be expanded in a single pass.
+
+    \param text The template text
+
+    \returns A tuple alternating literal strings and (modifier, name) tuples. Literal strings are at even positions
+  """
+  words = _var_re.split(text)
+  parts = []
+
+  for i in range(0, len(words) - 1, 3):
+    parts.append(words[i])
+    parts.append((words[i + 1], words[i + 2]))
+
+  parts.append(words[-1])
+
+  return tuple(parts)
+
+def _load_template(src):
+  """! Loads a compiled template.
+    Compiles a template file, or returns its cached compiled form if the
+    file has not changed since it was compiled.
+
+    \param src The path to the template file
+
+    \see compile_template()
+  """
+  st = os.stat(src)
+
+  with _templates_lock:
+    cached = _templates.get(src)
+
+  if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+    return cached[2]
+
+  with open(src, 'r', encoding = 'utf_8') as input_file:
+    parts = compile_template(input_file.read())
+
+  with _templates_lock:
+    _templates[src] = (st.st_mtime_ns, st.st_size, parts)
+
+  return parts
+
+def _render(parts, vars, src = None):
+  """! Expands a compiled template.
+    Unknown variables are left as they are and reported once, when the
+    expansion is done.
+
+    \param parts The compiled template, as returned by compile_template()
+    \param vars A dictionary of variables/values
+    \param src The template file path, used when reporting unknown variables
+
+    \returns A generator of chunks of the expanded text
+  """
+  out = []
+  size = 0
+  unknown = []
 
-  return line
+  for i, part in enumerate(parts):
+    if i % 2 == 0:
+      value = part
+    else:
+      mod, name = part
+      value = vars.get(name)
+
+      if value is None:
+        value = '@@' + mod + name + '@@'
+
+        if name not in unknown:
+          unknown.append(name)
+      elif mod == '+':
+        value = value.upper()
+      elif mod == '-':
+        value = value.lower()
+
+    out.append(value)
+    size += len(value)
+
+    if size >= _chunk_size:
+      yield ''.join(out)
+      out = []
+      size = 0
+
+  if out:
+    yield ''.join(out)
+
+  if unknown:
+    warn('expansion: unknown variable(s) {} in "{}"'.format(', '.join(unknown), src if src is not None else '<template>'))
+
+def expand_batch(jobs, vars = None, overwrite = False, newline = '\n', workers = 1):
+  """! Expands many template files.
+    Expands a set of template files, skipping the destination files whose
+    content would not change. Files are expanded by a pool of up to
+    \p workers processes.
+
+    \param jobs An iterable object of (template, destination, variables) tuples. Variables may be \p None
+    \param vars A dictionary of variables/values shared by every job. Job variables take precedence
+    \param overwrite True if existing destination files should be overwritten when their content changes
+    \param newline The newline character to use when transforming files
+    \param workers The maximum number of files to be expanded simultaniously
+
+    \returns A list of the destination files which have been written
+
+    \throws FileExistsError if a destination file exists, would change and \p overwrite is False
+  """
+  shared = dict(vars or {})
+  args = []
+
+  for src, dest, job_vars in jobs:
+    job_shared = dict(shared)
+    job_shared.update(job_vars or {})
+    args.append((src, dest, job_shared, overwrite, newline))
+
+  if workers <= 1 or len(args) <= 1:
+    results = [_expand_job(*a) for a in args]
+  else:
+    from . import parallel_call
+
+    results = parallel_call(_expand_job, args, threads = workers, executor = 'process')
+
+  return [a[1] for a, written in zip(args, results) if written]
+
+def load_manifest(path):
+  """! Loads a batch expansion manifest.
+
+    \param path The path to the JSON manifest
+
+    \returns A tuple made of the shared variables dictionary and of a list of (template, destination, variables) tuples
+
+    \see expand_batch()
+  """
+  with open(path, 'r', encoding = 'utf_8') as manifest_file:
+    manifest = json.load(manifest_file)
+
+  base = os.path.dirname(path)
+  jobs = []
+
+  for entry in manifest.get('files', []):
+    jobs.append((os.path.join(base, entry['template']), os.path.join(base, entry['output']), entry.get('vars')))
+
+  return manifest.get('vars', {}), jobs
+
+def dir_jobs(src_dir, pattern = '*.in', dest_dir = None):
+  """! Lists the templates in a directory tree.
+
+    \param src_dir The template directory path
+    \param pattern The glob pattern the template file names must match
+    \param dest_dir The destination directory path, \p None to write each output next to its template
+
+    \returns A list of (template, destination, None) tuples, each destination being named after its template without its last extension
+
+    \see expand_batch()
+  """
+  jobs = []
+
+  for src in sorted(glob.glob(os.path.join(src_dir, '**', pattern), recursive = True)):
+    if os.path.isfile(src):
+      dest = os.path.splitext(os.path.relpath(src, src_dir))[0]
+      jobs.append((src, os.path.join(dest_dir if dest_dir is not None else src_dir, dest), None))
+
+  return jobs
+
+def _expand_job(src, dest, vars, overwrite, newline):
+  """! Expands a template file unless its destination would not change.
+    Creates the destination directory if needed.
+
+    \returns True if \p dest has been written, False if it was up to date
+  """
+  if os.path.dirname(dest):
+    os.makedirs(os.path.dirname(dest), exist_ok = True)
+
+  writer = AtomicWriter(dest, 'w', overwrite, encoding = 'utf_8', newline = newline, buffering = _buffer_size)
+
+  try:
+    with writer as output_file:
+      expand_to(src, output_file, vars)
+  except FileExistsError:
+    err('expansion.expand_batch(): The destination file "{}" exists.'.format(dest))
+    raise
+
+  if writer.changed:
+    msg('Expanded file "{}" to file "{}"'.format(src, dest))
+  else:
+    msg('"{}" is up to date'.format(dest), v = 5)
+
+  return writer.changed
 
 def _help():
   """! Module as a program help method """
   print('Usage: expansion.py [OPTIONS] -o:out_file in_file')
+  print('       expansion.py [OPTIONS] -m:manifest')
+  print('       expansion.py [OPTIONS] -d:template_dir [-p:pattern] [-o:out_dir]')
   print()
   
   print('OPTIONS:')
-  print('\t-o:out_file\tOutput filename')
+  print('\t-o:out_file\tOutput filename (output directory in directory mode)')
   print('\t-f\tOverwrite existing files')
   print('\t-D:name=value\tDefine variable')
+  print('\t-m:manifest\tExpand the files listed in a JSON manifest')
+  print('\t-d:dir\tExpand the template files in a directory tree')
+  print('\t-p:pattern\tTemplate file name pattern in directory mode (default: *.in)')
+  print('\t-n:N\tExpand up to N files at the same time')
   
 def _main(args = sys.argv[1:]):
   """! Runs this module as a standalone program
@@ -119,6 +387,11 @@ def _main(args = sys.argv[1:]):
   """
   vars = {}
   owrite = False
+  out_file = None
+  manifest = None
+  src_dir = None
+  pattern = '*.in'
+  workers = 1
   
   for a in args:
     if a.startswith('-D:'):
@@ -132,20 +405,40 @@ def _main(args = sys.argv[1:]):
       out_file = a[3:]
     elif a == '-f':
       owrite = True
+    elif a.startswith('-m:'):
+      manifest = a[3:]
+    elif a.startswith('-d:'):
+      src_dir = a[3:]
+    elif a.startswith('-p:'):
+      pattern = a[3:]
+    elif a.startswith('-n:'):
+      try:
+        workers = int(a[3:])
+      except ValueError:
+        fatal('{} option not allowed'.format(a))
     elif a.startswith('-'):
       fatal('{} option not allowed'.format(a))
       sys.exit(1)
-  try:
-    if not args[-1].startswith('-'):
-      in_file = args[-1]
-    
-    expand_file(in_file, out_file, vars, owrite)
-  except NameError:
-    _help()
-    sys.exit(1)
-  except IndexError:
+
+  if manifest is not None or src_dir is not None:
+    jobs = []
+
+    if manifest is not None:
+      shared, jobs = load_manifest(manifest)
+      shared.update(vars)
+      vars = shared
+
+    if src_dir is not None:
+      jobs += dir_jobs(src_dir, pattern, out_file)
+
+    expand_batch(jobs, vars, owrite, workers = workers)
+    return
+
+  if out_file is None or not args or args[-1].startswith('-'):
     _help()
     sys.exit(1)
+
+  expand_file(args[-1], out_file, vars, owrite)
     
 if __name__ == '__main__':
   _main()
@@ -0,0 +1,252 @@
+"""
+Babilonia project: Utility library and framework for C11/Python3
+    Copyright (C) 2014  Alfredo Mungo
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import os
+import os.path
+import threading
+
+def scan_dir(src, subdirs = True, dirs = None):
+  """! Walks a directory tree
+    Yields the paths of the files contained in \p src (or in its full tree),
+    with a single \p os.scandir() call per directory.
+
+    \param src The toplevel directory path
+    \param subdirs True if the files in subdirectories should also be yielded
+    \param dirs A list to which the paths of the scanned directories are appended, if not \p None
+
+    \return A generator of file paths, each one joined to \p src
+  """
+  stack = [src]
+
+  while stack:
+    path = stack.pop()
+    subdir_paths = []
+
+    if dirs is not None:
+      dirs.append(path)
+
+    with os.scandir(path) as it:
+      for entry in it:
+        try:
+          is_dir = entry.is_dir()
+        except OSError:
+          continue
+
+        if is_dir:
+          if subdirs:
+            subdir_paths.append(entry.path)
+        else:
+          yield entry.path
+
+    # Keep the depth-first, in-order visit of the old recursive walker
+    stack.extend(reversed(subdir_paths))
+
+def normalize_ext(ext):
+  """! Normalizes a set of extensions
+
+    \param ext An extension or an iterable object containing extensions, with or without their leading dot. Multi-part extensions such as \p tar.gz are allowed
+
+    \return A tuple of the extensions without their leading dot, in the given order and without duplicates
+  """
+  if isinstance(ext, str):
+    ext = (ext,)
+
+  return tuple(dict.fromkeys(e.lstrip('.') for e in ext))
+
+def ext_matcher(ext):
+  """! Compiles an extension matcher
+    Compiles a set of extensions into a function which tells which one of
+    them a file path ends with. When more than one extension matches (e.g.
+    \p gz and \p tar.gz), the longest one wins.
+
+    \param ext An extension or an iterable object containing extensions
+
+    \return A callable object which accepts a file path and returns the matching extension (without dot), or \p None
+  """
+  exts = frozenset(normalize_ext(ext))
+  parts = max((e.count('.') for e in exts), default = 0) + 1
+
+  if parts == 1:
+    def match(path):
+      e = os.path.splitext(path)[1][1:]
+      return e if e in exts else None
+  else:
+    def match(path):
+      words = os.path.basename(path).lstrip('.').split('.')
+
+      for n in range(min(parts, len(words) - 1), 0, -1):
+        e = '.'.join(words[-n:])
+
+        if e in exts:
+          return e
+
+      return None
+
+  return match
+
+class FileIndex:
+  """!
+    Index of the files contained in a directory tree.
+
+    The tree is scanned once, when the index is created, and the files can
+    then be queried by extension or by name without touching the filesystem.
+    The index must be told about the files which are created or removed
+    afterwards.
+  """
+  def __init__(self, src, subdirs = True):
+    """!
+      \param src The toplevel directory path
+      \param subdirs True if the files in subdirectories should also be indexed
+    """
+
+    ## Toplevel directory path
+    self.root = os.path.normpath(src)
+
+    ## True if the files in subdirectories are indexed
+    self.subdirs = subdirs
+
+    ## Scanned directories
+    self.dirs = []
+
+    self._lock = threading.Lock()
+    self._files = {}
+
+    for f in scan_dir(src, subdirs, self.dirs):
+      f = os.path.normpath(f)
+      self._files[f] = None
+
+    self._rebuild()
+
+  def _rebuild(self):
+    """! Rebuilds the lookup tables """
+    self._by_ext = {}
+    self._by_name = {}
+
+    for f in self._files:
+      self._link(f)
+
+  def _link(self, f):
+    """! Adds a file to the lookup tables """
+    name = os.path.basename(f)
+    self._by_ext.setdefault(os.path.splitext(name)[1], []).append(f)
+    self._by_name.setdefault(name, []).append(f)
+
+  def covers(self, path):
+    """!
+      Checks whether a path belongs to the indexed tree.
+
+      \param path The file path
+
+      \return True if \p path would be indexed by a scan
+    """
+    rel = os.path.relpath(path, self.root)
+
+    if rel == os.pardir or rel.startswith(os.pardir + os.sep):
+      return False
+
+    return self.subdirs or os.sep not in rel
+
+  def add(self, path):
+    """!
+      Adds a file to the index.
+
+      \param path The file path
+    """
+    path = os.path.normpath(path)
+
+    with self._lock:
+      if path not in self._files:
+        self._files[path] = None
+        self._link(path)
+
+  def discard(self, path):
+    """!
+      Removes a file from the index.
+
+      \param path The file path
+    """
+    path = os.path.normpath(path)
+
+    with self._lock:
+      if path in self._files:
+        del self._files[path]
+        self._rebuild()
+
+  def all(self):
+    """!
+      \return A list of the indexed files
+    """
+    with self._lock:
+      return list(self._files)
+
+  def ext(self, ext):
+    """!
+      Returns the indexed files with one of the given extensions.
+
+      \param ext An extension (without dot) or an iterable object containing extensions
+
+      \return A list of file paths
+    """
+    return [f for files in self.partition_ext(ext).values() for f in files]
+
+  def partition_ext(self, ext):
+    """!
+      Partitions the indexed files by extension.
+
+      \param ext An extension (without dot) or an iterable object containing extensions
+
+      \return A dictionary mapping each extension to the list of the indexed files which end with it
+
+      \see ext_matcher()
+    """
+    exts = normalize_ext(ext)
+    match = ext_matcher(exts)
+    buckets = {e: [] for e in exts}
+
+    with self._lock:
+      # Files are looked up by their last extension only
+      for last in {'.' + e.rsplit('.', 1)[-1] for e in exts}:
+        for f in self._by_ext.get(last, ()):
+          e = match(f)
+
+          if e is not None:
+            buckets[e].append(f)
+
+    return buckets
+
+  def name(self, fnames, remove_ext = False):
+    """!
+      Returns the indexed files with one of the given names.
+
+      \param fnames A file name or an iterable object containing file names
+      \param remove_ext True to match the file names without their extension
+
+      \return A list of file paths
+    """
+    if isinstance(fnames, str):
+      fnames = (fnames,)
+
+    with self._lock:
+      if not remove_ext:
+        return [f for n in fnames for f in self._by_name.get(n, [])]
+
+      fnames = set(fnames)
+      return [f for f in self._files if os.path.splitext(os.path.basename(f))[0] in fnames]
+
+if __name__ == '__main__':
+  print('This module cannot be run on its own')
@@ -0,0 +1,296 @@
+"""
+Babilonia project: Utility library and framework for C11/Python3
+    Copyright (C) 2014  Alfredo Mungo
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import os
+import re
+import select
+import shlex
+import threading
+import time
+
+## Characters which make a command line need a shell
+_shell_chars = re.compile(r'[|&;<>()$`*?\[~#\n]|^\s*\w+=')
+
+## Shell builtins and keywords which are not programs, needing a shell as the first word of a command line
+_shell_builtins = frozenset(('.', ':', '!', '{', 'alias', 'break', 'case', 'cd', 'command', 'continue', 'eval', 'exec', 'exit', 'export', 'for', 'if', 'read', 'readonly', 'return', 'set', 'shift', 'source', 'trap', 'ulimit', 'umask', 'unset', 'until', 'wait', 'while'))
+
+## Token of the job slot every process owns (GNU make's implicit job slot)
+_implicit_token = b''
+
+class JobServer:
+  """!
+    Job slots shared by the commands run at the same time.
+
+    When a GNU make jobserver is inherited through \p MAKEFLAGS
+    (\p --jobserver-auth=R,W or \p --jobserver-auth=fifo:PATH), the slots are
+    shared with make and the other jobs it runs: a slot is taken by reading
+    a token from the jobserver and given back by writing it again, besides
+    the implicit slot of this process. Otherwise the slots are local to
+    this process.
+
+    \code{.py}
+    with server.slot():
+      subprocess.run(argv)
+    \endcode
+  """
+  def __init__(self, slots, makeflags = None):
+    """!
+      \param slots The number of local slots, used when there is no jobserver
+      \param makeflags The \p MAKEFLAGS value, \p None to read it from the environment
+    """
+
+    ## Jobserver pipe descriptors, None if there is no jobserver
+    self.fds = self._open(os.environ.get('MAKEFLAGS', '') if makeflags is None else makeflags)
+
+    ## Number of local slots
+    self.slots = slots
+
+    self._implicit = threading.Lock()
+    self._local = threading.BoundedSemaphore(max(slots, 1))
+
+  @staticmethod
+  def _open(makeflags):
+    """!
+      Opens the jobserver named by \p MAKEFLAGS.
+
+      \return The (read, write) descriptors of the jobserver, or \p None
+    """
+    auth = re.findall(r'--jobserver-(?:auth|fds)=(\S+)', makeflags)
+
+    if not auth:
+      return None
+
+    try:
+      if auth[-1].startswith('fifo:'):
+        fd = os.open(auth[-1][5:], os.O_RDWR)
+        return fd, fd
+
+      read_fd, write_fd = (int(fd) for fd in auth[-1].split(','))
+
+      # make only hands the descriptors to the commands it knows to be recursive
+      os.fstat(read_fd)
+      os.fstat(write_fd)
+      return read_fd, write_fd
+    except (OSError, ValueError):
+      return None
+
+  def acquire(self):
+    """!
+      Takes a job slot, waiting for one to be free.
+
+      \return The slot token, to be given back to release()
+    """
+    if self.fds is None:
+      self._local.acquire()
+      return _implicit_token
+
+    if self._implicit.acquire(blocking = False):
+      return _implicit_token
+
+    # make may share a non-blocking pipe, which is waited on first
+    while True:
+      select.select((self.fds[0],), (), ())
+
+      try:
+        token = os.read(self.fds[0], 1)
+      except (BlockingIOError, InterruptedError): # Taken by another job meanwhile
+        continue
+
+      if token:
+        return token
+
+  def release(self, token):
+    """!
+      Gives a job slot back.
+
+      \param token The slot token returned by acquire()
+    """
+    if self.fds is None:
+      self._local.release()
+    elif token == _implicit_token:
+      self._implicit.release()
+    else:
+      os.write(self.fds[1], token)
+
+  def slot(self):
+    """!
+      \return A context manager holding a job slot during its block
+    """
+    return _Slot(self)
+
+class _Slot:
+  """! Context manager holding a job slot """
+  def __init__(self, server):
+    self._server = server
+
+  def __enter__(self):
+    self._token = self._server.acquire()
+    return self
+
+  def __exit__(self, *exc):
+    self._server.release(self._token)
+    return False
+
+class JobResult:
+  """!
+    The outcome of a command.
+  """
+  def __init__(self, args, returncode, stdout, stderr, start, duration, cpu = None):
+    """!
+      \param args The command line
+      \param returncode The exit status
+      \param stdout The captured standard output, \p None if not captured
+      \param stderr The captured standard error, \p None if not captured
+      \param start The time the command started at, as returned by \p time.time()
+      \param duration The command wall time, in seconds
+      \param cpu The CPU time of the command process and of the processes it has waited for, in seconds, \p None if not known
+    """
+
+    ## Command line
+    self.args = args
+
+    ## Exit status
+    self.returncode = returncode
+
+    ## Captured standard output
+    self.stdout = stdout
+
+    ## Captured standard error
+    self.stderr = stderr
+
+    ## Start time
+    self.start = start
+
+    ## Wall time, in seconds
+    self.duration = duration
+
+    ## CPU time (user and system), in seconds, None if not known
+    self.cpu = cpu
+
+    ## Name of the target which has run the command, None if not known
+    self.target = None
+
+def needs_shell(args):
+  """!
+    Tells whether a command needs a shell.
+
+    \param args A command line string or an argument list
+
+    \return True if \p args is a string using shell features (pipes,
+      redirections, variables, globs, builtins, ...), or any string on
+      Windows, where commands may be shell builtins
+  """
+  if not isinstance(args, str):
+    return False
+
+  words = args.split(None, 1)
+
+  return os.name == 'nt' or _shell_chars.search(args) is not None or (bool(words) and words[0] in _shell_builtins)
+
+def run_job(args, server, stdin = None, stdout = None, stderr = None, capture = True, cwd = None):
+  """!
+    Runs a command once a job slot is free.
+
+    Argument lists and command lines which do not need a shell (see
+    needs_shell()) are run without one.
+
+    \param args A command line string or an argument list
+    \param server The JobServer whose slots are shared by the commands
+    \param stdin The standard input, see \p subprocess.run()
+    \param stdout The standard output, see \p subprocess.run(). Captured if \p None and \p capture is True
+    \param stderr The standard error, see \p subprocess.run(). Captured if \p None and \p capture is True
+    \param capture True to capture the outputs which are not redirected
+    \param cwd The working directory of the command, \p None for the current one
+
+    \return A JobResult object
+  """
+  import subprocess
+
+  shell = needs_shell(args)
+  argv = args
+
+  if isinstance(args, str) and not shell:
+    try:
+      argv = shlex.split(args)
+    except ValueError: # Unbalanced quotes, left to the shell to report
+      shell = True
+
+  if capture:
+    stdout = subprocess.PIPE if stdout is None else stdout
+    stderr = subprocess.PIPE if stderr is None else stderr
+
+  with server.slot():
+    start = time.time()
+    begin = time.perf_counter()
+
+    try:
+      process, cpu = _run(argv, stdin, stdout, stderr, shell, cwd)
+    except FileNotFoundError as e: # Reported as a shell would
+      message = '{}: command not found\n'.format(e.filename).encode()
+      return JobResult(args, 127, b'' if stdout == subprocess.PIPE else None, message if stderr == subprocess.PIPE else None, start, time.perf_counter() - begin)
+
+    duration = time.perf_counter() - begin
+
+  return JobResult(args, process.returncode, process.stdout, process.stderr, start, duration, cpu)
+
+def _run(argv, stdin, stdout, stderr, shell, cwd):
+  """!
+    Runs a process like \p subprocess.run(), reaping it with \p os.wait4()
+    where available to get its resource usage.
+
+    \return A (\p subprocess.CompletedProcess, CPU time) tuple, the CPU time being \p None if it cannot be measured
+  """
+  import subprocess
+
+  with subprocess.Popen(argv, stdin = stdin, stdout = stdout, stderr = stderr, shell = shell, cwd = cwd) as process:
+    if not hasattr(os, 'wait4'):
+      out, err = process.communicate()
+      return subprocess.CompletedProcess(argv, process.returncode, out, err), None
+
+    out, err = _read_outputs(process)
+    _, status, usage = os.wait4(process.pid, 0)
+    process.returncode = os.waitstatus_to_exitcode(status)
+
+  return subprocess.CompletedProcess(argv, process.returncode, out, err), usage.ru_utime + usage.ru_stime
+
+def _read_outputs(process):
+  """!
+    Reads the captured outputs of a process until it closes them, without
+    waiting for the process.
+
+    \return A (standard output, standard error) tuple, each \p None if not captured
+  """
+  if process.stdin is not None:
+    process.stdin.close()
+
+  err = [None]
+  reader = None
+
+  # Both pipes are read at the same time, so that a full pipe does not block the process
+  if process.stderr is not None:
+    reader = threading.Thread(target = lambda: err.__setitem__(0, process.stderr.read()))
+    reader.start()
+
+  out = process.stdout.read() if process.stdout is not None else None
+
+  if reader is not None:
+    reader.join()
+
+  return out, err[0]
+
+if __name__ == '__main__':
+  print('This module cannot be run on its own')
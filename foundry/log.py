@@ -0,0 +1,99 @@
+"""
+Babilonia project: Utility library and framework for C11/Python3
+    Copyright (C) 2014  Alfredo Mungo
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import sys
+
+## Verbosity level
+_verbosity = 4
+
+def fatal(s):
+  """!
+    Prints an error message and exits.
+  
+    \param s The error message to log
+  """
+  err(s)
+  sys.exit(1)
+  
+def err(s, fatal = False):
+  """!
+    Prints an error message.
+    
+    \param s The error message to log
+    \param fatal True if this is a fatal error
+  """
+  if (_verbosity > 0 and fatal) or (_verbosity > 1):
+    print(('ERROR: ' if not fatal else 'FATAL: ') + s, file=sys.stderr)
+  
+def msg(s, v = 4):
+  """!
+    Logs a message.
+  
+    \param s The message to log
+    \param v The verbosity of the message
+
+    \see set_verbosity()
+  """
+  if _verbosity >= v:
+    print(s if v < 5 else 'DEBUG: ' + s)
+  
+def warn(s):
+  """!
+    Warning message logging.
+  
+    \param s The warning message to log
+  """
+  if _verbosity >= 3:
+    print('Warning: ' + s, file=sys.stderr)
+
+def set_verbosity(v):
+  """! Sets the verbosity level
+    Sets the verbosity level to \p v. \p v must be an integer number from 0 to
+    5.
+
+    The foundry uses verbosity this way:
+    \li 0 - Silent running, no message is shown
+    \li 1 - Silent running, only fatal errors are reported
+    \li 2 - Silent running, every error is reported
+    \li 3 - Normal running, warning messages are reported
+    \li 4 - Normal running, warning messages and information messages are reported
+    \li 5 - Verbose running, warning, information, and debug messages are reported
+
+    Target change messages are shown with verbosity level greater than 1.
+    
+    \note
+      Verbosity level is automatically set form command line. This method is
+      used to allow overriding the default behavior.
+  """
+  global _verbosity
+
+  if v >= 0 and v <= 5:
+    _verbosity = v
+    msg('Verbosity set to %d' % v, v = 5)
+  else:
+    warn('Verbosity level out of range. Setting default value of 4...')
+    _verbosity = 4
+
+def get_verbosity():
+  """! Returns the verbosity state
+    \returns The current verbosity state
+  """
+  return _verbosity
+
+if __name__ == '__main__':
+  print('This module cannot be run on its own')
@@ -17,7 +17,7 @@ Babilonia project: Utility library and framework for C11/Python3
 """
 
 from sys import platform
-from . import fatal, msg
+from .log import fatal, msg
 
 def name_executable(name):
   """!
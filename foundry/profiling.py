@@ -0,0 +1,235 @@
+"""
+Babilonia project: Utility library and framework for C11/Python3
+    Copyright (C) 2014  Alfredo Mungo
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import os
+import json
+import time
+import threading
+import functools
+
+class Profiler:
+  """!
+    Collects timing statistics and trace events.
+
+    Statistics are aggregated by name: each name records how many times it
+    has been measured, the total wall time and the total CPU time: the one
+    of the thread running the measured block, so that the threads running
+    meanwhile are not counted, plus the one of the child processes run by
+    that thread (see _Measure.child_cpu). When tracing is enabled, each
+    measure is also kept as a Chrome trace event (see chrome://tracing or
+    https://ui.perfetto.dev).
+  """
+  def __init__(self):
+    ## True if measures are being collected
+    self.enabled = False
+
+    ## True if trace events are being collected
+    self.tracing = False
+
+    ## Aggregated statistics: name -> [count, wall time, CPU time]
+    self._stats = {}
+
+    ## Trace events
+    self._events = []
+
+    self._lock = threading.Lock()
+    self._origin = time.perf_counter()
+
+  def enable(self, tracing = False):
+    """!
+      Starts collecting measures.
+
+      \param tracing True to also collect trace events
+    """
+    self.enabled = True
+    self.tracing = self.tracing or tracing
+
+  def add(self, name, start, wall, cpu, category = 'foundry', args = None):
+    """!
+      Adds a measure.
+
+      \param name The measure name
+      \param start The \p time.perf_counter() value at the start of the measure
+      \param wall The wall time, in seconds
+      \param cpu The CPU time, in seconds
+      \param category The trace event category
+      \param args A dictionary of values to attach to the trace event
+    """
+    with self._lock:
+      stat = self._stats.setdefault(name, [0, 0.0, 0.0])
+      stat[0] += 1
+      stat[1] += wall
+      stat[2] += cpu
+
+      if self.tracing:
+        event = {
+          'name': name,
+          'cat': category,
+          'ph': 'X',
+          'ts': (start - self._origin) * 1e6,
+          'dur': wall * 1e6,
+          'pid': os.getpid(),
+          'tid': threading.get_ident()
+        }
+
+        if args:
+          event['args'] = args
+
+        self._events.append(event)
+
+  def measure(self, name, category = 'foundry', args = None):
+    """!
+      Returns a context manager measuring the time spent in its block.
+
+      \param name The measure name
+      \param category The trace event category
+      \param args A dictionary of values to attach to the trace event
+    """
+    return _Measure(self, name, category, args)
+
+  def profiled(self, name, category = 'foundry'):
+    """!
+      Function decorator measuring each call of the decorated function.
+
+      \param name The measure name
+      \param category The trace event category
+    """
+    def wrap(func):
+      @functools.wraps(func)
+      def wrap_f(*args, **kwargs):
+        if not self.enabled:
+          return func(*args, **kwargs)
+
+        with _Measure(self, name, category, None):
+          return func(*args, **kwargs)
+
+      return wrap_f
+
+    return wrap
+
+  def profiled_generator(self, name, category = 'foundry'):
+    """!
+      Generator function decorator measuring the time spent producing the
+      items of each generator, not counting the time spent by the consumer
+      between items. A single measure is added once the generator is done.
+
+      \param name The measure name
+      \param category The trace event category
+    """
+    def wrap(func):
+      @functools.wraps(func)
+      def wrap_f(*args, **kwargs):
+        gen = func(*args, **kwargs)
+
+        if not self.enabled:
+          yield from gen
+          return
+
+        start = time.perf_counter()
+        wall = 0.0
+        cpu = 0.0
+
+        try:
+          while True:
+            t0 = time.perf_counter()
+            c0 = _cpu_time()
+
+            try:
+              item = next(gen)
+            finally:
+              wall += time.perf_counter() - t0
+              cpu += _cpu_time() - c0
+
+            yield item
+        except StopIteration:
+          pass
+        finally:
+          self.add(name, start, wall, cpu, category)
+
+      return wrap_f
+
+    return wrap
+
+  def report(self):
+    """!
+      Formats the aggregated statistics, slowest first.
+
+      \return A list of text lines
+    """
+    with self._lock:
+      stats = sorted(self._stats.items(), key = lambda s: s[1][1], reverse = True)
+
+    lines = ['{:<40} {:>8} {:>12} {:>12}'.format('Name', 'Calls', 'Wall (s)', 'CPU (s)')]
+
+    for name, (count, wall, cpu) in stats:
+      lines.append('{:<40} {:>8} {:>12.3f} {:>12.3f}'.format(name[:40], count, wall, cpu))
+
+    return lines
+
+  def write_trace(self, path):
+    """!
+      Writes the trace events in the Chrome trace event format.
+
+      \param path The output file path
+    """
+    with self._lock:
+      events = list(self._events)
+
+    with open(path, 'w', encoding = 'utf_8') as trace_file:
+      json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, trace_file)
+
+class _Measure:
+  """! Context manager measuring the time spent in its block """
+  def __init__(self, profiler, name, category, args):
+    self._profiler = profiler
+    self._name = name
+    self._category = category
+    self._args = args
+
+    ## CPU time of the child processes run in the block, set by the code which waits for them
+    self.child_cpu = 0.0
+
+  def __enter__(self):
+    self._start = time.perf_counter()
+    self._cpu = _cpu_time()
+    self._outer = getattr(_current, 'measure', None)
+    _current.measure = self
+    return self
+
+  def __exit__(self, *exc):
+    _current.measure = self._outer
+
+    # The enclosing measure of the same thread includes the child processes run in this block
+    if self._outer is not None:
+      self._outer.child_cpu += self.child_cpu
+
+    if self._profiler.enabled:
+      cpu = _cpu_time() - self._cpu + self.child_cpu
+      self._profiler.add(self._name, self._start, time.perf_counter() - self._start, cpu, self._category, self._args)
+
+    return False
+
+## Per-thread state: the innermost measure being taken
+_current = threading.local()
+
+def _cpu_time():
+  """! Returns the CPU time (user and system) used so far by the calling thread, in seconds """
+  return time.thread_time()
+
+if __name__ == '__main__':
+  print('This module cannot be run on its own')
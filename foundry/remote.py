@@ -0,0 +1,666 @@
+"""
+Babilonia project: Utility library and framework for C11/Python3
+    Copyright (C) 2014  Alfredo Mungo
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+-------------------------------------------------------------------------------
+  REMOTE MODULE as an executable
+
+  The remote module runs a build worker, executing the actions sent by the
+  foundry processes whose FOUNDRY_REMOTE variable lists it, by running
+
+  python -m foundry.remote worker [options]
+
+
+  When running as an executable, you can provide the following options:
+
+    * -b:address to define the address to listen on (127.0.0.1)
+    * -p:port to define the port to listen on (7171, 0 for any free port)
+    * -n:N to run up to N actions at the same time (the number of CPUs)
+    * -d:dir to define the content store directory
+    * -r:N to remember the results of up to N actions (4096)
+
+
+  A worker runs any command it is sent: only make it listen on addresses
+  reachable by trusted hosts.
+
+  An action is made of a command line, its input files and its expected
+  output files. The worker runs the command in a scratch directory holding
+  the inputs at their relative paths, then sends the outputs back. Files are
+  addressed by the SHA-256 digest of their content: a worker is only sent
+  the inputs it does not hold yet, and an action whose command and inputs
+  have recently succeeded is answered from the stored outputs without being
+  run again.
+
+  Messages are JSON objects, each preceded by its length as a 4 byte big
+  endian integer, with file contents encoded in base64.
+"""
+
+import os
+import os.path
+import re
+import sys
+import json
+import time
+import base64
+import shutil
+import socket
+import struct
+import hashlib
+import tempfile
+import threading
+import collections
+import socketserver
+from .log import fatal, msg, warn
+from .jobs import JobServer, JobResult, run_job
+
+## Protocol version
+_version = 1
+
+## Default worker port
+default_port = 7171
+
+## Default number of action results remembered by a worker
+default_results = 4096
+
+## Timeout of the connections to the workers, in seconds
+_connect_timeout = 5
+
+## Message length prefix
+_length = struct.Struct('>I')
+
+## Content digest format
+_digest_re = re.compile(r'[0-9a-f]{64}$')
+
+class RemoteError(Exception):
+  """!
+    Raised when an action cannot be run remotely.
+  """
+  pass
+
+def digest(data):
+  """! Returns the SHA-256 hexadecimal digest of a byte string """
+  return hashlib.sha256(data).hexdigest()
+
+def parse_hosts(spec):
+  """!
+    Parses a worker list.
+
+    \param spec A comma separated list of \p host[:port] workers
+
+    \return A list of (host, port) tuples
+  """
+  hosts = []
+
+  for item in spec.split(','):
+    item = item.strip()
+
+    if item:
+      host, sep, port = item.rpartition(':')
+      hosts.append((host, int(port)) if sep else (item, default_port))
+
+  return hosts
+
+def send_message(sock, message):
+  """!
+    Sends a message.
+
+    \param sock The socket to send the message through
+    \param message A dictionary which can be serialized to JSON
+  """
+  data = json.dumps(message).encode('utf_8')
+  sock.sendall(_length.pack(len(data)) + data)
+
+def recv_message(sock):
+  """!
+    Receives a message.
+
+    \param sock The socket to receive the message from
+
+    \return The message dictionary
+
+    \throw ConnectionError If the connection is closed
+  """
+  size, = _length.unpack(_recv_exactly(sock, _length.size))
+
+  return json.loads(_recv_exactly(sock, size).decode('utf_8'))
+
+def _recv_exactly(sock, size):
+  """! Receives exactly \p size bytes """
+  chunks = []
+
+  while size > 0:
+    chunk = sock.recv(min(size, 1 << 20))
+
+    if not chunk:
+      raise ConnectionError('Connection closed')
+
+    chunks.append(chunk)
+    size -= len(chunk)
+
+  return b''.join(chunks)
+
+def _encode(data):
+  return base64.b64encode(data).decode('ascii')
+
+def _decode(text):
+  return base64.b64decode(text)
+
+def relative_path(path):
+  """!
+    Checks that a path lies in the working directory of an action.
+
+    \param path The file path
+
+    \return The normalized path
+
+    \throw RemoteError If \p path is absolute or outside the working directory
+  """
+  norm = os.path.normpath(path)
+
+  if os.path.isabs(norm) or os.path.splitdrive(norm)[0] or norm.split(os.sep)[0] == '..':
+    raise RemoteError('"{}" is outside of the working directory'.format(path))
+
+  return norm
+
+def _file_entry(path, data):
+  """! Describes a file of an action: its digest and its executable bit """
+  return {'digest': digest(data), 'executable': os.access(path, os.X_OK)}
+
+def _set_executable(path, executable):
+  """! Sets the executable bits of a file like a compiler would """
+  if executable:
+    os.chmod(path, os.stat(path).st_mode | 0o111)
+
+class ContentStore:
+  """!
+    Directory of file contents, each named after its digest.
+  """
+  def __init__(self, path):
+    """!
+      \param path The store directory path
+    """
+
+    ## Store directory path
+    self.path = path
+
+    os.makedirs(path, exist_ok = True)
+
+  def _entry(self, key):
+    if not isinstance(key, str) or not _digest_re.match(key):
+      raise RemoteError('Invalid digest "{}"'.format(key))
+
+    return os.path.join(self.path, key[:2], key[2:])
+
+  def has(self, key):
+    """! Tells whether the store holds the content of a digest """
+    return os.path.isfile(self._entry(key))
+
+  def get(self, key):
+    """!
+      \return The content of a digest
+
+      \throw FileNotFoundError If the store does not hold it
+    """
+    with open(self._entry(key), 'rb') as entry_file:
+      return entry_file.read()
+
+  def put(self, data, key = None):
+    """!
+      Stores a content.
+
+      \param data The content, as a byte string
+      \param key The expected digest of \p data, \p None if unknown
+
+      \return The digest of \p data
+
+      \throw RemoteError If \p data does not match \p key
+    """
+    actual = digest(data)
+
+    if key is not None and key != actual:
+      raise RemoteError('Content does not match its digest "{}"'.format(key))
+
+    entry = self._entry(actual)
+
+    if not os.path.isfile(entry):
+      os.makedirs(os.path.dirname(entry), exist_ok = True)
+      fd, tmp = tempfile.mkstemp(dir = os.path.dirname(entry))
+
+      with os.fdopen(fd, 'wb') as tmp_file:
+        tmp_file.write(data)
+
+      os.replace(tmp, entry)
+
+    return actual
+
+  def copy(self, key, dest):
+    """! Copies the content of a digest to a file """
+    shutil.copyfile(self._entry(key), dest)
+
+class Worker(socketserver.ThreadingTCPServer):
+  """!
+    Build worker, running the actions sent by foundry processes.
+  """
+  daemon_threads = True
+  allow_reuse_address = True
+
+  def __init__(self, address, slots, store, results = default_results):
+    """!
+      \param address The (host, port) address to listen on
+      \param slots The number of actions run at the same time
+      \param store The content store directory path
+      \param results The number of action results remembered, the least recently used ones being forgotten first
+    """
+    super().__init__(address, _WorkerHandler)
+
+    ## Number of actions run at the same time
+    self.slots = slots
+
+    ## Content store
+    self.store = ContentStore(store)
+
+    self._job_server = JobServer(slots, makeflags = '')
+    self._scratch = os.path.join(store, 'tmp')
+    self._max_results = results
+    self._results = collections.OrderedDict()
+    self._results_lock = threading.Lock()
+
+    os.makedirs(self._scratch, exist_ok = True)
+
+  def handle_message(self, message):
+    """!
+      Handles a client request.
+
+      \param message The request message
+
+      \return The reply message
+    """
+    kind = message.get('type')
+
+    if kind == 'hello':
+      return {'type': 'hello', 'version': _version, 'slots': self.slots}
+    elif kind == 'put':
+      for key, data in message['blobs'].items():
+        self.store.put(_decode(data), key)
+
+      return {'type': 'ok'}
+    elif kind == 'get':
+      return {'type': 'blobs', 'blobs': {key: _encode(self.store.get(key)) for key in message['digests']}}
+    elif kind == 'run':
+      return self.run_action(message['command'], message['inputs'], message['outputs'])
+
+    raise RemoteError('Unknown request "{}"'.format(kind))
+
+  def run_action(self, command, inputs, outputs):
+    """!
+      Runs an action in a scratch directory.
+
+      \param command The command line
+      \param inputs A dictionary mapping the input file paths to their entries (digest and executable bit)
+      \param outputs A list of the output file paths
+
+      \return A \p result message, or a \p missing message listing the input digests to send first
+    """
+    inputs = {relative_path(path): entry for path, entry in inputs.items()}
+    outputs = [relative_path(path) for path in outputs]
+    missing = sorted({entry['digest'] for entry in inputs.values() if not self.store.has(entry['digest'])})
+
+    if missing:
+      return {'type': 'missing', 'digests': missing}
+
+    key = digest(json.dumps([command, sorted(inputs.items(), key = lambda i: i[0]), outputs], sort_keys = True).encode('utf_8'))
+
+    with self._results_lock:
+      reply = self._results.get(key)
+
+      if reply is not None:
+        self._results.move_to_end(key)
+
+    if reply is not None and all(self.store.has(entry['digest']) for entry in reply['outputs'].values()):
+      msg('Cached: ' + str(command))
+      return dict(reply, cached = True)
+
+    sandbox = tempfile.mkdtemp(dir = self._scratch)
+
+    try:
+      for path, entry in inputs.items():
+        dest = os.path.join(sandbox, path)
+        os.makedirs(os.path.dirname(dest), exist_ok = True)
+        self.store.copy(entry['digest'], dest)
+        _set_executable(dest, entry['executable'])
+
+      for path in outputs:
+        os.makedirs(os.path.dirname(os.path.join(sandbox, path)), exist_ok = True)
+
+      result = run_job(command, self._job_server, cwd = sandbox)
+      files = {}
+
+      if result.returncode == 0:
+        for path in outputs:
+          out = os.path.join(sandbox, path)
+
+          if os.path.isfile(out):
+            with open(out, 'rb') as out_file:
+              data = out_file.read()
+
+            files[path] = _file_entry(out, data)
+            self.store.put(data, files[path]['digest'])
+    finally:
+      shutil.rmtree(sandbox, ignore_errors = True)
+
+    msg('{} ({:.3f}s, status {})'.format(command, result.duration, result.returncode))
+    reply = {
+      'type': 'result',
+      'returncode': result.returncode,
+      'stdout': _encode(result.stdout or b''),
+      'stderr': _encode(result.stderr or b''),
+      'outputs': files,
+      'cached': False
+    }
+
+    if result.returncode == 0:
+      with self._results_lock:
+        self._results[key] = reply
+        self._results.move_to_end(key)
+
+        while len(self._results) > self._max_results:
+          self._results.popitem(last = False)
+
+    return reply
+
+class _WorkerHandler(socketserver.BaseRequestHandler):
+  """! Connection to a client, serving its requests in order """
+  def handle(self):
+    while True:
+      try:
+        message = recv_message(self.request)
+      except (OSError, ValueError):
+        return
+
+      try:
+        reply = self.server.handle_message(message)
+      except (RemoteError, OSError, KeyError, TypeError, ValueError) as e:
+        reply = {'type': 'error', 'message': '{}: {}'.format(type(e).__name__, e)}
+
+      try:
+        send_message(self.request, reply)
+      except OSError:
+        return
+
+class RemotePool:
+  """!
+    Pool of workers running actions on behalf of this process.
+
+    Each action is sent to the reachable worker with the most free slots,
+    waiting for a slot if every worker is busy. A worker which cannot be
+    reached is left out of the pool and its action is sent to another one.
+  """
+  def __init__(self, hosts):
+    """!
+      \param hosts A list of (host, port) worker addresses, see parse_hosts()
+    """
+    self._workers = [_RemoteWorker(host, port) for host, port in hosts]
+    self._connected = False
+    self._cond = threading.Condition()
+
+  def _connect(self):
+    with self._cond:
+      if not self._connected:
+        for worker in self._workers:
+          worker.connect()
+
+        self._connected = True
+
+  def slots(self):
+    """!
+      \return The total number of slots of the reachable workers
+    """
+    self._connect()
+
+    with self._cond:
+      return sum(worker.slots for worker in self._workers if worker.up)
+
+  def _acquire(self):
+    self._connect()
+
+    with self._cond:
+      while True:
+        workers = [worker for worker in self._workers if worker.up]
+
+        if not workers:
+          return None
+
+        worker = max(workers, key = lambda w: w.free)
+
+        if worker.free > 0:
+          worker.free -= 1
+          return worker
+
+        self._cond.wait()
+
+  def _release(self, worker):
+    with self._cond:
+      worker.free += 1
+      self._cond.notify_all()
+
+  def run(self, command, inputs, outputs):
+    """!
+      Runs an action on a worker, then writes its outputs if it succeeds.
+
+      \param command The command line, using paths relative to the current directory
+      \param inputs A list of the input file paths, relative to the current directory
+      \param outputs A list of the output file paths, relative to the current directory
+
+      \return A JobResult object
+
+      \throw RemoteError If no worker can run the action
+    """
+    files = {}
+
+    for path in inputs:
+      with open(path, 'rb') as in_file:
+        files[relative_path(path)] = (_file_entry(path, in_file.read()), path)
+
+    outputs = [relative_path(path) for path in outputs]
+
+    while True:
+      worker = self._acquire()
+
+      if worker is None:
+        raise RemoteError('No worker available')
+
+      try:
+        return worker.run(command, files, outputs)
+      except (OSError, ValueError) as e:
+        warn('Worker {} failed: {}'.format(worker.name, e))
+
+        with self._cond:
+          worker.up = False
+      finally:
+        self._release(worker)
+
+class _RemoteWorker:
+  """! Client side of a worker """
+  def __init__(self, host, port):
+    ## Worker address, as host:port
+    self.name = '{}:{}'.format(host, port)
+
+    ## Number of slots of the worker
+    self.slots = 0
+
+    ## Number of free slots
+    self.free = 0
+
+    ## True if the worker is reachable
+    self.up = False
+
+    self._address = (host, port)
+    self._idle = []
+    self._lock = threading.Lock()
+
+  def _open(self):
+    sock = socket.create_connection(self._address, timeout = _connect_timeout)
+    sock.settimeout(None)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    return sock
+
+  @staticmethod
+  def _request(sock, message):
+    send_message(sock, message)
+    reply = recv_message(sock)
+
+    if reply.get('type') == 'error':
+      raise RemoteError(reply['message'])
+
+    return reply
+
+  def connect(self):
+    """! Greets the worker, learning its number of slots """
+    try:
+      sock = self._open()
+      reply = self._request(sock, {'type': 'hello'})
+
+      if reply.get('version') != _version:
+        sock.close()
+        raise RemoteError('protocol version {} not supported'.format(reply.get('version')))
+
+      self.slots = self.free = reply['slots']
+      self.up = True
+      self._idle.append(sock)
+      msg('Using worker {} ({} slot(s))'.format(self.name, self.slots), v = 5)
+    except (OSError, ValueError, RemoteError) as e:
+      warn('Worker {} is not available: {}'.format(self.name, e))
+
+  def run(self, command, files, outputs):
+    """!
+      Runs an action, see RemotePool.run().
+
+      \param command The command line
+      \param files A dictionary mapping the input paths to their (entry, local path) tuples
+      \param outputs A list of the output file paths
+
+      \return A JobResult object
+    """
+    with self._lock:
+      sock = self._idle.pop() if self._idle else None
+
+    if sock is None:
+      sock = self._open()
+
+    start = time.time()
+    begin = time.perf_counter()
+    request = {'type': 'run', 'command': command, 'inputs': {path: entry for path, (entry, _) in files.items()}, 'outputs': outputs}
+
+    try:
+      reply = self._request(sock, request)
+
+      if reply['type'] == 'missing':
+        wanted = set(reply['digests'])
+        blobs = {}
+
+        for entry, path in files.values():
+          if entry['digest'] in wanted and entry['digest'] not in blobs:
+            with open(path, 'rb') as in_file:
+              blobs[entry['digest']] = _encode(in_file.read())
+
+        self._request(sock, {'type': 'put', 'blobs': blobs})
+        reply = self._request(sock, request)
+
+      if reply['type'] != 'result':
+        raise RemoteError('Unexpected reply "{}"'.format(reply['type']))
+
+      entries = reply['outputs']
+      blobs = self._request(sock, {'type': 'get', 'digests': sorted({entry['digest'] for entry in entries.values()})})['blobs'] if entries else {}
+    except BaseException:
+      sock.close()
+      raise
+
+    with self._lock:
+      self._idle.append(sock)
+
+    for path, entry in entries.items():
+      data = _decode(blobs[entry['digest']])
+
+      if digest(data) != entry['digest']:
+        raise RemoteError('"{}" does not match its digest'.format(path))
+
+      if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok = True)
+
+      with open(path, 'wb') as out_file:
+        out_file.write(data)
+
+      _set_executable(path, entry['executable'])
+
+    return JobResult(command, reply['returncode'], _decode(reply['stdout']), _decode(reply['stderr']), start, time.perf_counter() - begin)
+
+def _help():
+  """! Module as a program help method """
+  print('Usage: remote.py worker [OPTIONS]')
+  print()
+
+  print('OPTIONS:')
+  print('\t-b:address\tAddress to listen on (default: 127.0.0.1)')
+  print('\t-p:port\tPort to listen on (default: {}, 0 for any free port)'.format(default_port))
+  print('\t-n:N\tRun up to N actions at the same time (default: the number of CPUs)')
+  print('\t-d:dir\tContent store directory')
+  print('\t-r:N\tRemember the results of up to N actions (default: {})'.format(default_results))
+
+def _main(args = sys.argv[1:]):
+  """! Runs this module as a standalone program
+
+    \param args The command line arguments to pass to the main method
+  """
+  if not args or args[0] != 'worker':
+    _help()
+    sys.exit(1)
+
+  address = '127.0.0.1'
+  port = default_port
+  slots = os.cpu_count() or 1
+  store = os.path.join(tempfile.gettempdir(), 'foundry-worker')
+  results = default_results
+
+  for a in args[1:]:
+    try:
+      if a.startswith('-b:'):
+        address = a[3:]
+      elif a.startswith('-p:'):
+        port = int(a[3:])
+      elif a.startswith('-n:'):
+        slots = max(int(a[3:]), 1)
+      elif a.startswith('-d:'):
+        store = a[3:]
+      elif a.startswith('-r:'):
+        results = max(int(a[3:]), 0)
+      else:
+        fatal('{} option not allowed'.format(a))
+    except ValueError:
+      fatal('{} option not allowed'.format(a))
+
+  worker = Worker((address, port), slots, store, results)
+  msg('Worker listening on {}:{} with {} slot(s), storing contents in "{}"'.format(*worker.server_address[:2], slots, store))
+
+  try:
+    worker.serve_forever()
+  except KeyboardInterrupt:
+    print()
+  finally:
+    worker.server_close()
+
+if __name__ == '__main__':
+  _main()
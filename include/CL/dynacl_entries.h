@@ -0,0 +1,157 @@
+/*
+ * DynaCL: OpenCL entry points
+ *
+ * This file is generated by codegen.py from cl.h, cl_gl.h, cl_ext.h: do not edit.
+ * It is included by CL/dynacl.h.
+ */
+#ifndef __DYNACL_ENTRIES_H
+#define __DYNACL_ENTRIES_H
+
+/* FUNCTION POINTER TYPES OF THE ENTRY POINTS DECLARED AS FUNCTIONS: */
+typedef CL_API_ENTRY cl_mem (CL_API_CALL *CLCREATEFROMGLBUFFER_PTR)(cl_context, cl_mem_flags, cl_GLuint, int *);
+typedef CL_API_ENTRY cl_mem (CL_API_CALL *CLCREATEFROMGLTEXTURE2D_PTR)(cl_context, cl_mem_flags, cl_GLenum, cl_GLint, cl_GLuint, cl_int *);
+typedef CL_API_ENTRY cl_mem (CL_API_CALL *CLCREATEFROMGLTEXTURE3D_PTR)(cl_context, cl_mem_flags, cl_GLenum, cl_GLint, cl_GLuint, cl_int *);
+typedef CL_API_ENTRY cl_mem (CL_API_CALL *CLCREATEFROMGLRENDERBUFFER_PTR)(cl_context, cl_mem_flags, cl_GLuint, cl_int *);
+typedef CL_API_ENTRY cl_int (CL_API_CALL *CLGETGLOBJECTINFO_PTR)(cl_mem, cl_gl_object_type *, cl_GLuint *);
+typedef CL_API_ENTRY cl_int (CL_API_CALL *CLGETGLTEXTUREINFO_PTR)(cl_mem, cl_gl_texture_info, size_t, void *, size_t *);
+typedef CL_API_ENTRY cl_int (CL_API_CALL *CLENQUEUEACQUIREGLOBJECTS_PTR)(cl_command_queue, cl_uint, const cl_mem *, cl_uint, const cl_event *, cl_event *);
+typedef CL_API_ENTRY cl_int (CL_API_CALL *CLENQUEUERELEASEGLOBJECTS_PTR)(cl_command_queue, cl_uint, const cl_mem *, cl_uint, const cl_event *, cl_event *);
+typedef CL_API_ENTRY cl_int (CL_API_CALL *CLGETGLCONTEXTINFOKHR_PTR)(const cl_context_properties *, cl_gl_context_info, size_t, void *, size_t *);
+typedef CL_API_ENTRY cl_int (CL_API_CALL *CLSETMEMOBJECTDESTRUCTORAPPLE_PTR)(cl_mem, void (*)(cl_mem , void*), void *);
+typedef CL_API_ENTRY void (CL_API_CALL *CLLOGMESSAGESTOSYSTEMLOGAPPLE_PTR)(const char *, const void *, size_t, void *);
+typedef CL_API_ENTRY void (CL_API_CALL *CLLOGMESSAGESTOSTDOUTAPPLE_PTR)(const char *, const void *, size_t, void *);
+typedef CL_API_ENTRY void (CL_API_CALL *CLLOGMESSAGESTOSTDERRAPPLE_PTR)(const char *, const void *, size_t, void *);
+typedef CL_API_ENTRY cl_int (CL_API_CALL *CLICDGETPLATFORMIDSKHR_PTR)(cl_uint, cl_platform_id *, cl_uint *);
+#if defined(CL_VERSION_1_1)
+typedef CL_API_ENTRY cl_int (CL_API_CALL *CLRELEASEDEVICEEXT_PTR)(cl_device_id);
+typedef CL_API_ENTRY cl_int (CL_API_CALL *CLRETAINDEVICEEXT_PTR)(cl_device_id);
+typedef CL_API_ENTRY cl_int (CL_API_CALL *CLCREATESUBDEVICESEXT_PTR)(cl_device_id, const cl_device_partition_property_ext *, cl_uint, cl_device_id *, cl_uint *);
+typedef CL_API_ENTRY cl_int (CL_API_CALL *CLGETDEVICEIMAGEINFOQCOM_PTR)(cl_device_id device, size_t image_width, size_t image_height, const cl_image_format *image_format, cl_image_pitch_info_qcom param_name, size_t param_value_size, void *param_value, size_t *param_value_size_ret);
+#endif
+/* FUNCTION POINTER TYPES END */
+
+/* OPENCL FUNCTION POINTERS: */
+DYNACL_EXTERN CLGETPLATFORMIDS_PTR clGetPlatformIDs DYNACL_NULLPTR;
+DYNACL_EXTERN CLGETPLATFORMINFO_PTR clGetPlatformInfo DYNACL_NULLPTR;
+DYNACL_EXTERN CLGETDEVICEIDS_PTR clGetDeviceIDs DYNACL_NULLPTR;
+DYNACL_EXTERN CLGETDEVICEINFO_PTR clGetDeviceInfo DYNACL_NULLPTR;
+DYNACL_EXTERN CLCREATECONTEXT_PTR clCreateContext DYNACL_NULLPTR;
+DYNACL_EXTERN CLCREATECONTEXTFROMTYPE_PTR clCreateContextFromType DYNACL_NULLPTR;
+DYNACL_EXTERN CLRETAINCONTEXT_PTR clRetainContext DYNACL_NULLPTR;
+DYNACL_EXTERN CLRELEASECONTEXT_PTR clReleaseContext DYNACL_NULLPTR;
+DYNACL_EXTERN CLGETCONTEXTINFO_PTR clGetContextInfo DYNACL_NULLPTR;
+DYNACL_EXTERN CLCREATECOMMANDQUEUE_PTR clCreateCommandQueue DYNACL_NULLPTR;
+DYNACL_EXTERN CLRETAINCOMMANDQUEUE_PTR clRetainCommandQueue DYNACL_NULLPTR;
+DYNACL_EXTERN CLRELEASECOMMANDQUEUE_PTR clReleaseCommandQueue DYNACL_NULLPTR;
+DYNACL_EXTERN CLGETCOMMANDQUEUEINFO_PTR clGetCommandQueueInfo DYNACL_NULLPTR;
+#if defined(CL_USE_DEPRECATED_OPENCL_1_0_APIS)
+DYNACL_EXTERN CLSETCOMMANDQUEUEPROPERTY_PTR clSetCommandQueueProperty DYNACL_NULLPTR;
+#endif
+DYNACL_EXTERN CLCREATEBUFFER_PTR clCreateBuffer DYNACL_NULLPTR;
+DYNACL_EXTERN CLCREATESUBBUFFER_PTR clCreateSubBuffer DYNACL_NULLPTR;
+DYNACL_EXTERN CLCREATEIMAGE2D_PTR clCreateImage2D DYNACL_NULLPTR;
+DYNACL_EXTERN CLCREATEIMAGE3D_PTR clCreateImage3D DYNACL_NULLPTR;
+DYNACL_EXTERN CLRETAINMEMOBJECT_PTR clRetainMemObject DYNACL_NULLPTR;
+DYNACL_EXTERN CLRELEASEMEMOBJECT_PTR clReleaseMemObject DYNACL_NULLPTR;
+DYNACL_EXTERN CLGETSUPPORTEDIMAGEFORMATS_PTR clGetSupportedImageFormats DYNACL_NULLPTR;
+DYNACL_EXTERN CLGETMEMOBJECTINFO_PTR clGetMemObjectInfo DYNACL_NULLPTR;
+DYNACL_EXTERN CLGETIMAGEINFO_PTR clGetImageInfo DYNACL_NULLPTR;
+DYNACL_EXTERN CLSETMEMOBJECTDESTRUCTORCALLBACK_PTR clSetMemObjectDestructorCallback DYNACL_NULLPTR;
+DYNACL_EXTERN CLCREATESAMPLER_PTR clCreateSampler DYNACL_NULLPTR;
+DYNACL_EXTERN CLRETAINSAMPLER_PTR clRetainSampler DYNACL_NULLPTR;
+DYNACL_EXTERN CLRELEASESAMPLER_PTR clReleaseSampler DYNACL_NULLPTR;
+DYNACL_EXTERN CLGETSAMPLERINFO_PTR clGetSamplerInfo DYNACL_NULLPTR;
+DYNACL_EXTERN CLCREATEPROGRAMWITHSOURCE_PTR clCreateProgramWithSource DYNACL_NULLPTR;
+DYNACL_EXTERN CLCREATEPROGRAMWITHBINARY_PTR clCreateProgramWithBinary DYNACL_NULLPTR;
+DYNACL_EXTERN CLRETAINPROGRAM_PTR clRetainProgram DYNACL_NULLPTR;
+DYNACL_EXTERN CLRELEASEPROGRAM_PTR clReleaseProgram DYNACL_NULLPTR;
+DYNACL_EXTERN CLBUILDPROGRAM_PTR clBuildProgram DYNACL_NULLPTR;
+DYNACL_EXTERN CLUNLOADCOMPILER_PTR clUnloadCompiler DYNACL_NULLPTR;
+DYNACL_EXTERN CLGETPROGRAMINFO_PTR clGetProgramInfo DYNACL_NULLPTR;
+DYNACL_EXTERN CLGETPROGRAMBUILDINFO_PTR clGetProgramBuildInfo DYNACL_NULLPTR;
+DYNACL_EXTERN CLCREATEKERNEL_PTR clCreateKernel DYNACL_NULLPTR;
+DYNACL_EXTERN CLCREATEKERNELSINPROGRAM_PTR clCreateKernelsInProgram DYNACL_NULLPTR;
+DYNACL_EXTERN CLRETAINKERNEL_PTR clRetainKernel DYNACL_NULLPTR;
+DYNACL_EXTERN CLRELEASEKERNEL_PTR clReleaseKernel DYNACL_NULLPTR;
+DYNACL_EXTERN CLSETKERNELARG_PTR clSetKernelArg DYNACL_NULLPTR;
+DYNACL_EXTERN CLGETKERNELINFO_PTR clGetKernelInfo DYNACL_NULLPTR;
+DYNACL_EXTERN CLGETKERNELWORKGROUPINFO_PTR clGetKernelWorkGroupInfo DYNACL_NULLPTR;
+DYNACL_EXTERN CLWAITFOREVENTS_PTR clWaitForEvents DYNACL_NULLPTR;
+DYNACL_EXTERN CLGETEVENTINFO_PTR clGetEventInfo DYNACL_NULLPTR;
+DYNACL_EXTERN CLCREATEUSEREVENT_PTR clCreateUserEvent DYNACL_NULLPTR;
+DYNACL_EXTERN CLRETAINEVENT_PTR clRetainEvent DYNACL_NULLPTR;
+DYNACL_EXTERN CLRELEASEEVENT_PTR clReleaseEvent DYNACL_NULLPTR;
+DYNACL_EXTERN CLSETUSEREVENTSTATUS_PTR clSetUserEventStatus DYNACL_NULLPTR;
+DYNACL_EXTERN CLSETEVENTCALLBACK_PTR clSetEventCallback DYNACL_NULLPTR;
+DYNACL_EXTERN CLGETEVENTPROFILINGINFO_PTR clGetEventProfilingInfo DYNACL_NULLPTR;
+DYNACL_EXTERN CLFLUSH_PTR clFlush DYNACL_NULLPTR;
+DYNACL_EXTERN CLFINISH_PTR clFinish DYNACL_NULLPTR;
+DYNACL_EXTERN CLENQUEUEREADBUFFER_PTR clEnqueueReadBuffer DYNACL_NULLPTR;
+DYNACL_EXTERN CLENQUEUEREADBUFFERRECT_PTR clEnqueueReadBufferRect DYNACL_NULLPTR;
+DYNACL_EXTERN CLENQUEUEWRITEBUFFER_PTR clEnqueueWriteBuffer DYNACL_NULLPTR;
+DYNACL_EXTERN CLENQUEUEWRITEBUFFERRECT_PTR clEnqueueWriteBufferRect DYNACL_NULLPTR;
+DYNACL_EXTERN CLENQUEUECOPYBUFFER_PTR clEnqueueCopyBuffer DYNACL_NULLPTR;
+DYNACL_EXTERN CLENQUEUECOPYBUFFERRECT_PTR clEnqueueCopyBufferRect DYNACL_NULLPTR;
+DYNACL_EXTERN CLENQUEUEREADIMAGE_PTR clEnqueueReadImage DYNACL_NULLPTR;
+DYNACL_EXTERN CLENQUEUEWRITEIMAGE_PTR clEnqueueWriteImage DYNACL_NULLPTR;
+DYNACL_EXTERN CLENQUEUECOPYIMAGE_PTR clEnqueueCopyImage DYNACL_NULLPTR;
+DYNACL_EXTERN CLENQUEUECOPYIMAGETOBUFFER_PTR clEnqueueCopyImageToBuffer DYNACL_NULLPTR;
+DYNACL_EXTERN CLENQUEUECOPYBUFFERTOIMAGE_PTR clEnqueueCopyBufferToImage DYNACL_NULLPTR;
+DYNACL_EXTERN CLENQUEUEMAPBUFFER_PTR clEnqueueMapBuffer DYNACL_NULLPTR;
+DYNACL_EXTERN CLENQUEUEMAPIMAGE_PTR clEnqueueMapImage DYNACL_NULLPTR;
+DYNACL_EXTERN CLENQUEUEUNMAPMEMOBJECT_PTR clEnqueueUnmapMemObject DYNACL_NULLPTR;
+DYNACL_EXTERN CLENQUEUENDRANGEKERNEL_PTR clEnqueueNDRangeKernel DYNACL_NULLPTR;
+DYNACL_EXTERN CLENQUEUETASK_PTR clEnqueueTask DYNACL_NULLPTR;
+DYNACL_EXTERN CLENQUEUENATIVEKERNEL_PTR clEnqueueNativeKernel DYNACL_NULLPTR;
+DYNACL_EXTERN CLENQUEUEMARKER_PTR clEnqueueMarker DYNACL_NULLPTR;
+DYNACL_EXTERN CLENQUEUEWAITFOREVENTS_PTR clEnqueueWaitForEvents DYNACL_NULLPTR;
+DYNACL_EXTERN CLENQUEUEBARRIER_PTR clEnqueueBarrier DYNACL_NULLPTR;
+DYNACL_EXTERN CLGETEXTENSIONFUNCTIONADDRESS_PTR clGetExtensionFunctionAddress DYNACL_NULLPTR;
+DYNACL_EXTERN CLCREATEFROMGLBUFFER_PTR dynacl_clCreateFromGLBuffer DYNACL_NULLPTR;
+DYNACL_EXTERN CLCREATEFROMGLTEXTURE2D_PTR dynacl_clCreateFromGLTexture2D DYNACL_NULLPTR;
+DYNACL_EXTERN CLCREATEFROMGLTEXTURE3D_PTR dynacl_clCreateFromGLTexture3D DYNACL_NULLPTR;
+DYNACL_EXTERN CLCREATEFROMGLRENDERBUFFER_PTR dynacl_clCreateFromGLRenderbuffer DYNACL_NULLPTR;
+DYNACL_EXTERN CLGETGLOBJECTINFO_PTR dynacl_clGetGLObjectInfo DYNACL_NULLPTR;
+DYNACL_EXTERN CLGETGLTEXTUREINFO_PTR dynacl_clGetGLTextureInfo DYNACL_NULLPTR;
+DYNACL_EXTERN CLENQUEUEACQUIREGLOBJECTS_PTR dynacl_clEnqueueAcquireGLObjects DYNACL_NULLPTR;
+DYNACL_EXTERN CLENQUEUERELEASEGLOBJECTS_PTR dynacl_clEnqueueReleaseGLObjects DYNACL_NULLPTR;
+DYNACL_EXTERN CLGETGLCONTEXTINFOKHR_PTR dynacl_clGetGLContextInfoKHR DYNACL_NULLPTR;
+DYNACL_EXTERN CLSETMEMOBJECTDESTRUCTORAPPLE_PTR dynacl_clSetMemObjectDestructorAPPLE DYNACL_NULLPTR;
+DYNACL_EXTERN CLLOGMESSAGESTOSYSTEMLOGAPPLE_PTR dynacl_clLogMessagesToSystemLogAPPLE DYNACL_NULLPTR;
+DYNACL_EXTERN CLLOGMESSAGESTOSTDOUTAPPLE_PTR dynacl_clLogMessagesToStdoutAPPLE DYNACL_NULLPTR;
+DYNACL_EXTERN CLLOGMESSAGESTOSTDERRAPPLE_PTR dynacl_clLogMessagesToStderrAPPLE DYNACL_NULLPTR;
+DYNACL_EXTERN CLICDGETPLATFORMIDSKHR_PTR dynacl_clIcdGetPlatformIDsKHR DYNACL_NULLPTR;
+#if defined(CL_VERSION_1_1)
+DYNACL_EXTERN CLRELEASEDEVICEEXT_PTR dynacl_clReleaseDeviceEXT DYNACL_NULLPTR;
+DYNACL_EXTERN CLRETAINDEVICEEXT_PTR dynacl_clRetainDeviceEXT DYNACL_NULLPTR;
+DYNACL_EXTERN CLCREATESUBDEVICESEXT_PTR dynacl_clCreateSubDevicesEXT DYNACL_NULLPTR;
+DYNACL_EXTERN CLGETDEVICEIMAGEINFOQCOM_PTR dynacl_clGetDeviceImageInfoQCOM DYNACL_NULLPTR;
+#endif
+/* OPENCL FUNCTION POINTERS END */
+
+/* ENTRY POINT NAMES MAPPED TO THEIR FUNCTION POINTERS: */
+#ifndef DYNACL_NO_ENTRY_MACROS
+#define clCreateFromGLBuffer dynacl_clCreateFromGLBuffer
+#define clCreateFromGLTexture2D dynacl_clCreateFromGLTexture2D
+#define clCreateFromGLTexture3D dynacl_clCreateFromGLTexture3D
+#define clCreateFromGLRenderbuffer dynacl_clCreateFromGLRenderbuffer
+#define clGetGLObjectInfo dynacl_clGetGLObjectInfo
+#define clGetGLTextureInfo dynacl_clGetGLTextureInfo
+#define clEnqueueAcquireGLObjects dynacl_clEnqueueAcquireGLObjects
+#define clEnqueueReleaseGLObjects dynacl_clEnqueueReleaseGLObjects
+#define clGetGLContextInfoKHR dynacl_clGetGLContextInfoKHR
+#define clSetMemObjectDestructorAPPLE dynacl_clSetMemObjectDestructorAPPLE
+#define clLogMessagesToSystemLogAPPLE dynacl_clLogMessagesToSystemLogAPPLE
+#define clLogMessagesToStdoutAPPLE dynacl_clLogMessagesToStdoutAPPLE
+#define clLogMessagesToStderrAPPLE dynacl_clLogMessagesToStderrAPPLE
+#define clIcdGetPlatformIDsKHR dynacl_clIcdGetPlatformIDsKHR
+#if defined(CL_VERSION_1_1)
+#define clReleaseDeviceEXT dynacl_clReleaseDeviceEXT
+#define clRetainDeviceEXT dynacl_clRetainDeviceEXT
+#define clCreateSubDevicesEXT dynacl_clCreateSubDevicesEXT
+#define clGetDeviceImageInfoQCOM dynacl_clGetDeviceImageInfoQCOM
+#endif
+#endif /* DYNACL_NO_ENTRY_MACROS */
+/* ENTRY POINT NAMES END */
+
+#endif /* __DYNACL_ENTRIES_H */
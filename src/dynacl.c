@@ -1,5 +1,5 @@
 /*
- * DynaCL: Dynamic OpenCL library loader for Windows
+ * DynaCL: Dynamic OpenCL library loader
  * 
  * Copyright (c) 2015 Alfredo Mungo
  * 
@@ -21,205 +21,403 @@
  * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
  * THE SOFTWARE.
  */
+#if !defined(_WIN32) && !defined(_POSIX_C_SOURCE)
+  /* clock_gettime() is POSIX, hidden by the strict ISO C modes (-std=c99, -std=c11) */
+  #define _POSIX_C_SOURCE 199309L
+#endif /* !_WIN32 && !_POSIX_C_SOURCE */
+
 #define DYNACL_INTERNAL
-#include <windows.h>
 #include <CL/dynacl.h>
 
-static HMODULE dynacl_dll = NULL;
+/*!
+ * Generic function pointer, holding any entry point. ISO C only allows
+ * converting function pointers to other function pointer types.
+ */
+typedef void (*dynacl_function)(void);
+
+/* LIBRARY LOADING BACKEND: */
+#ifdef _WIN32
+  #include <windows.h>
+
+  typedef HMODULE dynacl_module;
+
+  #define dynacl_open(library) LoadLibrary(library)
+  #define dynacl_symbol(module, name) (dynacl_function)GetProcAddress(module, name)
+  #define dynacl_close(module) FreeLibrary(module)
+
+  static SRWLOCK dynacl_lock = SRWLOCK_INIT;
+
+  #define dynacl_acquire() AcquireSRWLockExclusive(&dynacl_lock)
+  #define dynacl_release() ReleaseSRWLockExclusive(&dynacl_lock)
+#else
+  #include <dlfcn.h>
+  #include <pthread.h>
+  #include <string.h>
+  #include <time.h>
+  #include <unistd.h>
+
+  typedef void *dynacl_module;
+
+  #define dynacl_open(library) dlopen(library, RTLD_NOW | RTLD_LOCAL)
+  #define dynacl_close(module) dlclose(module)
+
+  /*!
+   * Looks a function up in a library.
+   *
+   * \p module The library
+   * \p name The function name
+   *
+   * \return The function address, NULL if the library does not export it
+   */
+  static dynacl_function dynacl_symbol(dynacl_module module, const char *name) {
+    dynacl_function address;
+
+    /* POSIX guarantees that dlsym() results convert to function pointers, which ISO C cannot express but as a copy */
+    *(void **)&address = dlsym(module, name);
+
+    return address;
+  }
+
+  static pthread_mutex_t dynacl_lock = PTHREAD_MUTEX_INITIALIZER;
+
+  #define dynacl_acquire() pthread_mutex_lock(&dynacl_lock)
+  #define dynacl_release() pthread_mutex_unlock(&dynacl_lock)
+#endif /* _WIN32 */
+/* LIBRARY LOADING BACKEND END */
+
+/* FUNCTION POINTER PUBLISHING: the lazy loader binds entry points while other threads may call them */
+#ifdef _MSC_VER
+  #define dynacl_store_release(p, v) InterlockedExchangePointer((PVOID volatile *)(p), (PVOID)(v))
+  #define dynacl_load_acquire(p) InterlockedCompareExchangePointer((PVOID volatile *)(p), NULL, NULL)
+#else
+  #define dynacl_store_release(p, v) __atomic_store_n(p, v, __ATOMIC_RELEASE)
+  #define dynacl_load_acquire(p) __atomic_load_n(p, __ATOMIC_ACQUIRE)
+#endif /* _MSC_VER */
+/* FUNCTION POINTER PUBLISHING END */
+
+static dynacl_module dynacl_dll = NULL;
+
+/* Number of dynacl_init() calls not matched by dynacl_shutdown() yet, guarded by dynacl_lock */
+static unsigned int dynacl_refs = 0;
+
+/* ENTRY POINT KINDS: */
+#define DYNACL_ENTRY_REQUIRED 0 /* Core entry point, dynacl_init() fails if it is missing */
+#define DYNACL_ENTRY_OPTIONAL 1 /* Entry point which may be missing from the library */
+#define DYNACL_ENTRY_EXTENSION 2 /* Extension entry point, looked up through clGetExtensionFunctionAddress() too */
+/* ENTRY POINT KINDS END */
+
+#ifdef DYNACL_INSTRUMENT
+/*!
+ * Call statistics of an entry point, updated atomically.
+ */
+typedef struct {
+  unsigned long long calls; /* Number of calls */
+  unsigned long long time_ns; /* Time spent in the calls, in nanoseconds */
+} dynacl_counter;
+
+#ifdef _MSC_VER
+  #define dynacl_atomic_add(p, v) InterlockedExchangeAdd64((volatile LONG64 *)(p), (LONG64)(v))
+  #define dynacl_atomic_load(p) (unsigned long long)InterlockedCompareExchange64((volatile LONG64 *)(p), 0, 0)
+  #define dynacl_atomic_store(p, v) InterlockedExchange64((volatile LONG64 *)(p), (LONG64)(v))
+#else
+  #define dynacl_atomic_add(p, v) __atomic_fetch_add(p, v, __ATOMIC_RELAXED)
+  #define dynacl_atomic_load(p) __atomic_load_n(p, __ATOMIC_RELAXED)
+  #define dynacl_atomic_store(p, v) __atomic_store_n(p, v, __ATOMIC_RELAXED)
+#endif /* _MSC_VER */
+
+/*!
+ * \return A monotonic time, in nanoseconds
+ */
+static unsigned long long dynacl_now() {
+#ifdef _WIN32
+  LARGE_INTEGER counter, frequency;
+
+  QueryPerformanceCounter(&counter);
+  QueryPerformanceFrequency(&frequency);
+
+  return (unsigned long long)((double)counter.QuadPart * 1e9 / (double)frequency.QuadPart);
+#else
+  struct timespec t;
+
+  clock_gettime(CLOCK_MONOTONIC, &t);
+
+  return (unsigned long long)t.tv_sec * 1000000000ULL + (unsigned long long)t.tv_nsec;
+#endif /* _WIN32 */
+}
+
+/*!
+ * Counts a call.
+ *
+ * \p counter The entry point counter
+ * \p start The time the call started at, as returned by dynacl_now()
+ */
+static void dynacl_count(dynacl_counter *counter, unsigned long long start) {
+  dynacl_atomic_add(&counter->calls, 1ULL);
+  dynacl_atomic_add(&counter->time_ns, dynacl_now() - start);
+}
+
+  /* The wrappers call the entry points through their dynacl_real_ pointers */
+  #define DYNACL_TARGET(name) dynacl_real_##name
+
+  #include "dynacl_instrument.h"
+#else
+  #define DYNACL_TARGET(name) name
+#endif /* DYNACL_INSTRUMENT */
+
+/*!
+ * An entry point of the OpenCL library.
+ */
+typedef struct {
+  const char *name; /* Symbol name */
+  dynacl_function *slot; /* Function pointer */
+  unsigned int kind; /* Entry point kind */
+#ifdef DYNACL_LAZY
+  dynacl_function trampoline; /* Lazy loader trampoline */
+#endif /* DYNACL_LAZY */
+#ifdef DYNACL_INSTRUMENT
+  dynacl_function *target; /* Function pointer called by the wrapper */
+  dynacl_function wrapper; /* Instrumented loader wrapper */
+  dynacl_counter *counter; /* Call statistics */
+#endif /* DYNACL_INSTRUMENT */
+} dynacl_entry;
+
+/*!
+ * Looks an entry point up.
+ *
+ * \p name The entry point name
+ * \p kind The entry point kind
+ *
+ * \return The entry point address, NULL if the library does not provide it
+ */
+static dynacl_function dynacl_lookup(const char *name, unsigned int kind) {
+  dynacl_function address = dynacl_symbol(dynacl_dll, name);
+
+  /*
+   * Extensions not exported by the library are provided by the platform. The
+   * library's clGetExtensionFunctionAddress() is called directly, as its
+   * function pointer may be a lazy trampoline taking the loader lock.
+   */
+  if(address == NULL && kind == DYNACL_ENTRY_EXTENSION) {
+    dynacl_function get = dynacl_symbol(dynacl_dll, "clGetExtensionFunctionAddress");
+
+    if(get != NULL)
+      *(void **)&address = ((CLGETEXTENSIONFUNCTIONADDRESS_PTR)get)(name);
+  }
+
+  return address;
+}
+
+#ifdef DYNACL_LAZY
+/*!
+ * Resolves an entry point on its first call, replacing its trampoline. The
+ * library is looked up under the loader lock, so that it cannot be unloaded
+ * meanwhile, and the function pointer is published with release semantics.
+ *
+ * \p name The entry point name
+ * \p slot The entry point function pointer
+ * \p kind The entry point kind
+ *
+ * \return Non-zero on success, zero if the library is not loaded or does not provide the entry point
+ */
+static int dynacl_resolve(const char *name, dynacl_function *slot, unsigned int kind) {
+  dynacl_function address = NULL;
+
+  dynacl_acquire();
+
+  if(dynacl_dll != NULL) {
+    address = dynacl_lookup(name, kind);
+
+    if(address != NULL)
+      dynacl_store_release(slot, address);
+  }
+
+  dynacl_release();
+
+  return address != NULL;
+}
+
+  #include "dynacl_lazy.h"
+
+  #define DYNACL_ENTRY_LAZY(trampoline) , (dynacl_function)trampoline
+#else
+  #define DYNACL_ENTRY_LAZY(trampoline)
+#endif /* DYNACL_LAZY */
+
+#ifdef DYNACL_INSTRUMENT
+  #define DYNACL_ENTRY_INSTRUMENT(target, wrapper, counter) , (dynacl_function *)&target, (dynacl_function)wrapper, &counter
+#else
+  #define DYNACL_ENTRY_INSTRUMENT(target, wrapper, counter)
+#endif /* DYNACL_INSTRUMENT */
+
+static dynacl_entry dynacl_entries[] = {
+  /* The identifiers are pasted first, as the entry point names may be macros */
+  #define DYNACL_ENTRY(name, kind) { #name, (dynacl_function *)&name, kind \
+    DYNACL_ENTRY_LAZY(dynacl_lazy_##name) \
+    DYNACL_ENTRY_INSTRUMENT(dynacl_real_##name, dynacl_instrument_##name, dynacl_counter_##name) },
+    #include "dynacl_table.h"
+  #undef DYNACL_ENTRY
+};
+
+#define DYNACL_ENTRY_COUNT (sizeof(dynacl_entries) / sizeof(dynacl_entries[0]))
+
+/*!
+ * Binds a function pointer.
+ *
+ * \p entry The entry point
+ * \p address The function the entry point calls, NULL to unbind it
+ */
+static void dynacl_bind(dynacl_entry *entry, dynacl_function address) {
+#ifdef DYNACL_INSTRUMENT
+  *entry->target = address;
+  *entry->slot = address != NULL ? entry->wrapper : NULL;
+#else
+  *entry->slot = address;
+#endif /* DYNACL_INSTRUMENT */
+}
 
 /*!
- * Loads each function from the library.
+ * Loads each function from the library. When DYNACL_LAZY is defined, the
+ * functions are bound to their trampolines instead, and are loaded on their
+ * first call.
  *
  * \return DYNACL_SUCCESS on success, DYNACL_IMPORT_ERROR on error
  */
 static unsigned int dynacl_loadLibraries();
 
-unsigned int dynacl_init(LPCSTR dllLibrary) {
-  dynacl_dll = LoadLibrary(dllLibrary); /* FIXME: Check if the file exists before calling this function */
-
-  if(dynacl_dll != NULL) { /* Module has been loaded */
-    return dynacl_loadLibraries();
-  } else { /* Module has not been loaded */
-    DWORD err = GetLastError();
-
-    switch(err) {
-      case ERROR_MOD_NOT_FOUND:
-        return DYNACL_FILE_NOT_FOUND;
-      case ERROR_TOO_MANY_OPEN_FILES:
-      case ERROR_ACCESS_DENIED:
-      case ERROR_NOT_ENOUGH_MEMORY:
-      case ERROR_OUTOFMEMORY:
-      case ERROR_INVALID_DRIVE:
-        return DYNACL_CANNOT_OPEN_FILE;
-      default:
-        return DYNACL_UNKNOWN_ERROR;
+/*!
+ * Tells why the library could not be loaded.
+ *
+ * \p library File path to the OpenCL library
+ *
+ * \return An error code
+ */
+static unsigned int dynacl_openError(const char *library);
+
+/*!
+ * Unbinds the function pointers and unloads the library.
+ */
+static void dynacl_unload();
+
+unsigned int dynacl_init(const char *library) {
+  unsigned int result = DYNACL_SUCCESS;
+
+  dynacl_acquire();
+
+  if(dynacl_refs == 0) { /* The library is loaded once, by the first call */
+    dynacl_dll = dynacl_open(library);
+
+    if(dynacl_dll != NULL) { /* Module has been loaded */
+      result = dynacl_loadLibraries();
+
+      if(result != DYNACL_SUCCESS)
+        dynacl_unload();
+    } else { /* Module has not been loaded */
+      result = dynacl_openError(library);
     }
   }
+
+  if(result == DYNACL_SUCCESS)
+    dynacl_refs++;
+
+  dynacl_release();
+
+  return result;
 }
 
+#ifdef _WIN32
+static unsigned int dynacl_openError(const char *library) {
+  DWORD err = GetLastError();
+
+  (void)library;
+
+  switch(err) {
+    case ERROR_MOD_NOT_FOUND:
+      return DYNACL_FILE_NOT_FOUND;
+    case ERROR_TOO_MANY_OPEN_FILES:
+    case ERROR_ACCESS_DENIED:
+    case ERROR_NOT_ENOUGH_MEMORY:
+    case ERROR_OUTOFMEMORY:
+    case ERROR_INVALID_DRIVE:
+      return DYNACL_CANNOT_OPEN_FILE;
+    default:
+      return DYNACL_UNKNOWN_ERROR;
+  }
+}
+#else
+static unsigned int dynacl_openError(const char *library) {
+  /* dlopen() does not report why it failed, except as a message */
+  if(strchr(library, '/') != NULL && access(library, F_OK) != 0)
+    return DYNACL_FILE_NOT_FOUND;
+
+  return DYNACL_CANNOT_OPEN_FILE;
+}
+#endif /* _WIN32 */
+
 static unsigned int dynacl_loadLibraries() {
-  #define DYNACL_LOADFUNC(functype, funcvar) if((funcvar = (functype)GetProcAddress(dynacl_dll, TEXT(#funcvar))) == NULL) return DYNACL_IMPORT_ERROR
-    DYNACL_LOADFUNC(CLGETPLATFORMIDS_PTR, clGetPlatformIDs);
-    DYNACL_LOADFUNC(CLGETPLATFORMINFO_PTR, clGetPlatformInfo);
-    DYNACL_LOADFUNC(CLGETDEVICEIDS_PTR, clGetDeviceIDs);
-    DYNACL_LOADFUNC(CLGETDEVICEINFO_PTR, clGetDeviceInfo);
-    DYNACL_LOADFUNC(CLCREATECONTEXT_PTR, clCreateContext);
-    DYNACL_LOADFUNC(CLCREATECONTEXTFROMTYPE_PTR, clCreateContextFromType);
-    DYNACL_LOADFUNC(CLRETAINCONTEXT_PTR, clRetainContext);
-    DYNACL_LOADFUNC(CLRELEASECONTEXT_PTR, clReleaseContext);
-    DYNACL_LOADFUNC(CLGETCONTEXTINFO_PTR, clGetContextInfo);
-    DYNACL_LOADFUNC(CLCREATECOMMANDQUEUE_PTR, clCreateCommandQueue);
-    DYNACL_LOADFUNC(CLRETAINCOMMANDQUEUE_PTR, clRetainCommandQueue);
-    DYNACL_LOADFUNC(CLRELEASECOMMANDQUEUE_PTR, clReleaseCommandQueue);
-    DYNACL_LOADFUNC(CLGETCOMMANDQUEUEINFO_PTR, clGetCommandQueueInfo);
-    #ifdef CL_USE_DEPRECATED_OPENCL_1_0_APIS
-      DYNACL_LOADFUNC(CLSETCOMMANDQUEUEPROPERTY_PTR, clSetCommandQueueProperty);
-    #endif
-    DYNACL_LOADFUNC(CLCREATEBUFFER_PTR, clCreateBuffer);
-    DYNACL_LOADFUNC(CLCREATESUBBUFFER_PTR, clCreateSubBuffer);
-    DYNACL_LOADFUNC(CLCREATEIMAGE2D_PTR, clCreateImage2D);
-    DYNACL_LOADFUNC(CLCREATEIMAGE3D_PTR, clCreateImage3D);
-    DYNACL_LOADFUNC(CLRETAINMEMOBJECT_PTR, clRetainMemObject);
-    DYNACL_LOADFUNC(CLRELEASEMEMOBJECT_PTR, clReleaseMemObject);
-    DYNACL_LOADFUNC(CLGETSUPPORTEDIMAGEFORMATS_PTR, clGetSupportedImageFormats);
-    DYNACL_LOADFUNC(CLGETMEMOBJECTINFO_PTR, clGetMemObjectInfo);
-    DYNACL_LOADFUNC(CLGETIMAGEINFO_PTR, clGetImageInfo);
-    DYNACL_LOADFUNC(CLSETMEMOBJECTDESTRUCTORCALLBACK_PTR, clSetMemObjectDestructorCallback);
-    DYNACL_LOADFUNC(CLCREATESAMPLER_PTR, clCreateSampler);
-    DYNACL_LOADFUNC(CLRETAINSAMPLER_PTR, clRetainSampler);
-    DYNACL_LOADFUNC(CLRELEASESAMPLER_PTR, clReleaseSampler);
-    DYNACL_LOADFUNC(CLGETSAMPLERINFO_PTR, clGetSamplerInfo);
-    DYNACL_LOADFUNC(CLCREATEPROGRAMWITHSOURCE_PTR, clCreateProgramWithSource);
-    DYNACL_LOADFUNC(CLCREATEPROGRAMWITHBINARY_PTR, clCreateProgramWithBinary);
-    DYNACL_LOADFUNC(CLRETAINPROGRAM_PTR, clRetainProgram);
-    DYNACL_LOADFUNC(CLRELEASEPROGRAM_PTR, clReleaseProgram);
-    DYNACL_LOADFUNC(CLBUILDPROGRAM_PTR, clBuildProgram);
-    DYNACL_LOADFUNC(CLUNLOADCOMPILER_PTR, clUnloadCompiler);
-    DYNACL_LOADFUNC(CLGETPROGRAMINFO_PTR, clGetProgramInfo);
-    DYNACL_LOADFUNC(CLGETPROGRAMBUILDINFO_PTR, clGetProgramBuildInfo);
-    DYNACL_LOADFUNC(CLCREATEKERNEL_PTR, clCreateKernel);
-    DYNACL_LOADFUNC(CLCREATEKERNELSINPROGRAM_PTR, clCreateKernelsInProgram);
-    DYNACL_LOADFUNC(CLRETAINKERNEL_PTR, clRetainKernel);
-    DYNACL_LOADFUNC(CLRELEASEKERNEL_PTR, clReleaseKernel);
-    DYNACL_LOADFUNC(CLSETKERNELARG_PTR, clSetKernelArg);
-    DYNACL_LOADFUNC(CLGETKERNELINFO_PTR, clGetKernelInfo);
-    DYNACL_LOADFUNC(CLGETKERNELWORKGROUPINFO_PTR, clGetKernelWorkGroupInfo);
-    DYNACL_LOADFUNC(CLWAITFOREVENTS_PTR, clWaitForEvents);
-    DYNACL_LOADFUNC(CLGETEVENTINFO_PTR, clGetEventInfo);
-    DYNACL_LOADFUNC(CLCREATEUSEREVENT_PTR, clCreateUserEvent);
-    DYNACL_LOADFUNC(CLRETAINEVENT_PTR, clRetainEvent);
-    DYNACL_LOADFUNC(CLRELEASEEVENT_PTR, clReleaseEvent);
-    DYNACL_LOADFUNC(CLSETUSEREVENTSTATUS_PTR, clSetUserEventStatus);
-    DYNACL_LOADFUNC(CLSETEVENTCALLBACK_PTR, clSetEventCallback);
-    DYNACL_LOADFUNC(CLGETEVENTPROFILINGINFO_PTR, clGetEventProfilingInfo);
-    DYNACL_LOADFUNC(CLFLUSH_PTR, clFlush);
-    DYNACL_LOADFUNC(CLFINISH_PTR, clFinish);
-    DYNACL_LOADFUNC(CLENQUEUEREADBUFFER_PTR, clEnqueueReadBuffer);
-    DYNACL_LOADFUNC(CLENQUEUEREADBUFFERRECT_PTR, clEnqueueReadBufferRect);
-    DYNACL_LOADFUNC(CLENQUEUEWRITEBUFFER_PTR, clEnqueueWriteBuffer);
-    DYNACL_LOADFUNC(CLENQUEUEWRITEBUFFERRECT_PTR, clEnqueueWriteBufferRect);
-    DYNACL_LOADFUNC(CLENQUEUECOPYBUFFER_PTR, clEnqueueCopyBuffer);
-    DYNACL_LOADFUNC(CLENQUEUECOPYBUFFERRECT_PTR, clEnqueueCopyBufferRect);
-    DYNACL_LOADFUNC(CLENQUEUEREADIMAGE_PTR, clEnqueueReadImage);
-    DYNACL_LOADFUNC(CLENQUEUEWRITEIMAGE_PTR, clEnqueueWriteImage);
-    DYNACL_LOADFUNC(CLENQUEUECOPYIMAGE_PTR, clEnqueueCopyImage);
-    DYNACL_LOADFUNC(CLENQUEUECOPYIMAGETOBUFFER_PTR, clEnqueueCopyImageToBuffer);
-    DYNACL_LOADFUNC(CLENQUEUECOPYBUFFERTOIMAGE_PTR, clEnqueueCopyBufferToImage);
-    DYNACL_LOADFUNC(CLENQUEUEMAPBUFFER_PTR, clEnqueueMapBuffer);
-    DYNACL_LOADFUNC(CLENQUEUEMAPIMAGE_PTR, clEnqueueMapImage);
-    DYNACL_LOADFUNC(CLENQUEUEUNMAPMEMOBJECT_PTR, clEnqueueUnmapMemObject);
-    DYNACL_LOADFUNC(CLENQUEUENDRANGEKERNEL_PTR, clEnqueueNDRangeKernel);
-    DYNACL_LOADFUNC(CLENQUEUETASK_PTR, clEnqueueTask);
-    DYNACL_LOADFUNC(CLENQUEUENATIVEKERNEL_PTR, clEnqueueNativeKernel);
-    DYNACL_LOADFUNC(CLENQUEUEMARKER_PTR, clEnqueueMarker);
-    DYNACL_LOADFUNC(CLENQUEUEWAITFOREVENTS_PTR, clEnqueueWaitForEvents);
-    DYNACL_LOADFUNC(CLENQUEUEBARRIER_PTR, clEnqueueBarrier);
-    DYNACL_LOADFUNC(CLGETEXTENSIONFUNCTIONADDRESS_PTR, clGetExtensionFunctionAddress);
-  #undef DYNACL_LOADFUNC
+  dynacl_entry *entry;
+
+  for(entry = dynacl_entries; entry < dynacl_entries + DYNACL_ENTRY_COUNT; entry++) {
+#ifdef DYNACL_LAZY
+    dynacl_bind(entry, entry->trampoline);
+#else
+    dynacl_bind(entry, dynacl_lookup(entry->name, entry->kind));
+
+    if(*entry->slot == NULL && entry->kind == DYNACL_ENTRY_REQUIRED)
+      return DYNACL_IMPORT_ERROR;
+#endif /* DYNACL_LAZY */
+  }
 
   return DYNACL_SUCCESS;
 }
 
-void dynacl_shutdown() {
-  #define DYNACL_UNLOADFUNC(funcvar) funcvar = NULL
-    DYNACL_UNLOADFUNC(clGetPlatformIDs);
-    DYNACL_UNLOADFUNC(clGetPlatformInfo);
-    DYNACL_UNLOADFUNC(clGetDeviceIDs);
-    DYNACL_UNLOADFUNC(clGetDeviceInfo);
-    DYNACL_UNLOADFUNC(clCreateContext);
-    DYNACL_UNLOADFUNC(clCreateContextFromType);
-    DYNACL_UNLOADFUNC(clRetainContext);
-    DYNACL_UNLOADFUNC(clReleaseContext);
-    DYNACL_UNLOADFUNC(clGetContextInfo);
-    DYNACL_UNLOADFUNC(clCreateCommandQueue);
-    DYNACL_UNLOADFUNC(clRetainCommandQueue);
-    DYNACL_UNLOADFUNC(clReleaseCommandQueue);
-    DYNACL_UNLOADFUNC(clGetCommandQueueInfo);
-    #ifdef CL_USE_DEPRECATED_OPENCL_1_0_APIS
-      DYNACL_UNLOADFUNC(clSetCommandQueueProperty);
-    #endif
-    DYNACL_UNLOADFUNC(clCreateBuffer);
-    DYNACL_UNLOADFUNC(clCreateSubBuffer);
-    DYNACL_UNLOADFUNC(clCreateImage2D);
-    DYNACL_UNLOADFUNC(clCreateImage3D);
-    DYNACL_UNLOADFUNC(clRetainMemObject);
-    DYNACL_UNLOADFUNC(clReleaseMemObject);
-    DYNACL_UNLOADFUNC(clGetSupportedImageFormats);
-    DYNACL_UNLOADFUNC(clGetMemObjectInfo);
-    DYNACL_UNLOADFUNC(clGetImageInfo);
-    DYNACL_UNLOADFUNC(clSetMemObjectDestructorCallback);
-    DYNACL_UNLOADFUNC(clCreateSampler);
-    DYNACL_UNLOADFUNC(clRetainSampler);
-    DYNACL_UNLOADFUNC(clReleaseSampler);
-    DYNACL_UNLOADFUNC(clGetSamplerInfo);
-    DYNACL_UNLOADFUNC(clCreateProgramWithSource);
-    DYNACL_UNLOADFUNC(clCreateProgramWithBinary);
-    DYNACL_UNLOADFUNC(clRetainProgram);
-    DYNACL_UNLOADFUNC(clReleaseProgram);
-    DYNACL_UNLOADFUNC(clBuildProgram);
-    DYNACL_UNLOADFUNC(clUnloadCompiler);
-    DYNACL_UNLOADFUNC(clGetProgramInfo);
-    DYNACL_UNLOADFUNC(clGetProgramBuildInfo);
-    DYNACL_UNLOADFUNC(clCreateKernel);
-    DYNACL_UNLOADFUNC(clCreateKernelsInProgram);
-    DYNACL_UNLOADFUNC(clRetainKernel);
-    DYNACL_UNLOADFUNC(clReleaseKernel);
-    DYNACL_UNLOADFUNC(clSetKernelArg);
-    DYNACL_UNLOADFUNC(clGetKernelInfo);
-    DYNACL_UNLOADFUNC(clGetKernelWorkGroupInfo);
-    DYNACL_UNLOADFUNC(clWaitForEvents);
-    DYNACL_UNLOADFUNC(clGetEventInfo);
-    DYNACL_UNLOADFUNC(clCreateUserEvent);
-    DYNACL_UNLOADFUNC(clRetainEvent);
-    DYNACL_UNLOADFUNC(clReleaseEvent);
-    DYNACL_UNLOADFUNC(clSetUserEventStatus);
-    DYNACL_UNLOADFUNC(clSetEventCallback);
-    DYNACL_UNLOADFUNC(clGetEventProfilingInfo);
-    DYNACL_UNLOADFUNC(clFlush);
-    DYNACL_UNLOADFUNC(clFinish);
-    DYNACL_UNLOADFUNC(clEnqueueReadBuffer);
-    DYNACL_UNLOADFUNC(clEnqueueReadBufferRect);
-    DYNACL_UNLOADFUNC(clEnqueueWriteBuffer);
-    DYNACL_UNLOADFUNC(clEnqueueWriteBufferRect);
-    DYNACL_UNLOADFUNC(clEnqueueCopyBuffer);
-    DYNACL_UNLOADFUNC(clEnqueueCopyBufferRect);
-    DYNACL_UNLOADFUNC(clEnqueueReadImage);
-    DYNACL_UNLOADFUNC(clEnqueueWriteImage);
-    DYNACL_UNLOADFUNC(clEnqueueCopyImage);
-    DYNACL_UNLOADFUNC(clEnqueueCopyImageToBuffer);
-    DYNACL_UNLOADFUNC(clEnqueueCopyBufferToImage);
-    DYNACL_UNLOADFUNC(clEnqueueMapBuffer);
-    DYNACL_UNLOADFUNC(clEnqueueMapImage);
-    DYNACL_UNLOADFUNC(clEnqueueUnmapMemObject);
-    DYNACL_UNLOADFUNC(clEnqueueNDRangeKernel);
-    DYNACL_UNLOADFUNC(clEnqueueTask);
-    DYNACL_UNLOADFUNC(clEnqueueNativeKernel);
-    DYNACL_UNLOADFUNC(clEnqueueMarker);
-    DYNACL_UNLOADFUNC(clEnqueueWaitForEvents);
-    DYNACL_UNLOADFUNC(clEnqueueBarrier);
-    DYNACL_UNLOADFUNC(clGetExtensionFunctionAddress);
-  #undef DYNACL_UNLOADFUNC
-
-  FreeLibrary(dynacl_dll);
+static void dynacl_unload() {
+  dynacl_entry *entry;
+
+  for(entry = dynacl_entries; entry < dynacl_entries + DYNACL_ENTRY_COUNT; entry++)
+    dynacl_bind(entry, NULL);
+
+  if(dynacl_dll != NULL)
+    dynacl_close(dynacl_dll);
+
   dynacl_dll = NULL;
 }
+
+void dynacl_shutdown() {
+  dynacl_acquire();
+
+  /* The library is unloaded by the call matching the first dynacl_init() */
+  if(dynacl_refs > 0 && --dynacl_refs == 0)
+    dynacl_unload();
+
+  dynacl_release();
+}
+
+unsigned int dynacl_get_stats(dynacl_stat *stats, unsigned int count) {
+#ifdef DYNACL_INSTRUMENT
+  unsigned int i;
+
+  for(i = 0; i < count && i < DYNACL_ENTRY_COUNT; i++) {
+    stats[i].name = dynacl_entries[i].name;
+    stats[i].calls = dynacl_atomic_load(&dynacl_entries[i].counter->calls);
+    stats[i].time_ns = dynacl_atomic_load(&dynacl_entries[i].counter->time_ns);
+  }
+
+  return DYNACL_ENTRY_COUNT;
+#else
+  (void)stats;
+  (void)count;
+
+  return 0;
+#endif /* DYNACL_INSTRUMENT */
+}
+
+void dynacl_reset_stats() {
+#ifdef DYNACL_INSTRUMENT
+  unsigned int i;
+
+  for(i = 0; i < DYNACL_ENTRY_COUNT; i++) {
+    dynacl_atomic_store(&dynacl_entries[i].counter->calls, 0ULL);
+    dynacl_atomic_store(&dynacl_entries[i].counter->time_ns, 0ULL);
+  }
+#endif /* DYNACL_INSTRUMENT */
+}
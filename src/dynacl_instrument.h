@@ -0,0 +1,1111 @@
+/*
+ * DynaCL: OpenCL entry point wrappers
+ *
+ * This file is generated by codegen.py from cl.h, cl_gl.h, cl_ext.h: do not edit.
+ * Each wrapper calls its entry point through its dynacl_real_ function
+ * pointer, loaded with acquire semantics as it may be resolved lazily by
+ * another thread, counting the calls and their time with dynacl_count(). It is
+ * included by src/dynacl.c when DYNACL_INSTRUMENT is defined.
+ */
+static CLGETPLATFORMIDS_PTR dynacl_real_clGetPlatformIDs = NULL;
+static dynacl_counter dynacl_counter_clGetPlatformIDs;
+
+static cl_int CL_API_CALL dynacl_instrument_clGetPlatformIDs(cl_uint a0, cl_platform_id * a1, cl_uint * a2) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLGETPLATFORMIDS_PTR)dynacl_load_acquire(&dynacl_real_clGetPlatformIDs))(a0, a1, a2);
+
+  dynacl_count(&dynacl_counter_clGetPlatformIDs, start);
+
+  return result;
+}
+
+static CLGETPLATFORMINFO_PTR dynacl_real_clGetPlatformInfo = NULL;
+static dynacl_counter dynacl_counter_clGetPlatformInfo;
+
+static cl_int CL_API_CALL dynacl_instrument_clGetPlatformInfo(cl_platform_id a0, cl_platform_info a1, size_t a2, void * a3, size_t * a4) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLGETPLATFORMINFO_PTR)dynacl_load_acquire(&dynacl_real_clGetPlatformInfo))(a0, a1, a2, a3, a4);
+
+  dynacl_count(&dynacl_counter_clGetPlatformInfo, start);
+
+  return result;
+}
+
+static CLGETDEVICEIDS_PTR dynacl_real_clGetDeviceIDs = NULL;
+static dynacl_counter dynacl_counter_clGetDeviceIDs;
+
+static cl_int CL_API_CALL dynacl_instrument_clGetDeviceIDs(cl_platform_id a0, cl_device_type a1, cl_uint a2, cl_device_id * a3, cl_uint * a4) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLGETDEVICEIDS_PTR)dynacl_load_acquire(&dynacl_real_clGetDeviceIDs))(a0, a1, a2, a3, a4);
+
+  dynacl_count(&dynacl_counter_clGetDeviceIDs, start);
+
+  return result;
+}
+
+static CLGETDEVICEINFO_PTR dynacl_real_clGetDeviceInfo = NULL;
+static dynacl_counter dynacl_counter_clGetDeviceInfo;
+
+static cl_int CL_API_CALL dynacl_instrument_clGetDeviceInfo(cl_device_id a0, cl_device_info a1, size_t a2, void * a3, size_t * a4) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLGETDEVICEINFO_PTR)dynacl_load_acquire(&dynacl_real_clGetDeviceInfo))(a0, a1, a2, a3, a4);
+
+  dynacl_count(&dynacl_counter_clGetDeviceInfo, start);
+
+  return result;
+}
+
+static CLCREATECONTEXT_PTR dynacl_real_clCreateContext = NULL;
+static dynacl_counter dynacl_counter_clCreateContext;
+
+static cl_context CL_API_CALL dynacl_instrument_clCreateContext(const cl_context_properties * a0, cl_uint a1, const cl_device_id * a2, void (CL_CALLBACK * a3)(const char *, const void *, size_t, void *), void * a4, cl_int * a5) {
+  unsigned long long start = dynacl_now();
+  cl_context result = ((CLCREATECONTEXT_PTR)dynacl_load_acquire(&dynacl_real_clCreateContext))(a0, a1, a2, a3, a4, a5);
+
+  dynacl_count(&dynacl_counter_clCreateContext, start);
+
+  return result;
+}
+
+static CLCREATECONTEXTFROMTYPE_PTR dynacl_real_clCreateContextFromType = NULL;
+static dynacl_counter dynacl_counter_clCreateContextFromType;
+
+static cl_context CL_API_CALL dynacl_instrument_clCreateContextFromType(const cl_context_properties * a0, cl_device_type a1, void (CL_CALLBACK * a2)(const char *, const void *, size_t, void *), void * a3, cl_int * a4) {
+  unsigned long long start = dynacl_now();
+  cl_context result = ((CLCREATECONTEXTFROMTYPE_PTR)dynacl_load_acquire(&dynacl_real_clCreateContextFromType))(a0, a1, a2, a3, a4);
+
+  dynacl_count(&dynacl_counter_clCreateContextFromType, start);
+
+  return result;
+}
+
+static CLRETAINCONTEXT_PTR dynacl_real_clRetainContext = NULL;
+static dynacl_counter dynacl_counter_clRetainContext;
+
+static cl_int CL_API_CALL dynacl_instrument_clRetainContext(cl_context a0) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLRETAINCONTEXT_PTR)dynacl_load_acquire(&dynacl_real_clRetainContext))(a0);
+
+  dynacl_count(&dynacl_counter_clRetainContext, start);
+
+  return result;
+}
+
+static CLRELEASECONTEXT_PTR dynacl_real_clReleaseContext = NULL;
+static dynacl_counter dynacl_counter_clReleaseContext;
+
+static cl_int CL_API_CALL dynacl_instrument_clReleaseContext(cl_context a0) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLRELEASECONTEXT_PTR)dynacl_load_acquire(&dynacl_real_clReleaseContext))(a0);
+
+  dynacl_count(&dynacl_counter_clReleaseContext, start);
+
+  return result;
+}
+
+static CLGETCONTEXTINFO_PTR dynacl_real_clGetContextInfo = NULL;
+static dynacl_counter dynacl_counter_clGetContextInfo;
+
+static cl_int CL_API_CALL dynacl_instrument_clGetContextInfo(cl_context a0, cl_context_info a1, size_t a2, void * a3, size_t * a4) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLGETCONTEXTINFO_PTR)dynacl_load_acquire(&dynacl_real_clGetContextInfo))(a0, a1, a2, a3, a4);
+
+  dynacl_count(&dynacl_counter_clGetContextInfo, start);
+
+  return result;
+}
+
+static CLCREATECOMMANDQUEUE_PTR dynacl_real_clCreateCommandQueue = NULL;
+static dynacl_counter dynacl_counter_clCreateCommandQueue;
+
+static cl_command_queue CL_API_CALL dynacl_instrument_clCreateCommandQueue(cl_context a0, cl_device_id a1, cl_command_queue_properties a2, cl_int * a3) {
+  unsigned long long start = dynacl_now();
+  cl_command_queue result = ((CLCREATECOMMANDQUEUE_PTR)dynacl_load_acquire(&dynacl_real_clCreateCommandQueue))(a0, a1, a2, a3);
+
+  dynacl_count(&dynacl_counter_clCreateCommandQueue, start);
+
+  return result;
+}
+
+static CLRETAINCOMMANDQUEUE_PTR dynacl_real_clRetainCommandQueue = NULL;
+static dynacl_counter dynacl_counter_clRetainCommandQueue;
+
+static cl_int CL_API_CALL dynacl_instrument_clRetainCommandQueue(cl_command_queue a0) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLRETAINCOMMANDQUEUE_PTR)dynacl_load_acquire(&dynacl_real_clRetainCommandQueue))(a0);
+
+  dynacl_count(&dynacl_counter_clRetainCommandQueue, start);
+
+  return result;
+}
+
+static CLRELEASECOMMANDQUEUE_PTR dynacl_real_clReleaseCommandQueue = NULL;
+static dynacl_counter dynacl_counter_clReleaseCommandQueue;
+
+static cl_int CL_API_CALL dynacl_instrument_clReleaseCommandQueue(cl_command_queue a0) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLRELEASECOMMANDQUEUE_PTR)dynacl_load_acquire(&dynacl_real_clReleaseCommandQueue))(a0);
+
+  dynacl_count(&dynacl_counter_clReleaseCommandQueue, start);
+
+  return result;
+}
+
+static CLGETCOMMANDQUEUEINFO_PTR dynacl_real_clGetCommandQueueInfo = NULL;
+static dynacl_counter dynacl_counter_clGetCommandQueueInfo;
+
+static cl_int CL_API_CALL dynacl_instrument_clGetCommandQueueInfo(cl_command_queue a0, cl_command_queue_info a1, size_t a2, void * a3, size_t * a4) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLGETCOMMANDQUEUEINFO_PTR)dynacl_load_acquire(&dynacl_real_clGetCommandQueueInfo))(a0, a1, a2, a3, a4);
+
+  dynacl_count(&dynacl_counter_clGetCommandQueueInfo, start);
+
+  return result;
+}
+
+#if defined(CL_USE_DEPRECATED_OPENCL_1_0_APIS)
+static CLSETCOMMANDQUEUEPROPERTY_PTR dynacl_real_clSetCommandQueueProperty = NULL;
+static dynacl_counter dynacl_counter_clSetCommandQueueProperty;
+
+static cl_int CL_API_CALL dynacl_instrument_clSetCommandQueueProperty(cl_command_queue a0, cl_command_queue_properties a1, cl_bool a2, cl_command_queue_properties * a3) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLSETCOMMANDQUEUEPROPERTY_PTR)dynacl_load_acquire(&dynacl_real_clSetCommandQueueProperty))(a0, a1, a2, a3);
+
+  dynacl_count(&dynacl_counter_clSetCommandQueueProperty, start);
+
+  return result;
+}
+
+#endif
+static CLCREATEBUFFER_PTR dynacl_real_clCreateBuffer = NULL;
+static dynacl_counter dynacl_counter_clCreateBuffer;
+
+static cl_mem CL_API_CALL dynacl_instrument_clCreateBuffer(cl_context a0, cl_mem_flags a1, size_t a2, void * a3, cl_int * a4) {
+  unsigned long long start = dynacl_now();
+  cl_mem result = ((CLCREATEBUFFER_PTR)dynacl_load_acquire(&dynacl_real_clCreateBuffer))(a0, a1, a2, a3, a4);
+
+  dynacl_count(&dynacl_counter_clCreateBuffer, start);
+
+  return result;
+}
+
+static CLCREATESUBBUFFER_PTR dynacl_real_clCreateSubBuffer = NULL;
+static dynacl_counter dynacl_counter_clCreateSubBuffer;
+
+static cl_mem CL_API_CALL dynacl_instrument_clCreateSubBuffer(cl_mem a0, cl_mem_flags a1, cl_buffer_create_type a2, const void * a3, cl_int * a4) {
+  unsigned long long start = dynacl_now();
+  cl_mem result = ((CLCREATESUBBUFFER_PTR)dynacl_load_acquire(&dynacl_real_clCreateSubBuffer))(a0, a1, a2, a3, a4);
+
+  dynacl_count(&dynacl_counter_clCreateSubBuffer, start);
+
+  return result;
+}
+
+static CLCREATEIMAGE2D_PTR dynacl_real_clCreateImage2D = NULL;
+static dynacl_counter dynacl_counter_clCreateImage2D;
+
+static cl_mem CL_API_CALL dynacl_instrument_clCreateImage2D(cl_context a0, cl_mem_flags a1, const cl_image_format * a2, size_t a3, size_t a4, size_t a5, void * a6, cl_int * a7) {
+  unsigned long long start = dynacl_now();
+  cl_mem result = ((CLCREATEIMAGE2D_PTR)dynacl_load_acquire(&dynacl_real_clCreateImage2D))(a0, a1, a2, a3, a4, a5, a6, a7);
+
+  dynacl_count(&dynacl_counter_clCreateImage2D, start);
+
+  return result;
+}
+
+static CLCREATEIMAGE3D_PTR dynacl_real_clCreateImage3D = NULL;
+static dynacl_counter dynacl_counter_clCreateImage3D;
+
+static cl_mem CL_API_CALL dynacl_instrument_clCreateImage3D(cl_context a0, cl_mem_flags a1, const cl_image_format * a2, size_t a3, size_t a4, size_t a5, size_t a6, size_t a7, void * a8, cl_int * a9) {
+  unsigned long long start = dynacl_now();
+  cl_mem result = ((CLCREATEIMAGE3D_PTR)dynacl_load_acquire(&dynacl_real_clCreateImage3D))(a0, a1, a2, a3, a4, a5, a6, a7, a8, a9);
+
+  dynacl_count(&dynacl_counter_clCreateImage3D, start);
+
+  return result;
+}
+
+static CLRETAINMEMOBJECT_PTR dynacl_real_clRetainMemObject = NULL;
+static dynacl_counter dynacl_counter_clRetainMemObject;
+
+static cl_int CL_API_CALL dynacl_instrument_clRetainMemObject(cl_mem a0) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLRETAINMEMOBJECT_PTR)dynacl_load_acquire(&dynacl_real_clRetainMemObject))(a0);
+
+  dynacl_count(&dynacl_counter_clRetainMemObject, start);
+
+  return result;
+}
+
+static CLRELEASEMEMOBJECT_PTR dynacl_real_clReleaseMemObject = NULL;
+static dynacl_counter dynacl_counter_clReleaseMemObject;
+
+static cl_int CL_API_CALL dynacl_instrument_clReleaseMemObject(cl_mem a0) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLRELEASEMEMOBJECT_PTR)dynacl_load_acquire(&dynacl_real_clReleaseMemObject))(a0);
+
+  dynacl_count(&dynacl_counter_clReleaseMemObject, start);
+
+  return result;
+}
+
+static CLGETSUPPORTEDIMAGEFORMATS_PTR dynacl_real_clGetSupportedImageFormats = NULL;
+static dynacl_counter dynacl_counter_clGetSupportedImageFormats;
+
+static cl_int CL_API_CALL dynacl_instrument_clGetSupportedImageFormats(cl_context a0, cl_mem_flags a1, cl_mem_object_type a2, cl_uint a3, cl_image_format * a4, cl_uint * a5) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLGETSUPPORTEDIMAGEFORMATS_PTR)dynacl_load_acquire(&dynacl_real_clGetSupportedImageFormats))(a0, a1, a2, a3, a4, a5);
+
+  dynacl_count(&dynacl_counter_clGetSupportedImageFormats, start);
+
+  return result;
+}
+
+static CLGETMEMOBJECTINFO_PTR dynacl_real_clGetMemObjectInfo = NULL;
+static dynacl_counter dynacl_counter_clGetMemObjectInfo;
+
+static cl_int CL_API_CALL dynacl_instrument_clGetMemObjectInfo(cl_mem a0, cl_mem_info a1, size_t a2, void * a3, size_t * a4) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLGETMEMOBJECTINFO_PTR)dynacl_load_acquire(&dynacl_real_clGetMemObjectInfo))(a0, a1, a2, a3, a4);
+
+  dynacl_count(&dynacl_counter_clGetMemObjectInfo, start);
+
+  return result;
+}
+
+static CLGETIMAGEINFO_PTR dynacl_real_clGetImageInfo = NULL;
+static dynacl_counter dynacl_counter_clGetImageInfo;
+
+static cl_int CL_API_CALL dynacl_instrument_clGetImageInfo(cl_mem a0, cl_image_info a1, size_t a2, void * a3, size_t * a4) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLGETIMAGEINFO_PTR)dynacl_load_acquire(&dynacl_real_clGetImageInfo))(a0, a1, a2, a3, a4);
+
+  dynacl_count(&dynacl_counter_clGetImageInfo, start);
+
+  return result;
+}
+
+static CLSETMEMOBJECTDESTRUCTORCALLBACK_PTR dynacl_real_clSetMemObjectDestructorCallback = NULL;
+static dynacl_counter dynacl_counter_clSetMemObjectDestructorCallback;
+
+static cl_int CL_API_CALL dynacl_instrument_clSetMemObjectDestructorCallback(cl_mem a0, void (CL_CALLBACK * a1)(cl_mem , void*), void * a2) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLSETMEMOBJECTDESTRUCTORCALLBACK_PTR)dynacl_load_acquire(&dynacl_real_clSetMemObjectDestructorCallback))(a0, a1, a2);
+
+  dynacl_count(&dynacl_counter_clSetMemObjectDestructorCallback, start);
+
+  return result;
+}
+
+static CLCREATESAMPLER_PTR dynacl_real_clCreateSampler = NULL;
+static dynacl_counter dynacl_counter_clCreateSampler;
+
+static cl_sampler CL_API_CALL dynacl_instrument_clCreateSampler(cl_context a0, cl_bool a1, cl_addressing_mode a2, cl_filter_mode a3, cl_int * a4) {
+  unsigned long long start = dynacl_now();
+  cl_sampler result = ((CLCREATESAMPLER_PTR)dynacl_load_acquire(&dynacl_real_clCreateSampler))(a0, a1, a2, a3, a4);
+
+  dynacl_count(&dynacl_counter_clCreateSampler, start);
+
+  return result;
+}
+
+static CLRETAINSAMPLER_PTR dynacl_real_clRetainSampler = NULL;
+static dynacl_counter dynacl_counter_clRetainSampler;
+
+static cl_int CL_API_CALL dynacl_instrument_clRetainSampler(cl_sampler a0) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLRETAINSAMPLER_PTR)dynacl_load_acquire(&dynacl_real_clRetainSampler))(a0);
+
+  dynacl_count(&dynacl_counter_clRetainSampler, start);
+
+  return result;
+}
+
+static CLRELEASESAMPLER_PTR dynacl_real_clReleaseSampler = NULL;
+static dynacl_counter dynacl_counter_clReleaseSampler;
+
+static cl_int CL_API_CALL dynacl_instrument_clReleaseSampler(cl_sampler a0) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLRELEASESAMPLER_PTR)dynacl_load_acquire(&dynacl_real_clReleaseSampler))(a0);
+
+  dynacl_count(&dynacl_counter_clReleaseSampler, start);
+
+  return result;
+}
+
+static CLGETSAMPLERINFO_PTR dynacl_real_clGetSamplerInfo = NULL;
+static dynacl_counter dynacl_counter_clGetSamplerInfo;
+
+static cl_int CL_API_CALL dynacl_instrument_clGetSamplerInfo(cl_sampler a0, cl_sampler_info a1, size_t a2, void * a3, size_t * a4) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLGETSAMPLERINFO_PTR)dynacl_load_acquire(&dynacl_real_clGetSamplerInfo))(a0, a1, a2, a3, a4);
+
+  dynacl_count(&dynacl_counter_clGetSamplerInfo, start);
+
+  return result;
+}
+
+static CLCREATEPROGRAMWITHSOURCE_PTR dynacl_real_clCreateProgramWithSource = NULL;
+static dynacl_counter dynacl_counter_clCreateProgramWithSource;
+
+static cl_program CL_API_CALL dynacl_instrument_clCreateProgramWithSource(cl_context a0, cl_uint a1, const char ** a2, const size_t * a3, cl_int * a4) {
+  unsigned long long start = dynacl_now();
+  cl_program result = ((CLCREATEPROGRAMWITHSOURCE_PTR)dynacl_load_acquire(&dynacl_real_clCreateProgramWithSource))(a0, a1, a2, a3, a4);
+
+  dynacl_count(&dynacl_counter_clCreateProgramWithSource, start);
+
+  return result;
+}
+
+static CLCREATEPROGRAMWITHBINARY_PTR dynacl_real_clCreateProgramWithBinary = NULL;
+static dynacl_counter dynacl_counter_clCreateProgramWithBinary;
+
+static cl_program CL_API_CALL dynacl_instrument_clCreateProgramWithBinary(cl_context a0, cl_uint a1, const cl_device_id * a2, const size_t * a3, const unsigned char ** a4, cl_int * a5, cl_int * a6) {
+  unsigned long long start = dynacl_now();
+  cl_program result = ((CLCREATEPROGRAMWITHBINARY_PTR)dynacl_load_acquire(&dynacl_real_clCreateProgramWithBinary))(a0, a1, a2, a3, a4, a5, a6);
+
+  dynacl_count(&dynacl_counter_clCreateProgramWithBinary, start);
+
+  return result;
+}
+
+static CLRETAINPROGRAM_PTR dynacl_real_clRetainProgram = NULL;
+static dynacl_counter dynacl_counter_clRetainProgram;
+
+static cl_int CL_API_CALL dynacl_instrument_clRetainProgram(cl_program a0) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLRETAINPROGRAM_PTR)dynacl_load_acquire(&dynacl_real_clRetainProgram))(a0);
+
+  dynacl_count(&dynacl_counter_clRetainProgram, start);
+
+  return result;
+}
+
+static CLRELEASEPROGRAM_PTR dynacl_real_clReleaseProgram = NULL;
+static dynacl_counter dynacl_counter_clReleaseProgram;
+
+static cl_int CL_API_CALL dynacl_instrument_clReleaseProgram(cl_program a0) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLRELEASEPROGRAM_PTR)dynacl_load_acquire(&dynacl_real_clReleaseProgram))(a0);
+
+  dynacl_count(&dynacl_counter_clReleaseProgram, start);
+
+  return result;
+}
+
+static CLBUILDPROGRAM_PTR dynacl_real_clBuildProgram = NULL;
+static dynacl_counter dynacl_counter_clBuildProgram;
+
+static cl_int CL_API_CALL dynacl_instrument_clBuildProgram(cl_program a0, cl_uint a1, const cl_device_id * a2, const char * a3, void (CL_CALLBACK * a4)(cl_program , void *), void * a5) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLBUILDPROGRAM_PTR)dynacl_load_acquire(&dynacl_real_clBuildProgram))(a0, a1, a2, a3, a4, a5);
+
+  dynacl_count(&dynacl_counter_clBuildProgram, start);
+
+  return result;
+}
+
+static CLUNLOADCOMPILER_PTR dynacl_real_clUnloadCompiler = NULL;
+static dynacl_counter dynacl_counter_clUnloadCompiler;
+
+static cl_int CL_API_CALL dynacl_instrument_clUnloadCompiler(void) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLUNLOADCOMPILER_PTR)dynacl_load_acquire(&dynacl_real_clUnloadCompiler))();
+
+  dynacl_count(&dynacl_counter_clUnloadCompiler, start);
+
+  return result;
+}
+
+static CLGETPROGRAMINFO_PTR dynacl_real_clGetProgramInfo = NULL;
+static dynacl_counter dynacl_counter_clGetProgramInfo;
+
+static cl_int CL_API_CALL dynacl_instrument_clGetProgramInfo(cl_program a0, cl_program_info a1, size_t a2, void * a3, size_t * a4) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLGETPROGRAMINFO_PTR)dynacl_load_acquire(&dynacl_real_clGetProgramInfo))(a0, a1, a2, a3, a4);
+
+  dynacl_count(&dynacl_counter_clGetProgramInfo, start);
+
+  return result;
+}
+
+static CLGETPROGRAMBUILDINFO_PTR dynacl_real_clGetProgramBuildInfo = NULL;
+static dynacl_counter dynacl_counter_clGetProgramBuildInfo;
+
+static cl_int CL_API_CALL dynacl_instrument_clGetProgramBuildInfo(cl_program a0, cl_device_id a1, cl_program_build_info a2, size_t a3, void * a4, size_t * a5) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLGETPROGRAMBUILDINFO_PTR)dynacl_load_acquire(&dynacl_real_clGetProgramBuildInfo))(a0, a1, a2, a3, a4, a5);
+
+  dynacl_count(&dynacl_counter_clGetProgramBuildInfo, start);
+
+  return result;
+}
+
+static CLCREATEKERNEL_PTR dynacl_real_clCreateKernel = NULL;
+static dynacl_counter dynacl_counter_clCreateKernel;
+
+static cl_kernel CL_API_CALL dynacl_instrument_clCreateKernel(cl_program a0, const char * a1, cl_int * a2) {
+  unsigned long long start = dynacl_now();
+  cl_kernel result = ((CLCREATEKERNEL_PTR)dynacl_load_acquire(&dynacl_real_clCreateKernel))(a0, a1, a2);
+
+  dynacl_count(&dynacl_counter_clCreateKernel, start);
+
+  return result;
+}
+
+static CLCREATEKERNELSINPROGRAM_PTR dynacl_real_clCreateKernelsInProgram = NULL;
+static dynacl_counter dynacl_counter_clCreateKernelsInProgram;
+
+static cl_int CL_API_CALL dynacl_instrument_clCreateKernelsInProgram(cl_program a0, cl_uint a1, cl_kernel * a2, cl_uint * a3) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLCREATEKERNELSINPROGRAM_PTR)dynacl_load_acquire(&dynacl_real_clCreateKernelsInProgram))(a0, a1, a2, a3);
+
+  dynacl_count(&dynacl_counter_clCreateKernelsInProgram, start);
+
+  return result;
+}
+
+static CLRETAINKERNEL_PTR dynacl_real_clRetainKernel = NULL;
+static dynacl_counter dynacl_counter_clRetainKernel;
+
+static cl_int CL_API_CALL dynacl_instrument_clRetainKernel(cl_kernel a0) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLRETAINKERNEL_PTR)dynacl_load_acquire(&dynacl_real_clRetainKernel))(a0);
+
+  dynacl_count(&dynacl_counter_clRetainKernel, start);
+
+  return result;
+}
+
+static CLRELEASEKERNEL_PTR dynacl_real_clReleaseKernel = NULL;
+static dynacl_counter dynacl_counter_clReleaseKernel;
+
+static cl_int CL_API_CALL dynacl_instrument_clReleaseKernel(cl_kernel a0) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLRELEASEKERNEL_PTR)dynacl_load_acquire(&dynacl_real_clReleaseKernel))(a0);
+
+  dynacl_count(&dynacl_counter_clReleaseKernel, start);
+
+  return result;
+}
+
+static CLSETKERNELARG_PTR dynacl_real_clSetKernelArg = NULL;
+static dynacl_counter dynacl_counter_clSetKernelArg;
+
+static cl_int CL_API_CALL dynacl_instrument_clSetKernelArg(cl_kernel a0, cl_uint a1, size_t a2, const void * a3) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLSETKERNELARG_PTR)dynacl_load_acquire(&dynacl_real_clSetKernelArg))(a0, a1, a2, a3);
+
+  dynacl_count(&dynacl_counter_clSetKernelArg, start);
+
+  return result;
+}
+
+static CLGETKERNELINFO_PTR dynacl_real_clGetKernelInfo = NULL;
+static dynacl_counter dynacl_counter_clGetKernelInfo;
+
+static cl_int CL_API_CALL dynacl_instrument_clGetKernelInfo(cl_kernel a0, cl_kernel_info a1, size_t a2, void * a3, size_t * a4) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLGETKERNELINFO_PTR)dynacl_load_acquire(&dynacl_real_clGetKernelInfo))(a0, a1, a2, a3, a4);
+
+  dynacl_count(&dynacl_counter_clGetKernelInfo, start);
+
+  return result;
+}
+
+static CLGETKERNELWORKGROUPINFO_PTR dynacl_real_clGetKernelWorkGroupInfo = NULL;
+static dynacl_counter dynacl_counter_clGetKernelWorkGroupInfo;
+
+static cl_int CL_API_CALL dynacl_instrument_clGetKernelWorkGroupInfo(cl_kernel a0, cl_device_id a1, cl_kernel_work_group_info a2, size_t a3, void * a4, size_t * a5) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLGETKERNELWORKGROUPINFO_PTR)dynacl_load_acquire(&dynacl_real_clGetKernelWorkGroupInfo))(a0, a1, a2, a3, a4, a5);
+
+  dynacl_count(&dynacl_counter_clGetKernelWorkGroupInfo, start);
+
+  return result;
+}
+
+static CLWAITFOREVENTS_PTR dynacl_real_clWaitForEvents = NULL;
+static dynacl_counter dynacl_counter_clWaitForEvents;
+
+static cl_int CL_API_CALL dynacl_instrument_clWaitForEvents(cl_uint a0, const cl_event * a1) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLWAITFOREVENTS_PTR)dynacl_load_acquire(&dynacl_real_clWaitForEvents))(a0, a1);
+
+  dynacl_count(&dynacl_counter_clWaitForEvents, start);
+
+  return result;
+}
+
+static CLGETEVENTINFO_PTR dynacl_real_clGetEventInfo = NULL;
+static dynacl_counter dynacl_counter_clGetEventInfo;
+
+static cl_int CL_API_CALL dynacl_instrument_clGetEventInfo(cl_event a0, cl_event_info a1, size_t a2, void * a3, size_t * a4) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLGETEVENTINFO_PTR)dynacl_load_acquire(&dynacl_real_clGetEventInfo))(a0, a1, a2, a3, a4);
+
+  dynacl_count(&dynacl_counter_clGetEventInfo, start);
+
+  return result;
+}
+
+static CLCREATEUSEREVENT_PTR dynacl_real_clCreateUserEvent = NULL;
+static dynacl_counter dynacl_counter_clCreateUserEvent;
+
+static cl_event CL_API_CALL dynacl_instrument_clCreateUserEvent(cl_context a0, cl_int * a1) {
+  unsigned long long start = dynacl_now();
+  cl_event result = ((CLCREATEUSEREVENT_PTR)dynacl_load_acquire(&dynacl_real_clCreateUserEvent))(a0, a1);
+
+  dynacl_count(&dynacl_counter_clCreateUserEvent, start);
+
+  return result;
+}
+
+static CLRETAINEVENT_PTR dynacl_real_clRetainEvent = NULL;
+static dynacl_counter dynacl_counter_clRetainEvent;
+
+static cl_int CL_API_CALL dynacl_instrument_clRetainEvent(cl_event a0) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLRETAINEVENT_PTR)dynacl_load_acquire(&dynacl_real_clRetainEvent))(a0);
+
+  dynacl_count(&dynacl_counter_clRetainEvent, start);
+
+  return result;
+}
+
+static CLRELEASEEVENT_PTR dynacl_real_clReleaseEvent = NULL;
+static dynacl_counter dynacl_counter_clReleaseEvent;
+
+static cl_int CL_API_CALL dynacl_instrument_clReleaseEvent(cl_event a0) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLRELEASEEVENT_PTR)dynacl_load_acquire(&dynacl_real_clReleaseEvent))(a0);
+
+  dynacl_count(&dynacl_counter_clReleaseEvent, start);
+
+  return result;
+}
+
+static CLSETUSEREVENTSTATUS_PTR dynacl_real_clSetUserEventStatus = NULL;
+static dynacl_counter dynacl_counter_clSetUserEventStatus;
+
+static cl_int CL_API_CALL dynacl_instrument_clSetUserEventStatus(cl_event a0, cl_int a1) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLSETUSEREVENTSTATUS_PTR)dynacl_load_acquire(&dynacl_real_clSetUserEventStatus))(a0, a1);
+
+  dynacl_count(&dynacl_counter_clSetUserEventStatus, start);
+
+  return result;
+}
+
+static CLSETEVENTCALLBACK_PTR dynacl_real_clSetEventCallback = NULL;
+static dynacl_counter dynacl_counter_clSetEventCallback;
+
+static cl_int CL_API_CALL dynacl_instrument_clSetEventCallback(cl_event a0, cl_int a1, void (CL_CALLBACK * a2)(cl_event, cl_int, void *), void * a3) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLSETEVENTCALLBACK_PTR)dynacl_load_acquire(&dynacl_real_clSetEventCallback))(a0, a1, a2, a3);
+
+  dynacl_count(&dynacl_counter_clSetEventCallback, start);
+
+  return result;
+}
+
+static CLGETEVENTPROFILINGINFO_PTR dynacl_real_clGetEventProfilingInfo = NULL;
+static dynacl_counter dynacl_counter_clGetEventProfilingInfo;
+
+static cl_int CL_API_CALL dynacl_instrument_clGetEventProfilingInfo(cl_event a0, cl_profiling_info a1, size_t a2, void * a3, size_t * a4) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLGETEVENTPROFILINGINFO_PTR)dynacl_load_acquire(&dynacl_real_clGetEventProfilingInfo))(a0, a1, a2, a3, a4);
+
+  dynacl_count(&dynacl_counter_clGetEventProfilingInfo, start);
+
+  return result;
+}
+
+static CLFLUSH_PTR dynacl_real_clFlush = NULL;
+static dynacl_counter dynacl_counter_clFlush;
+
+static cl_int CL_API_CALL dynacl_instrument_clFlush(cl_command_queue a0) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLFLUSH_PTR)dynacl_load_acquire(&dynacl_real_clFlush))(a0);
+
+  dynacl_count(&dynacl_counter_clFlush, start);
+
+  return result;
+}
+
+static CLFINISH_PTR dynacl_real_clFinish = NULL;
+static dynacl_counter dynacl_counter_clFinish;
+
+static cl_int CL_API_CALL dynacl_instrument_clFinish(cl_command_queue a0) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLFINISH_PTR)dynacl_load_acquire(&dynacl_real_clFinish))(a0);
+
+  dynacl_count(&dynacl_counter_clFinish, start);
+
+  return result;
+}
+
+static CLENQUEUEREADBUFFER_PTR dynacl_real_clEnqueueReadBuffer = NULL;
+static dynacl_counter dynacl_counter_clEnqueueReadBuffer;
+
+static cl_int CL_API_CALL dynacl_instrument_clEnqueueReadBuffer(cl_command_queue a0, cl_mem a1, cl_bool a2, size_t a3, size_t a4, void * a5, cl_uint a6, const cl_event * a7, cl_event * a8) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLENQUEUEREADBUFFER_PTR)dynacl_load_acquire(&dynacl_real_clEnqueueReadBuffer))(a0, a1, a2, a3, a4, a5, a6, a7, a8);
+
+  dynacl_count(&dynacl_counter_clEnqueueReadBuffer, start);
+
+  return result;
+}
+
+static CLENQUEUEREADBUFFERRECT_PTR dynacl_real_clEnqueueReadBufferRect = NULL;
+static dynacl_counter dynacl_counter_clEnqueueReadBufferRect;
+
+static cl_int CL_API_CALL dynacl_instrument_clEnqueueReadBufferRect(cl_command_queue a0, cl_mem a1, cl_bool a2, const size_t * a3, const size_t * a4, const size_t * a5, size_t a6, size_t a7, size_t a8, size_t a9, void * a10, cl_uint a11, const cl_event * a12, cl_event * a13) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLENQUEUEREADBUFFERRECT_PTR)dynacl_load_acquire(&dynacl_real_clEnqueueReadBufferRect))(a0, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11, a12, a13);
+
+  dynacl_count(&dynacl_counter_clEnqueueReadBufferRect, start);
+
+  return result;
+}
+
+static CLENQUEUEWRITEBUFFER_PTR dynacl_real_clEnqueueWriteBuffer = NULL;
+static dynacl_counter dynacl_counter_clEnqueueWriteBuffer;
+
+static cl_int CL_API_CALL dynacl_instrument_clEnqueueWriteBuffer(cl_command_queue a0, cl_mem a1, cl_bool a2, size_t a3, size_t a4, const void * a5, cl_uint a6, const cl_event * a7, cl_event * a8) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLENQUEUEWRITEBUFFER_PTR)dynacl_load_acquire(&dynacl_real_clEnqueueWriteBuffer))(a0, a1, a2, a3, a4, a5, a6, a7, a8);
+
+  dynacl_count(&dynacl_counter_clEnqueueWriteBuffer, start);
+
+  return result;
+}
+
+static CLENQUEUEWRITEBUFFERRECT_PTR dynacl_real_clEnqueueWriteBufferRect = NULL;
+static dynacl_counter dynacl_counter_clEnqueueWriteBufferRect;
+
+static cl_int CL_API_CALL dynacl_instrument_clEnqueueWriteBufferRect(cl_command_queue a0, cl_mem a1, cl_bool a2, const size_t * a3, const size_t * a4, const size_t * a5, size_t a6, size_t a7, size_t a8, size_t a9, const void * a10, cl_uint a11, const cl_event * a12, cl_event * a13) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLENQUEUEWRITEBUFFERRECT_PTR)dynacl_load_acquire(&dynacl_real_clEnqueueWriteBufferRect))(a0, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11, a12, a13);
+
+  dynacl_count(&dynacl_counter_clEnqueueWriteBufferRect, start);
+
+  return result;
+}
+
+static CLENQUEUECOPYBUFFER_PTR dynacl_real_clEnqueueCopyBuffer = NULL;
+static dynacl_counter dynacl_counter_clEnqueueCopyBuffer;
+
+static cl_int CL_API_CALL dynacl_instrument_clEnqueueCopyBuffer(cl_command_queue a0, cl_mem a1, cl_mem a2, size_t a3, size_t a4, size_t a5, cl_uint a6, const cl_event * a7, cl_event * a8) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLENQUEUECOPYBUFFER_PTR)dynacl_load_acquire(&dynacl_real_clEnqueueCopyBuffer))(a0, a1, a2, a3, a4, a5, a6, a7, a8);
+
+  dynacl_count(&dynacl_counter_clEnqueueCopyBuffer, start);
+
+  return result;
+}
+
+static CLENQUEUECOPYBUFFERRECT_PTR dynacl_real_clEnqueueCopyBufferRect = NULL;
+static dynacl_counter dynacl_counter_clEnqueueCopyBufferRect;
+
+static cl_int CL_API_CALL dynacl_instrument_clEnqueueCopyBufferRect(cl_command_queue a0, cl_mem a1, cl_mem a2, const size_t * a3, const size_t * a4, const size_t * a5, size_t a6, size_t a7, size_t a8, size_t a9, cl_uint a10, const cl_event * a11, cl_event * a12) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLENQUEUECOPYBUFFERRECT_PTR)dynacl_load_acquire(&dynacl_real_clEnqueueCopyBufferRect))(a0, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11, a12);
+
+  dynacl_count(&dynacl_counter_clEnqueueCopyBufferRect, start);
+
+  return result;
+}
+
+static CLENQUEUEREADIMAGE_PTR dynacl_real_clEnqueueReadImage = NULL;
+static dynacl_counter dynacl_counter_clEnqueueReadImage;
+
+static cl_int CL_API_CALL dynacl_instrument_clEnqueueReadImage(cl_command_queue a0, cl_mem a1, cl_bool a2, const size_t * a3, const size_t * a4, size_t a5, size_t a6, void * a7, cl_uint a8, const cl_event * a9, cl_event * a10) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLENQUEUEREADIMAGE_PTR)dynacl_load_acquire(&dynacl_real_clEnqueueReadImage))(a0, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10);
+
+  dynacl_count(&dynacl_counter_clEnqueueReadImage, start);
+
+  return result;
+}
+
+static CLENQUEUEWRITEIMAGE_PTR dynacl_real_clEnqueueWriteImage = NULL;
+static dynacl_counter dynacl_counter_clEnqueueWriteImage;
+
+static cl_int CL_API_CALL dynacl_instrument_clEnqueueWriteImage(cl_command_queue a0, cl_mem a1, cl_bool a2, const size_t * a3, const size_t * a4, size_t a5, size_t a6, const void * a7, cl_uint a8, const cl_event * a9, cl_event * a10) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLENQUEUEWRITEIMAGE_PTR)dynacl_load_acquire(&dynacl_real_clEnqueueWriteImage))(a0, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10);
+
+  dynacl_count(&dynacl_counter_clEnqueueWriteImage, start);
+
+  return result;
+}
+
+static CLENQUEUECOPYIMAGE_PTR dynacl_real_clEnqueueCopyImage = NULL;
+static dynacl_counter dynacl_counter_clEnqueueCopyImage;
+
+static cl_int CL_API_CALL dynacl_instrument_clEnqueueCopyImage(cl_command_queue a0, cl_mem a1, cl_mem a2, const size_t * a3, const size_t * a4, const size_t * a5, cl_uint a6, const cl_event * a7, cl_event * a8) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLENQUEUECOPYIMAGE_PTR)dynacl_load_acquire(&dynacl_real_clEnqueueCopyImage))(a0, a1, a2, a3, a4, a5, a6, a7, a8);
+
+  dynacl_count(&dynacl_counter_clEnqueueCopyImage, start);
+
+  return result;
+}
+
+static CLENQUEUECOPYIMAGETOBUFFER_PTR dynacl_real_clEnqueueCopyImageToBuffer = NULL;
+static dynacl_counter dynacl_counter_clEnqueueCopyImageToBuffer;
+
+static cl_int CL_API_CALL dynacl_instrument_clEnqueueCopyImageToBuffer(cl_command_queue a0, cl_mem a1, cl_mem a2, const size_t * a3, const size_t * a4, size_t a5, cl_uint a6, const cl_event * a7, cl_event * a8) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLENQUEUECOPYIMAGETOBUFFER_PTR)dynacl_load_acquire(&dynacl_real_clEnqueueCopyImageToBuffer))(a0, a1, a2, a3, a4, a5, a6, a7, a8);
+
+  dynacl_count(&dynacl_counter_clEnqueueCopyImageToBuffer, start);
+
+  return result;
+}
+
+static CLENQUEUECOPYBUFFERTOIMAGE_PTR dynacl_real_clEnqueueCopyBufferToImage = NULL;
+static dynacl_counter dynacl_counter_clEnqueueCopyBufferToImage;
+
+static cl_int CL_API_CALL dynacl_instrument_clEnqueueCopyBufferToImage(cl_command_queue a0, cl_mem a1, cl_mem a2, size_t a3, const size_t * a4, const size_t * a5, cl_uint a6, const cl_event * a7, cl_event * a8) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLENQUEUECOPYBUFFERTOIMAGE_PTR)dynacl_load_acquire(&dynacl_real_clEnqueueCopyBufferToImage))(a0, a1, a2, a3, a4, a5, a6, a7, a8);
+
+  dynacl_count(&dynacl_counter_clEnqueueCopyBufferToImage, start);
+
+  return result;
+}
+
+static CLENQUEUEMAPBUFFER_PTR dynacl_real_clEnqueueMapBuffer = NULL;
+static dynacl_counter dynacl_counter_clEnqueueMapBuffer;
+
+static void * CL_API_CALL dynacl_instrument_clEnqueueMapBuffer(cl_command_queue a0, cl_mem a1, cl_bool a2, cl_map_flags a3, size_t a4, size_t a5, cl_uint a6, const cl_event * a7, cl_event * a8, cl_int * a9) {
+  unsigned long long start = dynacl_now();
+  void * result = ((CLENQUEUEMAPBUFFER_PTR)dynacl_load_acquire(&dynacl_real_clEnqueueMapBuffer))(a0, a1, a2, a3, a4, a5, a6, a7, a8, a9);
+
+  dynacl_count(&dynacl_counter_clEnqueueMapBuffer, start);
+
+  return result;
+}
+
+static CLENQUEUEMAPIMAGE_PTR dynacl_real_clEnqueueMapImage = NULL;
+static dynacl_counter dynacl_counter_clEnqueueMapImage;
+
+static void * CL_API_CALL dynacl_instrument_clEnqueueMapImage(cl_command_queue a0, cl_mem a1, cl_bool a2, cl_map_flags a3, const size_t * a4, const size_t * a5, size_t * a6, size_t * a7, cl_uint a8, const cl_event * a9, cl_event * a10, cl_int * a11) {
+  unsigned long long start = dynacl_now();
+  void * result = ((CLENQUEUEMAPIMAGE_PTR)dynacl_load_acquire(&dynacl_real_clEnqueueMapImage))(a0, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11);
+
+  dynacl_count(&dynacl_counter_clEnqueueMapImage, start);
+
+  return result;
+}
+
+static CLENQUEUEUNMAPMEMOBJECT_PTR dynacl_real_clEnqueueUnmapMemObject = NULL;
+static dynacl_counter dynacl_counter_clEnqueueUnmapMemObject;
+
+static cl_int CL_API_CALL dynacl_instrument_clEnqueueUnmapMemObject(cl_command_queue a0, cl_mem a1, void * a2, cl_uint a3, const cl_event * a4, cl_event * a5) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLENQUEUEUNMAPMEMOBJECT_PTR)dynacl_load_acquire(&dynacl_real_clEnqueueUnmapMemObject))(a0, a1, a2, a3, a4, a5);
+
+  dynacl_count(&dynacl_counter_clEnqueueUnmapMemObject, start);
+
+  return result;
+}
+
+static CLENQUEUENDRANGEKERNEL_PTR dynacl_real_clEnqueueNDRangeKernel = NULL;
+static dynacl_counter dynacl_counter_clEnqueueNDRangeKernel;
+
+static cl_int CL_API_CALL dynacl_instrument_clEnqueueNDRangeKernel(cl_command_queue a0, cl_kernel a1, cl_uint a2, const size_t * a3, const size_t * a4, const size_t * a5, cl_uint a6, const cl_event * a7, cl_event * a8) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLENQUEUENDRANGEKERNEL_PTR)dynacl_load_acquire(&dynacl_real_clEnqueueNDRangeKernel))(a0, a1, a2, a3, a4, a5, a6, a7, a8);
+
+  dynacl_count(&dynacl_counter_clEnqueueNDRangeKernel, start);
+
+  return result;
+}
+
+static CLENQUEUETASK_PTR dynacl_real_clEnqueueTask = NULL;
+static dynacl_counter dynacl_counter_clEnqueueTask;
+
+static cl_int CL_API_CALL dynacl_instrument_clEnqueueTask(cl_command_queue a0, cl_kernel a1, cl_uint a2, const cl_event * a3, cl_event * a4) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLENQUEUETASK_PTR)dynacl_load_acquire(&dynacl_real_clEnqueueTask))(a0, a1, a2, a3, a4);
+
+  dynacl_count(&dynacl_counter_clEnqueueTask, start);
+
+  return result;
+}
+
+static CLENQUEUENATIVEKERNEL_PTR dynacl_real_clEnqueueNativeKernel = NULL;
+static dynacl_counter dynacl_counter_clEnqueueNativeKernel;
+
+static cl_int CL_API_CALL dynacl_instrument_clEnqueueNativeKernel(cl_command_queue a0, void (CL_CALLBACK * a1)(void *), void * a2, size_t a3, cl_uint a4, const cl_mem * a5, const void ** a6, cl_uint a7, const cl_event * a8, cl_event * a9) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLENQUEUENATIVEKERNEL_PTR)dynacl_load_acquire(&dynacl_real_clEnqueueNativeKernel))(a0, a1, a2, a3, a4, a5, a6, a7, a8, a9);
+
+  dynacl_count(&dynacl_counter_clEnqueueNativeKernel, start);
+
+  return result;
+}
+
+static CLENQUEUEMARKER_PTR dynacl_real_clEnqueueMarker = NULL;
+static dynacl_counter dynacl_counter_clEnqueueMarker;
+
+static cl_int CL_API_CALL dynacl_instrument_clEnqueueMarker(cl_command_queue a0, cl_event * a1) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLENQUEUEMARKER_PTR)dynacl_load_acquire(&dynacl_real_clEnqueueMarker))(a0, a1);
+
+  dynacl_count(&dynacl_counter_clEnqueueMarker, start);
+
+  return result;
+}
+
+static CLENQUEUEWAITFOREVENTS_PTR dynacl_real_clEnqueueWaitForEvents = NULL;
+static dynacl_counter dynacl_counter_clEnqueueWaitForEvents;
+
+static cl_int CL_API_CALL dynacl_instrument_clEnqueueWaitForEvents(cl_command_queue a0, cl_uint a1, const cl_event * a2) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLENQUEUEWAITFOREVENTS_PTR)dynacl_load_acquire(&dynacl_real_clEnqueueWaitForEvents))(a0, a1, a2);
+
+  dynacl_count(&dynacl_counter_clEnqueueWaitForEvents, start);
+
+  return result;
+}
+
+static CLENQUEUEBARRIER_PTR dynacl_real_clEnqueueBarrier = NULL;
+static dynacl_counter dynacl_counter_clEnqueueBarrier;
+
+static cl_int CL_API_CALL dynacl_instrument_clEnqueueBarrier(cl_command_queue a0) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLENQUEUEBARRIER_PTR)dynacl_load_acquire(&dynacl_real_clEnqueueBarrier))(a0);
+
+  dynacl_count(&dynacl_counter_clEnqueueBarrier, start);
+
+  return result;
+}
+
+static CLGETEXTENSIONFUNCTIONADDRESS_PTR dynacl_real_clGetExtensionFunctionAddress = NULL;
+static dynacl_counter dynacl_counter_clGetExtensionFunctionAddress;
+
+static void * CL_API_CALL dynacl_instrument_clGetExtensionFunctionAddress(const char * a0) {
+  unsigned long long start = dynacl_now();
+  void * result = ((CLGETEXTENSIONFUNCTIONADDRESS_PTR)dynacl_load_acquire(&dynacl_real_clGetExtensionFunctionAddress))(a0);
+
+  dynacl_count(&dynacl_counter_clGetExtensionFunctionAddress, start);
+
+  return result;
+}
+
+static CLCREATEFROMGLBUFFER_PTR dynacl_real_clCreateFromGLBuffer = NULL;
+static dynacl_counter dynacl_counter_clCreateFromGLBuffer;
+
+static cl_mem CL_API_CALL dynacl_instrument_clCreateFromGLBuffer(cl_context a0, cl_mem_flags a1, cl_GLuint a2, int * a3) {
+  unsigned long long start = dynacl_now();
+  cl_mem result = ((CLCREATEFROMGLBUFFER_PTR)dynacl_load_acquire(&dynacl_real_clCreateFromGLBuffer))(a0, a1, a2, a3);
+
+  dynacl_count(&dynacl_counter_clCreateFromGLBuffer, start);
+
+  return result;
+}
+
+static CLCREATEFROMGLTEXTURE2D_PTR dynacl_real_clCreateFromGLTexture2D = NULL;
+static dynacl_counter dynacl_counter_clCreateFromGLTexture2D;
+
+static cl_mem CL_API_CALL dynacl_instrument_clCreateFromGLTexture2D(cl_context a0, cl_mem_flags a1, cl_GLenum a2, cl_GLint a3, cl_GLuint a4, cl_int * a5) {
+  unsigned long long start = dynacl_now();
+  cl_mem result = ((CLCREATEFROMGLTEXTURE2D_PTR)dynacl_load_acquire(&dynacl_real_clCreateFromGLTexture2D))(a0, a1, a2, a3, a4, a5);
+
+  dynacl_count(&dynacl_counter_clCreateFromGLTexture2D, start);
+
+  return result;
+}
+
+static CLCREATEFROMGLTEXTURE3D_PTR dynacl_real_clCreateFromGLTexture3D = NULL;
+static dynacl_counter dynacl_counter_clCreateFromGLTexture3D;
+
+static cl_mem CL_API_CALL dynacl_instrument_clCreateFromGLTexture3D(cl_context a0, cl_mem_flags a1, cl_GLenum a2, cl_GLint a3, cl_GLuint a4, cl_int * a5) {
+  unsigned long long start = dynacl_now();
+  cl_mem result = ((CLCREATEFROMGLTEXTURE3D_PTR)dynacl_load_acquire(&dynacl_real_clCreateFromGLTexture3D))(a0, a1, a2, a3, a4, a5);
+
+  dynacl_count(&dynacl_counter_clCreateFromGLTexture3D, start);
+
+  return result;
+}
+
+static CLCREATEFROMGLRENDERBUFFER_PTR dynacl_real_clCreateFromGLRenderbuffer = NULL;
+static dynacl_counter dynacl_counter_clCreateFromGLRenderbuffer;
+
+static cl_mem CL_API_CALL dynacl_instrument_clCreateFromGLRenderbuffer(cl_context a0, cl_mem_flags a1, cl_GLuint a2, cl_int * a3) {
+  unsigned long long start = dynacl_now();
+  cl_mem result = ((CLCREATEFROMGLRENDERBUFFER_PTR)dynacl_load_acquire(&dynacl_real_clCreateFromGLRenderbuffer))(a0, a1, a2, a3);
+
+  dynacl_count(&dynacl_counter_clCreateFromGLRenderbuffer, start);
+
+  return result;
+}
+
+static CLGETGLOBJECTINFO_PTR dynacl_real_clGetGLObjectInfo = NULL;
+static dynacl_counter dynacl_counter_clGetGLObjectInfo;
+
+static cl_int CL_API_CALL dynacl_instrument_clGetGLObjectInfo(cl_mem a0, cl_gl_object_type * a1, cl_GLuint * a2) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLGETGLOBJECTINFO_PTR)dynacl_load_acquire(&dynacl_real_clGetGLObjectInfo))(a0, a1, a2);
+
+  dynacl_count(&dynacl_counter_clGetGLObjectInfo, start);
+
+  return result;
+}
+
+static CLGETGLTEXTUREINFO_PTR dynacl_real_clGetGLTextureInfo = NULL;
+static dynacl_counter dynacl_counter_clGetGLTextureInfo;
+
+static cl_int CL_API_CALL dynacl_instrument_clGetGLTextureInfo(cl_mem a0, cl_gl_texture_info a1, size_t a2, void * a3, size_t * a4) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLGETGLTEXTUREINFO_PTR)dynacl_load_acquire(&dynacl_real_clGetGLTextureInfo))(a0, a1, a2, a3, a4);
+
+  dynacl_count(&dynacl_counter_clGetGLTextureInfo, start);
+
+  return result;
+}
+
+static CLENQUEUEACQUIREGLOBJECTS_PTR dynacl_real_clEnqueueAcquireGLObjects = NULL;
+static dynacl_counter dynacl_counter_clEnqueueAcquireGLObjects;
+
+static cl_int CL_API_CALL dynacl_instrument_clEnqueueAcquireGLObjects(cl_command_queue a0, cl_uint a1, const cl_mem * a2, cl_uint a3, const cl_event * a4, cl_event * a5) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLENQUEUEACQUIREGLOBJECTS_PTR)dynacl_load_acquire(&dynacl_real_clEnqueueAcquireGLObjects))(a0, a1, a2, a3, a4, a5);
+
+  dynacl_count(&dynacl_counter_clEnqueueAcquireGLObjects, start);
+
+  return result;
+}
+
+static CLENQUEUERELEASEGLOBJECTS_PTR dynacl_real_clEnqueueReleaseGLObjects = NULL;
+static dynacl_counter dynacl_counter_clEnqueueReleaseGLObjects;
+
+static cl_int CL_API_CALL dynacl_instrument_clEnqueueReleaseGLObjects(cl_command_queue a0, cl_uint a1, const cl_mem * a2, cl_uint a3, const cl_event * a4, cl_event * a5) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLENQUEUERELEASEGLOBJECTS_PTR)dynacl_load_acquire(&dynacl_real_clEnqueueReleaseGLObjects))(a0, a1, a2, a3, a4, a5);
+
+  dynacl_count(&dynacl_counter_clEnqueueReleaseGLObjects, start);
+
+  return result;
+}
+
+static CLGETGLCONTEXTINFOKHR_PTR dynacl_real_clGetGLContextInfoKHR = NULL;
+static dynacl_counter dynacl_counter_clGetGLContextInfoKHR;
+
+static cl_int CL_API_CALL dynacl_instrument_clGetGLContextInfoKHR(const cl_context_properties * a0, cl_gl_context_info a1, size_t a2, void * a3, size_t * a4) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLGETGLCONTEXTINFOKHR_PTR)dynacl_load_acquire(&dynacl_real_clGetGLContextInfoKHR))(a0, a1, a2, a3, a4);
+
+  dynacl_count(&dynacl_counter_clGetGLContextInfoKHR, start);
+
+  return result;
+}
+
+static CLSETMEMOBJECTDESTRUCTORAPPLE_PTR dynacl_real_clSetMemObjectDestructorAPPLE = NULL;
+static dynacl_counter dynacl_counter_clSetMemObjectDestructorAPPLE;
+
+static cl_int CL_API_CALL dynacl_instrument_clSetMemObjectDestructorAPPLE(cl_mem a0, void (* a1)(cl_mem , void*), void * a2) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLSETMEMOBJECTDESTRUCTORAPPLE_PTR)dynacl_load_acquire(&dynacl_real_clSetMemObjectDestructorAPPLE))(a0, a1, a2);
+
+  dynacl_count(&dynacl_counter_clSetMemObjectDestructorAPPLE, start);
+
+  return result;
+}
+
+static CLLOGMESSAGESTOSYSTEMLOGAPPLE_PTR dynacl_real_clLogMessagesToSystemLogAPPLE = NULL;
+static dynacl_counter dynacl_counter_clLogMessagesToSystemLogAPPLE;
+
+static void CL_API_CALL dynacl_instrument_clLogMessagesToSystemLogAPPLE(const char * a0, const void * a1, size_t a2, void * a3) {
+  unsigned long long start = dynacl_now();
+
+  ((CLLOGMESSAGESTOSYSTEMLOGAPPLE_PTR)dynacl_load_acquire(&dynacl_real_clLogMessagesToSystemLogAPPLE))(a0, a1, a2, a3);
+  dynacl_count(&dynacl_counter_clLogMessagesToSystemLogAPPLE, start);
+}
+
+static CLLOGMESSAGESTOSTDOUTAPPLE_PTR dynacl_real_clLogMessagesToStdoutAPPLE = NULL;
+static dynacl_counter dynacl_counter_clLogMessagesToStdoutAPPLE;
+
+static void CL_API_CALL dynacl_instrument_clLogMessagesToStdoutAPPLE(const char * a0, const void * a1, size_t a2, void * a3) {
+  unsigned long long start = dynacl_now();
+
+  ((CLLOGMESSAGESTOSTDOUTAPPLE_PTR)dynacl_load_acquire(&dynacl_real_clLogMessagesToStdoutAPPLE))(a0, a1, a2, a3);
+  dynacl_count(&dynacl_counter_clLogMessagesToStdoutAPPLE, start);
+}
+
+static CLLOGMESSAGESTOSTDERRAPPLE_PTR dynacl_real_clLogMessagesToStderrAPPLE = NULL;
+static dynacl_counter dynacl_counter_clLogMessagesToStderrAPPLE;
+
+static void CL_API_CALL dynacl_instrument_clLogMessagesToStderrAPPLE(const char * a0, const void * a1, size_t a2, void * a3) {
+  unsigned long long start = dynacl_now();
+
+  ((CLLOGMESSAGESTOSTDERRAPPLE_PTR)dynacl_load_acquire(&dynacl_real_clLogMessagesToStderrAPPLE))(a0, a1, a2, a3);
+  dynacl_count(&dynacl_counter_clLogMessagesToStderrAPPLE, start);
+}
+
+static CLICDGETPLATFORMIDSKHR_PTR dynacl_real_clIcdGetPlatformIDsKHR = NULL;
+static dynacl_counter dynacl_counter_clIcdGetPlatformIDsKHR;
+
+static cl_int CL_API_CALL dynacl_instrument_clIcdGetPlatformIDsKHR(cl_uint a0, cl_platform_id * a1, cl_uint * a2) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLICDGETPLATFORMIDSKHR_PTR)dynacl_load_acquire(&dynacl_real_clIcdGetPlatformIDsKHR))(a0, a1, a2);
+
+  dynacl_count(&dynacl_counter_clIcdGetPlatformIDsKHR, start);
+
+  return result;
+}
+
+#if defined(CL_VERSION_1_1)
+static CLRELEASEDEVICEEXT_PTR dynacl_real_clReleaseDeviceEXT = NULL;
+static dynacl_counter dynacl_counter_clReleaseDeviceEXT;
+
+static cl_int CL_API_CALL dynacl_instrument_clReleaseDeviceEXT(cl_device_id a0) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLRELEASEDEVICEEXT_PTR)dynacl_load_acquire(&dynacl_real_clReleaseDeviceEXT))(a0);
+
+  dynacl_count(&dynacl_counter_clReleaseDeviceEXT, start);
+
+  return result;
+}
+
+static CLRETAINDEVICEEXT_PTR dynacl_real_clRetainDeviceEXT = NULL;
+static dynacl_counter dynacl_counter_clRetainDeviceEXT;
+
+static cl_int CL_API_CALL dynacl_instrument_clRetainDeviceEXT(cl_device_id a0) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLRETAINDEVICEEXT_PTR)dynacl_load_acquire(&dynacl_real_clRetainDeviceEXT))(a0);
+
+  dynacl_count(&dynacl_counter_clRetainDeviceEXT, start);
+
+  return result;
+}
+
+static CLCREATESUBDEVICESEXT_PTR dynacl_real_clCreateSubDevicesEXT = NULL;
+static dynacl_counter dynacl_counter_clCreateSubDevicesEXT;
+
+static cl_int CL_API_CALL dynacl_instrument_clCreateSubDevicesEXT(cl_device_id a0, const cl_device_partition_property_ext * a1, cl_uint a2, cl_device_id * a3, cl_uint * a4) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLCREATESUBDEVICESEXT_PTR)dynacl_load_acquire(&dynacl_real_clCreateSubDevicesEXT))(a0, a1, a2, a3, a4);
+
+  dynacl_count(&dynacl_counter_clCreateSubDevicesEXT, start);
+
+  return result;
+}
+
+static CLGETDEVICEIMAGEINFOQCOM_PTR dynacl_real_clGetDeviceImageInfoQCOM = NULL;
+static dynacl_counter dynacl_counter_clGetDeviceImageInfoQCOM;
+
+static cl_int CL_API_CALL dynacl_instrument_clGetDeviceImageInfoQCOM(cl_device_id a0, size_t a1, size_t a2, const cl_image_format * a3, cl_image_pitch_info_qcom a4, size_t a5, void * a6, size_t * a7) {
+  unsigned long long start = dynacl_now();
+  cl_int result = ((CLGETDEVICEIMAGEINFOQCOM_PTR)dynacl_load_acquire(&dynacl_real_clGetDeviceImageInfoQCOM))(a0, a1, a2, a3, a4, a5, a6, a7);
+
+  dynacl_count(&dynacl_counter_clGetDeviceImageInfoQCOM, start);
+
+  return result;
+}
+
+#endif
@@ -0,0 +1,767 @@
+/*
+ * DynaCL: OpenCL entry point trampolines
+ *
+ * This file is generated by codegen.py from cl.h, cl_gl.h, cl_ext.h: do not edit.
+ * Each trampoline resolves its entry point through dynacl_resolve() on its
+ * first call, then calls it, loading its function pointer with acquire
+ * semantics as other threads may be resolving it too. It is included by
+ * src/dynacl.c when DYNACL_LAZY is defined.
+ */
+static cl_int CL_API_CALL dynacl_lazy_clGetPlatformIDs(cl_uint a0, cl_platform_id * a1, cl_uint * a2) {
+  if(!dynacl_resolve("clGetPlatformIDs", (dynacl_function *)&DYNACL_TARGET(clGetPlatformIDs), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLGETPLATFORMIDS_PTR)dynacl_load_acquire(&DYNACL_TARGET(clGetPlatformIDs)))(a0, a1, a2);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clGetPlatformInfo(cl_platform_id a0, cl_platform_info a1, size_t a2, void * a3, size_t * a4) {
+  if(!dynacl_resolve("clGetPlatformInfo", (dynacl_function *)&DYNACL_TARGET(clGetPlatformInfo), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLGETPLATFORMINFO_PTR)dynacl_load_acquire(&DYNACL_TARGET(clGetPlatformInfo)))(a0, a1, a2, a3, a4);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clGetDeviceIDs(cl_platform_id a0, cl_device_type a1, cl_uint a2, cl_device_id * a3, cl_uint * a4) {
+  if(!dynacl_resolve("clGetDeviceIDs", (dynacl_function *)&DYNACL_TARGET(clGetDeviceIDs), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLGETDEVICEIDS_PTR)dynacl_load_acquire(&DYNACL_TARGET(clGetDeviceIDs)))(a0, a1, a2, a3, a4);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clGetDeviceInfo(cl_device_id a0, cl_device_info a1, size_t a2, void * a3, size_t * a4) {
+  if(!dynacl_resolve("clGetDeviceInfo", (dynacl_function *)&DYNACL_TARGET(clGetDeviceInfo), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLGETDEVICEINFO_PTR)dynacl_load_acquire(&DYNACL_TARGET(clGetDeviceInfo)))(a0, a1, a2, a3, a4);
+}
+
+static cl_context CL_API_CALL dynacl_lazy_clCreateContext(const cl_context_properties * a0, cl_uint a1, const cl_device_id * a2, void (CL_CALLBACK * a3)(const char *, const void *, size_t, void *), void * a4, cl_int * a5) {
+  if(!dynacl_resolve("clCreateContext", (dynacl_function *)&DYNACL_TARGET(clCreateContext), DYNACL_ENTRY_REQUIRED)) {
+    if(a5) *a5 = CL_INVALID_OPERATION;
+    return (cl_context)0;
+  }
+
+  return ((CLCREATECONTEXT_PTR)dynacl_load_acquire(&DYNACL_TARGET(clCreateContext)))(a0, a1, a2, a3, a4, a5);
+}
+
+static cl_context CL_API_CALL dynacl_lazy_clCreateContextFromType(const cl_context_properties * a0, cl_device_type a1, void (CL_CALLBACK * a2)(const char *, const void *, size_t, void *), void * a3, cl_int * a4) {
+  if(!dynacl_resolve("clCreateContextFromType", (dynacl_function *)&DYNACL_TARGET(clCreateContextFromType), DYNACL_ENTRY_REQUIRED)) {
+    if(a4) *a4 = CL_INVALID_OPERATION;
+    return (cl_context)0;
+  }
+
+  return ((CLCREATECONTEXTFROMTYPE_PTR)dynacl_load_acquire(&DYNACL_TARGET(clCreateContextFromType)))(a0, a1, a2, a3, a4);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clRetainContext(cl_context a0) {
+  if(!dynacl_resolve("clRetainContext", (dynacl_function *)&DYNACL_TARGET(clRetainContext), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLRETAINCONTEXT_PTR)dynacl_load_acquire(&DYNACL_TARGET(clRetainContext)))(a0);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clReleaseContext(cl_context a0) {
+  if(!dynacl_resolve("clReleaseContext", (dynacl_function *)&DYNACL_TARGET(clReleaseContext), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLRELEASECONTEXT_PTR)dynacl_load_acquire(&DYNACL_TARGET(clReleaseContext)))(a0);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clGetContextInfo(cl_context a0, cl_context_info a1, size_t a2, void * a3, size_t * a4) {
+  if(!dynacl_resolve("clGetContextInfo", (dynacl_function *)&DYNACL_TARGET(clGetContextInfo), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLGETCONTEXTINFO_PTR)dynacl_load_acquire(&DYNACL_TARGET(clGetContextInfo)))(a0, a1, a2, a3, a4);
+}
+
+static cl_command_queue CL_API_CALL dynacl_lazy_clCreateCommandQueue(cl_context a0, cl_device_id a1, cl_command_queue_properties a2, cl_int * a3) {
+  if(!dynacl_resolve("clCreateCommandQueue", (dynacl_function *)&DYNACL_TARGET(clCreateCommandQueue), DYNACL_ENTRY_REQUIRED)) {
+    if(a3) *a3 = CL_INVALID_OPERATION;
+    return (cl_command_queue)0;
+  }
+
+  return ((CLCREATECOMMANDQUEUE_PTR)dynacl_load_acquire(&DYNACL_TARGET(clCreateCommandQueue)))(a0, a1, a2, a3);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clRetainCommandQueue(cl_command_queue a0) {
+  if(!dynacl_resolve("clRetainCommandQueue", (dynacl_function *)&DYNACL_TARGET(clRetainCommandQueue), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLRETAINCOMMANDQUEUE_PTR)dynacl_load_acquire(&DYNACL_TARGET(clRetainCommandQueue)))(a0);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clReleaseCommandQueue(cl_command_queue a0) {
+  if(!dynacl_resolve("clReleaseCommandQueue", (dynacl_function *)&DYNACL_TARGET(clReleaseCommandQueue), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLRELEASECOMMANDQUEUE_PTR)dynacl_load_acquire(&DYNACL_TARGET(clReleaseCommandQueue)))(a0);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clGetCommandQueueInfo(cl_command_queue a0, cl_command_queue_info a1, size_t a2, void * a3, size_t * a4) {
+  if(!dynacl_resolve("clGetCommandQueueInfo", (dynacl_function *)&DYNACL_TARGET(clGetCommandQueueInfo), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLGETCOMMANDQUEUEINFO_PTR)dynacl_load_acquire(&DYNACL_TARGET(clGetCommandQueueInfo)))(a0, a1, a2, a3, a4);
+}
+
+#if defined(CL_USE_DEPRECATED_OPENCL_1_0_APIS)
+static cl_int CL_API_CALL dynacl_lazy_clSetCommandQueueProperty(cl_command_queue a0, cl_command_queue_properties a1, cl_bool a2, cl_command_queue_properties * a3) {
+  if(!dynacl_resolve("clSetCommandQueueProperty", (dynacl_function *)&DYNACL_TARGET(clSetCommandQueueProperty), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLSETCOMMANDQUEUEPROPERTY_PTR)dynacl_load_acquire(&DYNACL_TARGET(clSetCommandQueueProperty)))(a0, a1, a2, a3);
+}
+
+#endif
+static cl_mem CL_API_CALL dynacl_lazy_clCreateBuffer(cl_context a0, cl_mem_flags a1, size_t a2, void * a3, cl_int * a4) {
+  if(!dynacl_resolve("clCreateBuffer", (dynacl_function *)&DYNACL_TARGET(clCreateBuffer), DYNACL_ENTRY_REQUIRED)) {
+    if(a4) *a4 = CL_INVALID_OPERATION;
+    return (cl_mem)0;
+  }
+
+  return ((CLCREATEBUFFER_PTR)dynacl_load_acquire(&DYNACL_TARGET(clCreateBuffer)))(a0, a1, a2, a3, a4);
+}
+
+static cl_mem CL_API_CALL dynacl_lazy_clCreateSubBuffer(cl_mem a0, cl_mem_flags a1, cl_buffer_create_type a2, const void * a3, cl_int * a4) {
+  if(!dynacl_resolve("clCreateSubBuffer", (dynacl_function *)&DYNACL_TARGET(clCreateSubBuffer), DYNACL_ENTRY_REQUIRED)) {
+    if(a4) *a4 = CL_INVALID_OPERATION;
+    return (cl_mem)0;
+  }
+
+  return ((CLCREATESUBBUFFER_PTR)dynacl_load_acquire(&DYNACL_TARGET(clCreateSubBuffer)))(a0, a1, a2, a3, a4);
+}
+
+static cl_mem CL_API_CALL dynacl_lazy_clCreateImage2D(cl_context a0, cl_mem_flags a1, const cl_image_format * a2, size_t a3, size_t a4, size_t a5, void * a6, cl_int * a7) {
+  if(!dynacl_resolve("clCreateImage2D", (dynacl_function *)&DYNACL_TARGET(clCreateImage2D), DYNACL_ENTRY_REQUIRED)) {
+    if(a7) *a7 = CL_INVALID_OPERATION;
+    return (cl_mem)0;
+  }
+
+  return ((CLCREATEIMAGE2D_PTR)dynacl_load_acquire(&DYNACL_TARGET(clCreateImage2D)))(a0, a1, a2, a3, a4, a5, a6, a7);
+}
+
+static cl_mem CL_API_CALL dynacl_lazy_clCreateImage3D(cl_context a0, cl_mem_flags a1, const cl_image_format * a2, size_t a3, size_t a4, size_t a5, size_t a6, size_t a7, void * a8, cl_int * a9) {
+  if(!dynacl_resolve("clCreateImage3D", (dynacl_function *)&DYNACL_TARGET(clCreateImage3D), DYNACL_ENTRY_REQUIRED)) {
+    if(a9) *a9 = CL_INVALID_OPERATION;
+    return (cl_mem)0;
+  }
+
+  return ((CLCREATEIMAGE3D_PTR)dynacl_load_acquire(&DYNACL_TARGET(clCreateImage3D)))(a0, a1, a2, a3, a4, a5, a6, a7, a8, a9);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clRetainMemObject(cl_mem a0) {
+  if(!dynacl_resolve("clRetainMemObject", (dynacl_function *)&DYNACL_TARGET(clRetainMemObject), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLRETAINMEMOBJECT_PTR)dynacl_load_acquire(&DYNACL_TARGET(clRetainMemObject)))(a0);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clReleaseMemObject(cl_mem a0) {
+  if(!dynacl_resolve("clReleaseMemObject", (dynacl_function *)&DYNACL_TARGET(clReleaseMemObject), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLRELEASEMEMOBJECT_PTR)dynacl_load_acquire(&DYNACL_TARGET(clReleaseMemObject)))(a0);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clGetSupportedImageFormats(cl_context a0, cl_mem_flags a1, cl_mem_object_type a2, cl_uint a3, cl_image_format * a4, cl_uint * a5) {
+  if(!dynacl_resolve("clGetSupportedImageFormats", (dynacl_function *)&DYNACL_TARGET(clGetSupportedImageFormats), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLGETSUPPORTEDIMAGEFORMATS_PTR)dynacl_load_acquire(&DYNACL_TARGET(clGetSupportedImageFormats)))(a0, a1, a2, a3, a4, a5);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clGetMemObjectInfo(cl_mem a0, cl_mem_info a1, size_t a2, void * a3, size_t * a4) {
+  if(!dynacl_resolve("clGetMemObjectInfo", (dynacl_function *)&DYNACL_TARGET(clGetMemObjectInfo), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLGETMEMOBJECTINFO_PTR)dynacl_load_acquire(&DYNACL_TARGET(clGetMemObjectInfo)))(a0, a1, a2, a3, a4);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clGetImageInfo(cl_mem a0, cl_image_info a1, size_t a2, void * a3, size_t * a4) {
+  if(!dynacl_resolve("clGetImageInfo", (dynacl_function *)&DYNACL_TARGET(clGetImageInfo), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLGETIMAGEINFO_PTR)dynacl_load_acquire(&DYNACL_TARGET(clGetImageInfo)))(a0, a1, a2, a3, a4);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clSetMemObjectDestructorCallback(cl_mem a0, void (CL_CALLBACK * a1)(cl_mem , void*), void * a2) {
+  if(!dynacl_resolve("clSetMemObjectDestructorCallback", (dynacl_function *)&DYNACL_TARGET(clSetMemObjectDestructorCallback), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLSETMEMOBJECTDESTRUCTORCALLBACK_PTR)dynacl_load_acquire(&DYNACL_TARGET(clSetMemObjectDestructorCallback)))(a0, a1, a2);
+}
+
+static cl_sampler CL_API_CALL dynacl_lazy_clCreateSampler(cl_context a0, cl_bool a1, cl_addressing_mode a2, cl_filter_mode a3, cl_int * a4) {
+  if(!dynacl_resolve("clCreateSampler", (dynacl_function *)&DYNACL_TARGET(clCreateSampler), DYNACL_ENTRY_REQUIRED)) {
+    if(a4) *a4 = CL_INVALID_OPERATION;
+    return (cl_sampler)0;
+  }
+
+  return ((CLCREATESAMPLER_PTR)dynacl_load_acquire(&DYNACL_TARGET(clCreateSampler)))(a0, a1, a2, a3, a4);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clRetainSampler(cl_sampler a0) {
+  if(!dynacl_resolve("clRetainSampler", (dynacl_function *)&DYNACL_TARGET(clRetainSampler), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLRETAINSAMPLER_PTR)dynacl_load_acquire(&DYNACL_TARGET(clRetainSampler)))(a0);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clReleaseSampler(cl_sampler a0) {
+  if(!dynacl_resolve("clReleaseSampler", (dynacl_function *)&DYNACL_TARGET(clReleaseSampler), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLRELEASESAMPLER_PTR)dynacl_load_acquire(&DYNACL_TARGET(clReleaseSampler)))(a0);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clGetSamplerInfo(cl_sampler a0, cl_sampler_info a1, size_t a2, void * a3, size_t * a4) {
+  if(!dynacl_resolve("clGetSamplerInfo", (dynacl_function *)&DYNACL_TARGET(clGetSamplerInfo), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLGETSAMPLERINFO_PTR)dynacl_load_acquire(&DYNACL_TARGET(clGetSamplerInfo)))(a0, a1, a2, a3, a4);
+}
+
+static cl_program CL_API_CALL dynacl_lazy_clCreateProgramWithSource(cl_context a0, cl_uint a1, const char ** a2, const size_t * a3, cl_int * a4) {
+  if(!dynacl_resolve("clCreateProgramWithSource", (dynacl_function *)&DYNACL_TARGET(clCreateProgramWithSource), DYNACL_ENTRY_REQUIRED)) {
+    if(a4) *a4 = CL_INVALID_OPERATION;
+    return (cl_program)0;
+  }
+
+  return ((CLCREATEPROGRAMWITHSOURCE_PTR)dynacl_load_acquire(&DYNACL_TARGET(clCreateProgramWithSource)))(a0, a1, a2, a3, a4);
+}
+
+static cl_program CL_API_CALL dynacl_lazy_clCreateProgramWithBinary(cl_context a0, cl_uint a1, const cl_device_id * a2, const size_t * a3, const unsigned char ** a4, cl_int * a5, cl_int * a6) {
+  if(!dynacl_resolve("clCreateProgramWithBinary", (dynacl_function *)&DYNACL_TARGET(clCreateProgramWithBinary), DYNACL_ENTRY_REQUIRED)) {
+    if(a6) *a6 = CL_INVALID_OPERATION;
+    return (cl_program)0;
+  }
+
+  return ((CLCREATEPROGRAMWITHBINARY_PTR)dynacl_load_acquire(&DYNACL_TARGET(clCreateProgramWithBinary)))(a0, a1, a2, a3, a4, a5, a6);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clRetainProgram(cl_program a0) {
+  if(!dynacl_resolve("clRetainProgram", (dynacl_function *)&DYNACL_TARGET(clRetainProgram), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLRETAINPROGRAM_PTR)dynacl_load_acquire(&DYNACL_TARGET(clRetainProgram)))(a0);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clReleaseProgram(cl_program a0) {
+  if(!dynacl_resolve("clReleaseProgram", (dynacl_function *)&DYNACL_TARGET(clReleaseProgram), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLRELEASEPROGRAM_PTR)dynacl_load_acquire(&DYNACL_TARGET(clReleaseProgram)))(a0);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clBuildProgram(cl_program a0, cl_uint a1, const cl_device_id * a2, const char * a3, void (CL_CALLBACK * a4)(cl_program , void *), void * a5) {
+  if(!dynacl_resolve("clBuildProgram", (dynacl_function *)&DYNACL_TARGET(clBuildProgram), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLBUILDPROGRAM_PTR)dynacl_load_acquire(&DYNACL_TARGET(clBuildProgram)))(a0, a1, a2, a3, a4, a5);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clUnloadCompiler(void) {
+  if(!dynacl_resolve("clUnloadCompiler", (dynacl_function *)&DYNACL_TARGET(clUnloadCompiler), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLUNLOADCOMPILER_PTR)dynacl_load_acquire(&DYNACL_TARGET(clUnloadCompiler)))();
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clGetProgramInfo(cl_program a0, cl_program_info a1, size_t a2, void * a3, size_t * a4) {
+  if(!dynacl_resolve("clGetProgramInfo", (dynacl_function *)&DYNACL_TARGET(clGetProgramInfo), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLGETPROGRAMINFO_PTR)dynacl_load_acquire(&DYNACL_TARGET(clGetProgramInfo)))(a0, a1, a2, a3, a4);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clGetProgramBuildInfo(cl_program a0, cl_device_id a1, cl_program_build_info a2, size_t a3, void * a4, size_t * a5) {
+  if(!dynacl_resolve("clGetProgramBuildInfo", (dynacl_function *)&DYNACL_TARGET(clGetProgramBuildInfo), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLGETPROGRAMBUILDINFO_PTR)dynacl_load_acquire(&DYNACL_TARGET(clGetProgramBuildInfo)))(a0, a1, a2, a3, a4, a5);
+}
+
+static cl_kernel CL_API_CALL dynacl_lazy_clCreateKernel(cl_program a0, const char * a1, cl_int * a2) {
+  if(!dynacl_resolve("clCreateKernel", (dynacl_function *)&DYNACL_TARGET(clCreateKernel), DYNACL_ENTRY_REQUIRED)) {
+    if(a2) *a2 = CL_INVALID_OPERATION;
+    return (cl_kernel)0;
+  }
+
+  return ((CLCREATEKERNEL_PTR)dynacl_load_acquire(&DYNACL_TARGET(clCreateKernel)))(a0, a1, a2);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clCreateKernelsInProgram(cl_program a0, cl_uint a1, cl_kernel * a2, cl_uint * a3) {
+  if(!dynacl_resolve("clCreateKernelsInProgram", (dynacl_function *)&DYNACL_TARGET(clCreateKernelsInProgram), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLCREATEKERNELSINPROGRAM_PTR)dynacl_load_acquire(&DYNACL_TARGET(clCreateKernelsInProgram)))(a0, a1, a2, a3);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clRetainKernel(cl_kernel a0) {
+  if(!dynacl_resolve("clRetainKernel", (dynacl_function *)&DYNACL_TARGET(clRetainKernel), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLRETAINKERNEL_PTR)dynacl_load_acquire(&DYNACL_TARGET(clRetainKernel)))(a0);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clReleaseKernel(cl_kernel a0) {
+  if(!dynacl_resolve("clReleaseKernel", (dynacl_function *)&DYNACL_TARGET(clReleaseKernel), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLRELEASEKERNEL_PTR)dynacl_load_acquire(&DYNACL_TARGET(clReleaseKernel)))(a0);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clSetKernelArg(cl_kernel a0, cl_uint a1, size_t a2, const void * a3) {
+  if(!dynacl_resolve("clSetKernelArg", (dynacl_function *)&DYNACL_TARGET(clSetKernelArg), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLSETKERNELARG_PTR)dynacl_load_acquire(&DYNACL_TARGET(clSetKernelArg)))(a0, a1, a2, a3);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clGetKernelInfo(cl_kernel a0, cl_kernel_info a1, size_t a2, void * a3, size_t * a4) {
+  if(!dynacl_resolve("clGetKernelInfo", (dynacl_function *)&DYNACL_TARGET(clGetKernelInfo), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLGETKERNELINFO_PTR)dynacl_load_acquire(&DYNACL_TARGET(clGetKernelInfo)))(a0, a1, a2, a3, a4);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clGetKernelWorkGroupInfo(cl_kernel a0, cl_device_id a1, cl_kernel_work_group_info a2, size_t a3, void * a4, size_t * a5) {
+  if(!dynacl_resolve("clGetKernelWorkGroupInfo", (dynacl_function *)&DYNACL_TARGET(clGetKernelWorkGroupInfo), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLGETKERNELWORKGROUPINFO_PTR)dynacl_load_acquire(&DYNACL_TARGET(clGetKernelWorkGroupInfo)))(a0, a1, a2, a3, a4, a5);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clWaitForEvents(cl_uint a0, const cl_event * a1) {
+  if(!dynacl_resolve("clWaitForEvents", (dynacl_function *)&DYNACL_TARGET(clWaitForEvents), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLWAITFOREVENTS_PTR)dynacl_load_acquire(&DYNACL_TARGET(clWaitForEvents)))(a0, a1);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clGetEventInfo(cl_event a0, cl_event_info a1, size_t a2, void * a3, size_t * a4) {
+  if(!dynacl_resolve("clGetEventInfo", (dynacl_function *)&DYNACL_TARGET(clGetEventInfo), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLGETEVENTINFO_PTR)dynacl_load_acquire(&DYNACL_TARGET(clGetEventInfo)))(a0, a1, a2, a3, a4);
+}
+
+static cl_event CL_API_CALL dynacl_lazy_clCreateUserEvent(cl_context a0, cl_int * a1) {
+  if(!dynacl_resolve("clCreateUserEvent", (dynacl_function *)&DYNACL_TARGET(clCreateUserEvent), DYNACL_ENTRY_REQUIRED)) {
+    if(a1) *a1 = CL_INVALID_OPERATION;
+    return (cl_event)0;
+  }
+
+  return ((CLCREATEUSEREVENT_PTR)dynacl_load_acquire(&DYNACL_TARGET(clCreateUserEvent)))(a0, a1);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clRetainEvent(cl_event a0) {
+  if(!dynacl_resolve("clRetainEvent", (dynacl_function *)&DYNACL_TARGET(clRetainEvent), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLRETAINEVENT_PTR)dynacl_load_acquire(&DYNACL_TARGET(clRetainEvent)))(a0);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clReleaseEvent(cl_event a0) {
+  if(!dynacl_resolve("clReleaseEvent", (dynacl_function *)&DYNACL_TARGET(clReleaseEvent), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLRELEASEEVENT_PTR)dynacl_load_acquire(&DYNACL_TARGET(clReleaseEvent)))(a0);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clSetUserEventStatus(cl_event a0, cl_int a1) {
+  if(!dynacl_resolve("clSetUserEventStatus", (dynacl_function *)&DYNACL_TARGET(clSetUserEventStatus), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLSETUSEREVENTSTATUS_PTR)dynacl_load_acquire(&DYNACL_TARGET(clSetUserEventStatus)))(a0, a1);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clSetEventCallback(cl_event a0, cl_int a1, void (CL_CALLBACK * a2)(cl_event, cl_int, void *), void * a3) {
+  if(!dynacl_resolve("clSetEventCallback", (dynacl_function *)&DYNACL_TARGET(clSetEventCallback), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLSETEVENTCALLBACK_PTR)dynacl_load_acquire(&DYNACL_TARGET(clSetEventCallback)))(a0, a1, a2, a3);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clGetEventProfilingInfo(cl_event a0, cl_profiling_info a1, size_t a2, void * a3, size_t * a4) {
+  if(!dynacl_resolve("clGetEventProfilingInfo", (dynacl_function *)&DYNACL_TARGET(clGetEventProfilingInfo), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLGETEVENTPROFILINGINFO_PTR)dynacl_load_acquire(&DYNACL_TARGET(clGetEventProfilingInfo)))(a0, a1, a2, a3, a4);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clFlush(cl_command_queue a0) {
+  if(!dynacl_resolve("clFlush", (dynacl_function *)&DYNACL_TARGET(clFlush), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLFLUSH_PTR)dynacl_load_acquire(&DYNACL_TARGET(clFlush)))(a0);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clFinish(cl_command_queue a0) {
+  if(!dynacl_resolve("clFinish", (dynacl_function *)&DYNACL_TARGET(clFinish), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLFINISH_PTR)dynacl_load_acquire(&DYNACL_TARGET(clFinish)))(a0);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clEnqueueReadBuffer(cl_command_queue a0, cl_mem a1, cl_bool a2, size_t a3, size_t a4, void * a5, cl_uint a6, const cl_event * a7, cl_event * a8) {
+  if(!dynacl_resolve("clEnqueueReadBuffer", (dynacl_function *)&DYNACL_TARGET(clEnqueueReadBuffer), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLENQUEUEREADBUFFER_PTR)dynacl_load_acquire(&DYNACL_TARGET(clEnqueueReadBuffer)))(a0, a1, a2, a3, a4, a5, a6, a7, a8);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clEnqueueReadBufferRect(cl_command_queue a0, cl_mem a1, cl_bool a2, const size_t * a3, const size_t * a4, const size_t * a5, size_t a6, size_t a7, size_t a8, size_t a9, void * a10, cl_uint a11, const cl_event * a12, cl_event * a13) {
+  if(!dynacl_resolve("clEnqueueReadBufferRect", (dynacl_function *)&DYNACL_TARGET(clEnqueueReadBufferRect), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLENQUEUEREADBUFFERRECT_PTR)dynacl_load_acquire(&DYNACL_TARGET(clEnqueueReadBufferRect)))(a0, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11, a12, a13);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clEnqueueWriteBuffer(cl_command_queue a0, cl_mem a1, cl_bool a2, size_t a3, size_t a4, const void * a5, cl_uint a6, const cl_event * a7, cl_event * a8) {
+  if(!dynacl_resolve("clEnqueueWriteBuffer", (dynacl_function *)&DYNACL_TARGET(clEnqueueWriteBuffer), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLENQUEUEWRITEBUFFER_PTR)dynacl_load_acquire(&DYNACL_TARGET(clEnqueueWriteBuffer)))(a0, a1, a2, a3, a4, a5, a6, a7, a8);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clEnqueueWriteBufferRect(cl_command_queue a0, cl_mem a1, cl_bool a2, const size_t * a3, const size_t * a4, const size_t * a5, size_t a6, size_t a7, size_t a8, size_t a9, const void * a10, cl_uint a11, const cl_event * a12, cl_event * a13) {
+  if(!dynacl_resolve("clEnqueueWriteBufferRect", (dynacl_function *)&DYNACL_TARGET(clEnqueueWriteBufferRect), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLENQUEUEWRITEBUFFERRECT_PTR)dynacl_load_acquire(&DYNACL_TARGET(clEnqueueWriteBufferRect)))(a0, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11, a12, a13);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clEnqueueCopyBuffer(cl_command_queue a0, cl_mem a1, cl_mem a2, size_t a3, size_t a4, size_t a5, cl_uint a6, const cl_event * a7, cl_event * a8) {
+  if(!dynacl_resolve("clEnqueueCopyBuffer", (dynacl_function *)&DYNACL_TARGET(clEnqueueCopyBuffer), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLENQUEUECOPYBUFFER_PTR)dynacl_load_acquire(&DYNACL_TARGET(clEnqueueCopyBuffer)))(a0, a1, a2, a3, a4, a5, a6, a7, a8);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clEnqueueCopyBufferRect(cl_command_queue a0, cl_mem a1, cl_mem a2, const size_t * a3, const size_t * a4, const size_t * a5, size_t a6, size_t a7, size_t a8, size_t a9, cl_uint a10, const cl_event * a11, cl_event * a12) {
+  if(!dynacl_resolve("clEnqueueCopyBufferRect", (dynacl_function *)&DYNACL_TARGET(clEnqueueCopyBufferRect), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLENQUEUECOPYBUFFERRECT_PTR)dynacl_load_acquire(&DYNACL_TARGET(clEnqueueCopyBufferRect)))(a0, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11, a12);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clEnqueueReadImage(cl_command_queue a0, cl_mem a1, cl_bool a2, const size_t * a3, const size_t * a4, size_t a5, size_t a6, void * a7, cl_uint a8, const cl_event * a9, cl_event * a10) {
+  if(!dynacl_resolve("clEnqueueReadImage", (dynacl_function *)&DYNACL_TARGET(clEnqueueReadImage), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLENQUEUEREADIMAGE_PTR)dynacl_load_acquire(&DYNACL_TARGET(clEnqueueReadImage)))(a0, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clEnqueueWriteImage(cl_command_queue a0, cl_mem a1, cl_bool a2, const size_t * a3, const size_t * a4, size_t a5, size_t a6, const void * a7, cl_uint a8, const cl_event * a9, cl_event * a10) {
+  if(!dynacl_resolve("clEnqueueWriteImage", (dynacl_function *)&DYNACL_TARGET(clEnqueueWriteImage), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLENQUEUEWRITEIMAGE_PTR)dynacl_load_acquire(&DYNACL_TARGET(clEnqueueWriteImage)))(a0, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clEnqueueCopyImage(cl_command_queue a0, cl_mem a1, cl_mem a2, const size_t * a3, const size_t * a4, const size_t * a5, cl_uint a6, const cl_event * a7, cl_event * a8) {
+  if(!dynacl_resolve("clEnqueueCopyImage", (dynacl_function *)&DYNACL_TARGET(clEnqueueCopyImage), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLENQUEUECOPYIMAGE_PTR)dynacl_load_acquire(&DYNACL_TARGET(clEnqueueCopyImage)))(a0, a1, a2, a3, a4, a5, a6, a7, a8);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clEnqueueCopyImageToBuffer(cl_command_queue a0, cl_mem a1, cl_mem a2, const size_t * a3, const size_t * a4, size_t a5, cl_uint a6, const cl_event * a7, cl_event * a8) {
+  if(!dynacl_resolve("clEnqueueCopyImageToBuffer", (dynacl_function *)&DYNACL_TARGET(clEnqueueCopyImageToBuffer), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLENQUEUECOPYIMAGETOBUFFER_PTR)dynacl_load_acquire(&DYNACL_TARGET(clEnqueueCopyImageToBuffer)))(a0, a1, a2, a3, a4, a5, a6, a7, a8);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clEnqueueCopyBufferToImage(cl_command_queue a0, cl_mem a1, cl_mem a2, size_t a3, const size_t * a4, const size_t * a5, cl_uint a6, const cl_event * a7, cl_event * a8) {
+  if(!dynacl_resolve("clEnqueueCopyBufferToImage", (dynacl_function *)&DYNACL_TARGET(clEnqueueCopyBufferToImage), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLENQUEUECOPYBUFFERTOIMAGE_PTR)dynacl_load_acquire(&DYNACL_TARGET(clEnqueueCopyBufferToImage)))(a0, a1, a2, a3, a4, a5, a6, a7, a8);
+}
+
+static void * CL_API_CALL dynacl_lazy_clEnqueueMapBuffer(cl_command_queue a0, cl_mem a1, cl_bool a2, cl_map_flags a3, size_t a4, size_t a5, cl_uint a6, const cl_event * a7, cl_event * a8, cl_int * a9) {
+  if(!dynacl_resolve("clEnqueueMapBuffer", (dynacl_function *)&DYNACL_TARGET(clEnqueueMapBuffer), DYNACL_ENTRY_REQUIRED)) {
+    if(a9) *a9 = CL_INVALID_OPERATION;
+    return (void *)0;
+  }
+
+  return ((CLENQUEUEMAPBUFFER_PTR)dynacl_load_acquire(&DYNACL_TARGET(clEnqueueMapBuffer)))(a0, a1, a2, a3, a4, a5, a6, a7, a8, a9);
+}
+
+static void * CL_API_CALL dynacl_lazy_clEnqueueMapImage(cl_command_queue a0, cl_mem a1, cl_bool a2, cl_map_flags a3, const size_t * a4, const size_t * a5, size_t * a6, size_t * a7, cl_uint a8, const cl_event * a9, cl_event * a10, cl_int * a11) {
+  if(!dynacl_resolve("clEnqueueMapImage", (dynacl_function *)&DYNACL_TARGET(clEnqueueMapImage), DYNACL_ENTRY_REQUIRED)) {
+    if(a11) *a11 = CL_INVALID_OPERATION;
+    return (void *)0;
+  }
+
+  return ((CLENQUEUEMAPIMAGE_PTR)dynacl_load_acquire(&DYNACL_TARGET(clEnqueueMapImage)))(a0, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clEnqueueUnmapMemObject(cl_command_queue a0, cl_mem a1, void * a2, cl_uint a3, const cl_event * a4, cl_event * a5) {
+  if(!dynacl_resolve("clEnqueueUnmapMemObject", (dynacl_function *)&DYNACL_TARGET(clEnqueueUnmapMemObject), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLENQUEUEUNMAPMEMOBJECT_PTR)dynacl_load_acquire(&DYNACL_TARGET(clEnqueueUnmapMemObject)))(a0, a1, a2, a3, a4, a5);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clEnqueueNDRangeKernel(cl_command_queue a0, cl_kernel a1, cl_uint a2, const size_t * a3, const size_t * a4, const size_t * a5, cl_uint a6, const cl_event * a7, cl_event * a8) {
+  if(!dynacl_resolve("clEnqueueNDRangeKernel", (dynacl_function *)&DYNACL_TARGET(clEnqueueNDRangeKernel), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLENQUEUENDRANGEKERNEL_PTR)dynacl_load_acquire(&DYNACL_TARGET(clEnqueueNDRangeKernel)))(a0, a1, a2, a3, a4, a5, a6, a7, a8);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clEnqueueTask(cl_command_queue a0, cl_kernel a1, cl_uint a2, const cl_event * a3, cl_event * a4) {
+  if(!dynacl_resolve("clEnqueueTask", (dynacl_function *)&DYNACL_TARGET(clEnqueueTask), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLENQUEUETASK_PTR)dynacl_load_acquire(&DYNACL_TARGET(clEnqueueTask)))(a0, a1, a2, a3, a4);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clEnqueueNativeKernel(cl_command_queue a0, void (CL_CALLBACK * a1)(void *), void * a2, size_t a3, cl_uint a4, const cl_mem * a5, const void ** a6, cl_uint a7, const cl_event * a8, cl_event * a9) {
+  if(!dynacl_resolve("clEnqueueNativeKernel", (dynacl_function *)&DYNACL_TARGET(clEnqueueNativeKernel), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLENQUEUENATIVEKERNEL_PTR)dynacl_load_acquire(&DYNACL_TARGET(clEnqueueNativeKernel)))(a0, a1, a2, a3, a4, a5, a6, a7, a8, a9);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clEnqueueMarker(cl_command_queue a0, cl_event * a1) {
+  if(!dynacl_resolve("clEnqueueMarker", (dynacl_function *)&DYNACL_TARGET(clEnqueueMarker), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLENQUEUEMARKER_PTR)dynacl_load_acquire(&DYNACL_TARGET(clEnqueueMarker)))(a0, a1);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clEnqueueWaitForEvents(cl_command_queue a0, cl_uint a1, const cl_event * a2) {
+  if(!dynacl_resolve("clEnqueueWaitForEvents", (dynacl_function *)&DYNACL_TARGET(clEnqueueWaitForEvents), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLENQUEUEWAITFOREVENTS_PTR)dynacl_load_acquire(&DYNACL_TARGET(clEnqueueWaitForEvents)))(a0, a1, a2);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clEnqueueBarrier(cl_command_queue a0) {
+  if(!dynacl_resolve("clEnqueueBarrier", (dynacl_function *)&DYNACL_TARGET(clEnqueueBarrier), DYNACL_ENTRY_REQUIRED)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLENQUEUEBARRIER_PTR)dynacl_load_acquire(&DYNACL_TARGET(clEnqueueBarrier)))(a0);
+}
+
+static void * CL_API_CALL dynacl_lazy_clGetExtensionFunctionAddress(const char * a0) {
+  if(!dynacl_resolve("clGetExtensionFunctionAddress", (dynacl_function *)&DYNACL_TARGET(clGetExtensionFunctionAddress), DYNACL_ENTRY_REQUIRED)) {
+    return (void *)0;
+  }
+
+  return ((CLGETEXTENSIONFUNCTIONADDRESS_PTR)dynacl_load_acquire(&DYNACL_TARGET(clGetExtensionFunctionAddress)))(a0);
+}
+
+static cl_mem CL_API_CALL dynacl_lazy_clCreateFromGLBuffer(cl_context a0, cl_mem_flags a1, cl_GLuint a2, int * a3) {
+  if(!dynacl_resolve("clCreateFromGLBuffer", (dynacl_function *)&DYNACL_TARGET(clCreateFromGLBuffer), DYNACL_ENTRY_OPTIONAL)) {
+    if(a3) *a3 = CL_INVALID_OPERATION;
+    return (cl_mem)0;
+  }
+
+  return ((CLCREATEFROMGLBUFFER_PTR)dynacl_load_acquire(&DYNACL_TARGET(clCreateFromGLBuffer)))(a0, a1, a2, a3);
+}
+
+static cl_mem CL_API_CALL dynacl_lazy_clCreateFromGLTexture2D(cl_context a0, cl_mem_flags a1, cl_GLenum a2, cl_GLint a3, cl_GLuint a4, cl_int * a5) {
+  if(!dynacl_resolve("clCreateFromGLTexture2D", (dynacl_function *)&DYNACL_TARGET(clCreateFromGLTexture2D), DYNACL_ENTRY_OPTIONAL)) {
+    if(a5) *a5 = CL_INVALID_OPERATION;
+    return (cl_mem)0;
+  }
+
+  return ((CLCREATEFROMGLTEXTURE2D_PTR)dynacl_load_acquire(&DYNACL_TARGET(clCreateFromGLTexture2D)))(a0, a1, a2, a3, a4, a5);
+}
+
+static cl_mem CL_API_CALL dynacl_lazy_clCreateFromGLTexture3D(cl_context a0, cl_mem_flags a1, cl_GLenum a2, cl_GLint a3, cl_GLuint a4, cl_int * a5) {
+  if(!dynacl_resolve("clCreateFromGLTexture3D", (dynacl_function *)&DYNACL_TARGET(clCreateFromGLTexture3D), DYNACL_ENTRY_OPTIONAL)) {
+    if(a5) *a5 = CL_INVALID_OPERATION;
+    return (cl_mem)0;
+  }
+
+  return ((CLCREATEFROMGLTEXTURE3D_PTR)dynacl_load_acquire(&DYNACL_TARGET(clCreateFromGLTexture3D)))(a0, a1, a2, a3, a4, a5);
+}
+
+static cl_mem CL_API_CALL dynacl_lazy_clCreateFromGLRenderbuffer(cl_context a0, cl_mem_flags a1, cl_GLuint a2, cl_int * a3) {
+  if(!dynacl_resolve("clCreateFromGLRenderbuffer", (dynacl_function *)&DYNACL_TARGET(clCreateFromGLRenderbuffer), DYNACL_ENTRY_OPTIONAL)) {
+    if(a3) *a3 = CL_INVALID_OPERATION;
+    return (cl_mem)0;
+  }
+
+  return ((CLCREATEFROMGLRENDERBUFFER_PTR)dynacl_load_acquire(&DYNACL_TARGET(clCreateFromGLRenderbuffer)))(a0, a1, a2, a3);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clGetGLObjectInfo(cl_mem a0, cl_gl_object_type * a1, cl_GLuint * a2) {
+  if(!dynacl_resolve("clGetGLObjectInfo", (dynacl_function *)&DYNACL_TARGET(clGetGLObjectInfo), DYNACL_ENTRY_OPTIONAL)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLGETGLOBJECTINFO_PTR)dynacl_load_acquire(&DYNACL_TARGET(clGetGLObjectInfo)))(a0, a1, a2);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clGetGLTextureInfo(cl_mem a0, cl_gl_texture_info a1, size_t a2, void * a3, size_t * a4) {
+  if(!dynacl_resolve("clGetGLTextureInfo", (dynacl_function *)&DYNACL_TARGET(clGetGLTextureInfo), DYNACL_ENTRY_OPTIONAL)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLGETGLTEXTUREINFO_PTR)dynacl_load_acquire(&DYNACL_TARGET(clGetGLTextureInfo)))(a0, a1, a2, a3, a4);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clEnqueueAcquireGLObjects(cl_command_queue a0, cl_uint a1, const cl_mem * a2, cl_uint a3, const cl_event * a4, cl_event * a5) {
+  if(!dynacl_resolve("clEnqueueAcquireGLObjects", (dynacl_function *)&DYNACL_TARGET(clEnqueueAcquireGLObjects), DYNACL_ENTRY_OPTIONAL)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLENQUEUEACQUIREGLOBJECTS_PTR)dynacl_load_acquire(&DYNACL_TARGET(clEnqueueAcquireGLObjects)))(a0, a1, a2, a3, a4, a5);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clEnqueueReleaseGLObjects(cl_command_queue a0, cl_uint a1, const cl_mem * a2, cl_uint a3, const cl_event * a4, cl_event * a5) {
+  if(!dynacl_resolve("clEnqueueReleaseGLObjects", (dynacl_function *)&DYNACL_TARGET(clEnqueueReleaseGLObjects), DYNACL_ENTRY_OPTIONAL)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLENQUEUERELEASEGLOBJECTS_PTR)dynacl_load_acquire(&DYNACL_TARGET(clEnqueueReleaseGLObjects)))(a0, a1, a2, a3, a4, a5);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clGetGLContextInfoKHR(const cl_context_properties * a0, cl_gl_context_info a1, size_t a2, void * a3, size_t * a4) {
+  if(!dynacl_resolve("clGetGLContextInfoKHR", (dynacl_function *)&DYNACL_TARGET(clGetGLContextInfoKHR), DYNACL_ENTRY_EXTENSION)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLGETGLCONTEXTINFOKHR_PTR)dynacl_load_acquire(&DYNACL_TARGET(clGetGLContextInfoKHR)))(a0, a1, a2, a3, a4);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clSetMemObjectDestructorAPPLE(cl_mem a0, void (* a1)(cl_mem , void*), void * a2) {
+  if(!dynacl_resolve("clSetMemObjectDestructorAPPLE", (dynacl_function *)&DYNACL_TARGET(clSetMemObjectDestructorAPPLE), DYNACL_ENTRY_EXTENSION)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLSETMEMOBJECTDESTRUCTORAPPLE_PTR)dynacl_load_acquire(&DYNACL_TARGET(clSetMemObjectDestructorAPPLE)))(a0, a1, a2);
+}
+
+static void CL_API_CALL dynacl_lazy_clLogMessagesToSystemLogAPPLE(const char * a0, const void * a1, size_t a2, void * a3) {
+  if(!dynacl_resolve("clLogMessagesToSystemLogAPPLE", (dynacl_function *)&DYNACL_TARGET(clLogMessagesToSystemLogAPPLE), DYNACL_ENTRY_EXTENSION)) {
+    return;
+  }
+
+  ((CLLOGMESSAGESTOSYSTEMLOGAPPLE_PTR)dynacl_load_acquire(&DYNACL_TARGET(clLogMessagesToSystemLogAPPLE)))(a0, a1, a2, a3);
+}
+
+static void CL_API_CALL dynacl_lazy_clLogMessagesToStdoutAPPLE(const char * a0, const void * a1, size_t a2, void * a3) {
+  if(!dynacl_resolve("clLogMessagesToStdoutAPPLE", (dynacl_function *)&DYNACL_TARGET(clLogMessagesToStdoutAPPLE), DYNACL_ENTRY_EXTENSION)) {
+    return;
+  }
+
+  ((CLLOGMESSAGESTOSTDOUTAPPLE_PTR)dynacl_load_acquire(&DYNACL_TARGET(clLogMessagesToStdoutAPPLE)))(a0, a1, a2, a3);
+}
+
+static void CL_API_CALL dynacl_lazy_clLogMessagesToStderrAPPLE(const char * a0, const void * a1, size_t a2, void * a3) {
+  if(!dynacl_resolve("clLogMessagesToStderrAPPLE", (dynacl_function *)&DYNACL_TARGET(clLogMessagesToStderrAPPLE), DYNACL_ENTRY_EXTENSION)) {
+    return;
+  }
+
+  ((CLLOGMESSAGESTOSTDERRAPPLE_PTR)dynacl_load_acquire(&DYNACL_TARGET(clLogMessagesToStderrAPPLE)))(a0, a1, a2, a3);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clIcdGetPlatformIDsKHR(cl_uint a0, cl_platform_id * a1, cl_uint * a2) {
+  if(!dynacl_resolve("clIcdGetPlatformIDsKHR", (dynacl_function *)&DYNACL_TARGET(clIcdGetPlatformIDsKHR), DYNACL_ENTRY_EXTENSION)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLICDGETPLATFORMIDSKHR_PTR)dynacl_load_acquire(&DYNACL_TARGET(clIcdGetPlatformIDsKHR)))(a0, a1, a2);
+}
+
+#if defined(CL_VERSION_1_1)
+static cl_int CL_API_CALL dynacl_lazy_clReleaseDeviceEXT(cl_device_id a0) {
+  if(!dynacl_resolve("clReleaseDeviceEXT", (dynacl_function *)&DYNACL_TARGET(clReleaseDeviceEXT), DYNACL_ENTRY_EXTENSION)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLRELEASEDEVICEEXT_PTR)dynacl_load_acquire(&DYNACL_TARGET(clReleaseDeviceEXT)))(a0);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clRetainDeviceEXT(cl_device_id a0) {
+  if(!dynacl_resolve("clRetainDeviceEXT", (dynacl_function *)&DYNACL_TARGET(clRetainDeviceEXT), DYNACL_ENTRY_EXTENSION)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLRETAINDEVICEEXT_PTR)dynacl_load_acquire(&DYNACL_TARGET(clRetainDeviceEXT)))(a0);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clCreateSubDevicesEXT(cl_device_id a0, const cl_device_partition_property_ext * a1, cl_uint a2, cl_device_id * a3, cl_uint * a4) {
+  if(!dynacl_resolve("clCreateSubDevicesEXT", (dynacl_function *)&DYNACL_TARGET(clCreateSubDevicesEXT), DYNACL_ENTRY_EXTENSION)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLCREATESUBDEVICESEXT_PTR)dynacl_load_acquire(&DYNACL_TARGET(clCreateSubDevicesEXT)))(a0, a1, a2, a3, a4);
+}
+
+static cl_int CL_API_CALL dynacl_lazy_clGetDeviceImageInfoQCOM(cl_device_id a0, size_t a1, size_t a2, const cl_image_format * a3, cl_image_pitch_info_qcom a4, size_t a5, void * a6, size_t * a7) {
+  if(!dynacl_resolve("clGetDeviceImageInfoQCOM", (dynacl_function *)&DYNACL_TARGET(clGetDeviceImageInfoQCOM), DYNACL_ENTRY_EXTENSION)) {
+    return CL_INVALID_OPERATION;
+  }
+
+  return ((CLGETDEVICEIMAGEINFOQCOM_PTR)dynacl_load_acquire(&DYNACL_TARGET(clGetDeviceImageInfoQCOM)))(a0, a1, a2, a3, a4, a5, a6, a7);
+}
+
+#endif
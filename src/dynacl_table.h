@@ -0,0 +1,103 @@
+/*
+ * DynaCL: OpenCL entry point table
+ *
+ * This file is generated by codegen.py from cl.h, cl_gl.h, cl_ext.h: do not edit.
+ * It expands DYNACL_ENTRY(name, kind) once for each of the 92 entry
+ * points, and is included by src/dynacl.c.
+ */
+DYNACL_ENTRY(clGetPlatformIDs, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clGetPlatformInfo, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clGetDeviceIDs, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clGetDeviceInfo, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clCreateContext, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clCreateContextFromType, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clRetainContext, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clReleaseContext, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clGetContextInfo, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clCreateCommandQueue, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clRetainCommandQueue, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clReleaseCommandQueue, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clGetCommandQueueInfo, DYNACL_ENTRY_REQUIRED)
+#if defined(CL_USE_DEPRECATED_OPENCL_1_0_APIS)
+DYNACL_ENTRY(clSetCommandQueueProperty, DYNACL_ENTRY_REQUIRED)
+#endif
+DYNACL_ENTRY(clCreateBuffer, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clCreateSubBuffer, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clCreateImage2D, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clCreateImage3D, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clRetainMemObject, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clReleaseMemObject, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clGetSupportedImageFormats, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clGetMemObjectInfo, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clGetImageInfo, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clSetMemObjectDestructorCallback, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clCreateSampler, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clRetainSampler, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clReleaseSampler, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clGetSamplerInfo, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clCreateProgramWithSource, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clCreateProgramWithBinary, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clRetainProgram, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clReleaseProgram, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clBuildProgram, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clUnloadCompiler, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clGetProgramInfo, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clGetProgramBuildInfo, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clCreateKernel, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clCreateKernelsInProgram, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clRetainKernel, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clReleaseKernel, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clSetKernelArg, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clGetKernelInfo, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clGetKernelWorkGroupInfo, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clWaitForEvents, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clGetEventInfo, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clCreateUserEvent, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clRetainEvent, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clReleaseEvent, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clSetUserEventStatus, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clSetEventCallback, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clGetEventProfilingInfo, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clFlush, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clFinish, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clEnqueueReadBuffer, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clEnqueueReadBufferRect, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clEnqueueWriteBuffer, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clEnqueueWriteBufferRect, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clEnqueueCopyBuffer, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clEnqueueCopyBufferRect, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clEnqueueReadImage, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clEnqueueWriteImage, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clEnqueueCopyImage, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clEnqueueCopyImageToBuffer, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clEnqueueCopyBufferToImage, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clEnqueueMapBuffer, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clEnqueueMapImage, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clEnqueueUnmapMemObject, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clEnqueueNDRangeKernel, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clEnqueueTask, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clEnqueueNativeKernel, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clEnqueueMarker, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clEnqueueWaitForEvents, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clEnqueueBarrier, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clGetExtensionFunctionAddress, DYNACL_ENTRY_REQUIRED)
+DYNACL_ENTRY(clCreateFromGLBuffer, DYNACL_ENTRY_OPTIONAL)
+DYNACL_ENTRY(clCreateFromGLTexture2D, DYNACL_ENTRY_OPTIONAL)
+DYNACL_ENTRY(clCreateFromGLTexture3D, DYNACL_ENTRY_OPTIONAL)
+DYNACL_ENTRY(clCreateFromGLRenderbuffer, DYNACL_ENTRY_OPTIONAL)
+DYNACL_ENTRY(clGetGLObjectInfo, DYNACL_ENTRY_OPTIONAL)
+DYNACL_ENTRY(clGetGLTextureInfo, DYNACL_ENTRY_OPTIONAL)
+DYNACL_ENTRY(clEnqueueAcquireGLObjects, DYNACL_ENTRY_OPTIONAL)
+DYNACL_ENTRY(clEnqueueReleaseGLObjects, DYNACL_ENTRY_OPTIONAL)
+DYNACL_ENTRY(clGetGLContextInfoKHR, DYNACL_ENTRY_EXTENSION)
+DYNACL_ENTRY(clSetMemObjectDestructorAPPLE, DYNACL_ENTRY_EXTENSION)
+DYNACL_ENTRY(clLogMessagesToSystemLogAPPLE, DYNACL_ENTRY_EXTENSION)
+DYNACL_ENTRY(clLogMessagesToStdoutAPPLE, DYNACL_ENTRY_EXTENSION)
+DYNACL_ENTRY(clLogMessagesToStderrAPPLE, DYNACL_ENTRY_EXTENSION)
+DYNACL_ENTRY(clIcdGetPlatformIDsKHR, DYNACL_ENTRY_EXTENSION)
+#if defined(CL_VERSION_1_1)
+DYNACL_ENTRY(clReleaseDeviceEXT, DYNACL_ENTRY_EXTENSION)
+DYNACL_ENTRY(clRetainDeviceEXT, DYNACL_ENTRY_EXTENSION)
+DYNACL_ENTRY(clCreateSubDevicesEXT, DYNACL_ENTRY_EXTENSION)
+DYNACL_ENTRY(clGetDeviceImageInfoQCOM, DYNACL_ENTRY_EXTENSION)
+#endif
@@ -0,0 +1,843 @@
+/*
+ * DynaCL: stub OpenCL library
+ *
+ * This file is generated by codegen.py from cl.h, cl_gl.h, cl_ext.h: do not edit.
+ * It exports the 92 entry points loaded by DynaCL, doing nothing, and
+ * stands in for an OpenCL ICD in the tests.
+ */
+#include <CL/cl.h>
+#include <CL/cl_gl.h>
+#include <CL/cl_ext.h>
+
+CL_API_ENTRY cl_int CL_API_CALL clGetPlatformIDs(cl_uint a0, cl_platform_id * a1, cl_uint * a2) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clGetPlatformInfo(cl_platform_id a0, cl_platform_info a1, size_t a2, void * a3, size_t * a4) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clGetDeviceIDs(cl_platform_id a0, cl_device_type a1, cl_uint a2, cl_device_id * a3, cl_uint * a4) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clGetDeviceInfo(cl_device_id a0, cl_device_info a1, size_t a2, void * a3, size_t * a4) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_context CL_API_CALL clCreateContext(const cl_context_properties * a0, cl_uint a1, const cl_device_id * a2, void (CL_CALLBACK * a3)(const char *, const void *, size_t, void *), void * a4, cl_int * a5) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  (void)a5;
+  if(a5) *a5 = CL_OUT_OF_RESOURCES;
+  return (cl_context)0;
+}
+
+CL_API_ENTRY cl_context CL_API_CALL clCreateContextFromType(const cl_context_properties * a0, cl_device_type a1, void (CL_CALLBACK * a2)(const char *, const void *, size_t, void *), void * a3, cl_int * a4) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  if(a4) *a4 = CL_OUT_OF_RESOURCES;
+  return (cl_context)0;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clRetainContext(cl_context a0) {
+  (void)a0;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clReleaseContext(cl_context a0) {
+  (void)a0;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clGetContextInfo(cl_context a0, cl_context_info a1, size_t a2, void * a3, size_t * a4) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_command_queue CL_API_CALL clCreateCommandQueue(cl_context a0, cl_device_id a1, cl_command_queue_properties a2, cl_int * a3) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  if(a3) *a3 = CL_OUT_OF_RESOURCES;
+  return (cl_command_queue)0;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clRetainCommandQueue(cl_command_queue a0) {
+  (void)a0;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clReleaseCommandQueue(cl_command_queue a0) {
+  (void)a0;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clGetCommandQueueInfo(cl_command_queue a0, cl_command_queue_info a1, size_t a2, void * a3, size_t * a4) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  return CL_SUCCESS;
+}
+
+#if defined(CL_USE_DEPRECATED_OPENCL_1_0_APIS)
+CL_API_ENTRY cl_int CL_API_CALL clSetCommandQueueProperty(cl_command_queue a0, cl_command_queue_properties a1, cl_bool a2, cl_command_queue_properties * a3) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  return CL_SUCCESS;
+}
+
+#endif
+CL_API_ENTRY cl_mem CL_API_CALL clCreateBuffer(cl_context a0, cl_mem_flags a1, size_t a2, void * a3, cl_int * a4) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  if(a4) *a4 = CL_OUT_OF_RESOURCES;
+  return (cl_mem)0;
+}
+
+CL_API_ENTRY cl_mem CL_API_CALL clCreateSubBuffer(cl_mem a0, cl_mem_flags a1, cl_buffer_create_type a2, const void * a3, cl_int * a4) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  if(a4) *a4 = CL_OUT_OF_RESOURCES;
+  return (cl_mem)0;
+}
+
+CL_API_ENTRY cl_mem CL_API_CALL clCreateImage2D(cl_context a0, cl_mem_flags a1, const cl_image_format * a2, size_t a3, size_t a4, size_t a5, void * a6, cl_int * a7) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  (void)a5;
+  (void)a6;
+  (void)a7;
+  if(a7) *a7 = CL_OUT_OF_RESOURCES;
+  return (cl_mem)0;
+}
+
+CL_API_ENTRY cl_mem CL_API_CALL clCreateImage3D(cl_context a0, cl_mem_flags a1, const cl_image_format * a2, size_t a3, size_t a4, size_t a5, size_t a6, size_t a7, void * a8, cl_int * a9) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  (void)a5;
+  (void)a6;
+  (void)a7;
+  (void)a8;
+  (void)a9;
+  if(a9) *a9 = CL_OUT_OF_RESOURCES;
+  return (cl_mem)0;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clRetainMemObject(cl_mem a0) {
+  (void)a0;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clReleaseMemObject(cl_mem a0) {
+  (void)a0;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clGetSupportedImageFormats(cl_context a0, cl_mem_flags a1, cl_mem_object_type a2, cl_uint a3, cl_image_format * a4, cl_uint * a5) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  (void)a5;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clGetMemObjectInfo(cl_mem a0, cl_mem_info a1, size_t a2, void * a3, size_t * a4) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clGetImageInfo(cl_mem a0, cl_image_info a1, size_t a2, void * a3, size_t * a4) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clSetMemObjectDestructorCallback(cl_mem a0, void (CL_CALLBACK * a1)(cl_mem , void*), void * a2) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_sampler CL_API_CALL clCreateSampler(cl_context a0, cl_bool a1, cl_addressing_mode a2, cl_filter_mode a3, cl_int * a4) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  if(a4) *a4 = CL_OUT_OF_RESOURCES;
+  return (cl_sampler)0;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clRetainSampler(cl_sampler a0) {
+  (void)a0;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clReleaseSampler(cl_sampler a0) {
+  (void)a0;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clGetSamplerInfo(cl_sampler a0, cl_sampler_info a1, size_t a2, void * a3, size_t * a4) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_program CL_API_CALL clCreateProgramWithSource(cl_context a0, cl_uint a1, const char ** a2, const size_t * a3, cl_int * a4) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  if(a4) *a4 = CL_OUT_OF_RESOURCES;
+  return (cl_program)0;
+}
+
+CL_API_ENTRY cl_program CL_API_CALL clCreateProgramWithBinary(cl_context a0, cl_uint a1, const cl_device_id * a2, const size_t * a3, const unsigned char ** a4, cl_int * a5, cl_int * a6) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  (void)a5;
+  (void)a6;
+  if(a6) *a6 = CL_OUT_OF_RESOURCES;
+  return (cl_program)0;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clRetainProgram(cl_program a0) {
+  (void)a0;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clReleaseProgram(cl_program a0) {
+  (void)a0;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clBuildProgram(cl_program a0, cl_uint a1, const cl_device_id * a2, const char * a3, void (CL_CALLBACK * a4)(cl_program , void *), void * a5) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  (void)a5;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clUnloadCompiler(void) {
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clGetProgramInfo(cl_program a0, cl_program_info a1, size_t a2, void * a3, size_t * a4) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clGetProgramBuildInfo(cl_program a0, cl_device_id a1, cl_program_build_info a2, size_t a3, void * a4, size_t * a5) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  (void)a5;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_kernel CL_API_CALL clCreateKernel(cl_program a0, const char * a1, cl_int * a2) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  if(a2) *a2 = CL_OUT_OF_RESOURCES;
+  return (cl_kernel)0;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clCreateKernelsInProgram(cl_program a0, cl_uint a1, cl_kernel * a2, cl_uint * a3) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clRetainKernel(cl_kernel a0) {
+  (void)a0;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clReleaseKernel(cl_kernel a0) {
+  (void)a0;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clSetKernelArg(cl_kernel a0, cl_uint a1, size_t a2, const void * a3) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clGetKernelInfo(cl_kernel a0, cl_kernel_info a1, size_t a2, void * a3, size_t * a4) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clGetKernelWorkGroupInfo(cl_kernel a0, cl_device_id a1, cl_kernel_work_group_info a2, size_t a3, void * a4, size_t * a5) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  (void)a5;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clWaitForEvents(cl_uint a0, const cl_event * a1) {
+  (void)a0;
+  (void)a1;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clGetEventInfo(cl_event a0, cl_event_info a1, size_t a2, void * a3, size_t * a4) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_event CL_API_CALL clCreateUserEvent(cl_context a0, cl_int * a1) {
+  (void)a0;
+  (void)a1;
+  if(a1) *a1 = CL_OUT_OF_RESOURCES;
+  return (cl_event)0;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clRetainEvent(cl_event a0) {
+  (void)a0;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clReleaseEvent(cl_event a0) {
+  (void)a0;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clSetUserEventStatus(cl_event a0, cl_int a1) {
+  (void)a0;
+  (void)a1;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clSetEventCallback(cl_event a0, cl_int a1, void (CL_CALLBACK * a2)(cl_event, cl_int, void *), void * a3) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clGetEventProfilingInfo(cl_event a0, cl_profiling_info a1, size_t a2, void * a3, size_t * a4) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clFlush(cl_command_queue a0) {
+  (void)a0;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clFinish(cl_command_queue a0) {
+  (void)a0;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clEnqueueReadBuffer(cl_command_queue a0, cl_mem a1, cl_bool a2, size_t a3, size_t a4, void * a5, cl_uint a6, const cl_event * a7, cl_event * a8) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  (void)a5;
+  (void)a6;
+  (void)a7;
+  (void)a8;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clEnqueueReadBufferRect(cl_command_queue a0, cl_mem a1, cl_bool a2, const size_t * a3, const size_t * a4, const size_t * a5, size_t a6, size_t a7, size_t a8, size_t a9, void * a10, cl_uint a11, const cl_event * a12, cl_event * a13) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  (void)a5;
+  (void)a6;
+  (void)a7;
+  (void)a8;
+  (void)a9;
+  (void)a10;
+  (void)a11;
+  (void)a12;
+  (void)a13;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clEnqueueWriteBuffer(cl_command_queue a0, cl_mem a1, cl_bool a2, size_t a3, size_t a4, const void * a5, cl_uint a6, const cl_event * a7, cl_event * a8) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  (void)a5;
+  (void)a6;
+  (void)a7;
+  (void)a8;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clEnqueueWriteBufferRect(cl_command_queue a0, cl_mem a1, cl_bool a2, const size_t * a3, const size_t * a4, const size_t * a5, size_t a6, size_t a7, size_t a8, size_t a9, const void * a10, cl_uint a11, const cl_event * a12, cl_event * a13) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  (void)a5;
+  (void)a6;
+  (void)a7;
+  (void)a8;
+  (void)a9;
+  (void)a10;
+  (void)a11;
+  (void)a12;
+  (void)a13;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clEnqueueCopyBuffer(cl_command_queue a0, cl_mem a1, cl_mem a2, size_t a3, size_t a4, size_t a5, cl_uint a6, const cl_event * a7, cl_event * a8) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  (void)a5;
+  (void)a6;
+  (void)a7;
+  (void)a8;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clEnqueueCopyBufferRect(cl_command_queue a0, cl_mem a1, cl_mem a2, const size_t * a3, const size_t * a4, const size_t * a5, size_t a6, size_t a7, size_t a8, size_t a9, cl_uint a10, const cl_event * a11, cl_event * a12) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  (void)a5;
+  (void)a6;
+  (void)a7;
+  (void)a8;
+  (void)a9;
+  (void)a10;
+  (void)a11;
+  (void)a12;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clEnqueueReadImage(cl_command_queue a0, cl_mem a1, cl_bool a2, const size_t * a3, const size_t * a4, size_t a5, size_t a6, void * a7, cl_uint a8, const cl_event * a9, cl_event * a10) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  (void)a5;
+  (void)a6;
+  (void)a7;
+  (void)a8;
+  (void)a9;
+  (void)a10;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clEnqueueWriteImage(cl_command_queue a0, cl_mem a1, cl_bool a2, const size_t * a3, const size_t * a4, size_t a5, size_t a6, const void * a7, cl_uint a8, const cl_event * a9, cl_event * a10) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  (void)a5;
+  (void)a6;
+  (void)a7;
+  (void)a8;
+  (void)a9;
+  (void)a10;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clEnqueueCopyImage(cl_command_queue a0, cl_mem a1, cl_mem a2, const size_t * a3, const size_t * a4, const size_t * a5, cl_uint a6, const cl_event * a7, cl_event * a8) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  (void)a5;
+  (void)a6;
+  (void)a7;
+  (void)a8;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clEnqueueCopyImageToBuffer(cl_command_queue a0, cl_mem a1, cl_mem a2, const size_t * a3, const size_t * a4, size_t a5, cl_uint a6, const cl_event * a7, cl_event * a8) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  (void)a5;
+  (void)a6;
+  (void)a7;
+  (void)a8;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clEnqueueCopyBufferToImage(cl_command_queue a0, cl_mem a1, cl_mem a2, size_t a3, const size_t * a4, const size_t * a5, cl_uint a6, const cl_event * a7, cl_event * a8) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  (void)a5;
+  (void)a6;
+  (void)a7;
+  (void)a8;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY void * CL_API_CALL clEnqueueMapBuffer(cl_command_queue a0, cl_mem a1, cl_bool a2, cl_map_flags a3, size_t a4, size_t a5, cl_uint a6, const cl_event * a7, cl_event * a8, cl_int * a9) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  (void)a5;
+  (void)a6;
+  (void)a7;
+  (void)a8;
+  (void)a9;
+  if(a9) *a9 = CL_OUT_OF_RESOURCES;
+  return (void *)0;
+}
+
+CL_API_ENTRY void * CL_API_CALL clEnqueueMapImage(cl_command_queue a0, cl_mem a1, cl_bool a2, cl_map_flags a3, const size_t * a4, const size_t * a5, size_t * a6, size_t * a7, cl_uint a8, const cl_event * a9, cl_event * a10, cl_int * a11) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  (void)a5;
+  (void)a6;
+  (void)a7;
+  (void)a8;
+  (void)a9;
+  (void)a10;
+  (void)a11;
+  if(a11) *a11 = CL_OUT_OF_RESOURCES;
+  return (void *)0;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clEnqueueUnmapMemObject(cl_command_queue a0, cl_mem a1, void * a2, cl_uint a3, const cl_event * a4, cl_event * a5) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  (void)a5;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clEnqueueNDRangeKernel(cl_command_queue a0, cl_kernel a1, cl_uint a2, const size_t * a3, const size_t * a4, const size_t * a5, cl_uint a6, const cl_event * a7, cl_event * a8) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  (void)a5;
+  (void)a6;
+  (void)a7;
+  (void)a8;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clEnqueueTask(cl_command_queue a0, cl_kernel a1, cl_uint a2, const cl_event * a3, cl_event * a4) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clEnqueueNativeKernel(cl_command_queue a0, void (CL_CALLBACK * a1)(void *), void * a2, size_t a3, cl_uint a4, const cl_mem * a5, const void ** a6, cl_uint a7, const cl_event * a8, cl_event * a9) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  (void)a5;
+  (void)a6;
+  (void)a7;
+  (void)a8;
+  (void)a9;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clEnqueueMarker(cl_command_queue a0, cl_event * a1) {
+  (void)a0;
+  (void)a1;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clEnqueueWaitForEvents(cl_command_queue a0, cl_uint a1, const cl_event * a2) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clEnqueueBarrier(cl_command_queue a0) {
+  (void)a0;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY void * CL_API_CALL clGetExtensionFunctionAddress(const char * a0) {
+  (void)a0;
+  return (void *)0;
+}
+
+CL_API_ENTRY cl_mem CL_API_CALL clCreateFromGLBuffer(cl_context a0, cl_mem_flags a1, cl_GLuint a2, int * a3) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  if(a3) *a3 = CL_OUT_OF_RESOURCES;
+  return (cl_mem)0;
+}
+
+CL_API_ENTRY cl_mem CL_API_CALL clCreateFromGLTexture2D(cl_context a0, cl_mem_flags a1, cl_GLenum a2, cl_GLint a3, cl_GLuint a4, cl_int * a5) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  (void)a5;
+  if(a5) *a5 = CL_OUT_OF_RESOURCES;
+  return (cl_mem)0;
+}
+
+CL_API_ENTRY cl_mem CL_API_CALL clCreateFromGLTexture3D(cl_context a0, cl_mem_flags a1, cl_GLenum a2, cl_GLint a3, cl_GLuint a4, cl_int * a5) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  (void)a5;
+  if(a5) *a5 = CL_OUT_OF_RESOURCES;
+  return (cl_mem)0;
+}
+
+CL_API_ENTRY cl_mem CL_API_CALL clCreateFromGLRenderbuffer(cl_context a0, cl_mem_flags a1, cl_GLuint a2, cl_int * a3) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  if(a3) *a3 = CL_OUT_OF_RESOURCES;
+  return (cl_mem)0;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clGetGLObjectInfo(cl_mem a0, cl_gl_object_type * a1, cl_GLuint * a2) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clGetGLTextureInfo(cl_mem a0, cl_gl_texture_info a1, size_t a2, void * a3, size_t * a4) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clEnqueueAcquireGLObjects(cl_command_queue a0, cl_uint a1, const cl_mem * a2, cl_uint a3, const cl_event * a4, cl_event * a5) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  (void)a5;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clEnqueueReleaseGLObjects(cl_command_queue a0, cl_uint a1, const cl_mem * a2, cl_uint a3, const cl_event * a4, cl_event * a5) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  (void)a5;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clGetGLContextInfoKHR(const cl_context_properties * a0, cl_gl_context_info a1, size_t a2, void * a3, size_t * a4) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clSetMemObjectDestructorAPPLE(cl_mem a0, void (* a1)(cl_mem , void*), void * a2) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY void CL_API_CALL clLogMessagesToSystemLogAPPLE(const char * a0, const void * a1, size_t a2, void * a3) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+}
+
+CL_API_ENTRY void CL_API_CALL clLogMessagesToStdoutAPPLE(const char * a0, const void * a1, size_t a2, void * a3) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+}
+
+CL_API_ENTRY void CL_API_CALL clLogMessagesToStderrAPPLE(const char * a0, const void * a1, size_t a2, void * a3) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clIcdGetPlatformIDsKHR(cl_uint a0, cl_platform_id * a1, cl_uint * a2) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  return CL_SUCCESS;
+}
+
+#if defined(CL_VERSION_1_1)
+CL_API_ENTRY cl_int CL_API_CALL clReleaseDeviceEXT(cl_device_id a0) {
+  (void)a0;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clRetainDeviceEXT(cl_device_id a0) {
+  (void)a0;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clCreateSubDevicesEXT(cl_device_id a0, const cl_device_partition_property_ext * a1, cl_uint a2, cl_device_id * a3, cl_uint * a4) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  return CL_SUCCESS;
+}
+
+CL_API_ENTRY cl_int CL_API_CALL clGetDeviceImageInfoQCOM(cl_device_id a0, size_t a1, size_t a2, const cl_image_format * a3, cl_image_pitch_info_qcom a4, size_t a5, void * a6, size_t * a7) {
+  (void)a0;
+  (void)a1;
+  (void)a2;
+  (void)a3;
+  (void)a4;
+  (void)a5;
+  (void)a6;
+  (void)a7;
+  return CL_SUCCESS;
+}
+
+#endif
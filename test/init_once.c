@@ -0,0 +1,122 @@
+#include <CL/dynacl.h>
+#include <stdio.h>
+#include <string.h>
+
+#ifdef _WIN32
+#include <windows.h>
+
+#define DLL_PATH "OpenCL.dll"
+#else
+#include <pthread.h>
+
+#define DLL_PATH "libOpenCL.so"
+#endif /* _WIN32 */
+
+#define THREADS 8
+#define CALLS 3
+
+static const char *library;
+static unsigned int results[THREADS];
+
+/*
+ * Initializes DynaCL from a worker thread.
+ */
+#ifdef _WIN32
+static DWORD WINAPI init_thread(LPVOID arg) {
+  unsigned int *result = arg;
+
+  *result = dynacl_init(library);
+  return 0;
+}
+#else
+static void *init_thread(void *arg) {
+  unsigned int *result = arg;
+
+  *result = dynacl_init(library);
+  return NULL;
+}
+#endif /* _WIN32 */
+
+/*
+ * usage
+ *    init_once [library]
+ *
+ * Initializes DynaCL from several threads at once, then checks that the
+ * library stays loaded until the last dynacl_shutdown() call, and that the
+ * call statistics, if collected, count the calls.
+ */
+int main(int argc, char** argv) {
+  unsigned int i, count;
+  cl_uint platforms = 0;
+  dynacl_stat stats[256];
+#ifdef _WIN32
+  HANDLE threads[THREADS];
+#else
+  pthread_t threads[THREADS];
+#endif /* _WIN32 */
+
+  library = argc > 1 ? argv[1] : DLL_PATH;
+
+  printf("Initializing DynaCL with \"%s\" from %u threads...\n", library, THREADS);
+
+  for(i = 0; i < THREADS; i++) {
+#ifdef _WIN32
+    threads[i] = CreateThread(NULL, 0, init_thread, &results[i], 0, NULL);
+#else
+    pthread_create(&threads[i], NULL, init_thread, &results[i]);
+#endif /* _WIN32 */
+  }
+
+  for(i = 0; i < THREADS; i++) {
+#ifdef _WIN32
+    WaitForSingleObject(threads[i], INFINITE);
+    CloseHandle(threads[i]);
+#else
+    pthread_join(threads[i], NULL);
+#endif /* _WIN32 */
+
+    if(results[i] != DYNACL_SUCCESS) {
+      printf("dynacl_init() returned error %u.\n", results[i]);
+      return 1;
+    }
+  }
+
+  dynacl_reset_stats();
+
+  for(i = 0; i < CALLS; i++) {
+    if(clGetPlatformIDs(0, NULL, &platforms) != CL_SUCCESS) {
+      puts("clGetPlatformIDs() failed.");
+      return 1;
+    }
+  }
+
+  count = dynacl_get_stats(stats, sizeof(stats) / sizeof(stats[0]));
+
+  for(i = 0; i < count && i < sizeof(stats) / sizeof(stats[0]); i++) {
+    if(strcmp(stats[i].name, "clGetPlatformIDs") == 0) {
+      printf("clGetPlatformIDs() called %llu times in %llu ns.\n", stats[i].calls, stats[i].time_ns);
+
+      if(stats[i].calls != CALLS) {
+        puts("Wrong call count.");
+        return 1;
+      }
+    }
+  }
+
+  for(i = 0; i < THREADS; i++) {
+    if(clGetPlatformIDs == NULL) {
+      printf("The library has been unloaded after %u dynacl_shutdown() calls.\n", i);
+      return 1;
+    }
+
+    dynacl_shutdown();
+  }
+
+  if(clGetPlatformIDs != NULL) {
+    puts("The library has not been unloaded.");
+    return 1;
+  }
+
+  puts("Quitting...");
+  return 0;
+}
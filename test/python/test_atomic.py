@@ -0,0 +1,72 @@
+""" Tests for the atomic file writer """
+
+import os
+import os.path
+import stat
+import tempfile
+import unittest
+
+from foundry.atomic import AtomicWriter, write_if_changed
+
+class AtomicWriterTest(unittest.TestCase):
+  def setUp(self):
+    self._dir = tempfile.TemporaryDirectory()
+    self.dest = os.path.join(self._dir.name, 'out.h')
+    self._umask = os.umask(0o027)
+
+  def tearDown(self):
+    os.umask(self._umask)
+    self._dir.cleanup()
+
+  def mode(self):
+    return stat.S_IMODE(os.stat(self.dest).st_mode)
+
+  def test_write_if_changed(self):
+    self.assertTrue(write_if_changed(self.dest, 'a'))
+    os.utime(self.dest, ns = (1000000000, 1000000000))
+
+    self.assertFalse(write_if_changed(self.dest, 'a'))
+    self.assertEqual(os.stat(self.dest).st_mtime_ns, 1000000000)
+
+    self.assertTrue(write_if_changed(self.dest, b'b'))
+
+    with open(self.dest) as f:
+      self.assertEqual(f.read(), 'b')
+
+    self.assertEqual(os.listdir(self._dir.name), ['out.h'])
+
+  def test_error_keeps_file(self):
+    write_if_changed(self.dest, 'a')
+
+    with self.assertRaises(RuntimeError):
+      with AtomicWriter(self.dest) as f:
+        f.write('b')
+        raise RuntimeError()
+
+    with open(self.dest) as f:
+      self.assertEqual(f.read(), 'a')
+
+    self.assertEqual(os.listdir(self._dir.name), ['out.h'])
+
+  def test_no_overwrite(self):
+    write_if_changed(self.dest, 'a')
+    self.assertFalse(write_if_changed(self.dest, 'a', overwrite = False))
+
+    with self.assertRaises(FileExistsError):
+      write_if_changed(self.dest, 'b', overwrite = False)
+
+  @unittest.skipIf(os.name == 'nt', 'POSIX file modes')
+  def test_new_file_mode(self):
+    write_if_changed(self.dest, 'a')
+    self.assertEqual(self.mode(), 0o640)
+
+  @unittest.skipIf(os.name == 'nt', 'POSIX file modes')
+  def test_replaced_file_mode(self):
+    write_if_changed(self.dest, 'a')
+    os.chmod(self.dest, 0o755)
+
+    write_if_changed(self.dest, 'b')
+    self.assertEqual(self.mode(), 0o755)
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,33 @@
+""" Tests for the benchmark helpers """
+
+import os
+import sys
+import tempfile
+import unittest
+
+from foundry import bench
+
+class BenchTest(unittest.TestCase):
+  def test_run_benchmark(self):
+    code = 'print("warming up"); print(\'{"name": "init", "median_ns": 10}\'); print(\'{"name": "shutdown", "median_ns": 5}\')'
+    results = bench.run_benchmark([sys.executable, '-c', code], prefix = '100 symbols')
+
+    self.assertEqual(results, {'100 symbols/init': {'median_ns': 10}, '100 symbols/shutdown': {'median_ns': 5}})
+
+  def test_results(self):
+    with tempfile.TemporaryDirectory() as tmp:
+      path = os.path.join(tmp, 'results.json')
+      self.assertIsNone(bench.load_results(path))
+
+      bench.save_results(path, {'init': {'median_ns': 10}})
+      self.assertEqual(bench.load_results(path), {'init': {'median_ns': 10}})
+
+  def test_compare(self):
+    baseline = {'a': {'median_ns': 100}, 'b': {'median_ns': 100}, 'c': {'median_ns': 100}}
+    results = {'a': {'median_ns': 120}, 'b': {'median_ns': 130}, 'd': {'median_ns': 1000}}
+
+    self.assertEqual(bench.compare(results, baseline), [('b', 'median_ns', 100, 130)])
+    self.assertEqual(bench.compare(results, baseline, threshold = {'b': 0.5, None: 0.1}), [('a', 'median_ns', 100, 120)])
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,73 @@
+""" Tests for the object cache """
+
+import os
+import os.path
+import tempfile
+import unittest
+
+from foundry.cache import ObjectCache
+
+class ObjectCacheTest(unittest.TestCase):
+  def setUp(self):
+    self._dir = tempfile.TemporaryDirectory()
+    self.cache = ObjectCache(self.path('cache'), 250)
+
+  def tearDown(self):
+    self._dir.cleanup()
+
+  def path(self, name):
+    return os.path.join(self._dir.name, name)
+
+  def store(self, name, mtime = None):
+    """ Stores a 100 bytes output under the key of its name, then sets the entry time """
+    with open(self.path(name), 'wb') as f:
+      f.write(name.encode().ljust(100, b'.'))
+
+    key = ObjectCache.key(name)
+    self.cache.store(key, [self.path(name)])
+
+    if mtime is not None:
+      os.utime(self.cache._entry(key), (mtime, mtime))
+
+    return key
+
+  def test_key(self):
+    self.assertEqual(ObjectCache.key('a', b'b'), ObjectCache.key(b'a', 'b'))
+    self.assertNotEqual(ObjectCache.key('ab', 'c'), ObjectCache.key('a', 'bc'))
+
+  def test_restore(self):
+    key = self.store('a.o')
+    os.remove(self.path('a.o'))
+
+    self.assertTrue(self.cache.restore(key, [self.path('a.o'), self.path('a.d')]))
+    self.assertTrue(os.path.isfile(self.path('a.o')))
+    self.assertFalse(os.path.exists(self.path('a.d')))
+
+    self.assertFalse(self.cache.restore(ObjectCache.key('b.o'), [self.path('b.o')]))
+    self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+  def test_lru_eviction(self):
+    a = self.store('a.o', 1000)
+    b = self.store('b.o', 2000)
+
+    # Using an entry makes it the most recently used one
+    self.assertTrue(self.cache.restore(a, [self.path('a.o')]))
+    c = self.store('c.o')
+
+    self.assertFalse(os.path.exists(self.cache._entry(b)))
+    self.assertTrue(os.path.isdir(self.cache._entry(a)))
+    self.assertTrue(os.path.isdir(self.cache._entry(c)))
+
+  def test_size_from_existing_entries(self):
+    self.store('a.o', 1000)
+    self.store('b.o', 2000)
+
+    # A new cache object counts the entries already in the directory
+    self.cache = ObjectCache(self.path('cache'), 250)
+    self.store('c.o')
+
+    self.assertEqual(len(list(self.cache._entries())), 2)
+    self.assertFalse(os.path.exists(self.cache._entry(ObjectCache.key('a.o'))))
+
+if __name__ == '__main__':
+  unittest.main()
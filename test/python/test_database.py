@@ -0,0 +1,126 @@
+""" Tests for the build database and the decisions based on it """
+
+import os
+import os.path
+import tempfile
+import unittest
+
+import foundry
+from foundry.database import BuildDatabase
+
+class DatabaseTestCase(unittest.TestCase):
+  """ Base test case providing a temporary directory and a database in it """
+  def setUp(self):
+    self._dir = tempfile.TemporaryDirectory()
+    self.db_path = self.path('db.json')
+    self.db = BuildDatabase(self.db_path)
+
+  def tearDown(self):
+    self._dir.cleanup()
+
+  def path(self, name):
+    return os.path.join(self._dir.name, name)
+
+  def write(self, name, text, mtime = None):
+    with open(self.path(name), 'w') as f:
+      f.write(text)
+
+    if mtime is not None:
+      os.utime(self.path(name), ns = (mtime, mtime))
+
+    return self.path(name)
+
+class BuildDatabaseTest(DatabaseTestCase):
+  def test_hash_file(self):
+    a = self.write('a.c', 'int a;')
+    b = self.write('b.c', 'int a;')
+
+    self.assertEqual(self.db.hash_file(a), self.db.hash_file(b))
+    self.assertNotEqual(self.db.hash_file(a), self.db.hash_file(self.write('c.c', 'int c;')))
+    self.assertIsNone(self.db.hash_file(self.path('missing.c')))
+
+  def test_hash_cached_by_size_and_mtime(self):
+    src = self.write('a.c', 'int a;', mtime = 1000000000)
+    digest = self.db.hash_file(src)
+
+    # Same size and time: the cached hash is trusted
+    self.write('a.c', 'int b;', mtime = 1000000000)
+    self.assertEqual(self.db.hash_file(src), digest)
+
+    self.write('a.c', 'int b;', mtime = 2000000000)
+    self.assertNotEqual(self.db.hash_file(src), digest)
+
+  def test_is_up_to_date(self):
+    src = self.write('a.c', 'int a;')
+    obj = self.path('a.o')
+
+    self.assertIsNone(self.db.is_up_to_date(obj, 'cc -c a.c'))
+
+    self.db.record(obj, 'cc -c a.c', [src])
+    self.assertFalse(self.db.is_up_to_date(obj, 'cc -c a.c'))
+
+    self.write('a.o', '')
+    self.assertTrue(self.db.is_up_to_date(obj, 'cc -c a.c'))
+    self.assertFalse(self.db.is_up_to_date(obj, 'cc -O2 -c a.c'))
+
+    self.write('a.c', 'int b, c;')
+    self.assertFalse(self.db.is_up_to_date(obj, 'cc -c a.c'))
+
+  def test_save_and_load(self):
+    src = self.write('a.c', 'int a;')
+    self.write('a.o', '')
+    self.db.record(self.path('a.o'), 'cc -c a.c', [src])
+    self.db.record_timing('cc -c a.c', 1.5)
+    self.db.save()
+
+    db = BuildDatabase(self.db_path)
+    self.assertTrue(db.is_up_to_date(self.path('a.o'), 'cc -c a.c'))
+    self.assertEqual(db.inputs(self.path('a.o')), [os.path.normpath(src)])
+    self.assertEqual(db.timing('cc -c a.c'), 1.5)
+
+  def test_invalid_file(self):
+    self.write('db.json', '{"format": 0, "outputs": {"a.o": {}}}')
+    self.db.load()
+    self.assertEqual(self.db.inputs('a.o'), [])
+
+class NeedsCompileTest(DatabaseTestCase):
+  def setUp(self):
+    super().setUp()
+    self._database = foundry._database
+    foundry._database = self.db
+
+  def tearDown(self):
+    foundry._database = self._database
+    super().tearDown()
+
+  def test_no_record(self):
+    src = self.write('a.c', 'int a;', mtime = 1000000000)
+    obj = self.path('a.o')
+
+    self.assertTrue(foundry.needs_compile(src, obj, 'cc -c a.c'))
+
+    self.write('a.o', '', mtime = 2000000000)
+    self.assertFalse(foundry.needs_compile(src, obj, 'cc -c a.c'))
+
+    os.utime(src, ns = (3000000000, 3000000000))
+    self.assertTrue(foundry.needs_compile(src, obj, 'cc -c a.c'))
+
+  def test_record(self):
+    src = self.write('a.c', 'int a;')
+    header = self.write('a.h', 'extern int a;')
+    obj = self.write('a.o', '')
+    self.write('a.d', '{}: {} \\\n {}\n'.format(obj, src, header))
+
+    foundry.record_build(obj, 'cc -c a.c', [src], depfile = self.path('a.d'))
+    self.assertFalse(foundry.needs_compile(src, obj, 'cc -c a.c'))
+    self.assertTrue(foundry.needs_compile(src, obj, 'cc -g -c a.c'))
+
+    # A touched but unchanged header does not trigger a recompile, a changed one does
+    os.utime(header)
+    self.assertFalse(foundry.needs_compile(src, obj, 'cc -c a.c'))
+
+    self.write('a.h', 'extern long a;')
+    self.assertTrue(foundry.needs_compile(src, obj, 'cc -c a.c'))
+
+if __name__ == '__main__':
+  unittest.main()
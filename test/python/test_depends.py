@@ -0,0 +1,63 @@
+""" Tests for the dependency file parser and the include graph """
+
+import os
+import os.path
+import tempfile
+import unittest
+
+from foundry.depends import IncludeGraph, parse_deps
+
+class ParseDepsTest(unittest.TestCase):
+  def test_simple_rule(self):
+    self.assertEqual(parse_deps('a.o: a.c a.h\n'), {'a.o': ['a.c', 'a.h']})
+
+  def test_continuations(self):
+    text = 'a.o: a.c \\\n  include/a.h \\\r\n  include/b.h\n'
+    self.assertEqual(parse_deps(text), {'a.o': ['a.c', os.path.normpath('include/a.h'), os.path.normpath('include/b.h')]})
+
+  def test_escaped_spaces(self):
+    self.assertEqual(parse_deps('my\\ file.o: my\\ file.c dir\\ x/a.h\n'), {'my file.o': ['my file.c', os.path.normpath('dir x/a.h')]})
+
+  def test_escapes(self):
+    self.assertEqual(parse_deps('a.o: a\\#b.h a$$c.h\n'), {'a.o': ['a#b.h', 'a$c.h']})
+
+  def test_multiple_rules(self):
+    text = 'a.o b.o: common.h\na.o: a.c\n\ncommon.h:\n'
+    self.assertEqual(parse_deps(text), {'a.o': ['common.h', 'a.c'], 'b.o': ['common.h'], 'common.h': []})
+
+  def test_paths_normalized(self):
+    self.assertEqual(parse_deps('./src/a.o: src/../src/a.c\n'), {os.path.normpath('src/a.o'): [os.path.normpath('src/a.c')]})
+
+class IncludeGraphTest(unittest.TestCase):
+  def setUp(self):
+    self._dir = tempfile.TemporaryDirectory()
+    self.graph = IncludeGraph()
+
+  def tearDown(self):
+    self._dir.cleanup()
+
+  def write_depfile(self, text, mtime):
+    path = os.path.join(self._dir.name, 'a.d')
+
+    with open(path, 'w') as f:
+      f.write(text)
+
+    os.utime(path, ns = (mtime, mtime))
+    return path
+
+  def test_prerequisites(self):
+    self.assertFalse(self.graph.load(os.path.join(self._dir.name, 'missing.d')))
+
+    self.assertTrue(self.graph.load(self.write_depfile('a.o: a.c a.h\na.h: b.h\n', 1000000000)))
+    self.assertEqual(self.graph.prerequisites('a.o'), {'a.c', 'a.h', 'b.h'})
+
+  def test_reload(self):
+    depfile = self.write_depfile('a.o: a.c a.h\n', 1000000000)
+    self.graph.load(depfile)
+
+    self.write_depfile('a.o: a.c\n', 2000000000)
+    self.graph.load(depfile)
+    self.assertEqual(self.graph.prerequisites('a.o'), {'a.c'})
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,97 @@
+""" Tests for the dry run plan and its critical path estimate """
+
+import contextlib
+import io
+import os
+import os.path
+import sys
+import tempfile
+import unittest
+
+import foundry
+from foundry import Target
+
+@Target('test-plan-a', private = True)
+def target_plan_a():
+  foundry.check_call('touch made-a')
+
+@Target('test-plan-b', deps = ('test-plan-a',))
+def target_plan_b():
+  foundry.check_call('touch made-b1')
+  foundry.check_call('touch made-b2')
+
+@Target('test-plan-c', deps = ('test-plan-a',))
+def target_plan_c():
+  foundry.check_call('touch made-c')
+
+class DryRunTest(unittest.TestCase):
+  def setUp(self):
+    self._dir = tempfile.TemporaryDirectory()
+    self._state = sys.argv, os.getcwd(), foundry._database, foundry._dry_run, foundry._planned_commands, foundry._planned_outputs, foundry._parallel_queues
+    foundry._database = None
+    foundry._planned_commands = []
+    foundry._planned_outputs = set()
+
+    for name in ('test-plan-a', 'test-plan-b', 'test-plan-c'):
+      foundry._targets[name].called = False
+      foundry._targets[name].status = None
+
+    # Timings of the last run
+    db = foundry.BuildDatabase(os.path.join(self._dir.name, foundry._database_path))
+    db.record_timing('@test-plan-a', 0.5)
+    db.record_timing('touch made-a', 1.0)
+    db.record_timing('@test-plan-b', 0.0)
+    db.record_timing('touch made-b1', 2.0)
+    db.record_timing('touch made-b2', 2.0)
+    db.record_timing('@test-plan-c', 0.1)
+    db.save()
+
+  def tearDown(self):
+    sys.argv, cwd, foundry._database, foundry._dry_run, foundry._planned_commands, foundry._planned_outputs, foundry._parallel_queues = self._state
+    os.chdir(cwd)
+    self._dir.cleanup()
+
+  def run_foundry(self, *args):
+    """ Runs a build script with the given command line, returning the printed lines """
+    sys.argv = [os.path.join(self._dir.name, 'build.py')] + list(args)
+    out = io.StringIO()
+
+    with contextlib.redirect_stdout(out):
+      foundry.run_foundry()
+
+    return out.getvalue().splitlines()
+
+  def test_commands_planned(self):
+    lines = self.run_foundry('--dry-run', '-n:2', 'test-plan-b', 'test-plan-c')
+
+    self.assertEqual(sorted(foundry._planned_commands), [
+      ('test-plan-a', 'touch made-a'),
+      ('test-plan-b', 'touch made-b1'),
+      ('test-plan-b', 'touch made-b2'),
+      ('test-plan-c', 'touch made-c')
+    ])
+    self.assertIn('touch made-b1', lines)
+    self.assertEqual([f for f in os.listdir(self._dir.name) if f.startswith('made')], [])
+
+  def test_plan(self):
+    lines = self.run_foundry('--dry-run', '-n:2', 'test-plan-b', 'test-plan-c')
+    plan = lines[lines.index('Dry run: 3 target(s) would run, 0 up to date, 4 command(s) planned'):]
+
+    # Each target is estimated from its own time plus its commands, two of them running at once
+    self.assertEqual(plan[1:], [
+      '  {:<24} would run ~2.000s, 2 command(s)'.format('test-plan-b'),
+      '  {:<24} would run ~0.100s, 1 command(s)'.format('test-plan-c'),
+      'Estimated critical path: 3.500s (test-plan-a -> test-plan-b)',
+      'Estimated total work: 3.600s, at least 3.500s with -n:2',
+      'No timing recorded for 1 planned step(s): the estimates only cover the ones run before'
+    ])
+
+  def test_serial_estimate(self):
+    lines = self.run_foundry('--dry-run', 'test-plan-b')
+
+    self.assertIn('  {:<24} would run ~4.000s, 2 command(s)'.format('test-plan-b'), lines)
+    self.assertIn('Estimated critical path: 5.500s (test-plan-a -> test-plan-b)', lines)
+    self.assertIn('Estimated total work: 5.500s, at least 5.500s with -n:1', lines)
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,191 @@
+""" Tests for the template expansion module """
+
+import contextlib
+import io
+import os
+import os.path
+import tempfile
+import unittest
+
+from foundry import expansion
+
+class ExpansionTestCase(unittest.TestCase):
+  """ Base test case providing a temporary directory """
+  def setUp(self):
+    self._dir = tempfile.TemporaryDirectory()
+
+  def tearDown(self):
+    self._dir.cleanup()
+
+  def path(self, *names):
+    return os.path.join(self._dir.name, *names)
+
+  def write(self, name, text, mtime = None):
+    with open(self.path(name), 'w', encoding = 'utf_8') as f:
+      f.write(text)
+
+    if mtime is not None:
+      os.utime(self.path(name), ns = (mtime, mtime))
+
+    return self.path(name)
+
+  def read(self, name):
+    with open(self.path(name), encoding = 'utf_8') as f:
+      return f.read()
+
+class TemplateTest(ExpansionTestCase):
+  def test_compile_template(self):
+    self.assertEqual(expansion.compile_template('a @@X@@ b @@+Y@@'), ('a ', ('', 'X'), ' b ', ('+', 'Y'), ''))
+    self.assertEqual(expansion.compile_template('no variables'), ('no variables',))
+
+  def test_single_pass(self):
+    src = self.write('a.in', '@@A@@ @@B@@')
+
+    # Substituted values are not expanded again
+    self.assertEqual(expansion.expand_file(src, None, {'A': '@@B@@', 'B': 'b'}), '@@B@@ b')
+
+  def test_modifiers(self):
+    src = self.write('a.in', '@@NAME@@ @@+NAME@@ @@-NAME@@')
+    self.assertEqual(expansion.expand_file(src, None, {'NAME': 'John Doe'}), 'John Doe JOHN DOE john doe')
+
+  def test_unknown_variable(self):
+    src = self.write('a.in', '@@A@@ @@+MISSING@@ @@MISSING@@')
+    errors = io.StringIO()
+
+    with contextlib.redirect_stderr(errors):
+      self.assertEqual(expansion.expand_file(src, None, {'A': 'a'}), 'a @@+MISSING@@ @@MISSING@@')
+
+    # Reported once per template
+    self.assertEqual(errors.getvalue().count('MISSING'), 1)
+    self.assertIn(src, errors.getvalue())
+
+  def test_template_cache(self):
+    src = self.write('a.in', '@@A@@', mtime = 1000000000)
+    parts = expansion._load_template(src)
+    self.assertIs(expansion._load_template(src), parts)
+
+    # Same size and time: the compiled template is trusted
+    self.write('a.in', '@@B@@', mtime = 1000000000)
+    self.assertEqual(expansion.expand_file(src, None, {'A': 'a', 'B': 'b'}), 'a')
+
+    self.write('a.in', '@@B@@', mtime = 2000000000)
+    self.assertEqual(expansion.expand_file(src, None, {'A': 'a', 'B': 'b'}), 'b')
+
+class StreamTest(ExpansionTestCase):
+  def setUp(self):
+    super().setUp()
+    self._chunk_size = expansion._chunk_size
+    expansion._chunk_size = 8
+
+  def tearDown(self):
+    expansion._chunk_size = self._chunk_size
+    super().tearDown()
+
+  def test_expand_iter_chunks(self):
+    src = self.write('a.in', 'line @@A@@\n' * 10)
+    chunks = list(expansion.expand_iter(src, {'A': 'a'}))
+
+    self.assertGreater(len(chunks), 1)
+    self.assertEqual(''.join(chunks), 'line a\n' * 10)
+
+  def test_expand_to_text_stream(self):
+    src = self.write('a.in', '@@A@@ è')
+    out = io.StringIO()
+    expansion.expand_to(src, out, {'A': 'a'})
+
+    self.assertEqual(out.getvalue(), 'a è')
+
+  def test_expand_to_binary_stream(self):
+    src = self.write('a.in', '@@A@@ è')
+    out = io.BytesIO()
+    expansion.expand_to(src, out, {'A': 'a'})
+
+    self.assertEqual(out.getvalue(), 'a è'.encode('utf_8'))
+
+    with open(self.path('a.out'), 'wb') as f:
+      expansion.expand_file(src, f, {'A': 'a'})
+
+    with open(self.path('a.out'), 'rb') as f:
+      self.assertEqual(f.read(), 'a è'.encode('utf_8'))
+
+  def test_expand_file_newline(self):
+    src = self.write('a.in', '@@A@@\n@@A@@\n')
+    expansion.expand_file(src, self.path('a'), {'A': 'a'}, newline = '\r\n')
+
+    with open(self.path('a'), 'rb') as f:
+      self.assertEqual(f.read(), b'a\r\na\r\n')
+
+    with self.assertRaises(FileExistsError), contextlib.redirect_stderr(io.StringIO()):
+      expansion.expand_file(src, self.path('a'), {'A': 'b'})
+
+class BatchTest(ExpansionTestCase):
+  def setUp(self):
+    super().setUp()
+    os.makedirs(self.path('d', 'sub'))
+    self.write(os.path.join('d', 'f.h.in'), '#define F @@V@@\n')
+    self.write(os.path.join('d', 'sub', 'g.h.in'), '#define G @@V@@\n')
+    self.write(os.path.join('d', 'sub', 'notes.txt'), '@@V@@')
+
+  def main(self, *args):
+    with contextlib.redirect_stdout(io.StringIO()):
+      expansion._main(list(args))
+
+  def test_dir_jobs(self):
+    jobs = expansion.dir_jobs(self.path('d'), dest_dir = self.path('out'))
+
+    self.assertEqual(jobs, [
+      (self.path('d', 'f.h.in'), self.path('out', 'f.h'), None),
+      (self.path('d', 'sub', 'g.h.in'), self.path('out', 'sub', 'g.h'), None)
+    ])
+
+  def test_directory_mode(self):
+    for workers in ('1', '3'):
+      self.main('-D:V=7', '-d:' + self.path('d'), '-o:' + self.path('out'), '-n:' + workers, '-f')
+
+      self.assertEqual(self.read(os.path.join('out', 'f.h')), '#define F 7\n')
+      self.assertEqual(self.read(os.path.join('out', 'sub', 'g.h')), '#define G 7\n')
+      self.assertFalse(os.path.exists(self.path('out', 'sub', 'notes')))
+
+  def test_directory_mode_in_place(self):
+    self.main('-D:V=7', '-d:' + self.path('d'), '-p:*.txt.in')
+    self.assertFalse(os.path.exists(self.path('d', 'sub', 'notes')))
+
+    self.main('-D:V=7', '-d:' + self.path('d'))
+    self.assertEqual(self.read(os.path.join('d', 'sub', 'g.h')), '#define G 7\n')
+
+  def test_manifest(self):
+    self.write('manifest.json', '''{
+      "vars": {"V": "1", "W": "shared"},
+      "files": [
+        {"template": "d/f.h.in", "output": "gen/f.h"},
+        {"template": "d/sub/g.h.in", "output": "gen/g.h", "vars": {"V": "2"}}
+      ]
+    }''')
+    shared, jobs = expansion.load_manifest(self.path('manifest.json'))
+
+    self.assertEqual(shared, {'V': '1', 'W': 'shared'})
+    self.assertEqual(jobs[1], (self.path('d/sub/g.h.in'), self.path('gen/g.h'), {'V': '2'}))
+
+    # Command line variables take precedence over the shared ones, job variables over both
+    self.main('-D:V=3', '-m:' + self.path('manifest.json'))
+    self.assertEqual(self.read('gen/f.h'), '#define F 3\n')
+    self.assertEqual(self.read('gen/g.h'), '#define G 2\n')
+
+  def test_unchanged_outputs_kept(self):
+    jobs = expansion.dir_jobs(self.path('d'), dest_dir = self.path('out'))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+      self.assertEqual(len(expansion.expand_batch(jobs, {'V': '1'})), 2)
+
+      os.utime(self.path('out', 'f.h'), ns = (1000000000, 1000000000))
+      self.assertEqual(expansion.expand_batch(jobs, {'V': '1'}), [])
+      self.assertEqual(os.stat(self.path('out', 'f.h')).st_mtime_ns, 1000000000)
+
+      # Changed outputs are only replaced if allowed
+      with self.assertRaises(FileExistsError), contextlib.redirect_stderr(io.StringIO()):
+        expansion.expand_batch(jobs, {'V': '2'})
+
+      self.assertEqual(expansion.expand_batch(jobs, {'V': '2'}, overwrite = True), [self.path('out', 'f.h'), self.path('out', 'sub', 'g.h')])
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,67 @@
+""" Tests for the directory walker and the file index """
+
+import os
+import os.path
+import tempfile
+import unittest
+
+from foundry.fileindex import FileIndex, ext_matcher, normalize_ext, scan_dir
+
+class FileIndexTest(unittest.TestCase):
+  def setUp(self):
+    self._dir = tempfile.TemporaryDirectory()
+    self.root = self._dir.name
+
+    for name in ('a.c', 'a.h', 'b.tar.gz', 'x.gz', 'sub/b.c', 'sub/deep/c.c', 'sub/deep/a.h'):
+      path = self.path(name)
+      os.makedirs(os.path.dirname(path), exist_ok = True)
+      open(path, 'w').close()
+
+  def tearDown(self):
+    self._dir.cleanup()
+
+  def path(self, name):
+    return os.path.normpath(os.path.join(self.root, name))
+
+  def paths(self, *names):
+    return sorted(self.path(n) for n in names)
+
+  def test_scan_dir(self):
+    dirs = []
+    files = [os.path.normpath(f) for f in scan_dir(self.root, True, dirs)]
+
+    self.assertEqual(sorted(files), self.paths('a.c', 'a.h', 'b.tar.gz', 'x.gz', 'sub/b.c', 'sub/deep/c.c', 'sub/deep/a.h'))
+    self.assertEqual(sorted(os.path.normpath(d) for d in dirs), self.paths('.', 'sub', 'sub/deep'))
+    self.assertEqual(sorted(os.path.normpath(f) for f in scan_dir(self.root, False)), self.paths('a.c', 'a.h', 'b.tar.gz', 'x.gz'))
+
+  def test_ext_matcher(self):
+    self.assertEqual(normalize_ext(['.c', 'h', 'c']), ('c', 'h'))
+
+    match = ext_matcher(('gz', '.tar.gz', 'c'))
+    self.assertEqual(match('dir/b.tar.gz'), 'tar.gz')
+    self.assertEqual(match('x.gz'), 'gz')
+    self.assertEqual(match('a.c'), 'c')
+    self.assertIsNone(match('a.h'))
+    self.assertIsNone(ext_matcher('c')('.c'))
+
+  def test_queries(self):
+    index = FileIndex(self.root)
+
+    self.assertEqual(sorted(index.ext('c')), self.paths('a.c', 'sub/b.c', 'sub/deep/c.c'))
+    self.assertEqual({e: sorted(f) for e, f in index.partition_ext(('gz', 'tar.gz')).items()}, {'gz': self.paths('x.gz'), 'tar.gz': self.paths('b.tar.gz')})
+    self.assertEqual(sorted(index.name('a.h')), self.paths('a.h', 'sub/deep/a.h'))
+    self.assertEqual(sorted(index.name('a', remove_ext = True)), self.paths('a.c', 'a.h', 'sub/deep/a.h'))
+
+  def test_update(self):
+    index = FileIndex(self.root, subdirs = False)
+
+    self.assertTrue(index.covers(self.path('new.c')))
+    self.assertFalse(index.covers(self.path('sub/new.c')))
+    self.assertFalse(index.covers(os.path.join(self.root, os.pardir, 'new.c')))
+
+    index.add(self.path('new.c'))
+    index.discard(self.path('a.c'))
+    self.assertEqual(index.ext('c'), [self.path('new.c')])
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,26 @@
+""" Tests for the cost of importing foundry """
+
+import os
+import subprocess
+import sys
+import unittest
+
+class ImportTest(unittest.TestCase):
+  def test_lazy_imports(self):
+    code = 'import sys, foundry; print(" ".join(sorted(m for m in sys.modules if m.split(".")[0] in ("foundry", "glob", "shlex", "shutil"))))'
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    out = subprocess.run([sys.executable, '-c', code], cwd = root, stdout = subprocess.PIPE, universal_newlines = True, check = True).stdout
+
+    self.assertEqual(out.split(), ['foundry', 'foundry.log'])
+
+  def test_lazy_exports(self):
+    import foundry
+    from foundry.atomic import write_if_changed
+
+    self.assertIs(foundry.write_if_changed, write_if_changed)
+
+    with self.assertRaises(AttributeError):
+      foundry.no_such_attribute
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,127 @@
+""" Tests for the job server and the job runner """
+
+import os
+import sys
+import tempfile
+import threading
+import unittest
+
+from foundry.jobs import JobServer, needs_shell, run_job
+
+@unittest.skipIf(os.name == 'nt', 'GNU make jobserver pipes')
+class JobServerTest(unittest.TestCase):
+  def setUp(self):
+    self.read_fd, self.write_fd = os.pipe()
+
+  def tearDown(self):
+    os.close(self.read_fd)
+    os.close(self.write_fd)
+
+  def server(self, tokens, auth = None):
+    os.write(self.write_fd, tokens)
+    return JobServer(1, makeflags = ' -j --jobserver-auth={} '.format(auth or '{},{}'.format(self.read_fd, self.write_fd)))
+
+  def test_no_jobserver(self):
+    server = JobServer(2, makeflags = '-j2')
+    self.assertIsNone(server.fds)
+
+    tokens = [server.acquire(), server.acquire()]
+    self.assertFalse(server._local.acquire(blocking = False))
+
+    for token in tokens:
+      server.release(token)
+
+  def test_invalid_descriptors(self):
+    self.assertIsNone(JobServer(1, makeflags = '--jobserver-auth=1000,1001').fds)
+    self.assertIsNone(JobServer(1, makeflags = '--jobserver-auth=a,b').fds)
+
+  def test_tokens(self):
+    server = self.server(b'+-')
+    self.assertEqual(server.fds, (self.read_fd, self.write_fd))
+
+    # The implicit slot comes first and is not read from the pipe
+    implicit = server.acquire()
+    self.assertEqual(implicit, b'')
+
+    first, second = server.acquire(), server.acquire()
+    self.assertEqual({first, second}, {b'+', b'-'})
+
+    # Tokens are given back to the pipe as they were read
+    server.release(second)
+    server.release(implicit)
+    self.assertEqual(os.read(self.read_fd, 1), second)
+
+    server.release(first)
+    self.assertEqual(os.read(self.read_fd, 1), first)
+
+  def test_wait_for_token(self):
+    server = self.server(b'')
+    server.acquire()
+    tokens = []
+
+    waiter = threading.Thread(target = lambda: tokens.append(server.acquire()))
+    waiter.start()
+    waiter.join(0.1)
+    self.assertTrue(waiter.is_alive())
+
+    os.write(self.write_fd, b'x')
+    waiter.join(5)
+    self.assertEqual(tokens, [b'x'])
+
+  def test_non_blocking_pipe(self):
+    os.set_blocking(self.read_fd, False)
+    server = self.server(b'x')
+
+    server.acquire()
+    self.assertEqual(server.acquire(), b'x')
+
+  def test_fifo(self):
+    with tempfile.TemporaryDirectory() as tmp:
+      fifo = os.path.join(tmp, 'jobserver')
+      os.mkfifo(fifo)
+
+      server = JobServer(1, makeflags = '--jobserver-auth=fifo:' + fifo)
+      self.assertEqual(server.fds[0], server.fds[1])
+
+      try:
+        os.write(server.fds[1], b'f')
+        server.acquire()
+        self.assertEqual(server.acquire(), b'f')
+      finally:
+        os.close(server.fds[0])
+
+class RunJobTest(unittest.TestCase):
+  def test_needs_shell(self):
+    self.assertFalse(needs_shell(['echo', '|']))
+
+    if os.name != 'nt':
+      self.assertFalse(needs_shell('gcc -c -o a.o a.c'))
+
+    self.assertTrue(needs_shell('gcc -E a.c | wc -l'))
+    self.assertTrue(needs_shell('CC=gcc make'))
+    self.assertTrue(needs_shell('exit 3'))
+
+  def test_run(self):
+    result = run_job([sys.executable, '-c', 'import sys; print("out"); print("err", file = sys.stderr); sys.exit(3)'], JobServer(1, makeflags = ''))
+
+    self.assertEqual(result.returncode, 3)
+    self.assertEqual(result.stdout.strip(), b'out')
+    self.assertEqual(result.stderr.strip(), b'err')
+    self.assertGreaterEqual(result.duration, 0.0)
+
+  def test_child_cpu(self):
+    result = run_job([sys.executable, '-c', 'import time\nt = time.process_time()\nwhile time.process_time() - t < 0.2: pass'], JobServer(1, makeflags = ''))
+
+    if hasattr(os, 'wait4'):
+      self.assertGreaterEqual(result.cpu, 0.15)
+    else:
+      self.assertIsNone(result.cpu)
+
+  def test_command_not_found(self):
+    result = run_job(['foundry-no-such-command'], JobServer(1, makeflags = ''))
+
+    self.assertEqual(result.returncode, 127)
+    self.assertIn(b'command not found', result.stderr)
+
+if __name__ == '__main__':
+  unittest.main()
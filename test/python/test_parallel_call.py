@@ -0,0 +1,119 @@
+""" Tests for parallel_call() and its executors """
+
+import asyncio
+import concurrent.futures
+import os
+import threading
+import time
+import unittest
+
+import foundry
+from foundry import parallel_call
+
+def square(x):
+  return x * x
+
+def pid(x):
+  return os.getpid()
+
+class ParallelCallTest(unittest.TestCase):
+  def setUp(self):
+    self.calls = []
+    self._lock = threading.Lock()
+
+  def sleep(self, delay, value):
+    time.sleep(delay)
+
+    with self._lock:
+      self.calls.append(value)
+
+    return value
+
+  def fail(self, delay, value):
+    time.sleep(delay)
+    raise ValueError(value)
+
+  def test_thread_order(self):
+    results = parallel_call(self.sleep, [(0.1, 'a'), (0.05, 'b'), (0.0, 'c')], threads = 3)
+
+    self.assertIsInstance(results, foundry.CallResults)
+    self.assertEqual(results, ['a', 'b', 'c'])
+    self.assertEqual(self.calls, ['c', 'b', 'a'])
+
+  def test_durations(self):
+    results = parallel_call(self.sleep, [(0.1, 'a'), (0.0, 'b')], threads = 2)
+
+    self.assertEqual(len(results.durations), 2)
+    self.assertGreaterEqual(results.durations[0], 0.1)
+    self.assertLess(results.durations[1], 0.1)
+
+  def test_empty(self):
+    results = parallel_call(self.sleep, [])
+    self.assertEqual((results, results.durations), ([], []))
+
+  def test_process(self):
+    self.assertEqual(parallel_call(square, [(i,) for i in range(5)], threads = 2, executor = 'process'), [0, 1, 4, 9, 16])
+    self.assertNotIn(os.getpid(), parallel_call(pid, [(0,), (1,)], threads = 2, executor = 'process'))
+
+  def test_asyncio(self):
+    async def coroutine(delay, value):
+      await asyncio.sleep(delay)
+      self.calls.append(value)
+      return value
+
+    results = parallel_call(coroutine, [(0.1, 'a'), (0.0, 'b')], threads = 2, executor = 'asyncio')
+
+    self.assertEqual(results, ['a', 'b'])
+    self.assertEqual(self.calls, ['b', 'a'])
+    self.assertGreaterEqual(results.durations[0], 0.1)
+
+    # Plain functions are run in worker threads
+    self.assertEqual(parallel_call(square, [(2,), (3,)], executor = 'asyncio'), [4, 9])
+
+  def test_executor_object(self):
+    with concurrent.futures.ThreadPoolExecutor(2) as xtor:
+      self.assertEqual(parallel_call(square, [(2,), (3,)], executor = xtor), [4, 9])
+
+      # The executor is left running
+      self.assertEqual(xtor.submit(square, 4).result(), 16)
+
+  def test_unknown_executor(self):
+    with self.assertRaises(ValueError):
+      parallel_call(square, [(2,)], executor = 'fiber')
+
+  def test_fail_fast(self):
+    with self.assertRaisesRegex(ValueError, 'first'):
+      parallel_call(self.fail, [(0.0, 'first')] + [(0.05, 'slow')] * 4, threads = 1)
+
+    # The pending calls have been cancelled
+    self.assertEqual(self.calls, [])
+
+  def test_no_fail_fast(self):
+    with self.assertRaisesRegex(ValueError, 'first'):
+      parallel_call(lambda d, v: self.fail(d, v) if v == 'first' else self.sleep(d, v), [(0.0, 'first')] + [(0.0, 'next')] * 3, threads = 1, fail_fast = False)
+
+    self.assertEqual(self.calls, ['next'] * 3)
+
+  def test_first_failure_in_order(self):
+    func = lambda d, v: self.fail(d, v)
+
+    with self.assertRaisesRegex(ValueError, 'a'):
+      parallel_call(func, [(0.1, 'a'), (0.0, 'b')], threads = 2, fail_fast = False)
+
+  def test_asyncio_fail_fast(self):
+    async def coroutine(delay, value):
+      await asyncio.sleep(delay)
+
+      if value == 'fail':
+        raise ValueError(value)
+
+      self.calls.append(value)
+
+    with self.assertRaisesRegex(ValueError, 'fail'):
+      parallel_call(coroutine, [(0.0, 'fail'), (0.2, 'slow')], threads = 2, executor = 'asyncio')
+
+    # The slower call has been cancelled
+    self.assertEqual(self.calls, [])
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,99 @@
+""" Tests for parallel_compile() """
+
+import contextlib
+import io
+import os
+import os.path
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import foundry
+
+## Compiler stand-in: copies the source to the object, failing if the source says so
+compiler = '''
+import shutil, sys
+
+with open(sys.argv[1]) as f:
+  if f.read() == 'fail':
+    sys.exit(2)
+
+shutil.copy(sys.argv[1], sys.argv[2])
+'''
+
+class ParallelCompileTest(unittest.TestCase):
+  def setUp(self):
+    self._dir = tempfile.TemporaryDirectory()
+    self._state = foundry._database, foundry._object_cache, foundry._remote_pool
+    foundry._database = foundry.BuildDatabase(self.path('db.json'))
+    foundry._object_cache = False
+    foundry._remote_pool = False
+
+    with open(self.path('cc.py'), 'w') as f:
+      f.write(compiler)
+
+    self.command = '{} {} {{src}} {{obj}}'.format(sys.executable, self.path('cc.py'))
+
+  def tearDown(self):
+    foundry._database, foundry._object_cache, foundry._remote_pool = self._state
+    self._dir.cleanup()
+
+  def path(self, name):
+    return os.path.join(self._dir.name, name)
+
+  def sources(self, **texts):
+    for name, text in texts.items():
+      with open(self.path(name + '.c'), 'w') as f:
+        f.write(text)
+
+    return {self.path(name + '.c'): self.path(name + '.o') for name in texts}
+
+  def compile(self, objects, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()) as errors:
+      result = foundry.parallel_compile(objects, self.command, threads = 2, **kwargs)
+
+    return result, errors.getvalue()
+
+  def test_rebuilds_out_of_date(self):
+    objects = self.sources(a = 'a', b = 'b')
+
+    self.assertEqual(sorted(self.compile(objects)[0]), sorted(objects.values()))
+    self.assertEqual(self.compile(objects)[0], [])
+
+    self.sources(b = 'bb')
+    self.assertEqual(self.compile(objects)[0], [self.path('b.o')])
+
+  def test_failures_collected(self):
+    objects = self.sources(a = 'fail', b = 'b', c = 'fail', d = 'd')
+
+    with self.assertRaises(foundry.BuildError) as cm:
+      self.compile(objects)
+
+    # Every command has run, and each failure is in the error
+    self.assertEqual(len(cm.exception.failures), 2)
+    self.assertTrue(all(isinstance(e, subprocess.CalledProcessError) and e.returncode == 2 for e in cm.exception.failures))
+    self.assertEqual(sorted(e.cmd.split()[-1] for e in cm.exception.failures), [self.path('a.o'), self.path('c.o')])
+    self.assertTrue(os.path.isfile(self.path('b.o')) and os.path.isfile(self.path('d.o')))
+
+    # The successful builds have been recorded
+    self.assertEqual(self.compile({self.path('b.c'): self.path('b.o')})[0], [])
+
+  def test_failures_reported(self):
+    objects = self.sources(a = 'fail')
+
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()) as errors:
+      with self.assertRaises(foundry.BuildError):
+        foundry.parallel_compile(objects, self.command)
+
+    self.assertIn('returned 2', errors.getvalue())
+
+  def test_needs(self):
+    objects = self.sources(a = 'a', b = 'b')
+    result = self.compile(objects, needs = lambda src, obj: src.endswith('b.c'))[0]
+
+    self.assertEqual(result, [self.path('b.o')])
+    self.assertFalse(os.path.exists(self.path('a.o')))
+
+if __name__ == '__main__':
+  unittest.main()
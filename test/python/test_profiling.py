@@ -0,0 +1,97 @@
+""" Tests for the build profiler """
+
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from foundry.profiling import Profiler
+
+class ProfilerTest(unittest.TestCase):
+  def setUp(self):
+    self.profiler = Profiler()
+    self.profiler.enable(tracing = True)
+
+  def test_disabled(self):
+    profiler = Profiler()
+
+    with profiler.measure('block'):
+      pass
+
+    self.assertEqual(profiler.report()[1:], [])
+
+  def test_measure(self):
+    with self.profiler.measure('block', 'test', {'n': 1}) as measure:
+      measure.child_cpu = 2.0
+
+    with self.profiler.measure('block'):
+      pass
+
+    count, wall, cpu = self.profiler._stats['block']
+    self.assertEqual(count, 2)
+    self.assertGreaterEqual(cpu, 2.0)
+
+    event = self.profiler._events[0]
+    self.assertEqual((event['name'], event['cat'], event['ph'], event['args']), ('block', 'test', 'X', {'n': 1}))
+
+  def test_other_threads_not_counted(self):
+    done = threading.Event()
+
+    def spin():
+      while not done.is_set():
+        pass
+
+    thread = threading.Thread(target = spin)
+    thread.start()
+
+    try:
+      with self.profiler.measure('sleep'):
+        time.sleep(0.2)
+    finally:
+      done.set()
+      thread.join()
+
+    self.assertLess(self.profiler._stats['sleep'][2], 0.1)
+
+  def test_child_cpu_counted_by_outer_measure(self):
+    with self.profiler.measure('target'):
+      with self.profiler.measure('command') as measure:
+        measure.child_cpu = 2.0
+
+    self.assertGreaterEqual(self.profiler._stats['command'][2], 2.0)
+    self.assertGreaterEqual(self.profiler._stats['target'][2], 2.0)
+
+  def test_decorators(self):
+    @self.profiler.profiled('function')
+    def function(x):
+      return x + 1
+
+    @self.profiler.profiled_generator('generator')
+    def generator(n):
+      yield from range(n)
+
+    self.assertEqual(function(1), 2)
+    self.assertEqual(list(generator(3)), [0, 1, 2])
+    self.assertEqual(self.profiler._stats['function'][0], 1)
+    self.assertEqual(self.profiler._stats['generator'][0], 1)
+
+  def test_report_and_trace(self):
+    self.profiler.add('slow', 0.0, 2.0, 1.0)
+    self.profiler.add('fast', 0.0, 1.0, 1.0)
+
+    self.assertEqual([line.split()[0] for line in self.profiler.report()[1:]], ['slow', 'fast'])
+
+    with tempfile.TemporaryDirectory() as tmp:
+      path = os.path.join(tmp, 'trace.json')
+      self.profiler.write_trace(path)
+
+      with open(path) as f:
+        trace = json.load(f)
+
+    self.assertEqual([e['name'] for e in trace['traceEvents']], ['slow', 'fast'])
+    self.assertEqual(trace['traceEvents'][0]['dur'], 2e6)
+
+if __name__ == '__main__':
+  unittest.main()
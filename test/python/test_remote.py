@@ -0,0 +1,158 @@
+""" Tests for the remote worker protocol """
+
+import contextlib
+import io
+import os
+import os.path
+import socket
+import sys
+import tempfile
+import threading
+import unittest
+
+from foundry import remote
+from foundry.remote import ContentStore, RemoteError, RemotePool, Worker, digest
+
+class MessageTest(unittest.TestCase):
+  def test_framing(self):
+    a, b = socket.socketpair()
+
+    with a, b:
+      remote.send_message(a, {'type': 'hello'})
+      self.assertEqual(b.recv(4), len(b'{"type": "hello"}').to_bytes(4, 'big'))
+      self.assertEqual(b.recv(17), b'{"type": "hello"}')
+
+      # Larger than the socket buffers: received in several chunks
+      large = {'type': 'put', 'blobs': {'x': 'é' * 1000000}}
+      sender = threading.Thread(target = remote.send_message, args = (a, large))
+      sender.start()
+      self.assertEqual(remote.recv_message(b), large)
+      sender.join()
+
+      a.close()
+
+      with self.assertRaises(ConnectionError):
+        remote.recv_message(b)
+
+  def test_parse_hosts(self):
+    self.assertEqual(remote.parse_hosts('a, b:1234,,[::1]:5'), [('a', remote.default_port), ('b', 1234), ('[::1]', 5)])
+
+  def test_relative_path(self):
+    self.assertEqual(remote.relative_path('src/../src/a.c'), os.path.normpath('src/a.c'))
+
+    for path in ('/etc/passwd', '../a.c', 'src/../../a.c'):
+      with self.assertRaises(RemoteError):
+        remote.relative_path(path)
+
+class WorkerTestCase(unittest.TestCase):
+  """ Base test case running a worker on a free local port """
+  def setUp(self):
+    self._dir = tempfile.TemporaryDirectory()
+    self.worker = Worker(('127.0.0.1', 0), 2, os.path.join(self._dir.name, 'store'))
+    self._thread = threading.Thread(target = self.worker.serve_forever, args = (0.05,), daemon = True)
+    self._thread.start()
+
+  def tearDown(self):
+    self.worker.shutdown()
+    self.worker.server_close()
+    self._dir.cleanup()
+
+  def request(self, message):
+    with socket.create_connection(self.worker.server_address[:2]) as sock:
+      remote.send_message(sock, message)
+      return remote.recv_message(sock)
+
+class WorkerTest(WorkerTestCase):
+  def test_hello(self):
+    self.assertEqual(self.request({'type': 'hello'}), {'type': 'hello', 'version': remote._version, 'slots': 2})
+
+  def test_errors(self):
+    for message in ({'type': 'dance'}, {'type': 'get', 'digests': ['../x']}, {'type': 'put', 'blobs': {'0' * 64: remote._encode(b'x')}}):
+      self.assertEqual(self.request(message)['type'], 'error')
+
+  def test_run(self):
+    source = b'int main() { return 0; }'
+    command = [sys.executable, '-c', 'import shutil; shutil.copy("src/a.c", "out/a.o"); print("done")']
+    run = {'type': 'run', 'command': command, 'inputs': {'src/a.c': {'digest': digest(source), 'executable': False}}, 'outputs': ['out/a.o']}
+
+    self.assertEqual(self.request(run), {'type': 'missing', 'digests': [digest(source)]})
+    self.assertEqual(self.request({'type': 'put', 'blobs': {digest(source): remote._encode(source)}}), {'type': 'ok'})
+
+    reply = self.request(run)
+    self.assertEqual((reply['type'], reply['returncode'], reply['cached']), ('result', 0, False))
+    self.assertEqual(remote._decode(reply['stdout']).strip(), b'done')
+    self.assertEqual(reply['outputs']['out/a.o']['digest'], digest(source))
+
+    # Same command and inputs: answered from the stored outputs
+    self.assertTrue(self.request(run)['cached'])
+
+    blobs = self.request({'type': 'get', 'digests': [digest(source)]})['blobs']
+    self.assertEqual(remote._decode(blobs[digest(source)]), source)
+
+  def test_results_bounded(self):
+    worker = Worker(('127.0.0.1', 0), 1, os.path.join(self._dir.name, 'store'), results = 2)
+    commands = [[sys.executable, '-c', 'print({})'.format(i)] for i in range(3)]
+
+    try:
+      with contextlib.redirect_stdout(io.StringIO()):
+        for command in commands:
+          self.assertFalse(worker.run_action(command, {}, [])['cached'])
+
+        # The least recently used result has been forgotten
+        self.assertEqual(len(worker._results), 2)
+        self.assertTrue(worker.run_action(commands[1], {}, [])['cached'])
+        self.assertFalse(worker.run_action(commands[0], {}, [])['cached'])
+        self.assertTrue(worker.run_action(commands[1], {}, [])['cached'])
+        self.assertFalse(worker.run_action(commands[2], {}, [])['cached'])
+    finally:
+      worker.server_close()
+
+  def test_run_outside(self):
+    reply = self.request({'type': 'run', 'command': 'true', 'inputs': {}, 'outputs': ['../a.o']})
+    self.assertEqual(reply['type'], 'error')
+
+class RemotePoolTest(WorkerTestCase):
+  def setUp(self):
+    super().setUp()
+    self._cwd = os.getcwd()
+    os.chdir(self._dir.name)
+
+  def tearDown(self):
+    os.chdir(self._cwd)
+    super().tearDown()
+
+  def test_run(self):
+    with open('a.c', 'w') as f:
+      f.write('int a;')
+
+    pool = RemotePool([self.worker.server_address[:2]])
+    self.assertEqual(pool.slots(), 2)
+
+    result = pool.run([sys.executable, '-c', 'import shutil; shutil.copy("a.c", "obj/a.o")'], ['a.c'], ['obj/a.o'])
+    self.assertEqual(result.returncode, 0)
+
+    with open('obj/a.o') as f:
+      self.assertEqual(f.read(), 'int a;')
+
+  def test_no_worker(self):
+    with socket.socket() as sock:
+      sock.bind(('127.0.0.1', 0))
+      pool = RemotePool([sock.getsockname()])
+
+    with self.assertRaises(RemoteError):
+      pool.run('true', [], [])
+
+class ContentStoreTest(unittest.TestCase):
+  def test_put(self):
+    with tempfile.TemporaryDirectory() as tmp:
+      store = ContentStore(tmp)
+      key = store.put(b'data')
+
+      self.assertTrue(store.has(key))
+      self.assertEqual(store.get(key), b'data')
+
+      with self.assertRaises(RemoteError):
+        store.put(b'other', key)
+
+if __name__ == '__main__':
+  unittest.main()
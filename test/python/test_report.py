@@ -0,0 +1,100 @@
+""" Tests for the build summary and the JSON build report """
+
+import contextlib
+import io
+import json
+import os
+import os.path
+import sys
+import tempfile
+import unittest
+
+import foundry
+from foundry import Target
+
+@Target('test-report-dep', private = True)
+def target_report_dep():
+  foundry.check_call([sys.executable, '-c', 'pass'])
+
+@Target('test-report', deps = ('test-report-dep',))
+def target_report():
+  foundry.check_call([sys.executable, '-c', 'pass'])
+  foundry.call([sys.executable, '-c', 'import sys; sys.exit(3)'])
+
+@Target('test-report-fail', deps = ('test-report-dep',), private = True)
+def target_report_fail():
+  foundry.fatal('failed')
+
+class ReportTest(unittest.TestCase):
+  def setUp(self):
+    self._dir = tempfile.TemporaryDirectory()
+    self._state = sys.argv, os.getcwd(), foundry._database, foundry._report_path, foundry._job_history
+    foundry._database = None
+    foundry._job_history = []
+
+    for name in ('test-report-dep', 'test-report', 'test-report-fail'):
+      foundry._targets[name].called = False
+      foundry._targets[name].status = None
+
+  def tearDown(self):
+    sys.argv, cwd, foundry._database, foundry._report_path, foundry._job_history = self._state
+    os.chdir(cwd)
+    self._dir.cleanup()
+
+  def run_foundry(self, *args):
+    """ Runs a build script with the given command line, returning the report and the printed lines """
+    path = os.path.join(self._dir.name, 'report.json')
+    sys.argv = [os.path.join(self._dir.name, 'build.py'), '--report:' + path] + list(args)
+    out = io.StringIO()
+
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(io.StringIO()):
+      try:
+        foundry.run_foundry()
+      except SystemExit:
+        pass
+
+    with open(path) as f:
+      return json.load(f), out.getvalue().splitlines()
+
+  def test_report(self):
+    report, lines = self.run_foundry('test-report')
+
+    self.assertEqual(report['format'], 1)
+    self.assertEqual(report['status'], 'succeeded')
+    self.assertGreaterEqual(report['duration'], 0.0)
+    self.assertEqual(report['cache'], {'enabled': False, 'hits': 0, 'misses': 0})
+
+    targets = {t['name']: t for t in report['targets']}
+    self.assertEqual(targets['test-report']['status'], 'run')
+    self.assertEqual(targets['test-report']['commands'], 2)
+    self.assertEqual(targets['test-report-dep']['commands'], 1)
+    self.assertIsNone(targets['test-report']['reason'])
+
+    commands = [c for c in report['commands'] if c['target'] == 'test-report']
+    self.assertEqual([c['status'] for c in commands], [0, 3])
+    self.assertTrue(all(c['start'] >= report['start'] and c['duration'] >= 0.0 for c in commands))
+    self.assertIn(sys.executable, commands[0]['command'])
+
+    # The summary only lists the public targets
+    summary = [line for line in lines if line.startswith(('Build ', '  test-report'))]
+    self.assertTrue(summary[0].startswith('Build succeeded'))
+    self.assertEqual([line.split()[0] for line in summary[1:]], ['test-report'])
+
+  def test_failed_report(self):
+    report, lines = self.run_foundry('test-report-fail')
+
+    self.assertEqual(report['status'], 'failed')
+
+    targets = {t['name']: t['status'] for t in report['targets']}
+    self.assertEqual((targets['test-report-dep'], targets['test-report-fail']), ('run', 'failed'))
+
+  def test_summary(self):
+    foundry._targets['test-report'].status = 'skipped'
+    foundry._targets['test-report'].skip_reason = 'inputs unchanged'
+    lines = foundry._summary(False, 1.5)
+
+    self.assertIn('  {:<24} skipped (inputs unchanged)'.format('test-report'), lines)
+    self.assertRegex(lines[0], r'^Build succeeded in 1\.500s: \d+ target\(s\) run, \d+ skipped, \d+ failed')
+
+if __name__ == '__main__':
+  unittest.main()
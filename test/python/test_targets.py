@@ -0,0 +1,225 @@
+""" Tests for the target scheduler """
+
+import contextlib
+import io
+import os
+import os.path
+import sys
+import tempfile
+import time
+import unittest
+
+import foundry
+from foundry import Target
+
+runs = []
+
+@Target('test-shared', repeatable = True, private = True)
+def target_shared():
+  runs.append('shared')
+
+@Target('test-a', deps = ('test-shared',), private = True)
+def target_a():
+  print('a start')
+  time.sleep(0.05)
+  print('a end')
+
+@Target('test-b', deps = ('test-shared',), private = True)
+def target_b():
+  print('b start')
+  time.sleep(0.05)
+  print('b end')
+
+@Target('test-first', deps = ('test-first-dep',), private = True)
+def target_first():
+  time.sleep(0.05)
+  runs.append('first')
+
+@Target('test-first-dep', private = True)
+def target_first_dep():
+  time.sleep(0.05)
+  runs.append('first-dep')
+
+@Target('test-second', deps = ('test-second-dep', 'test-first-dep'), private = True)
+def target_second():
+  runs.append('second')
+
+@Target('test-second-dep', private = True)
+def target_second_dep():
+  runs.append('second-dep')
+
+class SchedulerTest(unittest.TestCase):
+  def setUp(self):
+    self._dir = tempfile.TemporaryDirectory()
+    self._state = sys.argv, os.getcwd(), foundry._parallel_queues, foundry._database
+    foundry._database = None
+    runs.clear()
+
+    for name in ('test-shared', 'test-a', 'test-b', 'test-first', 'test-first-dep', 'test-second', 'test-second-dep'):
+      foundry._targets[name].called = False
+
+  def tearDown(self):
+    sys.argv, cwd, foundry._parallel_queues, foundry._database = self._state
+    os.chdir(cwd)
+    self._dir.cleanup()
+
+  def run_targets(self, *names):
+    """ Runs targets as if given on the command line of a build script, returning the lines they have printed """
+    sys.argv = [os.path.join(self._dir.name, 'build.py'), '-n:2'] + list(names)
+    out = io.StringIO()
+
+    with contextlib.redirect_stdout(out):
+      foundry.run_foundry()
+
+    return [line for line in out.getvalue().splitlines() if line.startswith(('a ', 'b '))]
+
+  def test_shared_dependency_runs_once(self):
+    self.run_targets('test-a', 'test-b')
+    self.assertEqual(runs, ['shared'])
+
+  def test_roots_run_in_order(self):
+    self.run_targets('test-first', 'test-second')
+    self.assertEqual(runs, ['first-dep', 'first', 'second-dep', 'second'])
+
+  def test_parallel_output_grouped(self):
+    lines = self.run_targets('test-a', 'test-b')
+    self.assertIn(lines, (['a start', 'a end', 'b start', 'b end'], ['b start', 'b end', 'a start', 'a end']))
+
+class DeclaredFilesTest(unittest.TestCase):
+  def setUp(self):
+    self._dir = tempfile.TemporaryDirectory()
+    self._database = foundry._database
+    foundry._database = foundry.BuildDatabase(self.path('db.json'))
+    self.options = 'O1'
+    self.runs = 0
+    self.write('a.c', 'a')
+    self.target = foundry._Target('test-declared', self.build, inputs = self.path('*.c'), outputs = lambda: [self.path('out')], options = lambda: self.options)
+
+  def tearDown(self):
+    foundry._database = self._database
+    self._dir.cleanup()
+
+  def path(self, name):
+    return os.path.join(self._dir.name, name)
+
+  def write(self, name, text, mtime = None):
+    with open(self.path(name), 'w') as f:
+      f.write(text)
+
+    if mtime is not None:
+      os.utime(self.path(name), ns = (mtime, mtime))
+
+  def build(self):
+    self.runs += 1
+    self.write('out', 'built')
+
+  def run_target(self):
+    """ Runs the target, returning why it has been skipped or None if it has run """
+    with contextlib.redirect_stdout(io.StringIO()):
+      self.target._run()
+
+    self.assertEqual(self.target.status, 'skipped' if self.target.skip_reason else 'run')
+    return self.target.skip_reason
+
+  def test_skipped_when_unchanged(self):
+    self.assertIsNone(self.run_target())
+    self.assertEqual(self.run_target(), 'inputs unchanged')
+    self.assertEqual(self.runs, 1)
+
+    # Touched but unchanged inputs do not matter
+    os.utime(self.path('a.c'), ns = (3000000000, 3000000000))
+    self.assertEqual(self.run_target(), 'inputs unchanged')
+
+  def test_changed_input(self):
+    self.run_target()
+    self.write('a.c', 'changed')
+    self.assertIsNone(self.run_target())
+
+  def test_new_input(self):
+    self.run_target()
+    self.write('b.c', 'b')
+    self.assertIsNone(self.run_target())
+    self.assertEqual(self.run_target(), 'inputs unchanged')
+
+  def test_changed_options(self):
+    self.run_target()
+    self.options = 'O2'
+    self.assertIsNone(self.run_target())
+    self.assertEqual(self.run_target(), 'inputs unchanged')
+
+  def test_missing_output(self):
+    self.run_target()
+    os.remove(self.path('out'))
+    self.assertIsNone(self.run_target())
+    self.assertEqual(self.runs, 2)
+
+  def test_no_record(self):
+    # Without a record of the last run, the outputs must be newer than the inputs
+    self.write('a.c', 'a', mtime = 2000000000)
+    self.write('out', 'built', mtime = 1000000000)
+    self.assertIsNone(self.run_target())
+
+    foundry._database = foundry.BuildDatabase(self.path('other.json'))
+    os.utime(self.path('out'), ns = (3000000000, 3000000000))
+    self.assertEqual(self.run_target(), 'outputs newer than inputs')
+
+  def test_failure_not_recorded(self):
+    self.target.target = lambda: foundry.fatal('failed')
+    self.write('out', 'old', mtime = 1000000000)
+
+    with self.assertRaises(SystemExit), contextlib.redirect_stderr(io.StringIO()):
+      self.run_target()
+
+    self.assertEqual(self.target.status, 'failed')
+    self.assertIsNone(foundry._database.is_unchanged(self.target._record_key(), self.target._record_command([self.path('a.c')])))
+
+@Target('test-fatal', private = True)
+def target_fatal():
+  foundry.fatal('test failed')
+
+class WatchTest(unittest.TestCase):
+  def setUp(self):
+    self._dir = tempfile.TemporaryDirectory()
+    self._database = foundry._database
+    foundry._database = foundry.BuildDatabase(self.path('db.json'))
+    os.mkdir(self.path('src'))
+    os.mkdir(self.path('out'))
+
+  def tearDown(self):
+    foundry._database = self._database
+    foundry.invalidate_file_index()
+    self._dir.cleanup()
+
+  def path(self, *names):
+    return os.path.join(self._dir.name, *names)
+
+  def test_failure_reported(self):
+    foundry._targets['test-fatal'].called = False
+
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+      self.assertFalse(foundry._run_watched([foundry._targets['test-fatal']]))
+
+  def test_scanned_directories_tracked(self):
+    open(self.path('src', 'a.c'), 'w').close()
+    tgt = foundry._Target('test-scan', lambda: None, inputs = self.path('src', '*.c'), outputs = lambda: foundry.dir_filter_ext(self.path('out'), 'o', cached = True))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+      tgt._run()
+
+    self.assertLessEqual({self.path('src'), self.path('src', 'a.c'), self.path('out')}, tgt.tracked_inputs)
+
+    # A new file matching the inputs changes a tracked directory
+    state = foundry._stat_inputs(tgt.tracked_inputs)
+    time.sleep(0.01)
+    open(self.path('src', 'b.c'), 'w').close()
+    self.assertNotEqual(foundry._stat_inputs(tgt.tracked_inputs), state)
+
+  def test_recursive_glob_directories(self):
+    os.makedirs(self.path('src', 'sub', 'deep'))
+    dirs = foundry._glob_dirs(self.path('src', '**', '*.c'))
+
+    self.assertEqual(sorted(os.path.normpath(d) for d in dirs), [self.path('src'), self.path('src', 'sub'), self.path('src', 'sub', 'deep')])
+    self.assertEqual(foundry._glob_dirs('*.c'), [os.curdir])
+
+if __name__ == '__main__':
+  unittest.main()
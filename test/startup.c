@@ -1,7 +1,9 @@
-#include <windows.h>
 #include <CL/dynacl.h>
 #include <stdio.h>
 
+#ifdef _WIN32
+#include <windows.h>
+
 #define DLL_PATH "C:\\Program Files\\NVIDIA Corporation\\OpenCL\\OpenCL64.dll"
 
 /*
@@ -10,20 +12,49 @@
  *    getLastErrorText(msgText,sizeof(msgText));
  */
 static CHAR * getLastErrorText(CHAR *pBuf, ULONG bufSize);
+#else
+#include <dlfcn.h>
 
+#define DLL_PATH "libOpenCL.so"
+#endif /* _WIN32 */
+
+/*
+ * usage
+ *    startup [library]
+ *
+ * Loads the OpenCL library (DLL_PATH by default) and calls it.
+ */
 int main(int argc, char** argv) {
   unsigned int err;
+  cl_uint platforms = 0;
+  const char *library = argc > 1 ? argv[1] : DLL_PATH;
 
-  puts("Initializing DynaCL...");
-  err = dynacl_init(TEXT(DLL_PATH));
+  printf("Initializing DynaCL with \"%s\"...\n", library);
+  err = dynacl_init(library);
   if(err != DYNACL_SUCCESS) {
-    CHAR msg[1024];
     printf("dynacl_init() returned error %u.\n", err);
-    printf("%s\n", getLastErrorText(msg, 1024));
+#ifdef _WIN32
+    {
+      CHAR msg[1024];
+      printf("%s\n", getLastErrorText(msg, 1024));
+    }
+#else
+    {
+      const char *msg = dlerror();
+      printf("%s\n", msg != NULL ? msg : "");
+    }
+#endif /* _WIN32 */
     
     return 1;
   } else puts("dynacl_init() returned success.");
 
+  if(clGetPlatformIDs(0, NULL, &platforms) != CL_SUCCESS) {
+    puts("clGetPlatformIDs() failed.");
+    dynacl_shutdown();
+
+    return 1;
+  } else printf("clGetPlatformIDs() found %u platforms.\n", platforms);
+
   puts("Shutting down DynaCL...");
   dynacl_shutdown();
 
@@ -31,6 +62,8 @@ int main(int argc, char** argv) {
   return 0;
 }
 
+#ifdef _WIN32
+
 static CHAR *                      //   return error message
 getLastErrorText(                  // converts "Lasr Error" code into text
 CHAR *pBuf,                        //   message buffer
@@ -64,3 +97,4 @@ ULONG bufSize)                     //   buffer size
      }
      return(pBuf);
 }
+#endif /* _WIN32 */